@@ -0,0 +1,337 @@
+"""
+Persistent cross-episode store of action outcomes keyed by Z-machine state.
+
+Every episode replays the same opening, and the agent keeps trying actions
+whose outcome in that exact game state is already known. JerichoInterface
+records each command it executes here as
+
+    (world-state digest, normalized action) -> (response, score delta,
+    location before/after, death flag, outcome kind)
+
+so later turns and later episodes can look the outcome up instead of asking
+an LLM about it:
+- ZorkCritic settles known parser rejections, blocked moves and score
+  increases without an evaluation (see ZorkCritic.evaluate_with_lookahead)
+- HybridZorkExtractor reuses the extraction it made for the same outcome
+- SynthesisTrigger skips memory synthesis for outcomes already seen
+
+Entries live in a SQLite file under zork_game_workdir, capped by entry count
+with least-recently-used rows evicted first. Statistics count, per consumer,
+the LLM evaluations a known outcome could have replaced ("skippable") and the
+ones it did replace ("skipped").
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from game_interface.core.lookahead import LookaheadOutcome, normalize_action
+from session.game_configuration import GameConfiguration
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outcomes (
+    state_digest TEXT NOT NULL,
+    action TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    response TEXT NOT NULL,
+    score_delta INTEGER NOT NULL,
+    location_before INTEGER,
+    location_after INTEGER,
+    inventory_gained TEXT NOT NULL,
+    inventory_lost TEXT NOT NULL,
+    is_direction INTEGER NOT NULL,
+    extraction TEXT,
+    times_seen INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (state_digest, action)
+)
+"""
+
+_COLUMNS = (
+    "kind, response, score_delta, location_before, location_after, "
+    "inventory_gained, inventory_lost, is_direction"
+)
+
+
+class ActionOutcomeStore:
+    """
+    SQLite-backed, LRU-bounded map from (state digest, action) to outcome.
+
+    Thread-safe: one instance is shared by every component in the process,
+    including memory synthesis running on the turn pipeline's worker.
+    """
+
+    def __init__(self, db_path: str, max_entries: int = 50000, logger=None):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: SQLite file (":memory:" for a non-persistent store)
+            max_entries: Row cap; least recently used rows are evicted first
+            logger: Logger instance for open failures
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._entries = 0
+
+        # Counters
+        self.lookups = 0
+        self.hits = 0
+        self.records = 0
+        self.known_outcomes = 0
+        self.evictions = 0
+        self.skippable: Counter = Counter()
+        self.skipped: Counter = Counter()
+
+        self._open_db(db_path)
+
+    def record(self, state_digest: str, outcome: LookaheadOutcome) -> bool:
+        """
+        Store the outcome of an executed command.
+
+        Args:
+            state_digest: World-state digest from before the command
+            outcome: Classified outcome of the command
+
+        Returns:
+            True if the same outcome (same response) was already stored
+        """
+        key = (state_digest, normalize_action(outcome.action))
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                return False
+
+            row = self._conn.execute(
+                "SELECT response FROM outcomes WHERE state_digest = ? AND action = ?", key
+            ).fetchone()
+            known = row is not None and row[0] == outcome.response
+            if known:
+                self._conn.execute(
+                    "UPDATE outcomes SET times_seen = times_seen + 1, accessed_at = ? "
+                    "WHERE state_digest = ? AND action = ?",
+                    (now, *key),
+                )
+                self.known_outcomes += 1
+            else:
+                # A different response replaces the entry (and its extraction)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO outcomes (state_digest, action, kind, response, "
+                    "score_delta, location_before, location_after, inventory_gained, "
+                    "inventory_lost, is_direction, extraction, times_seen, created_at, "
+                    "accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, 1, ?, ?)",
+                    (
+                        *key,
+                        outcome.kind,
+                        outcome.response,
+                        outcome.score_delta,
+                        outcome.location_before,
+                        outcome.location_after,
+                        json.dumps(outcome.inventory_gained),
+                        json.dumps(outcome.inventory_lost),
+                        int(outcome.is_direction),
+                        now,
+                        now,
+                    ),
+                )
+                if row is None:
+                    self._entries += 1
+                    self._evict_overflow()
+            self.records += 1
+            self._conn.commit()
+            return known
+
+    def lookup(self, state_digest: str, action: str) -> Optional[LookaheadOutcome]:
+        """
+        Get the stored outcome of an action in a state.
+
+        Returns:
+            The outcome (with cached=True), or None if it has not been seen
+        """
+        key = (state_digest, normalize_action(action))
+        with self._lock:
+            if self._conn is None:
+                return None
+            self.lookups += 1
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM outcomes WHERE state_digest = ? AND action = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE outcomes SET accessed_at = ? WHERE state_digest = ? AND action = ?",
+                (time.time(), *key),
+            )
+            self._conn.commit()
+
+        kind, response, score_delta, before, after, gained, lost, is_direction = row
+        return LookaheadOutcome(
+            action=action,
+            kind=kind,
+            response=response,
+            score_delta=score_delta,
+            location_before=before,
+            location_after=after,
+            inventory_gained=json.loads(gained),
+            inventory_lost=json.loads(lost),
+            is_direction=bool(is_direction),
+            cached=True,
+        )
+
+    def get_extraction(self, state_digest: str, action: str) -> Optional[Dict[str, Any]]:
+        """Get the extractor fields saved for an outcome (None if there are none)."""
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT extraction FROM outcomes WHERE state_digest = ? AND action = ?",
+                (state_digest, normalize_action(action)),
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+    def set_extraction(self, state_digest: str, action: str, extraction: Dict[str, Any]) -> None:
+        """Save the extractor fields for a stored outcome."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute(
+                "UPDATE outcomes SET extraction = ? WHERE state_digest = ? AND action = ?",
+                (json.dumps(extraction), state_digest, normalize_action(action)),
+            )
+            self._conn.commit()
+
+    def count_skip(self, consumer: str, skipped: bool) -> None:
+        """
+        Count an LLM evaluation that a known outcome could replace.
+
+        Args:
+            consumer: Component that consulted the store ("critic", "extractor", ...)
+            skipped: Whether the evaluation was actually skipped
+        """
+        with self._lock:
+            self.skippable[consumer] += 1
+            if skipped:
+                self.skipped[consumer] += 1
+
+    def clear(self) -> None:
+        """Drop every stored outcome."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM outcomes")
+                self._conn.commit()
+                self._entries = 0
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store counters for status reporting."""
+        return {
+            "entries": self._entries,
+            "records": self.records,
+            "known_outcomes": self.known_outcomes,
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+            "evictions": self.evictions,
+            "llm_evaluations_skippable": dict(self.skippable),
+            "llm_evaluations_skipped": dict(self.skipped),
+            "persistent": self._conn is not None and self.db_path != ":memory:",
+        }
+
+    def _open_db(self, db_path: str) -> None:
+        try:
+            if db_path != ":memory:":
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_outcomes_accessed ON outcomes(accessed_at)"
+            )
+            self._conn.commit()
+            self._entries = self._conn.execute("SELECT COUNT(*) FROM outcomes").fetchone()[0]
+        except sqlite3.Error as e:
+            self._conn = None
+            if self.logger:
+                self.logger.warning(
+                    f"Action outcome store unavailable: {e}",
+                    extra={"event_type": "outcome_store_unavailable", "db_path": db_path},
+                )
+
+    def _evict_overflow(self) -> None:
+        if self._entries <= self.max_entries:
+            return
+        # Other processes may share the file; recount before evicting
+        self._entries = self._conn.execute("SELECT COUNT(*) FROM outcomes").fetchone()[0]
+        overflow = self._entries - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM outcomes WHERE rowid IN "
+                "(SELECT rowid FROM outcomes ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,),
+            )
+            self._entries -= overflow
+            self.evictions += overflow
+
+
+# One store per database file, shared by every component in the process
+_outcome_stores: Dict[str, ActionOutcomeStore] = {}
+_outcome_stores_lock = threading.Lock()
+
+
+def get_outcome_store(config: GameConfiguration, logger=None) -> Optional[ActionOutcomeStore]:
+    """
+    Get the shared outcome store for a configuration.
+
+    Args:
+        config: GameConfiguration instance
+        logger: Logger instance (used only when the store is first created)
+
+    Returns:
+        ActionOutcomeStore, or None when the store is disabled
+    """
+    if not config.outcome_store_enabled:
+        return None
+
+    db_path = (
+        str(Path(config.zork_game_workdir) / config.outcome_store_file)
+        if config.outcome_store_file
+        else ":memory:"
+    )
+    with _outcome_stores_lock:
+        store = _outcome_stores.get(db_path)
+        if store is None:
+            store = ActionOutcomeStore(
+                db_path=db_path,
+                max_entries=config.outcome_store_max_entries,
+                logger=logger,
+            )
+            _outcome_stores[db_path] = store
+        return store
+
+
+def close_outcome_stores() -> None:
+    """Close and forget all shared stores (e.g., in tests)."""
+    with _outcome_stores_lock:
+        for store in _outcome_stores.values():
+            store.close()
+        _outcome_stores.clear()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# ABOUTME: Regression harness comparing full and incremental knowledge-base updates on a recorded episode log.
+# ABOUTME: Replays the periodic update schedule in both modes and reports prompt size and section overlap.
+
+"""
+Knowledge Update Mode Comparison
+
+Replays a recorded episode_log.jsonl through AdaptiveKnowledgeManager twice,
+once per knowledge_update_mode, calling the analysis model at the same turns
+the orchestrator would (every knowledge_update_interval turns plus a final
+update). For each mode it reports the number of updates and the estimated
+prompt tokens sent; for the resulting knowledge bases it reports which
+sections each produced and the word overlap of every shared section.
+
+This makes real analysis-model calls using the configuration in pyproject.toml.
+"""
+
+import json
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from knowledge import AdaptiveKnowledgeManager
+from knowledge.section_utils import split_sections
+from session.game_configuration import GameConfiguration
+from shared_utils import estimate_tokens
+
+
+class PromptMeter:
+    """Wraps an LLM client to record the estimated prompt tokens of each call."""
+
+    def __init__(self, client):
+        self._client = client
+        self.prompt_tokens: List[int] = []
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs):
+        self.prompt_tokens.append(
+            sum(estimate_tokens(m.get("content", "")) for m in kwargs.get("messages", []))
+        )
+        return self._client.chat.completions.create(**kwargs)
+
+
+def last_turn_in_log(log_path: Path) -> int:
+    """Find the highest turn number recorded in an episode log."""
+    last_turn = 0
+    with open(log_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("event_type") in ("turn_completed", "final_action_selection"):
+                turn = entry.get("turn")
+                if isinstance(turn, int):
+                    last_turn = max(last_turn, turn)
+    return last_turn
+
+
+def word_overlap(a: str, b: str) -> float:
+    """Jaccard similarity of the lowercase word sets of two texts."""
+    words_a = set(re.findall(r"[a-z']+", a.lower()))
+    words_b = set(re.findall(r"[a-z']+", b.lower()))
+    if not words_a and not words_b:
+        return 1.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+def compare_knowledge_bases(full_kb: str, incremental_kb: str) -> Dict[str, Optional[float]]:
+    """
+    Compare two knowledge bases section by section.
+
+    Returns:
+        Mapping of section name to word overlap (None if only one side has it)
+    """
+    full_sections = split_sections(full_kb)
+    incremental_sections = split_sections(incremental_kb)
+    comparison = {}
+    for name in list(full_sections) + [n for n in incremental_sections if n not in full_sections]:
+        if name in full_sections and name in incremental_sections:
+            comparison[name] = word_overlap(full_sections[name], incremental_sections[name])
+        else:
+            comparison[name] = None
+    return comparison
+
+
+def replay_mode(
+    mode: str, log_path: Path, episode_id: str, last_turn: int, interval: int, workdir: Path
+) -> Dict:
+    """Run the periodic and final knowledge updates for one mode."""
+    episode_dir = workdir / "episodes" / episode_id
+    episode_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copy(log_path, episode_dir / "episode_log.jsonl")
+
+    config = GameConfiguration.from_toml().model_copy(
+        update={"knowledge_update_mode": mode, "zork_game_workdir": str(workdir)}
+    )
+    output_file = workdir / "knowledgebase.md"
+    manager = AdaptiveKnowledgeManager(
+        config=config,
+        log_file=str(workdir / "unused.jsonl"),
+        output_file=str(output_file),
+        workdir=str(workdir),
+    )
+    meter = PromptMeter(manager.client)
+    manager.client = meter
+
+    update_turns = list(range(interval, last_turn + 1, interval))
+    if not update_turns or update_turns[-1] != last_turn:
+        update_turns.append(last_turn)
+
+    successes = 0
+    start = time.perf_counter()
+    for end_turn in update_turns:
+        is_final = end_turn == update_turns[-1]
+        if mode == "incremental":
+            updated = manager.update_knowledge_incrementally(episode_id, end_turn, is_final)
+        else:
+            updated = manager.update_knowledge_from_turns(episode_id, 1, end_turn, is_final)
+        successes += int(bool(updated))
+
+    return {
+        "updates_attempted": len(update_turns),
+        "updates_succeeded": successes,
+        "llm_calls": len(meter.prompt_tokens),
+        "prompt_tokens_total": sum(meter.prompt_tokens),
+        "prompt_tokens_max": max(meter.prompt_tokens, default=0),
+        "seconds": time.perf_counter() - start,
+        "knowledge": output_file.read_text(encoding="utf-8") if output_file.exists() else "",
+    }
+
+
+def print_report(results: Dict[str, Dict], comparison: Dict[str, Optional[float]]) -> None:
+    print("=" * 80)
+    print("KNOWLEDGE UPDATE MODES")
+    print("=" * 80)
+    for mode, result in results.items():
+        print(f"\n{mode.upper()}")
+        print(f"  Updates succeeded:   {result['updates_succeeded']}/{result['updates_attempted']}")
+        print(f"  LLM calls:           {result['llm_calls']}")
+        print(f"  Prompt tokens total: ~{result['prompt_tokens_total']:,}")
+        print(f"  Prompt tokens max:   ~{result['prompt_tokens_max']:,}")
+        print(f"  Wall time:           {result['seconds']:.1f}s")
+        print(f"  Knowledge base size: {len(result['knowledge']):,} chars")
+
+    full_tokens = results["full"]["prompt_tokens_total"]
+    if full_tokens:
+        saved = 1 - results["incremental"]["prompt_tokens_total"] / full_tokens
+        print(f"\nPrompt tokens saved by incremental mode: {saved:.1%}")
+
+    print("\nSECTION OVERLAP (word Jaccard, full vs incremental)")
+    for name, overlap in comparison.items():
+        shown = "missing in one mode" if overlap is None else f"{overlap:.2f}"
+        print(f"  {name}: {shown}")
+    print()
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python analyze_knowledge_modes.py <episode_log.jsonl> [interval]")
+        print()
+        print("Example:")
+        print("  python analyze_knowledge_modes.py game_files/episodes/2025-11-10T13:25:37/episode_log.jsonl 100")
+        sys.exit(1)
+
+    log_path = Path(sys.argv[1])
+    if not log_path.exists():
+        print(f"Error: Log file not found: {log_path}")
+        sys.exit(1)
+
+    interval = int(sys.argv[2]) if len(sys.argv) > 2 else GameConfiguration.from_toml().knowledge_update_interval
+    episode_id = log_path.parent.name
+    last_turn = last_turn_in_log(log_path)
+    if last_turn == 0:
+        print(f"Error: No turns found in {log_path}")
+        sys.exit(1)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("full", "incremental"):
+            results[mode] = replay_mode(
+                mode, log_path, episode_id, last_turn, interval, Path(tmp) / mode
+            )
+
+    print_report(
+        results,
+        compare_knowledge_bases(results["full"]["knowledge"], results["incremental"]["knowledge"]),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# ABOUTME: Offline benchmark of the orchestrator turn loop, with every LLM call replayed from a cassette.
+# ABOUTME: Reports turns/sec plus per-phase CPU time and (optionally) allocations of the non-LLM hot path.
+
+"""
+Turn Loop Benchmark
+
+Plays a real ZorkOrchestratorV2 episode against Jericho with
+llm_cassette_mode="replay", so no LLM endpoint is contacted and the timings
+measure only the local work of a turn: context building, prompt assembly,
+critic bookkeeping, the Z-machine, extraction, memory, objectives, map
+updates, logging and state export.
+
+By default the cassette is synthetic: the agent plays the Zork I walkthrough
+that ships with Jericho, the critic accepts every action and the other
+components return neutral answers. Pass --cassette to replay a cassette
+recorded from a real run (llm_cassette_mode="record") instead.
+
+Phase CPU time is thread CPU time (time.thread_time) and is exclusive:
+a phase called from inside another (e.g. the agent re-prompted from the
+critic loop) is charged only to the inner phase. Pipelining and background
+export are disabled so that all of a turn's work runs on the measured thread.
+
+tests/test_turn_loop_benchmark.py runs a short benchmark with a CPU budget
+per turn to catch hot-path regressions.
+"""
+
+import argparse
+import functools
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from llm_cassette import CassetteServer, LLMCassette, close_cassettes, get_cassette, stream_name
+from managers.memory.models import MemorySynthesisResponse
+from managers.objective_manager import (
+    ObjectiveCompletionResponse,
+    ObjectiveDiscoveryResponse,
+    ObjectiveRefinementResponse,
+)
+from orchestration.parallel_runner import episode_worker_config
+from session.game_configuration import GameConfiguration
+from shared_utils import create_json_schema
+from zork_agent import AgentResponse
+from zork_critic import CriticResponse, FailureDetectionResponse
+
+# The extractor defines its LLM schema inline; only the title names its stream
+EXTRACTOR_SCHEMA = {"json_schema": {"schema": {"title": "LLMExtraction"}}}
+
+PER_MODEL_BASE_URLS = (
+    "agent_base_url",
+    "info_ext_base_url",
+    "critic_base_url",
+    "analysis_base_url",
+    "memory_base_url",
+)
+
+# (phase, attribute of the orchestrator or "" for the orchestrator itself, method)
+PHASE_METHODS = [
+    ("agent_context", "context_manager", "get_agent_context"),
+    ("agent_context", "context_manager", "get_formatted_agent_prompt_context"),
+    ("agent", "agent", "get_action_with_reasoning"),
+    ("agent", "agent", "get_action_candidates"),
+    ("critic", "", "_execute_critic_evaluation_loop"),
+    ("critic", "", "_execute_candidate_selection"),
+    ("game_engine", "jericho_interface", "send_command"),
+    ("extraction", "extractor", "extract_info"),
+    ("extraction", "", "_process_extraction"),
+    ("memory", "simple_memory", "record_action_outcome"),
+    ("objectives", "objective_manager", "check_objective_completion"),
+    ("loop_detection", "state_manager", "track_state_hash"),
+    ("periodic_updates", "", "_check_periodic_updates"),
+    ("state_export", "", "_export_coordinated_state"),
+    # Everything else the loop does (score tracking, logging, bookkeeping)
+    ("orchestrator", "", "_run_game_loop"),
+]
+
+
+class PhaseProfiler:
+    """
+    Charges exclusive thread CPU time (and optionally net allocated bytes) to phases.
+
+    Wraps methods on a live orchestrator; nested phases are subtracted from
+    the phase that called them.
+    """
+
+    def __init__(self, track_allocations: bool = False):
+        self.track_allocations = track_allocations
+        self.cpu: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.alloc: Dict[str, int] = {}
+        # One frame per active phase: [child cpu, child alloc]
+        self._stack: List[List[float]] = []
+
+    def install(self, orchestrator) -> None:
+        """Wrap the phase methods of an orchestrator instance."""
+        for phase, attribute, method in PHASE_METHODS:
+            target = getattr(orchestrator, attribute) if attribute else orchestrator
+            if hasattr(target, method):
+                setattr(target, method, self._wrap(phase, getattr(target, method)))
+
+    def _wrap(self, phase: str, fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            frame = [0.0, 0]
+            self._stack.append(frame)
+            alloc_start = tracemalloc.get_traced_memory()[0] if self.track_allocations else 0
+            cpu_start = time.thread_time()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                cpu = time.thread_time() - cpu_start
+                alloc = (
+                    tracemalloc.get_traced_memory()[0] - alloc_start
+                    if self.track_allocations
+                    else 0
+                )
+                self._stack.pop()
+                self.cpu[phase] = self.cpu.get(phase, 0.0) + cpu - frame[0]
+                self.alloc[phase] = self.alloc.get(phase, 0) + alloc - frame[1]
+                self.calls[phase] = self.calls.get(phase, 0) + 1
+                if self._stack:
+                    self._stack[-1][0] += cpu
+                    self._stack[-1][1] += alloc
+
+        return timed
+
+
+def load_walkthrough(game_file_path: str) -> List[str]:
+    """Get the built-in Jericho walkthrough for a game."""
+    from jericho import FrotzEnv
+
+    env = FrotzEnv(game_file_path)
+    try:
+        return env.get_walkthrough()
+    finally:
+        env.close()
+
+
+def build_walkthrough_cassette(path: Path, actions: List[str]) -> Path:
+    """
+    Write a synthetic replay cassette that plays a fixed action list.
+
+    Args:
+        path: Cassette file to write
+        actions: Agent actions, one per turn (the last repeats once exhausted)
+
+    Returns:
+        The cassette path
+    """
+
+    def entry(component: str, response_format, content: Any) -> Dict[str, Any]:
+        if not isinstance(content, str):
+            content = json.dumps(content)
+        return {
+            "stream": stream_name(component, response_format),
+            "component": component,
+            "key": None,
+            "response": {"content": content, "model": "cassette", "usage": None},
+        }
+
+    agent = create_json_schema(AgentResponse)
+    entries = [
+        entry("Agent", agent, {"thinking": "Following the walkthrough.", "action": action})
+        for action in actions
+    ]
+    entries += [
+        entry(
+            "Critic",
+            create_json_schema(CriticResponse),
+            {"score": 0.9, "justification": "Plausible.", "confidence": 0.9},
+        ),
+        entry(
+            "Critic",
+            create_json_schema(FailureDetectionResponse),
+            {"action_failed": False, "reason": "No failure."},
+        ),
+        entry(
+            "Extractor",
+            EXTRACTOR_SCHEMA,
+            {"exits": [], "in_combat": False, "is_room_description": False},
+        ),
+        entry(
+            "SimpleMemory",
+            create_json_schema(MemorySynthesisResponse),
+            {"should_remember": False, "reasoning": "Routine."},
+        ),
+        entry(
+            "ObjectiveManager",
+            create_json_schema(ObjectiveCompletionResponse),
+            {"completed_objectives": [], "reasoning": ""},
+        ),
+        entry(
+            "ObjectiveManager",
+            create_json_schema(ObjectiveDiscoveryResponse),
+            {"objectives": ["Explore the house and collect treasures"], "reasoning": ""},
+        ),
+        entry(
+            "ObjectiveManager",
+            create_json_schema(ObjectiveRefinementResponse),
+            {"refined_objectives": [], "reasoning": ""},
+        ),
+        entry("EpisodeSynthesizer", None, "Followed the walkthrough."),
+    ]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for item in entries:
+            f.write(json.dumps(item) + "\n")
+    return path
+
+
+def run_benchmark(
+    turns: int = 50,
+    cassette: Optional[str] = None,
+    track_allocations: bool = False,
+    workdir: Optional[str] = None,
+    config: Optional[GameConfiguration] = None,
+    http: bool = False,
+) -> Dict[str, Any]:
+    """
+    Play one replayed episode and measure the turn loop.
+
+    Args:
+        turns: Maximum turns to play
+        cassette: Recorded cassette to replay (synthetic walkthrough if omitted)
+        track_allocations: Measure net allocated bytes per phase (slower)
+        workdir: Game workdir (a temporary directory if omitted)
+        config: Base configuration (pyproject.toml if omitted)
+        http: Replay through a local CassetteServer instead of in-process, so
+            LLMClient's HTTP path (payload building, session, parsing) is timed too
+
+    Returns:
+        Report dict (see print_report)
+    """
+    # Imported here so the module can be inspected without Jericho loaded
+    from orchestration.zork_orchestrator_v2 import ZorkOrchestratorV2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir_path = Path(workdir or tmp)
+        base = config or GameConfiguration.from_toml()
+        if cassette is None:
+            cassette = str(
+                build_walkthrough_cassette(
+                    workdir_path / "walkthrough_cassette.jsonl",
+                    load_walkthrough(base.game_file_path),
+                )
+            )
+
+        cassette_path = str(Path(cassette).resolve())
+        server = None
+        if http:
+            server = CassetteServer(LLMCassette(cassette_path, "replay")).start()
+            transport = {
+                "llm_cassette_mode": "off",
+                "client_base_url": server.base_url,
+                **{url: None for url in PER_MODEL_BASE_URLS},
+            }
+        else:
+            transport = {"llm_cassette_mode": "replay", "llm_cassette_file": cassette_path}
+
+        episode_id = "benchmark"
+        bench_config = episode_worker_config(
+            base.model_copy(
+                update={
+                    "zork_game_workdir": str(workdir_path),
+                    "max_turns_per_episode": turns,
+                    **transport,
+                    "llm_cache_enabled": False,
+                    "llm_shared_request_slots": 0,
+                    "enable_pipelined_turns": False,
+                    "enable_background_state_export": False,
+                    "agent_candidate_count": 1,
+                    "turn_delay_seconds": 0.0,
+                    "s3_bucket": None,
+                }
+            ),
+            episode_id,
+        )
+        Path(bench_config.episode_log_file).parent.mkdir(parents=True, exist_ok=True)
+
+        # Start from a fresh replay position even if a previous run used this file
+        close_cassettes()
+        orchestrator = ZorkOrchestratorV2(episode_id=episode_id, config=bench_config)
+        profiler = PhaseProfiler(track_allocations=track_allocations)
+        profiler.install(orchestrator)
+
+        if track_allocations:
+            tracemalloc.start()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            score = orchestrator.play_episode()
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            peak = tracemalloc.get_traced_memory()[1] if track_allocations else None
+            if track_allocations:
+                tracemalloc.stop()
+            if server:
+                server.stop()
+
+        played = orchestrator.game_state.turn_count
+        cassette_stats = (server.cassette if server else get_cassette(bench_config)).get_stats()
+        close_cassettes()
+
+    loop_cpu = sum(profiler.cpu.values())
+    phases = {}
+    for phase in dict.fromkeys(phase for phase, _, _ in PHASE_METHODS):
+        if phase not in profiler.calls:
+            continue
+        phases[phase] = {
+            "calls": profiler.calls[phase],
+            "cpu_ms": round(profiler.cpu[phase] * 1000, 3),
+            "cpu_ms_per_turn": round(profiler.cpu[phase] * 1000 / max(played, 1), 3),
+            "share": round(profiler.cpu[phase] / loop_cpu, 3) if loop_cpu else 0.0,
+        }
+        if track_allocations:
+            phases[phase]["alloc_kb"] = round(profiler.alloc[phase] / 1024, 1)
+
+    return {
+        "transport": "http" if http else "in-process",
+        "turns": played,
+        "score": score,
+        "wall_seconds": round(wall, 3),
+        "turns_per_sec": round(played / wall, 2) if wall else 0.0,
+        "episode_cpu_seconds": round(cpu, 3),
+        "loop_cpu_ms_per_turn": round(loop_cpu * 1000 / max(played, 1), 3),
+        "peak_alloc_kb": round(peak / 1024, 1) if peak is not None else None,
+        "phases": phases,
+        "cassette": {
+            k: cassette_stats[k] for k in ("exact_hits", "sequence_hits", "repeats", "misses")
+        },
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("=" * 80)
+    print(f"TURN LOOP BENCHMARK (LLM calls replayed, {report['transport']})")
+    print("=" * 80)
+    print(f"Turns played:          {report['turns']} (score {report['score']})")
+    print(f"Wall time:             {report['wall_seconds']:.2f}s")
+    print(f"Turns/sec:             {report['turns_per_sec']:.2f}")
+    print(f"Episode CPU:           {report['episode_cpu_seconds']:.2f}s")
+    print(f"Loop CPU per turn:     {report['loop_cpu_ms_per_turn']:.2f} ms")
+    if report["peak_alloc_kb"] is not None:
+        print(f"Peak traced memory:    {report['peak_alloc_kb']:,.1f} KB")
+
+    print("\nPHASES (exclusive thread CPU)")
+    with_alloc = report["peak_alloc_kb"] is not None
+    header = f"  {'phase':<18}{'calls':>7}{'ms/turn':>10}{'share':>8}"
+    print(header + (f"{'net KB':>10}" if with_alloc else ""))
+    for name, phase in sorted(report["phases"].items(), key=lambda item: -item[1]["cpu_ms"]):
+        line = f"  {name:<18}{phase['calls']:>7}{phase['cpu_ms_per_turn']:>10.2f}{phase['share']:>8.1%}"
+        if with_alloc:
+            line += f"{phase['alloc_kb']:>10.1f}"
+        print(line)
+
+    stats = report["cassette"]
+    print(
+        f"\nCassette: {stats['exact_hits']} exact, {stats['sequence_hits']} in order, "
+        f"{stats['repeats']} repeated, {stats['misses']} missed"
+    )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the turn loop offline")
+    parser.add_argument("--turns", type=int, default=50, help="Turns to play (default 50)")
+    parser.add_argument("--cassette", help="Recorded cassette to replay (default: walkthrough)")
+    parser.add_argument("--allocations", action="store_true", help="Track allocations per phase")
+    parser.add_argument("--http", action="store_true", help="Replay through a local HTTP stand-in")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if args.cassette and not Path(args.cassette).exists():
+        print(f"Error: Cassette not found: {args.cassette}")
+        sys.exit(1)
+
+    report = run_benchmark(
+        turns=args.turns,
+        cassette=args.cassette,
+        track_allocations=args.allocations,
+        http=args.http,
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
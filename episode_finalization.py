@@ -0,0 +1,177 @@
+# ABOUTME: Process-wide background worker for end-of-episode analysis (final knowledge update, synthesis, summary)
+# ABOUTME: Readers of knowledgebase.md wait on its barrier; knowledge writers always wait so updates never overlap
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class EpisodeFinalizer:
+    """
+    Single background worker that runs episode finalization jobs.
+
+    EpisodeSynthesizer submits an episode's final knowledge update,
+    inter-episode synthesis and summary here, so the next episode (a new
+    orchestrator in the same process) can start immediately. The first code
+    that needs the updated knowledgebase.md calls knowledge_barrier():
+
+    - Readers (agent knowledge load, objective bootstrap) wait only while
+      wait_for_knowledge is set; otherwise they use the previous knowledge base
+      and the update lands for the episode after.
+    - Writers (knowledge updates) pass force=True and always wait, so two
+      updates of knowledgebase.md never run at once.
+
+    Barriers called from the worker itself return immediately, since the job
+    runs the same KnowledgeManager code that guards the next episode's updates.
+    """
+
+    THREAD_NAME_PREFIX = "zorkgpt-episode-finalizer"
+
+    def __init__(self, logger=None):
+        """
+        Initialize the finalizer.
+
+        Args:
+            logger: Logger instance for job failures and barrier timing
+        """
+        self.logger = logger
+        self.wait_for_knowledge = True
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Tuple[str, Future]] = []
+        self._lock = threading.Lock()
+
+        # Instrumentation
+        self.jobs_submitted = 0
+        self.jobs_failed = 0
+        self.barrier_count = 0
+        self.barrier_wait_seconds = 0.0
+
+    def configure(self, wait_for_knowledge: bool, logger=None) -> None:
+        """
+        Set the reader wait policy (and logger) for subsequent barriers.
+
+        Args:
+            wait_for_knowledge: Readers wait for pending finalization (True) or
+                use the knowledge base as it is (False)
+            logger: Logger instance (keeps the current one if None)
+        """
+        self.wait_for_knowledge = wait_for_knowledge
+        if logger is not None:
+            self.logger = logger
+
+    def submit(self, episode_id: str, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Schedule an episode's finalization.
+
+        Args:
+            episode_id: Episode being finalized (for logging)
+            fn: Callable to run
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Future for the job
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=self.THREAD_NAME_PREFIX
+                )
+            future = self._executor.submit(self._run_job, episode_id, fn, args, kwargs)
+            self._pending.append((episode_id, future))
+            self.jobs_submitted += 1
+        return future
+
+    def has_pending(self) -> bool:
+        """Check whether any finalization job is still running or queued."""
+        with self._lock:
+            self._pending = [(name, f) for name, f in self._pending if not f.done()]
+            return bool(self._pending)
+
+    def knowledge_barrier(self, reason: str, force: bool = False) -> None:
+        """
+        Wait for pending finalization before using knowledgebase.md.
+
+        Args:
+            reason: What needs the knowledge base (logged with wait time)
+            force: Wait regardless of the wait_for_knowledge policy (writers)
+        """
+        if threading.current_thread().name.startswith(self.THREAD_NAME_PREFIX):
+            return
+        if not force and not self.wait_for_knowledge:
+            return
+        self.wait(reason)
+
+    def wait(self, reason: str) -> None:
+        """
+        Wait for all submitted finalization jobs to finish.
+
+        Args:
+            reason: Why the caller needs the results (logged with wait time)
+        """
+        with self._lock:
+            pending = list(self._pending)
+        if not pending:
+            return
+
+        start = time.perf_counter()
+        for _, future in pending:
+            future.result()
+        waited = time.perf_counter() - start
+
+        with self._lock:
+            # Drop only what finished; jobs submitted meanwhile stay pending
+            self._pending = [(name, f) for name, f in self._pending if not f.done()]
+            self.barrier_count += 1
+            self.barrier_wait_seconds += waited
+
+        if self.logger:
+            self.logger.info(
+                f"Episode finalization barrier '{reason}' waited {waited:.3f}s",
+                extra={
+                    "event_type": "episode_finalization_barrier",
+                    "reason": reason,
+                    "episodes": [episode_id for episode_id, _ in pending],
+                    "wait_seconds": waited,
+                },
+            )
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get finalizer statistics for orchestrator status reporting."""
+        self.has_pending()  # Drop finished jobs
+        return {
+            "wait_for_knowledge": self.wait_for_knowledge,
+            "jobs_submitted": self.jobs_submitted,
+            "jobs_failed": self.jobs_failed,
+            "jobs_pending": len(self._pending),
+            "barrier_count": self.barrier_count,
+            "barrier_wait_seconds": round(self.barrier_wait_seconds, 3),
+        }
+
+    def _run_job(self, episode_id: str, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Execute a finalization job, logging (not raising) any failure."""
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            with self._lock:
+                self.jobs_failed += 1
+            if self.logger:
+                self.logger.error(
+                    f"Background finalization of episode {episode_id} failed: {e}",
+                    extra={
+                        "event_type": "episode_finalization_failed",
+                        "episode_id": episode_id,
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                    },
+                    exc_info=True,
+                )
+            return None
+
+
+_episode_finalizer = EpisodeFinalizer()
+
+
+def get_episode_finalizer() -> EpisodeFinalizer:
+    """Get the process-wide finalizer shared by every orchestrator in this process."""
+    return _episode_finalizer
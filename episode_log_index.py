@@ -0,0 +1,264 @@
+# ABOUTME: Byte-offset index over JSONL episode logs (turn -> lines, event_type -> lines)
+# ABOUTME: Fed by the JSON log handler as it writes; readers seek straight to a turn window
+
+import json
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Events that move the turn counter, mirroring how turn windows are attributed:
+# everything after turn_completed(N) belongs to N until the next action selection.
+TURN_EVENTS = ("turn_completed", "final_action_selection")
+
+# Key for the view that includes every line regardless of episode_id
+ALL_EPISODES = object()
+
+# Shared indexes kept by get_log_index (least recently used dropped first).
+# A dropped index is rebuilt from disk by refresh() the next time it is asked for.
+MAX_LOG_INDEXES = 8
+
+
+class LogLine(NamedTuple):
+    """Index entry for one complete line of the log."""
+
+    offset: int
+    length: int
+    event_type: str
+    episode_id: Optional[str]
+    turn: Optional[int]
+
+
+class _TurnView:
+    """Lines of one episode (or of the whole file) with the turn each belongs to."""
+
+    def __init__(self):
+        self.lines: List[int] = []  # positions in EpisodeLogIndex.lines
+        self.turns: List[int] = []  # attributed turn per entry in self.lines
+        self.current_turn = 0
+        self.scanned = 0  # EpisodeLogIndex.lines consumed so far
+        self.monotonic = True
+
+
+class EpisodeLogIndex:
+    """
+    Incrementally maintained index of a JSONL log file.
+
+    IndexedJSONFileHandler appends an entry for every line it writes, taking
+    event_type, episode_id and turn from the log record, so no line has to be
+    decoded to index it. Lines written by anyone else (another process, an
+    earlier run, a plain FileHandler) are picked up by refresh(), which scans
+    only the bytes past the last indexed line.
+
+    Turn attribution follows extract_turn_window_data: "turn_completed" and
+    "final_action_selection" set the current turn and every other line belongs
+    to the current turn. Attribution is computed per episode_id so the
+    monolithic log can be windowed one episode at a time.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize an empty index.
+
+        Args:
+            path: JSONL log file to index
+        """
+        self.path = Path(path)
+        self.lines: List[LogLine] = []
+        self.indexed_bytes = 0
+        self.lock = threading.RLock()
+        self._event_lines: Dict[str, List[int]] = {}
+        self._views: Dict[Any, _TurnView] = {}
+
+        # Instrumentation
+        self.lines_from_handler = 0
+        self.lines_scanned = 0
+        self.lines_decoded = 0
+
+    def add_line(
+        self,
+        offset: int,
+        length: int,
+        event_type: str,
+        episode_id: Optional[str] = None,
+        turn: Optional[int] = None,
+    ) -> None:
+        """Record a line the caller has just written at `offset` (caller holds lock)."""
+        self._append(LogLine(offset, length, event_type or "", episode_id, turn))
+        self.indexed_bytes = offset + length
+        self.lines_from_handler += 1
+
+    def refresh(self) -> None:
+        """Index complete lines appended to the file since the last refresh."""
+        with self.lock:
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                return
+            if size < self.indexed_bytes:
+                # Truncated or replaced: start over
+                self._reset()
+            if size == self.indexed_bytes:
+                return
+
+            with open(self.path, "rb") as f:
+                f.seek(self.indexed_bytes)
+                offset = self.indexed_bytes
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # torn final line; index it once it is complete
+                    self._append(self._scan_line(offset, raw))
+                    offset += len(raw)
+                    self.lines_scanned += 1
+                self.indexed_bytes = offset
+
+    def has_event(self, event_type: str) -> bool:
+        """Check whether any indexed line has this event_type."""
+        self.refresh()
+        return event_type in self._event_lines
+
+    def iter_entries(
+        self,
+        start_turn: Optional[int] = None,
+        end_turn: Optional[int] = None,
+        event_types: Optional[Iterable[str]] = None,
+        episode_id: Any = ALL_EPISODES,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Decode the lines of a turn window.
+
+        Args:
+            start_turn: First turn to include (None for the beginning)
+            end_turn: Last turn to include (None for the end)
+            event_types: Only decode lines with these event types (None for all)
+            episode_id: Restrict to one episode's lines and turn numbering
+                (ALL_EPISODES uses every line, as for per-episode log files)
+
+        Yields:
+            (turn, entry) pairs in file order, where turn is the attributed turn
+        """
+        self.refresh()
+        with self.lock:
+            view = self._view(episode_id)
+            selected = self._window(view, start_turn, end_turn)
+            wanted = set(event_types) if event_types is not None else None
+            targets = [
+                (turn, self.lines[pos])
+                for pos, turn in selected
+                if wanted is None or self.lines[pos].event_type in wanted
+            ]
+
+        if not targets:
+            return
+
+        with open(self.path, "rb") as f:
+            for turn, line in targets:
+                f.seek(line.offset)
+                try:
+                    entry = json.loads(f.read(line.length))
+                except json.JSONDecodeError:
+                    continue
+                self.lines_decoded += 1
+                yield turn, entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        with self.lock:
+            return {
+                "path": str(self.path),
+                "lines": len(self.lines),
+                "indexed_bytes": self.indexed_bytes,
+                "event_types": len(self._event_lines),
+                "lines_from_handler": self.lines_from_handler,
+                "lines_scanned": self.lines_scanned,
+                "lines_decoded": self.lines_decoded,
+            }
+
+    def _append(self, line: LogLine) -> None:
+        self._event_lines.setdefault(line.event_type, []).append(len(self.lines))
+        self.lines.append(line)
+
+    def _reset(self) -> None:
+        self.lines = []
+        self.indexed_bytes = 0
+        self._event_lines = {}
+        self._views = {}
+
+    @staticmethod
+    def _scan_line(offset: int, raw: bytes) -> LogLine:
+        """Index a line written outside the handler (requires decoding it once)."""
+        try:
+            entry = json.loads(raw)
+        except json.JSONDecodeError:
+            return LogLine(offset, len(raw), "", None, None)
+        if not isinstance(entry, dict):
+            return LogLine(offset, len(raw), "", None, None)
+        return LogLine(
+            offset,
+            len(raw),
+            entry.get("event_type", "") or "",
+            entry.get("episode_id"),
+            entry.get("turn"),
+        )
+
+    def _view(self, episode_id: Any) -> _TurnView:
+        """Bring the turn attribution for an episode (or all lines) up to date."""
+        view = self._views.setdefault(episode_id, _TurnView())
+        for pos in range(view.scanned, len(self.lines)):
+            line = self.lines[pos]
+            if episode_id is not ALL_EPISODES and line.episode_id != episode_id:
+                continue
+            if line.event_type == "turn_completed":
+                view.current_turn = line.turn if isinstance(line.turn, int) else 0
+            elif line.event_type == "final_action_selection" and isinstance(line.turn, int):
+                view.current_turn = line.turn
+            if view.turns and view.current_turn < view.turns[-1]:
+                view.monotonic = False
+            view.lines.append(pos)
+            view.turns.append(view.current_turn)
+        view.scanned = len(self.lines)
+        return view
+
+    @staticmethod
+    def _window(
+        view: _TurnView, start_turn: Optional[int], end_turn: Optional[int]
+    ) -> List[Tuple[int, int]]:
+        """Select (line position, turn) pairs whose turn falls in the window."""
+        if view.monotonic:
+            lo = 0 if start_turn is None else bisect_left(view.turns, start_turn)
+            hi = len(view.turns) if end_turn is None else bisect_right(view.turns, end_turn)
+            return list(zip(view.lines[lo:hi], view.turns[lo:hi]))
+
+        return [
+            (pos, turn)
+            for pos, turn in zip(view.lines, view.turns)
+            if (start_turn is None or turn >= start_turn)
+            and (end_turn is None or turn <= end_turn)
+        ]
+
+
+_indexes: "OrderedDict[Path, EpisodeLogIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_log_index(path) -> EpisodeLogIndex:
+    """
+    Get the shared index for a log file.
+
+    The writer (IndexedJSONFileHandler) and readers in the same process share
+    one instance, so lines written by the handler never need to be re-read.
+    At most MAX_LOG_INDEXES files are kept; each episode writes its own log,
+    so older episodes' indexes are dropped as new ones are opened.
+    """
+    key = Path(path).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = EpisodeLogIndex(key)
+            _indexes[key] = index
+            while len(_indexes) > MAX_LOG_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(key)
+        return index
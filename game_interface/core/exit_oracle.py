@@ -0,0 +1,186 @@
+# ABOUTME: Memoized ground-truth exit detection keyed by location and world state
+# ABOUTME: Lets get_valid_exits skip the per-direction save/step/restore probe on repeat states
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+ExitKey = Tuple[int, str]
+
+
+class ExitOracle:
+    """
+    Cache of probed exits keyed by (location id, world-state hash).
+
+    JerichoInterface.get_valid_exits probes every direction word with a
+    set_state/step pair, which is a dozen Z-machine steps per call. The exits
+    of a room only change when the world changes (a door opens, the dam
+    drains, the player carries a light source), so a probe result can be
+    reused for as long as the world-state hash matches. Jericho's
+    get_world_state_hash covers the cleaned object tree (locations and
+    attributes) plus the game's special RAM, which is exactly the state that
+    can open or close an exit.
+
+    The cache is a bounded LRU and can be serialized so short-lived processes
+    (zork_cli) keep their results between invocations.
+    """
+
+    def __init__(self, max_entries: int = 4096, logger=None):
+        """
+        Initialize the oracle.
+
+        Args:
+            max_entries: Maximum number of (location, world state) entries kept
+            logger: Optional logger instance for debugging
+        """
+        self.max_entries = max_entries
+        self.logger = logger
+        self._entries: "OrderedDict[ExitKey, List[str]]" = OrderedDict()
+
+        # Instrumentation (reset per episode via reset_stats)
+        self.hits = 0
+        self.misses = 0
+        self.probes_run = 0
+        self.probes_avoided = 0
+        self.stale_invalidations = 0
+
+    def lookup(self, location_id: int, world_hash: str) -> Optional[List[str]]:
+        """
+        Get cached exits for a state.
+
+        Args:
+            location_id: Z-machine object number of the player's location
+            world_hash: Jericho world-state hash for the current state
+
+        Returns:
+            Sorted exit list, or None if this state has not been probed
+        """
+        key = (location_id, world_hash)
+        exits = self._entries.get(key)
+        if exits is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return list(exits)
+
+    def has_entries(self) -> bool:
+        """Check whether anything has been cached yet."""
+        return bool(self._entries)
+
+    def store(
+        self, location_id: int, world_hash: str, exits: List[str], directions_probed: int
+    ) -> None:
+        """
+        Record the result of a full probe.
+
+        Args:
+            location_id: Z-machine object number of the player's location
+            world_hash: Jericho world-state hash the probe ran against
+            exits: Exits found by the probe
+            directions_probed: Number of direction words stepped during the probe
+        """
+        self._entries[(location_id, world_hash)] = sorted(exits)
+        self._entries.move_to_end((location_id, world_hash))
+        self.probes_run += directions_probed
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def record_hit_savings(self, directions_skipped: int) -> None:
+        """Count the Z-machine steps a cache hit avoided."""
+        self.probes_avoided += directions_skipped
+
+    def verify_move(
+        self, location_id: int, world_hash: str, direction: str, moved: bool
+    ) -> bool:
+        """
+        Check an observed movement against the cached exits for its start state.
+
+        The world-state key cannot see every global flag the game uses to gate
+        exits, so a real move that contradicts the cache (an exit that did not
+        move the player, or a non-exit that did) drops that location's entries.
+
+        Args:
+            location_id: Location before the move
+            world_hash: World-state hash before the move
+            direction: Direction word that was executed
+            moved: Whether the player's location changed
+
+        Returns:
+            True if the cache was consistent (or had no entry), False if invalidated
+        """
+        exits = self._entries.get((location_id, world_hash))
+        if exits is None or (direction in exits) == moved:
+            return True
+
+        removed = self.invalidate_location(location_id)
+        self.stale_invalidations += 1
+        if self.logger:
+            self.logger.info(
+                f"Exit oracle entry for location {location_id} contradicted by '{direction}'",
+                extra={
+                    "event_type": "exit_oracle_stale_entry",
+                    "location_id": location_id,
+                    "direction": direction,
+                    "moved": moved,
+                    "entries_removed": removed,
+                },
+            )
+        return False
+
+    def invalidate_location(self, location_id: int) -> int:
+        """
+        Drop every cached entry for a location.
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [key for key in self._entries if key[0] == location_id]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def reset_stats(self) -> None:
+        """Reset per-episode counters (cached entries are kept)."""
+        self.hits = 0
+        self.misses = 0
+        self.probes_run = 0
+        self.probes_avoided = 0
+        self.stale_invalidations = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get oracle statistics for status reporting."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "probes_run": self.probes_run,
+            "probes_avoided": self.probes_avoided,
+            "stale_invalidations": self.stale_invalidations,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize cached entries (not statistics) to a JSON-safe dict."""
+        return {
+            "entries": [
+                {"location_id": loc, "world_hash": world_hash, "exits": exits}
+                for (loc, world_hash), exits in self._entries.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], max_entries: int = 4096, logger=None) -> "ExitOracle":
+        """Restore an oracle from to_dict() output."""
+        oracle = cls(max_entries=max_entries, logger=logger)
+        for entry in data.get("entries", []):
+            oracle._entries[(entry["location_id"], entry["world_hash"])] = list(entry["exits"])
+        while len(oracle._entries) > max_entries:
+            oracle._entries.popitem(last=False)
+        return oracle
@@ -1,13 +1,19 @@
 # ABOUTME: Production interface for interacting with Zork I via Jericho library
 # ABOUTME: Provides both structured (ZObject) and text-based access to game state
 
+import hashlib
 import os
 import pickle
+from dataclasses import replace
 from pathlib import Path
 from typing import List, Optional, Tuple, Any, Dict
 from jericho import FrotzEnv
 from jericho.util import clean
 
+from .exit_oracle import ExitOracle
+from .lookahead import LookaheadOutcome, LookaheadSimulator
+from .world_snapshot import WorldSnapshot
+
 
 class JerichoInterface:
     """
@@ -43,6 +49,22 @@ class JerichoInterface:
         self.logger = logger
         self.env: Optional[FrotzEnv] = None
 
+        # Memoizes get_valid_exits per (location, world state)
+        self.exit_oracle = ExitOracle(logger=logger)
+        self._direction_words: Optional[List[str]] = None
+
+        # Dry-runs candidate actions on a saved state (memoized per world state)
+        self.lookahead = LookaheadSimulator(self, logger=logger)
+
+        # Optional ActionOutcomeStore: when set, send_command records every
+        # outcome and last_outcome/last_outcome_digest describe the latest one
+        self.outcome_store = None
+        self.last_outcome: Optional[LookaheadOutcome] = None
+        self.last_outcome_digest: Optional[str] = None
+
+        # Object-tree index for the current Z-machine state (see get_world_snapshot)
+        self._snapshot: Optional[WorldSnapshot] = None
+
     def __enter__(self):
         """Support for context manager protocol."""
         return self
@@ -68,6 +90,8 @@ class JerichoInterface:
 
         try:
             self.env = FrotzEnv(self.game_file_path)
+            self._direction_words = None
+            self._snapshot = None
             intro, _ = self.env.reset()
             intro_text = clean(intro)
 
@@ -98,8 +122,26 @@ class JerichoInterface:
         if self.env is None:
             raise RuntimeError("Environment not started. Call start() first.")
 
+        # Snapshot the pre-move state so the exit oracle can check its cache
+        direction = self._as_direction_word(cmd) if self.exit_oracle.has_entries() else None
+        recording = self.outcome_store is not None
+        if direction or recording:
+            before_hash = self._world_state_digest()
+        if direction:
+            before_loc = self.env.get_player_location().num
+        if recording:
+            before = self.lookahead.observe()
+
         observation, reward, done, info = self.env.step(cmd)
         observation_text = clean(observation)
+        self._snapshot = None
+
+        if direction:
+            moved = self.env.get_player_location().num != before_loc
+            self.exit_oracle.verify_move(before_loc, before_hash, direction, moved)
+
+        if recording:
+            self._record_outcome(cmd, observation_text, done, before, before_hash)
 
         if self.logger:
             self.logger.debug(
@@ -108,13 +150,28 @@ class JerichoInterface:
 
         return observation_text
 
+    def _record_outcome(
+        self, cmd: str, response: str, done: bool, before: Dict[str, Any], before_hash: str
+    ) -> None:
+        """Classify an executed command and record it in the outcome store."""
+        try:
+            outcome = self.lookahead.classify(cmd, response, done, before, before_hash)
+            known = self.outcome_store.record(before_hash, outcome)
+            self.last_outcome = replace(outcome, cached=known)
+            self.last_outcome_digest = before_hash
+        except Exception as e:
+            self.last_outcome = None
+            self.last_outcome_digest = None
+            if self.logger:
+                self.logger.warning(f"Failed to record outcome of '{cmd}': {e}")
+
     def get_inventory_structured(self) -> List[Any]:
         """
         Get the player's inventory as a list of ZObjects.
 
         This provides direct access to the Z-machine object tree, eliminating
-        the need for regex parsing of inventory text. Uses Jericho's built-in
-        get_inventory() method.
+        the need for regex parsing of inventory text. Served from the current
+        WorldSnapshot (same sibling-chain order as Jericho's get_inventory()).
 
         Returns:
             List of Jericho ZObject instances representing items in inventory.
@@ -126,7 +183,7 @@ class JerichoInterface:
         if self.env is None:
             raise RuntimeError("Environment not started. Call start() first.")
 
-        return self.env.get_inventory()
+        return self.get_world_snapshot().inventory()
 
     def get_inventory_text(self) -> List[str]:
         """
@@ -205,6 +262,32 @@ class JerichoInterface:
 
         return self.env.get_world_objects()
 
+    def get_world_snapshot(self) -> WorldSnapshot:
+        """
+        Get the indexed object tree for the current game state.
+
+        Built on first use after each state change and shared by every caller
+        until the next send_command/restore_state, so the critic, extractor and
+        context manager query one index instead of rescanning all objects.
+
+        Returns:
+            WorldSnapshot for the current Z-machine state
+
+        Raises:
+            RuntimeError: If the environment is not initialized
+        """
+        if self.env is None:
+            raise RuntimeError("Environment not started. Call start() first.")
+
+        if self._snapshot is None:
+            self._snapshot = WorldSnapshot(
+                objects=self.env.get_world_objects(),
+                location=self.env.get_player_location(),
+                player=self.env.get_player_object(),
+                attribute_fn=self.get_object_attributes,
+            )
+        return self._snapshot
+
     def save_state(self) -> tuple:
         """
         Get the current game state for later restoration.
@@ -241,6 +324,7 @@ class JerichoInterface:
             raise RuntimeError("Environment not started. Call start() first.")
 
         self.env.set_state(state)
+        self._snapshot = None
 
     def get_score(self) -> Tuple[int, int]:
         """
@@ -363,6 +447,7 @@ class JerichoInterface:
 
             # Restore the state using Jericho
             self.env.set_state(state)
+            self._snapshot = None
 
             if self.logger:
                 self.logger.info(
@@ -524,9 +609,9 @@ class JerichoInterface:
         """
         Get all objects visible in the current location.
 
-        This method traverses the Z-machine object tree to find objects
-        whose parent is the current location and filters for visible objects.
-        The player object itself is excluded from the results.
+        Returns the children of the current location in the Z-machine object
+        tree, read from the current WorldSnapshot. The player object itself is
+        excluded from the results.
 
         Returns:
             List of ZObject instances that are visible in the current location
@@ -543,32 +628,9 @@ class JerichoInterface:
             raise RuntimeError("Environment not started. Call start() first.")
 
         try:
-            current_location = self.get_location_structured()
-            if current_location is None:
-                return []
-
-            location_id = current_location.num
-            visible_objects = []
-
-            # Get the player object to exclude it from visible objects
-            player = self.get_player_object()
-            player_id = player.num if player else None
-
-            # Get all objects in the world
-            all_objects = self.env.get_world_objects()
-
-            # Find objects whose parent is the current location
-            for obj in all_objects:
-                if obj.parent == location_id:
-                    # Exclude the player object - you can't interact with yourself
-                    if player_id is not None and obj.num == player_id:
-                        continue
-
-                    # Include all other objects whose parent is the current location
-                    # In Z-machine, parent relationship determines visibility
-                    visible_objects.append(obj)
-
-            return visible_objects
+            # Objects whose parent is the current location, excluding the player.
+            # In Z-machine, parent relationship determines visibility.
+            return self.get_world_snapshot().visible_objects()
 
         except Exception as e:
             if self.logger:
@@ -654,6 +716,11 @@ class JerichoInterface:
         This new approach achieves 100% detection by testing each direction from
         the Z-machine dictionary and checking for location ID changes.
 
+        Probe results are memoized in self.exit_oracle keyed by (location id,
+        world-state hash), so revisiting a room in an unchanged world (and the
+        repeated calls made during critic rejection loops) costs one hash
+        instead of a dozen Z-machine steps.
+
         IMPORTANT: This is for critic validation ONLY. The agent should discover
         exits organically through gameplay by reading room descriptions.
 
@@ -669,35 +736,17 @@ class JerichoInterface:
             return []
 
         try:
-            # Save current state for restoration
-            state = self.env.get_state()
             current_loc = self.env.get_player_location()
+            world_hash = self._world_state_digest()
+            directions = self._get_direction_words()
 
-            # Get direction words from Z-machine dictionary
-            vocab = self.env.get_dictionary()
-            directions = [w.word for w in vocab if w.is_dir]
-
-            working_exits = []
-            for direction in directions:
-                try:
-                    # Restore state before testing each direction
-                    self.env.set_state(state)
-
-                    # Test direction by executing it
-                    self.env.step(direction)
-                    new_loc = self.env.get_player_location()
-
-                    # Check if location changed (ground truth)
-                    if new_loc and new_loc.num != current_loc.num:
-                        working_exits.append(direction)
-                except Exception as dir_error:
-                    # Log and continue - don't let one bad direction break all detection
-                    if self.logger:
-                        self.logger.debug(f"Failed to test direction '{direction}': {dir_error}")
-                    continue  # State will be restored at start of next iteration
-
-            # Restore original state after all testing
-            self.env.set_state(state)
+            cached = self.exit_oracle.lookup(current_loc.num, world_hash)
+            if cached is not None:
+                self.exit_oracle.record_hit_savings(len(directions))
+                return cached
+
+            working_exits = self._probe_exits(current_loc, directions)
+            self.exit_oracle.store(current_loc.num, world_hash, working_exits, len(directions))
 
             return sorted(working_exits)
 
@@ -706,6 +755,110 @@ class JerichoInterface:
                 self.logger.warning(f"Failed to get valid exits from Jericho: {e}")
             return []
 
+    def get_state_digest(self) -> str:
+        """
+        Get a compact digest of the game-relevant Z-machine state, for loop detection.
+
+        Covers the cleaned object tree and Jericho's per-game special RAM
+        rather than the whole save state: the move counter, parse buffers and
+        RNG in the full state change every turn, so no state would ever repeat.
+
+        Returns:
+            Hex digest string (equal digests mean the same world state)
+
+        Raises:
+            RuntimeError: If the environment is not initialized
+        """
+        if self.env is None:
+            raise RuntimeError("Environment not started. Call start() first.")
+        return self._world_state_digest()
+
+    def _world_state_digest(self) -> str:
+        """
+        Digest the world state for ExitOracle keys and loop detection.
+
+        Covers the same state as env.get_world_state_hash() (the object tree
+        with noisy objects such as Zork I's thief disconnected, plus Jericho's
+        per-game special RAM) but hashes the cleaned ZObject array as raw
+        bytes instead of stringifying every ZObject, which made the hash
+        slower than the probe it was meant to skip. Without the cleaning,
+        wandering objects change the tree every turn and no state repeats.
+
+        Returns:
+            Hex digest string
+        """
+        objects = self.env.get_world_objects(clean=True)
+        digest = hashlib.blake2b(memoryview(objects).cast("B"), digest_size=16)
+        digest.update(str(self.env._get_special_ram()).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _as_direction_word(self, cmd: str) -> Optional[str]:
+        """
+        Map a bare movement command ('north', 'go ne') to its dictionary direction word.
+
+        Returns:
+            The dictionary word, or None if cmd is not a plain movement
+        """
+        words = cmd.strip().lower().split()
+        if len(words) == 2 and words[0] == "go":
+            words = words[1:]
+        if len(words) != 1:
+            return None
+
+        directions = self._get_direction_words()
+        word = words[0]
+        if word in directions:
+            return word
+        # Z-machine v3 dictionaries truncate words to 6 characters ("northe")
+        if word[:6] in directions:
+            return word[:6]
+        return None
+
+    def _get_direction_words(self) -> List[str]:
+        """Get direction words from the Z-machine dictionary (static per game)."""
+        if self._direction_words is None:
+            vocab = self.env.get_dictionary()
+            self._direction_words = [w.word for w in vocab if w.is_dir]
+        return self._direction_words
+
+    def _probe_exits(self, current_loc: Any, directions: List[str]) -> List[str]:
+        """
+        Step every direction from a saved state and keep the ones that move the player.
+
+        Args:
+            current_loc: Player location ZObject before probing
+            directions: Direction words to test
+
+        Returns:
+            Directions that changed the player's location (unsorted)
+        """
+        # Save current state for restoration
+        state = self.env.get_state()
+
+        working_exits = []
+        for direction in directions:
+            try:
+                # Restore state before testing each direction
+                self.env.set_state(state)
+
+                # Test direction by executing it
+                self.env.step(direction)
+                new_loc = self.env.get_player_location()
+
+                # Check if location changed (ground truth)
+                if new_loc and new_loc.num != current_loc.num:
+                    working_exits.append(direction)
+            except Exception as dir_error:
+                # Log and continue - don't let one bad direction break all detection
+                if self.logger:
+                    self.logger.debug(f"Failed to test direction '{direction}': {dir_error}")
+                continue  # State will be restored at start of next iteration
+
+        # Restore original state after all testing
+        self.env.set_state(state)
+
+        return working_exits
+
     def close(self) -> None:
         """Cleanup and close the environment."""
         if self.env is not None:
@@ -0,0 +1,298 @@
+# ABOUTME: Dry-runs candidate actions on a saved Z-machine state and classifies what they do
+# ABOUTME: Lets the critic settle deterministic outcomes (parser errors, blocked moves, deaths) without an LLM call
+
+import re
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from jericho.util import clean
+
+# Outcome kinds, in precedence order (an action that moves the player and
+# scores points is a score change). A parser message outranks a world-state
+# change: Zork sets bookkeeping flags on the player even for refused commands.
+DEATH = "death"
+SCORE_CHANGE = "score_change"
+MOVEMENT = "movement"
+INVENTORY_CHANGE = "inventory_change"
+WORLD_CHANGE = "world_change"
+PARSER_REJECTION = "parser_rejection"
+NO_OP = "no_op"
+
+# Zork I parser messages for commands it refused before running any game logic
+PARSER_REJECTION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"^I don't know the word",
+        r"^You used the word .* in a way that I don't understand",
+        r"^That sentence isn't one I recognize",
+        r"^There was no verb in that sentence",
+        r"^I beg your pardon\?",
+        r"^I couldn't find anything to",
+        r"^You can't see any .* here",
+        r"^What do you want to ",
+        r"^Which .* do you mean",
+        r"^There seems to be a noun missing",
+    ]
+]
+
+# Commands whose effect reaches outside the Z-machine state (files, process exit)
+UNSAFE_VERBS = frozenset(["save", "restore", "restart", "quit", "q", "script", "unscript"])
+
+DEATH_PHRASES = ("you have died", "you are dead")
+
+LookaheadKey = Tuple[str, str]
+
+
+DIRECTION_ABBREVIATIONS = {
+    "n": "north", "s": "south", "e": "east", "w": "west",
+    "ne": "northeast", "nw": "northwest", "se": "southeast", "sw": "southwest",
+    "u": "up", "d": "down",
+}
+
+
+def normalize_action(action: str) -> str:
+    """
+    Canonical form of a command, so equivalent commands share a memo/store key.
+
+    Lowercases, collapses whitespace, drops trailing punctuation and spells
+    out movement ("n", "go n" and "north" are all "north").
+    """
+    words = action.lower().strip().rstrip(".!").split()
+    if len(words) == 2 and words[0] == "go":
+        words = words[1:]
+    if len(words) == 1:
+        words = [DIRECTION_ABBREVIATIONS.get(words[0], words[0])]
+    return " ".join(words)
+
+
+@dataclass(frozen=True)
+class LookaheadOutcome:
+    """What one action did when executed from the current state."""
+
+    action: str
+    kind: str
+    response: str
+    score_delta: int = 0
+    location_before: Optional[int] = None
+    location_after: Optional[int] = None
+    inventory_gained: List[str] = field(default_factory=list)
+    inventory_lost: List[str] = field(default_factory=list)
+    is_direction: bool = False
+    cached: bool = False
+
+    @property
+    def moved(self) -> bool:
+        """Whether the action changed the player's location."""
+        return self.location_before != self.location_after
+
+    @property
+    def died(self) -> bool:
+        """Whether the action killed the player."""
+        return self.kind == DEATH
+
+    @property
+    def blocked_move(self) -> bool:
+        """A movement command that left the player (and the world) where it was."""
+        return self.is_direction and self.kind == NO_OP
+
+
+class LookaheadSimulator:
+    """
+    Executes candidate actions against a snapshot of the Z-machine and restores it.
+
+    Zork is deterministic given its full save state (RAM, stack and RNG), so
+    stepping an action from a restored snapshot shows exactly what it would do
+    now. The critic uses that to answer, without an LLM call, the cases where
+    the outcome is already decided: the parser rejects the command, a
+    movement goes nowhere, the action kills the player, or it scores points.
+
+    Outcomes are memoized per (world-state digest, normalized action), the
+    same digest JerichoInterface uses for the exit oracle and loop detection,
+    so re-evaluating an action in the rejection loop or on a revisit costs one
+    hash. The digest leaves out the RNG, so a memoized outcome of a random
+    event (combat) is one sample; deaths are therefore never served from the
+    memo but re-simulated against the live state.
+    """
+
+    def __init__(self, jericho_interface, max_entries: int = 2048, logger=None):
+        """
+        Initialize the simulator.
+
+        Args:
+            jericho_interface: JerichoInterface whose environment is simulated
+            max_entries: Maximum number of memoized (state, action) outcomes
+            logger: Optional logger instance for debugging
+        """
+        self.jericho = jericho_interface
+        self.max_entries = max_entries
+        self.logger = logger
+        self._memo: "OrderedDict[LookaheadKey, LookaheadOutcome]" = OrderedDict()
+
+        # Instrumentation
+        self.simulations = 0
+        self.memo_hits = 0
+        self.outcome_counts: Counter = Counter()
+
+    def simulate(self, action: str) -> Optional[LookaheadOutcome]:
+        """
+        Dry-run one action from the current state.
+
+        Args:
+            action: Game command to try
+
+        Returns:
+            The classified outcome, or None if the environment is not running
+            or the command cannot be simulated safely
+        """
+        return self.simulate_candidates([action])[0]
+
+    def simulate_candidates(self, actions: List[str]) -> List[Optional[LookaheadOutcome]]:
+        """
+        Dry-run several alternative actions, each from the current state.
+
+        The state is saved once and restored before each action and at the
+        end, so the live game is unchanged whatever the actions do.
+
+        Args:
+            actions: Game commands to try
+
+        Returns:
+            One outcome (or None, see simulate) per action, in order
+        """
+        env = self.jericho.env
+        if env is None:
+            return [None] * len(actions)
+
+        results: List[Optional[LookaheadOutcome]] = [None] * len(actions)
+        digest = self.jericho.get_state_digest()
+        pending = []
+        for i, action in enumerate(actions):
+            normalized = normalize_action(action)
+            if not normalized or normalized.split()[0] in UNSAFE_VERBS:
+                continue
+
+            cached = self._memo.get((digest, normalized))
+            if cached is not None:
+                self._memo.move_to_end((digest, normalized))
+                self.memo_hits += 1
+                results[i] = replace(cached, action=action, cached=True)
+            else:
+                pending.append((i, action, normalized))
+
+        if not pending:
+            return results
+
+        state = self.jericho.save_state()
+        before = self.observe()
+        try:
+            for i, action, normalized in pending:
+                self.jericho.restore_state(state)
+                try:
+                    outcome = self._run(env, action, digest, before)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.debug(f"Lookahead failed for '{action}': {e}")
+                    continue
+
+                results[i] = outcome
+                self.simulations += 1
+                self.outcome_counts[outcome.kind] += 1
+                if outcome.kind != DEATH:
+                    self._store((digest, normalized), outcome)
+        finally:
+            self.jericho.restore_state(state)
+
+        return results
+
+    def _run(
+        self, env: Any, action: str, digest: str, before: Dict[str, Any]
+    ) -> LookaheadOutcome:
+        """Step one action (state already restored) and classify the result."""
+        observation, _, done, _ = env.step(action)
+        return self.classify(action, clean(observation), done, before, digest)
+
+    def observe(self) -> Dict[str, Any]:
+        """Capture the parts of the current state used to classify an outcome."""
+        env = self.jericho.env
+        location = env.get_player_location()
+        return {
+            "score": env.get_score(),
+            "location": location.num if location is not None else None,
+            "inventory": {obj.num: obj.name for obj in env.get_inventory()},
+        }
+
+    def classify(
+        self, action: str, response: str, done: bool, before: Dict[str, Any], digest: str
+    ) -> LookaheadOutcome:
+        """
+        Classify an action that has just been executed.
+
+        Also used by JerichoInterface.send_command to record real outcomes.
+
+        Args:
+            action: Command that was executed
+            response: Cleaned game response
+            done: Jericho's episode-over flag from the step
+            before: observe() output from before the step
+            digest: World-state digest from before the step
+
+        Returns:
+            The classified outcome
+        """
+        after = self.observe()
+        score_delta = after["score"] - before["score"]
+        gained = [name for num, name in after["inventory"].items() if num not in before["inventory"]]
+        lost = [name for num, name in before["inventory"].items() if num not in after["inventory"]]
+        lowered = response.lower()
+
+        if any(phrase in lowered for phrase in DEATH_PHRASES) or (
+            done and not self.jericho.env.victory()
+        ):
+            kind = DEATH
+        elif score_delta:
+            kind = SCORE_CHANGE
+        elif after["location"] != before["location"]:
+            kind = MOVEMENT
+        elif gained or lost:
+            kind = INVENTORY_CHANGE
+        elif any(pattern.search(response) for pattern in PARSER_REJECTION_PATTERNS):
+            kind = PARSER_REJECTION
+        elif self.jericho.get_state_digest() != digest:
+            kind = WORLD_CHANGE
+        else:
+            kind = NO_OP
+
+        return LookaheadOutcome(
+            action=action,
+            kind=kind,
+            response=response,
+            score_delta=score_delta,
+            location_before=before["location"],
+            location_after=after["location"],
+            inventory_gained=gained,
+            inventory_lost=lost,
+            is_direction=self.jericho._as_direction_word(action) is not None,
+        )
+
+    def _store(self, key: LookaheadKey, outcome: LookaheadOutcome) -> None:
+        """Memoize an outcome, evicting the least recently used entries."""
+        self._memo[key] = outcome
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all memoized outcomes."""
+        self._memo.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get simulator statistics for status reporting."""
+        lookups = self.simulations + self.memo_hits
+        return {
+            "entries": len(self._memo),
+            "simulations": self.simulations,
+            "memo_hits": self.memo_hits,
+            "hit_rate": round(self.memo_hits / lookups, 3) if lookups else 0.0,
+            "outcomes": dict(self.outcome_counts),
+        }
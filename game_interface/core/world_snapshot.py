@@ -0,0 +1,136 @@
+# ABOUTME: Indexed view of the Z-machine object tree, built once per game step
+# ABOUTME: Gives O(children) lookups for visible, inventory and accessible objects
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class WorldSnapshot:
+    """
+    Read-only index over one state of the Z-machine object tree.
+
+    Visible-object, inventory and container lookups used to walk the full
+    world-object list (~250 objects in Zork I) separately in the critic,
+    extractor, context manager and JerichoInterface, several times per turn.
+    A snapshot walks it once and keeps:
+        - objects_by_num: object number -> ZObject
+        - children: parent number -> child ZObjects (object-number order)
+        - by_name: lowercased name -> ZObjects with that name
+        - attributes: object number -> attribute dict (get_object_attributes),
+          filled on first request so untouched objects cost nothing
+
+    JerichoInterface builds a snapshot lazily and discards it whenever the
+    game state can change (send_command, restore_state, start).
+    """
+
+    def __init__(
+        self,
+        objects: Iterable[Any],
+        location: Any,
+        player: Any,
+        attribute_fn: Callable[[Any], Dict[str, bool]],
+    ):
+        """
+        Build the indexes.
+
+        Args:
+            objects: All world objects (e.g., env.get_world_objects())
+            location: Player location ZObject (may be None)
+            player: Player ZObject (may be None)
+            attribute_fn: Maps a ZObject to its attribute dict
+        """
+        self.location = location
+        self.player = player
+        self.location_id: Optional[int] = location.num if location is not None else None
+        self.player_id: Optional[int] = player.num if player is not None else None
+
+        self.objects_by_num: Dict[int, Any] = {}
+        self.children: Dict[int, List[Any]] = defaultdict(list)
+        self.by_name: Dict[str, List[Any]] = defaultdict(list)
+        self.attributes: Dict[int, Dict[str, bool]] = {}
+        self._attribute_fn = attribute_fn
+
+        for obj in objects:
+            if not obj.num:
+                continue  # Object 0 is a placeholder
+            self.objects_by_num[obj.num] = obj
+            self.children[obj.parent].append(obj)
+            if obj.name:
+                self.by_name[obj.name.lower()].append(obj)
+
+        self._accessible: Optional[List[Any]] = None
+        self._accessible_ids: Optional[frozenset] = None
+
+    def get_object(self, num: int) -> Optional[Any]:
+        """Get an object by number."""
+        return self.objects_by_num.get(num)
+
+    def children_of(self, num: int) -> List[Any]:
+        """Get the direct children of an object (empty list if none)."""
+        return list(self.children.get(num, ()))
+
+    def attributes_of(self, obj: Any) -> Dict[str, bool]:
+        """Get the (memoized) attribute dict for an object."""
+        if obj is None:
+            return {}
+        attrs = self.attributes.get(obj.num)
+        if attrs is None:
+            attrs = self._attribute_fn(obj)
+            self.attributes[obj.num] = attrs
+        return attrs
+
+    def find_by_name(self, name: str) -> List[Any]:
+        """Get objects whose full name matches exactly (case-insensitive)."""
+        return list(self.by_name.get(name.lower(), ()))
+
+    def visible_objects(self) -> List[Any]:
+        """Objects directly in the current location, excluding the player."""
+        if self.location_id is None:
+            return []
+        return [
+            obj for obj in self.children.get(self.location_id, ())
+            if obj.num != self.player_id
+        ]
+
+    def inventory(self) -> List[Any]:
+        """Objects held by the player, in Z-machine sibling order."""
+        if self.player is None:
+            return []
+
+        items = []
+        item_num = self.player.child
+        while item_num and item_num in self.objects_by_num:
+            item = self.objects_by_num[item_num]
+            items.append(item)
+            item_num = item.sibling
+        return items
+
+    def accessible_objects(self) -> List[Any]:
+        """
+        Objects the player can reach: room contents, inventory, and the
+        contents of transparent (open or see-through) containers among them,
+        recursively.
+        """
+        if self._accessible is None:
+            accessible = self.visible_objects() + self.inventory()
+            seen = {obj.num for obj in accessible}
+            frontier = list(accessible)
+            while frontier:
+                next_frontier = []
+                for obj in frontier:
+                    if not self.attributes_of(obj).get("transparent"):
+                        continue
+                    for child in self.children.get(obj.num, ()):
+                        if child.num not in seen:
+                            seen.add(child.num)
+                            accessible.append(child)
+                            next_frontier.append(child)
+                frontier = next_frontier
+            self._accessible = accessible
+        return list(self._accessible)
+
+    def is_accessible(self, num: int) -> bool:
+        """Check whether an object is in accessible_objects() in O(1)."""
+        if self._accessible_ids is None:
+            self._accessible_ids = frozenset(obj.num for obj in self.accessible_objects())
+        return num in self._accessible_ids
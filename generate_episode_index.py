@@ -5,18 +5,29 @@ Episode Index Generator for ZorkGPT Viewer
 This script generates an index of available episodes by scanning S3 snapshots
 or local snapshot directories. It creates an episodes.json file that the viewer
 can use to list and switch between episodes.
+
+Finished episodes are summarized by the manifest.json written at finalization;
+older episodes fall back to reading their first and last snapshots in parallel.
+With --incremental, episodes whose listing is unchanged since the previous
+index are copied from it without reading anything.
 """
 
 import json
 import os
-import glob
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 import argparse
 import tomllib
 from pathlib import Path
 
+from state_exporter import FilesystemBucket
+from state_journal import MANIFEST_FILE, episode_summary, read_journal, reconstruct_state
+
+# Full keyframe snapshots and (in delta export mode) per-turn journal deltas
+SNAPSHOT_FILE_PATTERN = re.compile(r"(turn|delta)_(\d+)\.json$")
+
 # Optional S3 support
 try:
     import boto3
@@ -39,6 +50,15 @@ def load_config():
     return {}
 
 
+def load_index(path: str) -> Optional[Dict[str, Any]]:
+    """Load a previously generated index, or None if it is missing or unreadable."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
 class EpisodeIndexGenerator:
     """Generates an index of available ZorkGPT episodes."""
 
@@ -47,16 +67,22 @@ class EpisodeIndexGenerator:
         s3_bucket: Optional[str] = None,
         s3_key_prefix: str = "",
         local_snapshots_dir: str = "./zorkgpt/snapshots",
+        s3_client=None,
+        max_workers: int = 8,
     ):
         self.s3_bucket = s3_bucket
         self.s3_key_prefix = s3_key_prefix
         self.local_snapshots_dir = local_snapshots_dir
-        self.s3_client = None
+        self.s3_client = s3_client
+        self.max_workers = max_workers
+        self.stats = {"reused": 0, "from_manifest": 0, "from_snapshots": 0}
 
         print(f"S3_AVAILABLE: {S3_AVAILABLE}")
         print(f"s3_bucket provided: {s3_bucket}")
 
-        if S3_AVAILABLE and s3_bucket:
+        if s3_client is not None:
+            print(f"Using provided S3 client for bucket: {s3_bucket}")
+        elif S3_AVAILABLE and s3_bucket:
             try:
                 self.s3_client = boto3.client("s3")
                 print(f"S3 client initialized for bucket: {s3_bucket}")
@@ -68,21 +94,35 @@ class EpisodeIndexGenerator:
             if not s3_bucket:
                 print("No S3 bucket specified - S3 scanning disabled")
 
-    def generate_index(self) -> Dict[str, Any]:
-        """Generate episode index from available sources."""
+    def generate_index(
+        self, previous_index: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate episode index from available sources.
+
+        Args:
+            previous_index: An earlier index; episodes whose snapshot listing is
+                unchanged are copied from it instead of being re-read
+        """
         episodes = []
+        previous = {
+            (episode["source"], episode["episode_id"]): episode
+            for episode in (previous_index or {}).get("episodes", [])
+            if "listing_signature" in episode
+        }
+        self.stats = {"reused": 0, "from_manifest": 0, "from_snapshots": 0}
 
         # Try S3 first if available
         if self.s3_client and self.s3_bucket:
             print("Scanning S3 for episodes...")
-            s3_episodes = self._scan_s3_episodes()
+            s3_episodes = self._scan_s3_episodes(previous)
             episodes.extend(s3_episodes)
             print(f"Found {len(s3_episodes)} episodes in S3")
 
         # Scan local snapshots
         if os.path.exists(self.local_snapshots_dir):
             print(f"Scanning local directory: {self.local_snapshots_dir}")
-            local_episodes = self._scan_local_episodes()
+            local_episodes = self._scan_local_episodes(previous)
             episodes.extend(local_episodes)
             print(f"Found {len(local_episodes)} episodes locally")
         else:
@@ -93,6 +133,8 @@ class EpisodeIndexGenerator:
         unique_episodes.sort(key=lambda x: x["start_time"], reverse=True)
 
         # Mark only the most recent episode as not game over (current episode)
+        for episode in unique_episodes:
+            episode["game_over"] = True
         if unique_episodes:
             unique_episodes[0]["game_over"] = False
 
@@ -104,12 +146,16 @@ class EpisodeIndexGenerator:
         }
 
         print(f"Generated index with {len(unique_episodes)} unique episodes")
+        print(
+            f"Reused {self.stats['reused']}, read {self.stats['from_manifest']} manifests, "
+            f"scanned {self.stats['from_snapshots']} episodes' snapshots"
+        )
         return index
 
-    def _scan_s3_episodes(self) -> List[Dict[str, Any]]:
-        """Scan S3 for episode snapshots."""
-        episodes = []
-
+    def _scan_s3_episodes(
+        self, previous: Optional[Dict[tuple, Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Scan S3 for episode snapshots with a single listing of the snapshots prefix."""
         try:
             # List objects in the snapshots prefix
             snapshots_prefix = f"{self.s3_key_prefix}snapshots/"
@@ -118,121 +164,217 @@ class EpisodeIndexGenerator:
             paginator = self.s3_client.get_paginator("list_objects_v2")
             pages = paginator.paginate(Bucket=self.s3_bucket, Prefix=snapshots_prefix)
 
-            episode_dirs = set()
+            # Group keys like "snapshots/2024-01-15T10:30:45/turn_1.json" by episode
+            listings: Dict[str, List[Dict[str, Any]]] = {}
             total_objects = 0
-
             for page in pages:
-                if "Contents" not in page:
-                    print("No contents in this page")
-                    continue
-
-                page_objects = len(page["Contents"])
-                total_objects += page_objects
-                print(f"Processing page with {page_objects} objects")
-
-                for obj in page["Contents"]:
-                    key = obj["Key"]
-
-                    # Extract episode ID from path like "snapshots/2024-01-15T10:30:45/turn_1.json"
-                    match = re.match(
-                        rf"{re.escape(snapshots_prefix)}([^/]+)/turn_(\d+)\.json$", key
+                for obj in page.get("Contents", []):
+                    total_objects += 1
+                    episode_id, _, name = obj["Key"][len(snapshots_prefix) :].partition("/")
+                    if not name or "/" in name:
+                        continue
+                    listings.setdefault(episode_id, []).append(
+                        {
+                            "name": name,
+                            "path": obj["Key"],
+                            "last_modified": obj["LastModified"],
+                        }
                     )
-                    if match:
-                        episode_id = match.group(1)
-                        turn_num = int(match.group(2))
-                        episode_dirs.add(episode_id)
-                        print(f"Found episode: {episode_id}, turn: {turn_num}")
 
             print(f"Total objects scanned: {total_objects}")
-            print(f"Episode directories found: {len(episode_dirs)}")
-
-            # For each episode, get metadata from the first and last snapshots
-            for episode_id in episode_dirs:
-                print(f"Getting info for episode: {episode_id}")
-                episode_info = self._get_s3_episode_info(episode_id)
-                if episode_info:
-                    episodes.append(episode_info)
-                    print(f"Successfully added episode: {episode_id}")
-                else:
-                    print(f"Failed to get info for episode: {episode_id}")
+            print(f"Episode directories found: {len(listings)}")
+
+            return self._collect_episodes("s3", listings, previous or {}, self._get_s3_snapshot)
 
         except Exception as e:
             print(f"Error scanning S3 episodes: {e}")
+            return []
 
-        return episodes
-
-    def _get_s3_episode_info(self, episode_id: str) -> Optional[Dict[str, Any]]:
-        """Get episode information from S3 snapshots."""
+    def _scan_local_episodes(
+        self, previous: Optional[Dict[tuple, Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Scan local directory for episode snapshots."""
         try:
-            episode_prefix = f"{self.s3_key_prefix}snapshots/{episode_id}/"
-
-            # List all snapshots for this episode using pagination
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(Bucket=self.s3_bucket, Prefix=episode_prefix)
-
-            # Find turn files and extract turn numbers
-            turn_files = []
-            for page in pages:
-                if "Contents" not in page:
-                    continue
-
-                for obj in page["Contents"]:
-                    key = obj["Key"]
-                    match = re.search(r"turn_(\d+)\.json$", key)
-                    if match:
-                        turn_num = int(match.group(1))
-                        turn_files.append(
+            listings: Dict[str, List[Dict[str, Any]]] = {}
+            with os.scandir(self.local_snapshots_dir) as episode_dirs:
+                for episode_dir in episode_dirs:
+                    if not episode_dir.is_dir():
+                        continue
+                    with os.scandir(episode_dir.path) as files:
+                        listings[episode_dir.name] = [
                             {
-                                "turn": turn_num,
-                                "key": key,
-                                "last_modified": obj["LastModified"],
+                                "name": f.name,
+                                "path": f.path,
+                                "last_modified": f.stat().st_mtime,
                             }
-                        )
+                            for f in files
+                            if f.is_file()
+                        ]
 
-            if not turn_files:
-                return None
+            return self._collect_episodes(
+                "local", listings, previous or {}, self._read_local_snapshot
+            )
 
-            # Sort by turn number
-            turn_files.sort(key=lambda x: x["turn"])
+        except Exception as e:
+            print(f"Error scanning local episodes: {e}")
+            return []
 
-            # Get first snapshot for episode metadata
-            first_snapshot_key = turn_files[0]["key"]
-            first_snapshot = self._get_s3_snapshot(first_snapshot_key)
+    def _collect_episodes(
+        self,
+        source: str,
+        listings: Dict[str, List[Dict[str, Any]]],
+        previous: Dict[tuple, Dict[str, Any]],
+        read: Callable[[str], Optional[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Build index entries for listed episodes.
 
-            # Get last snapshot for final stats
-            last_snapshot_key = turn_files[-1]["key"]
-            last_snapshot = self._get_s3_snapshot(last_snapshot_key)
+        Episodes whose listing matches the previous index are copied; the rest
+        are read (manifest, else first/last snapshots) on a thread pool.
+        """
+        episodes = []
+        to_read = []
+        for episode_id, files in listings.items():
+            signature = self._listing_signature(files)
+            cached = previous.get((source, episode_id))
+            if cached and cached["listing_signature"] == signature:
+                episodes.append(dict(cached))
+                self.stats["reused"] += 1
+            else:
+                to_read.append((episode_id, files, signature))
+
+        if to_read:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                infos = pool.map(
+                    lambda item: self._read_episode_info(source, *item, read), to_read
+                )
+                for (episode_id, _, _), (info, origin) in zip(to_read, infos):
+                    if info:
+                        episodes.append(info)
+                        self.stats[origin] += 1
+                    else:
+                        print(f"Failed to get info for episode: {episode_id}")
 
-            if not first_snapshot or not last_snapshot:
-                return None
+        return episodes
+
+    @staticmethod
+    def _listing_signature(files: List[Dict[str, Any]]) -> str:
+        """Object count and newest modification time; changes when an episode gains turns."""
+        newest = max((f["last_modified"] for f in files), default="")
+        return f"{len(files)}@{newest}"
 
-            # Extract episode information
-            episode_info = {
-                "episode_id": episode_id,
-                "source": "s3",
-                "start_time": first_snapshot.get("metadata", {}).get(
-                    "timestamp", episode_id
-                ),
-                "end_time": last_snapshot.get("metadata", {}).get("timestamp", ""),
-                "total_turns": last_snapshot.get("metadata", {}).get(
-                    "turn_count", len(turn_files)
-                ),
-                "final_score": last_snapshot.get("metadata", {}).get("score", 0),
-                "game_over": True,  # Will be set to False for current episode later
-                "death_count": last_snapshot.get("current_state", {}).get(
-                    "death_count", 0
-                ),
-                "models": last_snapshot.get("metadata", {}).get("models", {}),
-                "snapshot_count": len(turn_files),
-                "first_turn": turn_files[0]["turn"],
-                "last_turn": turn_files[-1]["turn"],
-            }
-
-            return episode_info
+    def _read_episode_info(
+        self,
+        source: str,
+        episode_id: str,
+        files: List[Dict[str, Any]],
+        signature: str,
+        read: Callable[[str], Optional[Dict[str, Any]]],
+    ) -> tuple:
+        """
+        Read one episode's index entry from its manifest, snapshots or journal.
+
+        Returns:
+            Tuple of (entry or None, "from_manifest" or "from_snapshots")
+        """
+        origin = "from_manifest"
+        try:
+            names = {f["name"]: f["path"] for f in files}
+            episode_info = None
+
+            if MANIFEST_FILE in names:
+                manifest = read(names[MANIFEST_FILE])
+                if manifest:
+                    episode_info = dict(manifest)
+
+            if episode_info is None:
+                origin = "from_snapshots"
+                episode_info = self._summarize_snapshots(episode_id, files, read)
+                if episode_info is None and "state_journal.jsonl" in names:
+                    # Delta export mode writes a single journal per episode
+                    episode_info = self._get_local_journal_info(
+                        episode_id, names["state_journal.jsonl"]
+                    )
+                if episode_info is None:
+                    return None, origin
+
+            episode_info.update(
+                source=source,
+                game_over=True,  # Will be set to False for current episode later
+                listing_signature=signature,
+            )
+            return episode_info, origin
 
         except Exception as e:
-            print(f"Error getting S3 episode info for {episode_id}: {e}")
+            print(f"Error getting {source} episode info for {episode_id}: {e}")
+            return None, origin
+
+    def _summarize_snapshots(
+        self,
+        episode_id: str,
+        files: List[Dict[str, Any]],
+        read: Callable[[str], Optional[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Summarize an episode from its first and last keyframe/delta snapshots."""
+        turn_files = []
+        for f in files:
+            match = SNAPSHOT_FILE_PATTERN.fullmatch(f["name"])
+            if match:
+                turn_files.append(
+                    {"turn": int(match.group(2)), "kind": match.group(1), "path": f["path"]}
+                )
+        if not turn_files:
+            return None
+
+        # Sort by turn number
+        turn_files.sort(key=lambda x: x["turn"])
+
+        first_snapshot = self._load_snapshot_at(turn_files, 0, read)
+        last_snapshot = self._load_snapshot_at(turn_files, len(turn_files) - 1, read)
+        if not first_snapshot or not last_snapshot:
+            return None
+
+        return episode_summary(
+            episode_id,
+            first_snapshot,
+            last_snapshot,
+            snapshot_count=len(turn_files),
+            first_turn=turn_files[0]["turn"],
+            last_turn=turn_files[-1]["turn"],
+        )
+
+    def _load_snapshot_at(
+        self,
+        turn_files: List[Dict[str, Any]],
+        index: int,
+        read: Callable[[str], Optional[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load the full state for turn_files[index].
+
+        Keyframes (turn_N.json) are read directly; a delta (delta_N.json) is
+        rebuilt by replaying the deltas after the nearest preceding keyframe.
+        """
+        entry = turn_files[index]
+        if entry["kind"] == "turn":
+            return read(entry["path"])
+
+        start = index
+        while start >= 0 and turn_files[start]["kind"] != "turn":
+            start -= 1
+        if start < 0:
+            return None
+
+        keyframe = read(turn_files[start]["path"])
+        if keyframe is None:
             return None
+        records = [{"type": "keyframe", "turn": turn_files[start]["turn"], "state": keyframe}]
+        for delta_entry in turn_files[start + 1 : index + 1]:
+            delta = read(delta_entry["path"])
+            if delta is None:
+                return None
+            records.append(delta)
+        return reconstruct_state(records)
 
     def _get_s3_snapshot(self, key: str) -> Optional[Dict[str, Any]]:
         """Get a snapshot from S3."""
@@ -244,87 +386,26 @@ class EpisodeIndexGenerator:
             print(f"Error reading S3 snapshot {key}: {e}")
             return None
 
-    def _scan_local_episodes(self) -> List[Dict[str, Any]]:
-        """Scan local directory for episode snapshots."""
-        episodes = []
-
-        try:
-            # Look for episode directories
-            episode_pattern = os.path.join(self.local_snapshots_dir, "*")
-            episode_dirs = [d for d in glob.glob(episode_pattern) if os.path.isdir(d)]
-
-            for episode_dir in episode_dirs:
-                episode_id = os.path.basename(episode_dir)
-                episode_info = self._get_local_episode_info(episode_id, episode_dir)
-                if episode_info:
-                    episodes.append(episode_info)
-
-        except Exception as e:
-            print(f"Error scanning local episodes: {e}")
-
-        return episodes
-
-    def _get_local_episode_info(
-        self, episode_id: str, episode_dir: str
+    def _get_local_journal_info(
+        self, episode_id: str, journal_file: str
     ) -> Optional[Dict[str, Any]]:
-        """Get episode information from local snapshots."""
+        """Get episode information from a delta-mode state journal."""
         try:
-            # Find all turn files
-            turn_pattern = os.path.join(episode_dir, "turn_*.json")
-            turn_files = glob.glob(turn_pattern)
-
-            if not turn_files:
+            records = read_journal(Path(journal_file))
+            if not records or records[0]["type"] != "keyframe":
                 return None
 
-            # Extract turn numbers and sort
-            turn_info = []
-            for turn_file in turn_files:
-                match = re.search(r"turn_(\d+)\.json$", turn_file)
-                if match:
-                    turn_num = int(match.group(1))
-                    turn_info.append(
-                        {
-                            "turn": turn_num,
-                            "file": turn_file,
-                            "mtime": os.path.getmtime(turn_file),
-                        }
-                    )
-
-            turn_info.sort(key=lambda x: x["turn"])
-
-            # Read first and last snapshots
-            first_snapshot = self._read_local_snapshot(turn_info[0]["file"])
-            last_snapshot = self._read_local_snapshot(turn_info[-1]["file"])
-
-            if not first_snapshot or not last_snapshot:
-                return None
-
-            # Extract episode information
-            episode_info = {
-                "episode_id": episode_id,
-                "source": "local",
-                "start_time": first_snapshot.get("metadata", {}).get(
-                    "timestamp", episode_id
-                ),
-                "end_time": last_snapshot.get("metadata", {}).get("timestamp", ""),
-                "total_turns": last_snapshot.get("metadata", {}).get(
-                    "turn_count", len(turn_info)
-                ),
-                "final_score": last_snapshot.get("metadata", {}).get("score", 0),
-                "game_over": True,  # Will be set to False for current episode later
-                "death_count": last_snapshot.get("current_state", {}).get(
-                    "death_count", 0
-                ),
-                "models": last_snapshot.get("metadata", {}).get("models", {}),
-                "snapshot_count": len(turn_info),
-                "first_turn": turn_info[0]["turn"],
-                "last_turn": turn_info[-1]["turn"],
-            }
-
-            return episode_info
+            return episode_summary(
+                episode_id,
+                records[0]["state"],
+                reconstruct_state(records),
+                snapshot_count=len(records),
+                first_turn=records[0]["turn"],
+                last_turn=records[-1]["turn"],
+            )
 
         except Exception as e:
-            print(f"Error getting local episode info for {episode_id}: {e}")
+            print(f"Error reading state journal for {episode_id}: {e}")
             return None
 
     def _read_local_snapshot(self, file_path: str) -> Optional[Dict[str, Any]]:
@@ -429,6 +510,19 @@ def main():
     parser.add_argument(
         "--upload-s3", action="store_true", help="Upload index to S3 after generating"
     )
+    parser.add_argument(
+        "--s3-local-dir",
+        default=config.get("s3_local_dir"),
+        help="Read the bucket from <dir>/<bucket>/<key> instead of S3",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse unchanged episodes from the existing output file",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=8, help="Parallel snapshot reads"
+    )
 
     args = parser.parse_args()
 
@@ -452,13 +546,28 @@ def main():
     print(f"Final S3 prefix: '{s3_prefix}'")
 
     # Create generator
+    s3_client = None
+    if s3_bucket and args.s3_local_dir:
+        print(f"Using local bucket directory: {args.s3_local_dir}")
+        s3_client = FilesystemBucket(args.s3_local_dir)
     generator = EpisodeIndexGenerator(
-        s3_bucket=s3_bucket, s3_key_prefix=s3_prefix, local_snapshots_dir=args.local_dir
+        s3_bucket=s3_bucket,
+        s3_key_prefix=s3_prefix,
+        local_snapshots_dir=args.local_dir,
+        s3_client=s3_client,
+        max_workers=args.workers,
     )
 
+    # Previous index for an incremental update
+    previous_index = None
+    if args.incremental:
+        previous_index = load_index(args.output)
+        if previous_index:
+            print(f"Updating {previous_index.get('total_episodes', 0)} indexed episodes")
+
     # Generate index
     print("Generating episode index...")
-    index = generator.generate_index()
+    index = generator.generate_index(previous_index)
 
     # Save index locally
     generator.save_index(index, args.output)
@@ -2,16 +2,19 @@
 Jericho-based Zork Extractor using object tree for structured data.
 
 This extractor uses Jericho's Z-machine object tree to directly extract
-inventory, location, and visible objects WITHOUT regex parsing. LLM is used
-only for exits, combat detection, and room description detection.
+inventory, location, and visible objects WITHOUT regex parsing. Exits, combat
+and room description detection come from deterministic rules when the Z-machine
+state settles them, else from the LLM (memoized per normalized response text).
 
 This is the Phase 2 implementation with NO backwards compatibility.
 """
 
 import json
-from typing import Optional, List
+from collections import OrderedDict
+from typing import Any, Dict, Optional, List
 from pydantic import BaseModel
 from llm_client import LLMClientWrapper
+from prompt_cache import PromptBuilder
 
 from game_interface.core.jericho_interface import JerichoInterface
 from shared_utils import create_json_schema, strip_markdown_json_fences
@@ -44,6 +47,10 @@ GENERIC_LOCATION_FALLBACKS = {
 }
 
 
+# Zork I's VILLAINS table: characters that fight the player
+COMBAT_VILLAINS = ("troll", "thief", "cyclops")
+
+
 class ExtractorResponse(BaseModel):
     current_location_name: str
     exits: List[str]
@@ -66,10 +73,14 @@ class HybridZorkExtractor:
     - Visible objects (from object tree traversal)
     - Score/moves (from get_score)
 
-    Uses LLM only for:
-    - Exits (direction parsing is game-state dependent)
-    - Combat detection (requires semantic understanding)
-    - Room description detection (requires semantic understanding)
+    Exits, combat and room description detection use a rule-based fast path:
+    - Exits from get_valid_exits() (probed and memoized by the exit oracle)
+    - Combat from villains (COMBAT_VILLAINS) in the room's object tree
+    - Room description when the response opens with the room's title
+
+    The LLM is used only when the rules are ambiguous (entering a room
+    without its title, e.g. in the dark; a villain newly in the room),
+    and its answers are memoized per (normalized text, location, context).
     """
 
     def __init__(
@@ -138,6 +149,13 @@ class HybridZorkExtractor:
         # Previous state tracking for context
         self.previous_combat_state = False
         self.previous_location = None
+        self.previous_location_id = None
+
+        # Rule-based fast path and memo of LLM answers (see _classify_response)
+        self.fast_path_enabled = config.extractor_fast_path
+        self.memo_size = config.extractor_memo_size
+        self._memo: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self.reset_stats()
 
     def _load_system_prompt(self) -> None:
         """Load the system prompt for LLM extraction."""
@@ -160,7 +178,8 @@ Extract key information from the game text and return it as JSON with these fiel
         Extract structured information from Zork using hybrid approach.
 
         Uses Jericho object tree for location, inventory, visible objects.
-        Uses LLM for exits, combat detection, and room description detection.
+        Uses rules, then the memo, then the LLM for exits, combat detection,
+        and room description detection.
 
         Args:
             game_text_from_zork: Raw text from Zork (for LLM context)
@@ -177,9 +196,9 @@ Extract key information from the game text and return it as JSON with these fiel
             visible_characters = self._get_visible_characters_from_jericho()
             score, moves = self._get_score_from_jericho()
 
-            # Use LLM for exits, combat, and room description detection
-            llm_extracted = self._extract_with_llm(
-                game_text_from_zork, location_name, previous_location
+            # Exits, combat, and room description detection
+            llm_extracted, source = self._classify_response(
+                game_text_from_zork, location_name, previous_location, visible_characters
             )
 
             # Combine structured and LLM data
@@ -207,12 +226,14 @@ Extract key information from the game text and return it as JSON with these fiel
                         "visible_characters_count": len(visible_characters),
                         "exits_count": len(llm_extracted.get("exits", [])),
                         "in_combat": llm_extracted.get("in_combat", False),
+                        "extraction_source": source,
                     },
                 )
 
             # Update previous state tracking
             self.previous_combat_state = llm_extracted.get("in_combat", False)
             self.previous_location = location_name
+            self.previous_location_id = self._get_location_id_from_jericho()
 
             return extracted_info
 
@@ -239,6 +260,14 @@ Extract key information from the game text and return it as JSON with these fiel
                 )
             return "Unknown Location"
 
+    def _get_location_id_from_jericho(self) -> Optional[int]:
+        """Get current location object number from Jericho (None if unavailable)."""
+        try:
+            location_obj = self.jericho.get_location_structured()
+            return location_obj.num if location_obj else None
+        except Exception:
+            return None
+
     def _get_inventory_from_jericho(self) -> List[str]:
         """Get inventory from Jericho object tree."""
         try:
@@ -256,25 +285,15 @@ Extract key information from the game text and return it as JSON with these fiel
         """
         Get visible objects from Jericho object tree.
 
-        Traverses the Z-machine object tree to find objects in the current location.
-        Objects are considered visible if they are children of the current location.
+        Reads the children of the current location from the per-step
+        WorldSnapshot (the player object is already excluded).
         """
         try:
-            location_obj = self.jericho.get_location_structured()
-            if not location_obj:
-                return []
-
-            visible_objects = []
-            all_objects = self.jericho.get_all_objects()
-
-            # Find objects whose parent is the current location
-            for obj in all_objects:
-                if obj.parent == location_obj.num and obj.name:
-                    # Filter out the player object and empty names
-                    if obj.name.strip() and not obj.name.lower() == "cretin":
-                        visible_objects.append(obj.name)
-
-            return visible_objects
+            return [
+                obj.name
+                for obj in self.jericho.get_visible_objects_in_location()
+                if obj.name and obj.name.strip()
+            ]
 
         except Exception as e:
             if self.logger:
@@ -292,12 +311,7 @@ Extract key information from the game text and return it as JSON with these fiel
         or properties in the Z-machine. This is a heuristic approach.
         """
         try:
-            location_obj = self.jericho.get_location_structured()
-            if not location_obj:
-                return []
-
             characters = []
-            all_objects = self.jericho.get_all_objects()
 
             # Character detection heuristics for Zork
             character_keywords = [
@@ -311,8 +325,8 @@ Extract key information from the game text and return it as JSON with these fiel
                 "demon",
             ]
 
-            for obj in all_objects:
-                if obj.parent == location_obj.num and obj.name:
+            for obj in self.jericho.get_visible_objects_in_location():
+                if obj.name:
                     obj_name_lower = obj.name.lower()
                     # Check if object name contains character keywords
                     if any(keyword in obj_name_lower for keyword in character_keywords):
@@ -342,13 +356,150 @@ Extract key information from the game text and return it as JSON with these fiel
                 )
             return None, None
 
+    def _classify_response(
+        self,
+        game_text: str,
+        current_location: str,
+        previous_location: Optional[str],
+        visible_characters: List[str],
+    ) -> tuple[dict, str]:
+        """
+        Get exits, combat status and room description flag for a response.
+
+        Tries the rules, then the memo of earlier LLM answers, then the answer
+        stored with a known outcome in the action outcome store, then the LLM.
+
+        Returns:
+            Tuple of (extracted fields, source: "rules", "memo", "outcome_store" or "llm")
+        """
+        self.turns += 1
+        if self.fast_path_enabled:
+            extracted = self._extract_with_rules(game_text, current_location, visible_characters)
+            if extracted is not None:
+                self.rule_turns += 1
+                return extracted, "rules"
+
+        key = (
+            " ".join(game_text.lower().split()),
+            current_location,
+            previous_location,
+            self.previous_combat_state,
+        )
+        memoized = self._memo.get(key)
+        if memoized is not None:
+            self._memo.move_to_end(key)
+            self.memo_hits += 1
+            return dict(memoized), "memo"
+
+        # An outcome seen before (possibly in an earlier episode) keeps its extraction
+        store = getattr(self.jericho, "outcome_store", None)
+        outcome = getattr(self.jericho, "last_outcome", None) if store is not None else None
+        if outcome is not None and outcome.cached:
+            stored = store.get_extraction(self.jericho.last_outcome_digest, outcome.action)
+            store.count_skip("extractor", skipped=stored is not None)
+            if stored is not None:
+                self.store_hits += 1
+                return stored, "outcome_store"
+
+        self.llm_calls += 1
+        extracted = self._extract_with_llm(game_text, current_location, previous_location)
+        failed = extracted.pop("_failed", False)
+        if self.memo_size > 0 and not failed:
+            self._memo[key] = dict(extracted)
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        if outcome is not None and not failed:
+            store.set_extraction(self.jericho.last_outcome_digest, outcome.action, extracted)
+        return extracted, "llm"
+
+    def _extract_with_rules(
+        self, game_text: str, current_location: str, visible_characters: List[str]
+    ) -> Optional[dict]:
+        """
+        Derive exits, combat and room description from the Z-machine state.
+
+        Returns:
+            Extracted fields, or None when the rules cannot decide
+        """
+        is_room_description = self._starts_with_room_title(game_text, current_location)
+        if not is_room_description:
+            location_id = self._get_location_id_from_jericho()
+            if location_id is None or location_id != self.previous_location_id:
+                # Entered a room without its title (darkness, a vehicle, the intro)
+                return None
+
+        villains = [
+            name for name in visible_characters
+            if any(villain in name.lower() for villain in COMBAT_VILLAINS)
+        ]
+        if villains and not self.previous_combat_state:
+            # A villain in the room may be asleep, just passing or attacking
+            return None
+
+        try:
+            exits = self.jericho.get_valid_exits()
+        except Exception:
+            return None
+        if not isinstance(exits, list):
+            return None
+
+        return {
+            "exits": exits,
+            "in_combat": bool(villains),
+            "is_room_description": is_room_description,
+        }
+
+    @staticmethod
+    def _starts_with_room_title(game_text: str, location_name: str) -> bool:
+        """
+        Check whether text opens with the room's title, as Zork room descriptions do.
+
+        Jericho's object name abbreviates the printed title ("West House" for
+        "West of House", "Living" for "Living Room"), so the name's words must
+        appear in order among the first few words, starting with the first.
+        """
+        name_words = location_name.lower().split()
+        if not name_words:
+            return False
+        text_words = [word.strip(",.") for word in game_text.lower().split()[: len(name_words) + 2]]
+        if not text_words or text_words[0] != name_words[0]:
+            return False
+        remaining = iter(text_words)
+        return all(word in remaining for word in name_words)
+
+    def reset_stats(self) -> None:
+        """Reset fast path counters (e.g., at the start of an episode)."""
+        self.turns = 0
+        self.rule_turns = 0
+        self.memo_hits = 0
+        self.store_hits = 0
+        self.llm_calls = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fast path counters for status reporting."""
+        return {
+            "fast_path_enabled": self.fast_path_enabled,
+            "turns": self.turns,
+            "rule_turns": self.rule_turns,
+            "memo_hits": self.memo_hits,
+            "store_hits": self.store_hits,
+            "llm_calls": self.llm_calls,
+            "memo_entries": len(self._memo),
+            "llm_free_rate": (
+                round((self.rule_turns + self.memo_hits + self.store_hits) / self.turns, 3)
+                if self.turns
+                else 0.0
+            ),
+        }
+
     def _extract_with_llm(
         self, game_text: str, current_location: str, previous_location: str = None
     ) -> dict:
         """
         Use LLM to extract exits, combat status, and room description detection.
 
-        This is the ONLY place where LLM is used for extraction.
+        This is the ONLY place where LLM is used for extraction. Failed calls
+        return the fallback fields with "_failed": True so they are not memoized.
         """
         try:
             # Build extraction prompt
@@ -357,14 +508,12 @@ Extract key information from the game text and return it as JSON with these fiel
             )
 
             # Use proper system/user message structure with caching
-            messages = [
-                {
-                    "role": "system",
-                    "content": self.system_prompt,
-                    "cache_control": {"type": "ephemeral"},
-                },
-                {"role": "user", "content": extraction_prompt},
-            ]
+            messages = (
+                PromptBuilder(self.model)
+                .add("static", self.system_prompt)
+                .add("turn", extraction_prompt)
+                .build()
+            )
 
             # Define minimal schema for LLM extraction
             class LLMExtraction(BaseModel):
@@ -385,7 +534,12 @@ Extract key information from the game text and return it as JSON with these fiel
             )
 
             if not llm_response:
-                return {"exits": [], "in_combat": False, "is_room_description": False}
+                return {
+                    "exits": [],
+                    "in_combat": False,
+                    "is_room_description": False,
+                    "_failed": True,
+                }
 
             # Extract content from the response
             response_content = (
@@ -408,6 +562,7 @@ Extract key information from the game text and return it as JSON with these fiel
                 "exits": [],
                 "in_combat": self.previous_combat_state,
                 "is_room_description": False,
+                "_failed": True,
             }
 
     def _build_llm_extraction_prompt(
@@ -462,6 +617,7 @@ Extract key information from the game text and return it as JSON with these fiel
                 "exits": [],
                 "in_combat": self.previous_combat_state,
                 "is_room_description": False,
+                "_failed": True,
             }
 
     def _create_fallback_response(
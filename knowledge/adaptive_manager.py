@@ -10,7 +10,7 @@ knowledge generation, and cross-episode synthesis.
 """
 
 import os
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
 from llm_client import LLMClientWrapper
@@ -21,6 +21,8 @@ from knowledge import turn_extraction
 from knowledge import knowledge_generation
 from knowledge import cross_episode_synthesis
 from knowledge import section_utils
+from knowledge import incremental
+from shared_store import atomic_write_text, store_lock
 
 try:
     from langfuse.decorators import observe
@@ -79,6 +81,13 @@ class AdaptiveKnowledgeManager:
         # Load agent instructions to avoid duplication
         self.agent_instructions = self._load_agent_instructions()
 
+        # Incremental mode: turns already analyzed, per episode
+        self.rolling_summaries: Dict[str, incremental.RollingSummary] = {}
+
+        # Knowledge base as last read, so a write can tell whether another
+        # process (a parallel episode) rewrote the file in the meantime
+        self._loaded_knowledge = ""
+
     def _get_episode_log_file(self, episode_id: str) -> Path:
         """Get the log file path for a specific episode."""
         return Path(self.workdir) / "episodes" / episode_id / "episode_log.jsonl"
@@ -214,6 +223,177 @@ class AdaptiveKnowledgeManager:
         Returns:
             bool: True if knowledge was updated, False if skipped
         """
+        # Steps 1-2: Extract turn window data and check quality
+        turn_data = self._prepare_turn_window(
+            episode_id, start_turn, end_turn, is_final_update
+        )
+        if turn_data is None:
+            return False
+
+        # Step 3: Load existing knowledge
+        existing_knowledge, cross_episode_preserved = self._load_existing_knowledge(
+            episode_id
+        )
+
+        # Step 4: Generate new knowledge in single pass
+        if self.logger:
+            self.logger.info(
+                "Generating knowledge base update",
+                extra={
+                    "event_type": "knowledge_generation_start",
+                    "episode_id": episode_id,
+                },
+            )
+
+        new_knowledge = knowledge_generation.generate_knowledge_directly(
+            turn_data=turn_data,
+            existing_knowledge=existing_knowledge,
+            client=self.client,
+            analysis_model=self.analysis_model,
+            analysis_sampling=self.analysis_sampling,
+            logger=self.logger
+        )
+
+        # Defensively remove any CROSS-EPISODE INSIGHTS the LLM generated
+        # Then restore the preserved version
+        new_knowledge = section_utils.remove_section(
+            new_knowledge, "CROSS-EPISODE INSIGHTS"
+        )
+        new_knowledge = self._restore_cross_episode_section(
+            new_knowledge, cross_episode_preserved
+        )
+
+        if not new_knowledge or new_knowledge.startswith("SKIP:"):
+            if self.logger:
+                self.logger.warning(
+                    f"Knowledge generation returned skip or empty: {new_knowledge[:100] if new_knowledge else 'None'}",
+                    extra={
+                        "event_type": "knowledge_update_skipped",
+                        "episode_id": episode_id,
+                    },
+                )
+            return False
+
+        # Step 5: Write updated knowledge to file
+        return self._write_knowledge(episode_id, new_knowledge)
+
+    def update_knowledge_incrementally(
+        self,
+        episode_id: str,
+        end_turn: int,
+        is_final_update: bool = False,
+    ) -> bool:
+        """
+        Update the knowledge base from the turns played since the last update.
+
+        Only the new turn window is sent to the analysis model, together with
+        a rolling summary of the turns already analyzed; the model returns
+        just the sections it revises, which are merged into the knowledge
+        base. The first update of a knowledge base falls back to full
+        generation, as there is nothing to merge into yet.
+
+        Args:
+            episode_id: Current episode ID
+            end_turn: Last turn to analyze
+            is_final_update: If True, more lenient about quality (episode-end updates)
+
+        Returns:
+            bool: True if knowledge was updated, False if skipped
+        """
+        summary = self.rolling_summaries.get(episode_id)
+        if summary is None:
+            summary = incremental.RollingSummary(episode_id)
+            self.rolling_summaries[episode_id] = summary
+
+        start_turn = summary.last_turn + 1
+        if start_turn > end_turn:
+            return False
+
+        turn_data = self._prepare_turn_window(
+            episode_id, start_turn, end_turn, is_final_update
+        )
+        if turn_data is None:
+            return False
+
+        if self._is_first_meaningful_update():
+            # Nothing to merge into yet: build the knowledge base from this window
+            if not self.update_knowledge_from_turns(
+                episode_id, start_turn, end_turn, is_final_update
+            ):
+                return False
+            summary.absorb(turn_data)
+            return True
+
+        existing_knowledge, cross_episode_preserved = self._load_existing_knowledge(
+            episode_id
+        )
+
+        response = knowledge_generation.generate_knowledge_incrementally(
+            turn_data=turn_data,
+            existing_knowledge=existing_knowledge,
+            summary=summary,
+            client=self.client,
+            analysis_model=self.analysis_model,
+            analysis_sampling=self.analysis_sampling,
+            token_budget=self.config.knowledge_prompt_token_budget,
+            logger=self.logger
+        )
+
+        if not response or response.startswith("SKIP:"):
+            if self.logger:
+                self.logger.info(
+                    f"Incremental knowledge update skipped: {response[:100] if response else 'None'}",
+                    extra={
+                        "event_type": "knowledge_update_skipped",
+                        "episode_id": episode_id,
+                        "turn_range": f"{start_turn}-{end_turn}",
+                    },
+                )
+            if response:
+                # Analyzed with nothing to add: do not send these turns again
+                summary.absorb(turn_data)
+            return False
+
+        merged, updated_sections = incremental.merge_section_updates(
+            existing_knowledge, response
+        )
+        if not updated_sections:
+            if self.logger:
+                self.logger.warning(
+                    "Incremental knowledge response contained no sections",
+                    extra={
+                        "event_type": "knowledge_update_skipped",
+                        "episode_id": episode_id,
+                        "response_preview": response[:100],
+                    },
+                )
+            return False
+
+        merged = self._restore_cross_episode_section(merged, cross_episode_preserved)
+        if not self._write_knowledge(episode_id, merged):
+            return False
+
+        summary.absorb(turn_data)
+        if self.logger:
+            self.logger.info(
+                f"Incremental knowledge update merged {len(updated_sections)} section(s)",
+                extra={
+                    "event_type": "knowledge_incremental_merge",
+                    "episode_id": episode_id,
+                    "turn_range": f"{start_turn}-{end_turn}",
+                    "updated_sections": updated_sections,
+                },
+            )
+        return True
+
+    def _prepare_turn_window(
+        self,
+        episode_id: str,
+        start_turn: int,
+        end_turn: int,
+        is_final_update: bool,
+    ) -> Optional[Dict]:
+        """Extract a turn window and apply the quality gate; None means skip."""
         if self.logger:
             self.logger.info(
                 f"Knowledge update requested for turns {start_turn}-{end_turn}",
@@ -225,7 +405,6 @@ class AdaptiveKnowledgeManager:
                 },
             )
 
-        # Step 1: Extract turn window data
         turn_data = turn_extraction.extract_turn_window_data(
             episode_id=episode_id,
             start_turn=start_turn,
@@ -245,9 +424,8 @@ class AdaptiveKnowledgeManager:
                         "reason": "no_data",
                     },
                 )
-            return False
+            return None
 
-        # Step 2: Quality check using heuristics
         should_update, reason = quality_assessment.should_update_knowledge(
             turn_data=turn_data,
             logger=self.logger
@@ -273,15 +451,24 @@ class AdaptiveKnowledgeManager:
                 },
             )
 
-        if not should_update:
-            return False
+        return turn_data if should_update else None
 
-        # Step 3: Load existing knowledge
+    def _load_existing_knowledge(self, episode_id: str) -> Tuple[str, str]:
+        """
+        Load the knowledge base with CROSS-EPISODE INSIGHTS split off.
+
+        The section is updated only at episode end; stripping it keeps the
+        analysis model from regenerating (and drifting) it.
+
+        Returns:
+            (knowledge without the section, preserved section content)
+        """
         existing_knowledge = ""
         try:
             if os.path.exists(self.output_file):
                 with open(self.output_file, "r", encoding="utf-8") as f:
                     existing_knowledge = f.read()
+            self._loaded_knowledge = existing_knowledge
 
         except Exception as e:
             if self.logger:
@@ -290,8 +477,6 @@ class AdaptiveKnowledgeManager:
                     extra={"event_type": "knowledge_update", "episode_id": episode_id},
                 )
 
-        # Preserve CROSS-EPISODE INSIGHTS section (updated only at episode end)
-        # Strip it from existing knowledge to prevent LLM regeneration drift
         cross_episode_preserved = section_utils.extract_section_content(
             existing_knowledge, "CROSS-EPISODE INSIGHTS"
         )
@@ -308,60 +493,59 @@ class AdaptiveKnowledgeManager:
                 existing_knowledge, "CROSS-EPISODE INSIGHTS"
             )
 
-        # Step 4: Generate new knowledge in single pass
-        if self.logger:
-            self.logger.info(
-                "Generating knowledge base update",
-                extra={
-                    "event_type": "knowledge_generation_start",
-                    "episode_id": episode_id,
-                },
-            )
+        return existing_knowledge, cross_episode_preserved
 
-        new_knowledge = knowledge_generation.generate_knowledge_directly(
-            turn_data=turn_data,
-            existing_knowledge=existing_knowledge,
-            client=self.client,
-            analysis_model=self.analysis_model,
-            analysis_sampling=self.analysis_sampling,
-            logger=self.logger
-        )
+    def _restore_cross_episode_section(
+        self, knowledge: str, cross_episode_preserved: str
+    ) -> str:
+        """Restore the preserved CROSS-EPISODE INSIGHTS section, if there was one."""
+        if not cross_episode_preserved:
+            return knowledge
 
-        # Defensively remove any CROSS-EPISODE INSIGHTS the LLM generated
-        # Then restore the preserved version
-        new_knowledge = section_utils.remove_section(
-            new_knowledge, "CROSS-EPISODE INSIGHTS"
+        knowledge = section_utils.update_section_content(
+            knowledge, "CROSS-EPISODE INSIGHTS", cross_episode_preserved
         )
-
-        # Restore preserved CROSS-EPISODE INSIGHTS if it existed
-        if cross_episode_preserved:
-            new_knowledge = section_utils.update_section_content(
-                new_knowledge, "CROSS-EPISODE INSIGHTS", cross_episode_preserved
+        if self.logger:
+            self.logger.debug(
+                "Restored CROSS-EPISODE INSIGHTS section after knowledge generation",
+                extra={
+                    "event_type": "knowledge_update",
+                    "restored_length": len(cross_episode_preserved),
+                }
             )
-            if self.logger:
-                self.logger.debug(
-                    "Restored CROSS-EPISODE INSIGHTS section after knowledge generation",
-                    extra={
-                        "event_type": "knowledge_update",
-                        "restored_length": len(cross_episode_preserved),
-                    }
-                )
+        return knowledge
 
-        if not new_knowledge or new_knowledge.startswith("SKIP:"):
-            if self.logger:
-                self.logger.warning(
-                    f"Knowledge generation returned skip or empty: {new_knowledge[:100] if new_knowledge else 'None'}",
-                    extra={
-                        "event_type": "knowledge_update_skipped",
-                        "episode_id": episode_id,
-                    },
-                )
-            return False
+    def _write_knowledge(self, episode_id: str, new_knowledge: str) -> bool:
+        """
+        Write the knowledge base file.
 
-        # Step 5: Write updated knowledge to file
+        If another process rewrote the file since it was loaded, the sections
+        this update changed are merged into that version instead of
+        overwriting it.
+        """
         try:
-            with open(self.output_file, "w", encoding="utf-8") as f:
-                f.write(new_knowledge)
+            with store_lock(self.output_file):
+                current = ""
+                if os.path.exists(self.output_file):
+                    with open(self.output_file, "r", encoding="utf-8") as f:
+                        current = f.read()
+
+                if current != self._loaded_knowledge:
+                    new_knowledge, taken = section_utils.merge_concurrent_update(
+                        self._loaded_knowledge, new_knowledge, current
+                    )
+                    if self.logger:
+                        self.logger.info(
+                            "Knowledge base changed on disk since it was loaded; merged sections",
+                            extra={
+                                "event_type": "knowledge_concurrent_merge",
+                                "episode_id": episode_id,
+                                "merged_sections": taken,
+                            },
+                        )
+
+                atomic_write_text(self.output_file, new_knowledge)
+                self._loaded_knowledge = new_knowledge
 
             if self.logger:
                 self.logger.info(
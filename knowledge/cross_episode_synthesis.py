@@ -10,9 +10,11 @@ on death patterns, environmental knowledge, strategic meta-patterns, and major
 discoveries that should persist across multiple game sessions.
 """
 
+import os
 from typing import Dict, Optional
 from pathlib import Path
 from knowledge.section_utils import extract_section_content, update_section_content
+from shared_store import atomic_write_text, store_lock
 from knowledge.knowledge_generation import format_turn_data_for_prompt
 from knowledge.turn_extraction import episode_ended_in_loop_break
 
@@ -293,17 +295,19 @@ Focus on UNIVERSAL patterns validated across episodes, not location-specific tac
 
         new_cross_episode_content = response.content.strip()
 
-        # Update the knowledge base with new cross-episode section
-        updated_knowledge = update_section_content(
-            existing_knowledge,
-            "CROSS-EPISODE INSIGHTS",
-            new_cross_episode_content
-        )
-
-        # Save the updated knowledge base
+        # Save the updated knowledge base. The section is applied to the file
+        # as it is now, which a parallel episode may have rewritten meanwhile.
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(updated_knowledge)
+            with store_lock(output_file):
+                if os.path.exists(output_file):
+                    with open(output_file, "r", encoding="utf-8") as f:
+                        existing_knowledge = f.read()
+                updated_knowledge = update_section_content(
+                    existing_knowledge,
+                    "CROSS-EPISODE INSIGHTS",
+                    new_cross_episode_content
+                )
+                atomic_write_text(output_file, updated_knowledge)
 
             if logger:
                 logger.info(
@@ -0,0 +1,169 @@
+# ABOUTME: Support for incremental knowledge-base updates that analyze only turns since the last update
+# ABOUTME: Rolling summary of analyzed turns, prompt token-budget guard and section-level merging
+
+"""
+Incremental knowledge update helpers.
+
+In incremental mode each periodic update sends the analysis model only the
+turns played since the previous successful update, plus a compact,
+deterministic summary of the turns already folded into the knowledge base.
+The model returns just the sections it wants to revise, which are merged
+into knowledgebase.md section by section.
+"""
+
+from typing import Callable, Dict, List, Tuple
+
+from shared_utils import estimate_tokens
+from knowledge import section_utils
+
+# Sections never taken from an incremental response (managed elsewhere)
+PROTECTED_SECTIONS = ("CROSS-EPISODE INSIGHTS",)
+
+# The budget guard never trims the new window below this many actions
+MIN_WINDOW_ACTIONS = 5
+
+# Cap on each list rendered into the rolling summary
+SUMMARY_LIST_LIMIT = 12
+
+
+class RollingSummary:
+    """
+    Compact record of the turns of one episode already analyzed.
+
+    Built from the same turn_data the analysis model saw, so it costs no LLM
+    calls. It is rendered into the incremental prompt in place of the full
+    history of earlier turns.
+    """
+
+    def __init__(self, episode_id: str):
+        self.episode_id = episode_id
+        self.last_turn = 0
+        self.updates = 0
+        self.actions = 0
+        self.score = 0
+        self.score_changes: List[str] = []
+        self.locations: List[str] = []
+        self.deaths: List[str] = []
+
+    def absorb(self, turn_data: Dict) -> None:
+        """Fold an analyzed turn window into the summary."""
+        self.last_turn = max(self.last_turn, turn_data["end_turn"])
+        self.updates += 1
+        self.actions += len(turn_data.get("actions_and_responses", []))
+
+        for change in turn_data.get("score_changes", []):
+            self.score = change["to_score"]
+            self.score_changes.append(
+                f"T{change['turn']}: {change['from_score']}→{change['to_score']}"
+            )
+
+        for change in turn_data.get("location_changes", []):
+            location = change["to_location"]
+            if location not in self.locations:
+                self.locations.append(location)
+
+        for death in turn_data.get("death_events", []):
+            self.deaths.append(
+                f"T{death['turn']}: {death.get('reason', '')} "
+                f"(action: {death.get('action_taken', 'Unknown')})"
+            )
+
+    def render(self, list_limit: int = SUMMARY_LIST_LIMIT) -> str:
+        """Render the summary for the prompt, keeping the newest list entries."""
+        if self.updates == 0:
+            return "No earlier turns have been analyzed in this episode."
+
+        def tail(items: List[str]) -> str:
+            if len(items) <= list_limit:
+                return ", ".join(items) if items else "none"
+            return f"(+{len(items) - list_limit} earlier) " + ", ".join(items[-list_limit:])
+
+        return (
+            f"Turns 1-{self.last_turn} ({self.actions} actions, {self.updates} update(s)) "
+            f"are already reflected in the knowledge base.\n"
+            f"- Score reached: {self.score}; changes: {tail(self.score_changes)}\n"
+            f"- Locations discovered: {tail(self.locations)}\n"
+            f"- Deaths: {tail(self.deaths)}"
+        )
+
+    def get_stats(self) -> Dict:
+        """Get summary statistics for status reporting."""
+        return {
+            "last_turn": self.last_turn,
+            "updates": self.updates,
+            "actions": self.actions,
+        }
+
+
+def fit_prompt_to_budget(
+    build_prompt: Callable[[Dict, str], str],
+    turn_data: Dict,
+    summary: RollingSummary,
+    token_budget: int,
+) -> Tuple[str, Dict]:
+    """
+    Build a prompt that fits the token budget.
+
+    Trims, in order: the oldest actions of the new window (never below
+    MIN_WINDOW_ACTIONS), then the rolling summary lists. Events (deaths,
+    score and location changes) are kept. If the prompt still exceeds the
+    budget it is returned as is and the overrun is reported.
+
+    Args:
+        build_prompt: Callable(turn_data, summary_text) -> prompt
+        turn_data: New turn window
+        summary: Rolling summary of earlier turns
+        token_budget: Maximum estimated prompt tokens
+
+    Returns:
+        (prompt, report) where report has estimated_tokens, dropped_actions
+        and over_budget
+    """
+    actions = turn_data["actions_and_responses"]
+    window = dict(turn_data)
+    summary_limit = SUMMARY_LIST_LIMIT
+    dropped = 0
+
+    prompt = build_prompt(window, summary.render(summary_limit))
+    tokens = estimate_tokens(prompt)
+
+    while tokens > token_budget and len(actions) - dropped > MIN_WINDOW_ACTIONS:
+        # Drop roughly the share of actions the prompt is over by
+        overshoot = (tokens - token_budget) / max(tokens, 1)
+        step = max(1, int(len(actions) * overshoot))
+        dropped = min(dropped + step, len(actions) - MIN_WINDOW_ACTIONS)
+        window["actions_and_responses"] = actions[dropped:]
+        prompt = build_prompt(window, summary.render(summary_limit))
+        tokens = estimate_tokens(prompt)
+
+    while tokens > token_budget and summary_limit > 1:
+        summary_limit //= 2
+        prompt = build_prompt(window, summary.render(summary_limit))
+        tokens = estimate_tokens(prompt)
+
+    return prompt, {
+        "estimated_tokens": tokens,
+        "dropped_actions": dropped,
+        "over_budget": tokens > token_budget,
+    }
+
+
+def merge_section_updates(existing_knowledge: str, response: str) -> Tuple[str, List[str]]:
+    """
+    Merge the sections of an incremental response into the knowledge base.
+
+    Sections present in the response replace the existing section of the same
+    name (or are appended); sections absent from the response are untouched.
+    PROTECTED_SECTIONS in the response are ignored.
+
+    Returns:
+        (merged knowledge base, names of the sections that were updated)
+    """
+    merged = existing_knowledge
+    updated = []
+    for name, content in section_utils.split_sections(response).items():
+        if name in PROTECTED_SECTIONS or not content:
+            continue
+        merged = section_utils.update_section_content(merged, name, content)
+        updated.append(name)
+    return merged, updated
@@ -11,6 +11,7 @@ and lessons learned.
 """
 
 from typing import Dict, Optional
+from knowledge.incremental import RollingSummary, fit_prompt_to_budget
 from knowledge.section_utils import extract_cross_episode_section
 from knowledge.turn_extraction import episode_ended_in_loop_break
 
@@ -25,6 +26,39 @@ except ImportError:
         return decorator
     LANGFUSE_AVAILABLE = False
 
+# Knowledge base sections the analysis model writes (CROSS-EPISODE INSIGHTS is
+# managed by cross-episode synthesis)
+KNOWLEDGE_SECTIONS = (
+    "UNIVERSAL GAME MECHANICS",
+    "DANGER CATEGORIES",
+    "STRATEGIC PRINCIPLES",
+    "DEATH & DANGER ANALYSIS",
+    "LESSONS LEARNED",
+)
+
+STRATEGY_SYSTEM_PROMPT = """You are creating a STRATEGIC knowledge base for an AI agent playing Zork.
+
+CRITICAL CONTEXT - Other Systems Handle:
+1. **Location-Specific Memory System**: Stores procedural knowledge at specific locations (e.g., "At Behind House, enter window leads to Kitchen"). Multi-step procedures are detected automatically.
+2. **Loop Break System**: Programmatically terminates episodes stuck without progress (20+ turns without score). These are system timeouts, NOT game mechanics.
+3. **Objective System**: Discovers and tracks goals automatically with LLM-based completion checking.
+4. **Map System**: Manages spatial relationships, exits, and navigation.
+
+YOUR ROLE:
+Generate ONLY universal game mechanics and strategic principles that apply REGARDLESS of location.
+
+SCOPE BOUNDARIES:
+✅ INCLUDE: "EXAMINE reveals hidden information" (universal mechanic)
+✅ INCLUDE: "Combat enemies exist in some locations" (danger category awareness)
+✅ INCLUDE: "Multi-step procedures exist - action A may enable action B" (meta-pattern)
+❌ EXCLUDE: "At Behind House, open window then enter window" (location-specific procedure → Memory System)
+❌ EXCLUDE: "Extended forest exploration causes mathematical death" (loop break timeout → System behavior)
+❌ EXCLUDE: "Prioritize time-sensitive objectives immediately" (objective prioritization → Objective System)
+
+If your knowledge requires phrases like "at Location X", "in Room Y", or "from Behind House", it belongs in the Memory System instead.
+
+Focus on WHY things happen and HOW to approach situations universally, not WHAT to do at specific locations."""
+
 
 def format_turn_data_for_prompt(turn_data: Dict) -> str:
     """
@@ -294,28 +328,7 @@ Generate the complete knowledge base with all sections."""
         messages = [
             {
                 "role": "system",
-                "content": """You are creating a STRATEGIC knowledge base for an AI agent playing Zork.
-
-CRITICAL CONTEXT - Other Systems Handle:
-1. **Location-Specific Memory System**: Stores procedural knowledge at specific locations (e.g., "At Behind House, enter window leads to Kitchen"). Multi-step procedures are detected automatically.
-2. **Loop Break System**: Programmatically terminates episodes stuck without progress (20+ turns without score). These are system timeouts, NOT game mechanics.
-3. **Objective System**: Discovers and tracks goals automatically with LLM-based completion checking.
-4. **Map System**: Manages spatial relationships, exits, and navigation.
-
-YOUR ROLE:
-Generate ONLY universal game mechanics and strategic principles that apply REGARDLESS of location.
-
-SCOPE BOUNDARIES:
-✅ INCLUDE: "EXAMINE reveals hidden information" (universal mechanic)
-✅ INCLUDE: "Combat enemies exist in some locations" (danger category awareness)
-✅ INCLUDE: "Multi-step procedures exist - action A may enable action B" (meta-pattern)
-❌ EXCLUDE: "At Behind House, open window then enter window" (location-specific procedure → Memory System)
-❌ EXCLUDE: "Extended forest exploration causes mathematical death" (loop break timeout → System behavior)
-❌ EXCLUDE: "Prioritize time-sensitive objectives immediately" (objective prioritization → Objective System)
-
-If your knowledge requires phrases like "at Location X", "in Room Y", or "from Behind House", it belongs in the Memory System instead.
-
-Focus on WHY things happen and HOW to approach situations universally, not WHAT to do at specific locations.""",
+                "content": STRATEGY_SYSTEM_PROMPT,
             },
             {"role": "user", "content": prompt},
         ]
@@ -347,3 +360,138 @@ Focus on WHY things happen and HOW to approach situations universally, not WHAT
             traceback.print_exc()
         # Return existing knowledge on failure
         return existing_knowledge
+
+
+def build_incremental_prompt(
+    turn_data: Dict, existing_knowledge: str, summary_text: str
+) -> str:
+    """
+    Build the prompt for an incremental knowledge update.
+
+    Args:
+        turn_data: Turns played since the last successful update
+        existing_knowledge: Current knowledge base (without CROSS-EPISODE INSIGHTS)
+        summary_text: Rendered RollingSummary of the turns already analyzed
+
+    Returns:
+        Prompt asking for revised sections only
+    """
+    section_list = "\n".join(f"- {name}" for name in KNOWLEDGE_SECTIONS)
+    return f"""Update the strategic knowledge base with NEW Zork gameplay.
+
+ARCHITECTURE REMINDER:
+- **Memory System** handles location-specific procedures
+- **Loop Break System** terminates episodes stuck 20+ turns without score (not a game mechanic)
+- **Objective System** discovers and tracks goals automatically
+- **Map System** manages spatial navigation and connections
+
+THIS knowledge base provides UNIVERSAL strategic wisdom, not location-specific tactics.
+
+EARLIER IN THIS EPISODE:
+{summary_text}
+
+NEW GAMEPLAY SINCE THE LAST UPDATE:
+{format_turn_data_for_prompt(turn_data)}
+
+CURRENT KNOWLEDGE BASE:
+{"-" * 50}
+{existing_knowledge if existing_knowledge else "No existing knowledge"}
+{"-" * 50}
+
+DEATHS IN THE NEW GAMEPLAY:
+{format_death_analysis_section(turn_data)}
+
+INSTRUCTIONS:
+The knowledge base has these sections:
+{section_list}
+
+Revise ONLY the sections that the new gameplay changes. For each, output the header
+("## SECTION NAME") followed by the COMPLETE revised section: keep the existing points
+that still hold, correct ones the new gameplay contradicts, and add new universal
+principles. Omit sections that need no change. Do not output CROSS-EPISODE INSIGHTS.
+If the new gameplay teaches nothing new, reply with "SKIP: <reason>".
+
+Apply the same rules as the existing knowledge base:
+1. **Universal Scope**: ONLY knowledge that applies regardless of location
+2. **Principle Over Instance**: Extract the pattern, not the specific example
+3. **System Awareness**: Deaths at 20+ turns without score are Loop Break timeouts, not game mechanics
+4. **Brevity**: 1-3 sentences per insight, bullet points, no repetition across sections"""
+
+
+@observe(name="strategy-generate-incremental-update")
+def generate_knowledge_incrementally(
+    turn_data: Dict,
+    existing_knowledge: str,
+    summary: RollingSummary,
+    client,
+    analysis_model: str,
+    analysis_sampling: dict,
+    token_budget: int,
+    logger=None
+) -> str:
+    """
+    Generate revised knowledge base sections from the turns since the last update.
+
+    Args:
+        turn_data: Turns played since the last successful update
+        existing_knowledge: Current knowledge base (without CROSS-EPISODE INSIGHTS)
+        summary: Rolling summary of the turns already analyzed
+        client: LLM client wrapper instance
+        analysis_model: Model identifier for knowledge generation
+        analysis_sampling: Sampling parameters (temperature, top_p, top_k, min_p, max_tokens)
+        token_budget: Maximum estimated prompt tokens (oldest new actions are trimmed first)
+        logger: Optional logger instance for logging
+
+    Returns:
+        Markdown with only the revised "## " sections, "SKIP: ..." if nothing
+        changed, or an empty string on failure
+    """
+    prompt, budget_report = fit_prompt_to_budget(
+        lambda window, summary_text: build_incremental_prompt(
+            window, existing_knowledge, summary_text
+        ),
+        turn_data,
+        summary,
+        token_budget,
+    )
+
+    if logger:
+        logger.info(
+            f"Incremental knowledge prompt: ~{budget_report['estimated_tokens']} tokens "
+            f"for turns {turn_data['start_turn']}-{turn_data['end_turn']}",
+            extra={
+                "event_type": "knowledge_incremental_prompt",
+                "episode_id": turn_data["episode_id"],
+                "start_turn": turn_data["start_turn"],
+                "end_turn": turn_data["end_turn"],
+                "token_budget": token_budget,
+                **budget_report,
+            },
+        )
+
+    try:
+        messages = [
+            {"role": "system", "content": STRATEGY_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+
+        response = client.chat.completions.create(
+            model=analysis_model,
+            messages=messages,
+            temperature=analysis_sampling.get("temperature"),
+            top_p=analysis_sampling.get("top_p"),
+            top_k=analysis_sampling.get("top_k"),
+            min_p=analysis_sampling.get("min_p"),
+            max_tokens=analysis_sampling.get("max_tokens") or 2000,
+            name="StrategyGenerator",
+        )
+
+        return response.content.strip()
+
+    except Exception as e:
+        if logger:
+            logger.error(
+                f"Incremental knowledge generation failed: {e}",
+                extra={"event_type": "knowledge_update", "error": str(e)},
+            )
+        return ""
@@ -10,7 +10,7 @@ updating section content.
 """
 
 import re
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 
 def extract_section_content(knowledge_content: str, section_name: str) -> str:
@@ -32,7 +32,7 @@ def extract_section_content(knowledge_content: str, section_name: str) -> str:
         return ""
 
     # Look for the section heading followed by content until next section or end
-    pattern = rf"## {re.escape(section_name)}(.*?)(?=\n## |$)"
+    pattern = rf"## {re.escape(section_name)}(?=[ \t]*(?:\n|$))(.*?)(?=\n## |$)"
     match = re.search(pattern, knowledge_content, re.DOTALL)
 
     if match:
@@ -64,7 +64,7 @@ def update_section_content(
     section_header = f"## {section_name}"
 
     # Check if section exists
-    pattern = rf"## {re.escape(section_name)}(.*?)(?=\n## |$)"
+    pattern = rf"## {re.escape(section_name)}(?=[ \t]*(?:\n|$))(.*?)(?=\n## |$)"
     match = re.search(pattern, knowledge_content, re.DOTALL)
 
     if match:
@@ -78,6 +78,28 @@ def update_section_content(
         return f"{knowledge_content}\n\n{section_header}\n\n{new_content}\n"
 
 
+def split_sections(knowledge_content: str) -> Dict[str, str]:
+    """
+    Split knowledge base content into its ## sections.
+
+    Args:
+        knowledge_content: Full knowledge base markdown content
+
+    Returns:
+        Ordered mapping of section name to section content (stripped); text
+        before the first section header is not included
+    """
+    if not knowledge_content:
+        return {}
+
+    sections = {}
+    for match in re.finditer(
+        r"^## (.+?)[ \t]*(?:\n|\Z)(.*?)(?=\n## |\Z)", knowledge_content, re.DOTALL | re.MULTILINE
+    ):
+        sections.setdefault(match.group(1).strip(), match.group(2).strip())
+    return sections
+
+
 def remove_section(knowledge_content: str, section_name: str) -> str:
     """
     Remove a section from knowledge base content.
@@ -93,7 +115,7 @@ def remove_section(knowledge_content: str, section_name: str) -> str:
         return ""
 
     # Use regex pattern to match section header and all content until next section or end
-    pattern = rf"## {re.escape(section_name)}(.*?)(?=\n## |$)"
+    pattern = rf"## {re.escape(section_name)}(?=[ \t]*(?:\n|$))(.*?)(?=\n## |$)"
 
     # Remove the section (replaces with empty string)
     result = re.sub(pattern, "", knowledge_content, flags=re.DOTALL)
@@ -135,3 +157,32 @@ def extract_cross_episode_section(knowledge_content: str) -> str:
 """
 
     return ""
+
+
+def merge_concurrent_update(
+    base_content: str, our_content: str, their_content: str
+) -> Tuple[str, List[str]]:
+    """
+    Three-way merge of two revisions of the knowledge base, section by section.
+
+    Used when another process rewrote the file between our read (base) and our
+    write. Starting from their version, every section we changed or added
+    relative to base replaces theirs; sections we left alone, and sections we
+    dropped, keep their version.
+
+    Args:
+        base_content: Knowledge base as we read it
+        our_content: Our revision of base_content
+        their_content: Knowledge base as currently on disk
+
+    Returns:
+        (merged knowledge base, names of the sections taken from our revision)
+    """
+    base_sections = split_sections(base_content)
+    merged = their_content
+    taken = []
+    for name, content in split_sections(our_content).items():
+        if content and base_sections.get(name) != content:
+            merged = update_section_content(merged, name, content)
+            taken.append(name)
+    return merged, taken
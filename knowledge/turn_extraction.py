@@ -8,10 +8,23 @@ Provides utilities to extract turn-based data from episode log files,
 including actions, responses, score/location/inventory changes, and death events.
 """
 
-import json
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 
+from episode_log_index import ALL_EPISODES, get_log_index
+
+# Event types extract_turn_window_data reads; all other lines are never decoded
+WINDOW_EVENT_TYPES = (
+    "final_action_selection",
+    "zork_response",
+    "game_over",
+    "game_over_final",
+    "death_during_inventory",
+    "death_state_extracted",
+    "experience",
+    "extracted_info",
+)
+
 
 def get_episode_log_file(episode_id: str, workdir: str = "game_files") -> Path:
     """
@@ -85,149 +98,7 @@ def extract_turn_window_data(
         # Fall back to monolithic file for backward compatibility
         episode_log_file = Path(log_file)
 
-    try:
-        with open(episode_log_file, "r", encoding="utf-8") as f:
-            current_turn = 0
-            current_score = 0
-            current_location = ""
-
-            for line in f:
-                try:
-                    log_entry = json.loads(line.strip())
-
-                    # Skip entries not from this episode only if reading from monolithic file
-                    if (
-                        episode_log_file == Path(log_file)
-                        and log_entry.get("episode_id") != episode_id
-                    ):
-                        continue
-
-                    event_type = log_entry.get("event_type", "")
-
-                    # Track turn progression - always update current_turn for this episode
-                    if event_type == "turn_completed":
-                        current_turn = log_entry.get("turn", 0)
-                    elif event_type == "final_action_selection":
-                        # Also update turn from action selection as backup
-                        current_turn = log_entry.get("turn", current_turn)
-
-                    # Collect action-response pairs - but only within our turn window
-                    if event_type == "final_action_selection" and (
-                        start_turn <= current_turn <= end_turn
-                    ):
-                        action_data = {
-                            "turn": current_turn,
-                            "action": log_entry.get("agent_action", ""),
-                            "reasoning": log_entry.get("agent_reasoning", ""),
-                            "critic_score": log_entry.get("critic_score", 0),
-                            "response": "",  # Will be filled by next zork_response
-                        }
-                        turn_data["actions_and_responses"].append(action_data)
-
-                    elif (
-                        event_type == "zork_response"
-                        and turn_data["actions_and_responses"]
-                        and (start_turn <= current_turn <= end_turn)
-                    ):
-                        # Update the last action with its response
-                        response = log_entry.get("zork_response", "")
-                        turn_data["actions_and_responses"][-1]["response"] = (
-                            response
-                        )
-
-
-                    # Only collect data within our turn window for other events
-                    if not (start_turn <= current_turn <= end_turn):
-                        continue
-
-                    # Track death and game over events
-                    if event_type in [
-                        "game_over",
-                        "game_over_final",
-                        "death_during_inventory",
-                    ]:
-                        death_event = {
-                            "turn": current_turn,
-                            "event_type": event_type,
-                            "reason": log_entry.get("reason", ""),
-                            "action_taken": log_entry.get("action_taken", ""),
-                            "final_score": log_entry.get(
-                                "final_score", current_score
-                            ),
-                            "death_count": log_entry.get("death_count", 0),
-                        }
-
-                        # Add to both death_events and game_over_events for different analysis purposes
-                        turn_data["game_over_events"].append(death_event)
-
-                        # Check if this is specifically a death (vs victory)
-                        reason = log_entry.get("reason", "").lower()
-                        death_indicators = [
-                            "died",
-                            "death",
-                            "eaten",
-                            "grue",
-                            "killed",
-                            "fall",
-                            "crushed",
-                        ]
-                        if any(
-                            indicator in reason for indicator in death_indicators
-                        ):
-                            turn_data["death_events"].append(death_event)
-
-                    # Track death state extraction for context
-                    elif event_type == "death_state_extracted":
-                        extracted_info = log_entry.get("extracted_info", {})
-                        if extracted_info and turn_data["death_events"]:
-                            # Add extraction details to the most recent death event
-                            turn_data["death_events"][-1]["death_location"] = (
-                                extracted_info.get("current_location_name", "")
-                            )
-                            turn_data["death_events"][-1]["death_objects"] = (
-                                extracted_info.get("visible_objects", [])
-                            )
-                            # Note: death_messages field removed as important_messages
-                            # was eliminated from extractor to reduce LLM token cost
-
-                    # Track score changes
-                    elif event_type == "experience" and "zork_score" in log_entry:
-                        new_score = log_entry.get("zork_score", 0)
-                        if new_score != current_score:
-                            turn_data["score_changes"].append(
-                                {
-                                    "turn": current_turn,
-                                    "from_score": current_score,
-                                    "to_score": new_score,
-                                    "change": new_score - current_score,
-                                }
-                            )
-                            current_score = new_score
-
-                    # Track location changes
-                    elif event_type == "extracted_info":
-                        extracted_info = log_entry.get("extracted_info", {})
-                        new_location = extracted_info.get(
-                            "current_location_name", ""
-                        )
-                        if (
-                            new_location
-                            and new_location != current_location
-                            and new_location != "Unknown Location"
-                        ):
-                            turn_data["location_changes"].append(
-                                {
-                                    "turn": current_turn,
-                                    "from_location": current_location,
-                                    "to_location": new_location,
-                                }
-                            )
-                            current_location = new_location
-
-                except json.JSONDecodeError:
-                    continue
-
-    except FileNotFoundError:
+    if not episode_log_file.exists():
         if logger:
             logger.warning(
                 f"Log file not found: {episode_log_file}",
@@ -235,6 +106,115 @@ def extract_turn_window_data(
             )
         return None
 
+    # Entries from other episodes only share the monolithic fallback file
+    episode_filter = (
+        episode_id if episode_log_file == Path(log_file) else ALL_EPISODES
+    )
+
+    current_score = 0
+    current_location = ""
+
+    # The index seeks straight to the window and decodes only the events used below
+    entries = get_log_index(episode_log_file).iter_entries(
+        start_turn, end_turn, WINDOW_EVENT_TYPES, episode_id=episode_filter
+    )
+    for current_turn, log_entry in entries:
+        event_type = log_entry.get("event_type", "")
+
+        # Collect action-response pairs
+        if event_type == "final_action_selection":
+            action_data = {
+                "turn": current_turn,
+                "action": log_entry.get("agent_action", ""),
+                "reasoning": log_entry.get("agent_reasoning", ""),
+                "critic_score": log_entry.get("critic_score", 0),
+                "response": "",  # Will be filled by next zork_response
+            }
+            turn_data["actions_and_responses"].append(action_data)
+
+        elif event_type == "zork_response" and turn_data["actions_and_responses"]:
+            # Update the last action with its response
+            response = log_entry.get("zork_response", "")
+            turn_data["actions_and_responses"][-1]["response"] = response
+
+        # Track death and game over events
+        elif event_type in [
+            "game_over",
+            "game_over_final",
+            "death_during_inventory",
+        ]:
+            death_event = {
+                "turn": current_turn,
+                "event_type": event_type,
+                "reason": log_entry.get("reason", ""),
+                "action_taken": log_entry.get("action_taken", ""),
+                "final_score": log_entry.get("final_score", current_score),
+                "death_count": log_entry.get("death_count", 0),
+            }
+
+            # Add to both death_events and game_over_events for different analysis purposes
+            turn_data["game_over_events"].append(death_event)
+
+            # Check if this is specifically a death (vs victory)
+            reason = log_entry.get("reason", "").lower()
+            death_indicators = [
+                "died",
+                "death",
+                "eaten",
+                "grue",
+                "killed",
+                "fall",
+                "crushed",
+            ]
+            if any(indicator in reason for indicator in death_indicators):
+                turn_data["death_events"].append(death_event)
+
+        # Track death state extraction for context
+        elif event_type == "death_state_extracted":
+            extracted_info = log_entry.get("extracted_info", {})
+            if extracted_info and turn_data["death_events"]:
+                # Add extraction details to the most recent death event
+                turn_data["death_events"][-1]["death_location"] = (
+                    extracted_info.get("current_location_name", "")
+                )
+                turn_data["death_events"][-1]["death_objects"] = (
+                    extracted_info.get("visible_objects", [])
+                )
+                # Note: death_messages field removed as important_messages
+                # was eliminated from extractor to reduce LLM token cost
+
+        # Track score changes
+        elif event_type == "experience" and "zork_score" in log_entry:
+            new_score = log_entry.get("zork_score", 0)
+            if new_score != current_score:
+                turn_data["score_changes"].append(
+                    {
+                        "turn": current_turn,
+                        "from_score": current_score,
+                        "to_score": new_score,
+                        "change": new_score - current_score,
+                    }
+                )
+                current_score = new_score
+
+        # Track location changes
+        elif event_type == "extracted_info":
+            extracted_info = log_entry.get("extracted_info", {})
+            new_location = extracted_info.get("current_location_name", "")
+            if (
+                new_location
+                and new_location != current_location
+                and new_location != "Unknown Location"
+            ):
+                turn_data["location_changes"].append(
+                    {
+                        "turn": current_turn,
+                        "from_location": current_location,
+                        "to_location": new_location,
+                    }
+                )
+                current_location = new_location
+
     return turn_data if turn_data["actions_and_responses"] else None
 
 
@@ -256,16 +236,4 @@ def episode_ended_in_loop_break(episode_id: str, workdir: str = "game_files") ->
     if not episode_log_file.exists():
         return False
 
-    try:
-        with open(episode_log_file, "r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    log_entry = json.loads(line.strip())
-                    if log_entry.get("event_type") == "stuck_termination":
-                        return True
-                except json.JSONDecodeError:
-                    continue
-    except FileNotFoundError:
-        return False
-
-    return False
+    return get_log_index(episode_log_file).has_event("stuck_termination")
@@ -0,0 +1,388 @@
+"""
+Record/replay cassettes for LLM calls.
+
+A cassette is a JSONL file of LLM exchanges. In record mode LLMClient appends
+every request/response it completes; in replay mode it answers every call
+from the cassette without touching the network, so a full episode can be
+re-run deterministically and offline (for debugging, tests and benchmarks).
+
+Each entry is filed under a stream: the component name passed to the client
+("Agent", "Critic", ...) plus the title of the structured-output schema, since
+one component can make several kinds of call (the critic both scores actions
+and detects failures). Replay looks an entry up by:
+1. Exact match on the request key within the stream (same content address
+   as the response cache: model, messages, sampling parameters,
+   response_format)
+2. Otherwise the next unused entry of the stream, in recorded order, so a run
+   whose prompts drift slightly (timestamps, different map rendering) still
+   gets the responses in the order they were recorded
+3. Once a stream is used up, its last entry is repeated
+
+Only a call on a stream with no entries at all is a miss.
+
+CassetteServer serves a cassette over HTTP as an OpenAI-compatible
+/chat/completions endpoint, for driving a client (or another process) that
+is pointed at a base URL rather than configured for in-process replay.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from llm_response_cache import LLMResponseCache
+from session.game_configuration import GameConfiguration
+
+CASSETTE_MODES = ("off", "record", "replay")
+
+# Header LLMClient sends with the component name, only to a CassetteServer
+COMPONENT_HEADER = "X-ZorkGPT-Component"
+
+
+class CassetteMissError(Exception):
+    """Raised in replay mode when the cassette has nothing for a call's stream."""
+
+    pass
+
+
+def stream_name(component: Optional[str], response_format: Optional[Dict[str, Any]]) -> str:
+    """
+    Name the stream an exchange belongs to.
+
+    Args:
+        component: Component name passed to the client (e.g., "Critic")
+        response_format: Structured output schema, if any
+
+    Returns:
+        "<component>" or "<component>/<schema title>"
+    """
+    stream = component or "unnamed"
+    schema = ((response_format or {}).get("json_schema") or {}).get("schema") or {}
+    title = schema.get("title")
+    return f"{stream}/{title}" if title else stream
+
+
+class LLMCassette:
+    """
+    A recorded sequence of LLM exchanges, in record or replay mode.
+
+    Thread-safe: post-action jobs and batched calls reach the cassette from
+    worker threads.
+    """
+
+    def __init__(self, path: str, mode: str, logger=None):
+        """
+        Initialize the cassette.
+
+        Record mode starts a new (empty) cassette file; replay mode loads it.
+
+        Args:
+            path: Cassette JSONL file
+            mode: "record" or "replay"
+            logger: Logger instance for replay misses
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.logger = logger
+        self._lock = threading.Lock()
+
+        self._entries: List[Dict[str, Any]] = []
+        self._used: List[bool] = []
+        self._by_key: Dict[Tuple[str, str], List[int]] = {}
+        self._by_stream: Dict[str, List[int]] = {}
+        self._next_in_stream: Dict[str, int] = {}
+
+        # Counters
+        self.recorded = 0
+        self.exact_hits = 0
+        self.sequence_hits = 0
+        self.repeats = 0
+        self.misses = 0
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("", encoding="utf-8")
+        else:
+            self._load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(
+        self,
+        component: Optional[str],
+        key: str,
+        model: str,
+        messages: Any,
+        response_format: Optional[Dict[str, Any]],
+        content: str,
+        response_model: str,
+        usage: Optional[Dict[str, Any]],
+    ) -> None:
+        """Append one completed exchange to the cassette file (not kept in memory)."""
+        entry = {
+            "stream": stream_name(component, response_format),
+            "component": component,
+            "key": key,
+            "model": model,
+            "messages": messages,
+            "response": {"content": content, "model": response_model, "usage": usage},
+        }
+        line = json.dumps(entry, default=str, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self.recorded += 1
+
+    def replay(
+        self,
+        component: Optional[str],
+        key: Optional[str],
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Find the recorded response for a call.
+
+        Args:
+            component: Component name passed to the client
+            key: Request key (LLMResponseCache.make_key)
+            response_format: Structured output schema, if any
+
+        Returns:
+            Dict with "content", "model" and "usage"
+
+        Raises:
+            CassetteMissError: If the call's stream has no entries
+        """
+        stream = stream_name(component, response_format)
+        with self._lock:
+            index = self._take_exact(stream, key)
+            if index is not None:
+                self.exact_hits += 1
+            else:
+                index = self._take_next(stream)
+                if index is not None:
+                    self.sequence_hits += 1
+                elif self._by_stream.get(stream):
+                    index = self._by_stream[stream][-1]
+                    self.repeats += 1
+                else:
+                    self.misses += 1
+
+        if index is None:
+            if self.logger:
+                self.logger.warning(
+                    f"LLM cassette has no responses for {stream}",
+                    extra={"event_type": "llm_cassette_miss", "stream": stream},
+                )
+            raise CassetteMissError(f"No recorded responses for {stream} in {self.path}")
+        return dict(self._entries[index]["response"])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get record/replay counters for status reporting."""
+        return {
+            "mode": self.mode,
+            "path": str(self.path),
+            "entries": len(self._entries) if self.replaying else self.recorded,
+            "streams": {stream: len(indices) for stream, indices in self._by_stream.items()},
+            "recorded": self.recorded,
+            "exact_hits": self.exact_hits,
+            "sequence_hits": self.sequence_hits,
+            "repeats": self.repeats,
+            "misses": self.misses,
+        }
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    self._add(json.loads(line))
+
+    def _add(self, entry: Dict[str, Any]) -> None:
+        index = len(self._entries)
+        self._entries.append(entry)
+        self._used.append(False)
+        if entry.get("key"):
+            self._by_key.setdefault((entry["stream"], entry["key"]), []).append(index)
+        self._by_stream.setdefault(entry["stream"], []).append(index)
+
+    def _take_exact(self, stream: str, key: Optional[str]) -> Optional[int]:
+        for index in self._by_key.get((stream, key), ()) if key else ():
+            if not self._used[index]:
+                self._used[index] = True
+                return index
+        return None
+
+    def _take_next(self, stream: str) -> Optional[int]:
+        indices = self._by_stream.get(stream, [])
+        position = self._next_in_stream.get(stream, 0)
+        # Skip entries already consumed by exact matches
+        while position < len(indices) and self._used[indices[position]]:
+            position += 1
+        if position == len(indices):
+            self._next_in_stream[stream] = position
+            return None
+        self._used[indices[position]] = True
+        self._next_in_stream[stream] = position + 1
+        return indices[position]
+
+
+# One cassette per file, shared by every LLMClient in the process
+_cassettes: Dict[str, LLMCassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(config: GameConfiguration, logger=None) -> Optional[LLMCassette]:
+    """
+    Get the shared cassette for a configuration.
+
+    Args:
+        config: GameConfiguration instance
+        logger: Logger instance (used only when the cassette is first opened)
+
+    Returns:
+        LLMCassette, or None when llm_cassette_mode is "off"
+    """
+    if config.llm_cassette_mode == "off":
+        return None
+    if config.llm_cassette_mode not in CASSETTE_MODES:
+        raise ValueError(
+            f"llm_cassette_mode must be one of {CASSETTE_MODES}, got {config.llm_cassette_mode!r}"
+        )
+
+    path = str(Path(config.zork_game_workdir) / config.llm_cassette_file)
+    with _cassettes_lock:
+        cassette = _cassettes.get(path)
+        if cassette is None or cassette.mode != config.llm_cassette_mode:
+            cassette = LLMCassette(path, config.llm_cassette_mode, logger=logger)
+            _cassettes[path] = cassette
+        return cassette
+
+
+def close_cassettes() -> None:
+    """Forget all shared cassettes (e.g., in tests)."""
+    with _cassettes_lock:
+        _cassettes.clear()
+
+
+# Base URLs of the CassetteServers running in this process
+_server_urls: set = set()
+
+
+def is_cassette_server(base_url: str) -> bool:
+    """Check whether a base URL points at a CassetteServer running in this process."""
+    return any(base_url.startswith(url) for url in _server_urls)
+
+
+class _CassetteRequestHandler(BaseHTTPRequestHandler):
+    """Answers POST .../chat/completions from the server's cassette."""
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown endpoint {self.path}"}})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        model = payload.pop("model", "")
+        messages = payload.pop("messages", [])
+        response_format = payload.pop("response_format", None)
+        # Whatever remains is exactly the sampling dict LLMClient keys on
+        key = LLMResponseCache.make_key(model, messages, payload, response_format)
+
+        try:
+            response = self.server.cassette.replay(
+                self.headers.get(COMPONENT_HEADER), key, response_format
+            )
+        except CassetteMissError as e:
+            self._send_json(404, {"error": {"message": str(e)}})
+            return
+
+        self._send_json(
+            200,
+            {
+                "id": f"cassette-{key[:12]}",
+                "object": "chat.completion",
+                "model": response.get("model") or model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": response["content"]},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": response.get("usage"),
+            },
+        )
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Keep test and benchmark output quiet
+        pass
+
+
+class CassetteServer:
+    """
+    Local stand-in for an OpenAI-compatible endpoint, backed by a cassette.
+
+    Usage:
+        with CassetteServer(LLMCassette("run.jsonl", "replay")) as server:
+            client = LLMClient(config, base_url=server.base_url)
+    """
+
+    def __init__(self, cassette: LLMCassette, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (port 0 picks a free port).
+
+        Args:
+            cassette: Cassette in replay mode
+            host: Interface to bind
+            port: Port to bind
+        """
+        self.cassette = cassette
+        self._httpd = ThreadingHTTPServer((host, port), _CassetteRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.cassette = cassette
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "CassetteServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="llm-cassette-server", daemon=True
+        )
+        self._thread.start()
+        _server_urls.add(self.base_url)
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        _server_urls.discard(self.base_url)
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "CassetteServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
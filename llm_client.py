@@ -5,13 +5,20 @@ This module replaces the OpenAI SDK to enable fine-tuned control over sampling
 parameters like top_k, min_p, etc. that are not supported by the OpenAI SDK.
 """
 
+import contextlib
 import requests
 import random
+import threading
 import time
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 from session.game_configuration import GameConfiguration
+from llm_cassette import COMPONENT_HEADER, get_cassette, is_cassette_server
+from llm_response_cache import LLMResponseCache, get_response_cache, is_cacheable
+from prompt_cache import get_prompt_cache_stats
+from shared_store import get_request_limiter
 
 # Default max_tokens for reasoning models (DeepSeek R1, QwQ, o1/o3)
 #
@@ -35,6 +42,45 @@ except ImportError:
     LANGFUSE_AVAILABLE = False
 
 
+# Pooled HTTP sessions, one per LLM endpoint.
+#
+# Every component (agent, critic, extractor, memory, objectives) talks to one
+# of a handful of base URLs. Sharing a keep-alive Session per base URL lets
+# those calls reuse TCP/TLS connections instead of handshaking on every turn.
+_http_sessions: Dict[str, requests.Session] = {}
+_http_sessions_lock = threading.Lock()
+
+
+def get_http_session(base_url: str, pool_maxsize: int = 8) -> requests.Session:
+    """
+    Get the shared keep-alive session for an LLM endpoint.
+
+    Args:
+        base_url: Endpoint base URL (e.g., from get_llm_base_url_for_model)
+        pool_maxsize: Connections to keep open for this endpoint
+
+    Returns:
+        requests.Session shared by all clients using this base URL
+    """
+    with _http_sessions_lock:
+        session = _http_sessions.get(base_url)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _http_sessions[base_url] = session
+        return session
+
+
+def close_http_sessions() -> None:
+    """Close all pooled sessions (e.g., at process shutdown or in tests)."""
+    with _http_sessions_lock:
+        for session in _http_sessions.values():
+            session.close()
+        _http_sessions.clear()
+
+
 @dataclass
 class LLMResponse:
     """Response object for LLM completions."""
@@ -97,39 +143,45 @@ class CircuitBreaker:
         self.state = CircuitState.CLOSED
         self.last_failure_time = 0.0
 
+        # Batched calls record outcomes from several worker threads
+        self._lock = threading.Lock()
+
     def call_succeeded(self):
         """Record a successful call."""
-        if self.state == CircuitState.HALF_OPEN:
-            self.success_count += 1
-            if self.success_count >= self.success_threshold:
-                self._close_circuit()
-        elif self.state == CircuitState.CLOSED:
-            # Reset failure count on success
-            self.failure_count = 0
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN:
+                self.success_count += 1
+                if self.success_count >= self.success_threshold:
+                    self._close_circuit()
+            elif self.state == CircuitState.CLOSED:
+                # Reset failure count on success
+                self.failure_count = 0
 
     def call_failed(self):
         """Record a failed call."""
-        self.failure_count += 1
-        self.success_count = 0  # Reset success count
-        self.last_failure_time = time.time()
+        with self._lock:
+            self.failure_count += 1
+            self.success_count = 0  # Reset success count
+            self.last_failure_time = time.time()
 
-        if self.failure_count >= self.failure_threshold:
-            self._open_circuit()
+            if self.failure_count >= self.failure_threshold:
+                self._open_circuit()
 
     def can_execute(self) -> bool:
         """Check if a call can be executed."""
-        if self.state == CircuitState.CLOSED:
-            return True
-        elif self.state == CircuitState.OPEN:
-            # Check if recovery timeout has passed
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
-                self._half_open_circuit()
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+            elif self.state == CircuitState.OPEN:
+                # Check if recovery timeout has passed
+                if time.time() - self.last_failure_time >= self.recovery_timeout:
+                    self._half_open_circuit()
+                    return True
+                return False
+            elif self.state == CircuitState.HALF_OPEN:
                 return True
-            return False
-        elif self.state == CircuitState.HALF_OPEN:
-            return True
 
-        return False
+            return False
 
     def _close_circuit(self):
         """Close the circuit (normal operation)."""
@@ -183,6 +235,21 @@ class LLMClient:
         self.retry_config = config.retry
         self.logger = logger
 
+        # Keep-alive session shared with every client on the same endpoint
+        self.session = get_http_session(self.base_url, config.llm_http_pool_maxsize)
+
+        # Shared content-addressed response cache (None when disabled)
+        self.response_cache = get_response_cache(config, logger)
+
+        # Cross-process request cap and rate-limit cooldown (None when disabled)
+        self.request_limiter = get_request_limiter(config)
+
+        # Record/replay cassette (None when llm_cassette_mode is "off")
+        self.cassette = get_cassette(config, logger)
+
+        # Provider-reported prompt cache hits, totaled per component
+        self.prompt_cache_stats = get_prompt_cache_stats()
+
         # Initialize circuit breaker if enabled
         if self.retry_config["circuit_breaker_enabled"]:
             self.circuit_breaker = CircuitBreaker(
@@ -334,6 +401,48 @@ class LLMClient:
         Returns:
             LLMResponse object with the generated content
         """
+        use_cache = bool(self.response_cache) and is_cacheable(self.config, name, temperature)
+        request_key = None
+        if use_cache or self.cassette:
+            request_key = LLMResponseCache.make_key(
+                model=model,
+                messages=messages,
+                sampling={
+                    "temperature": temperature,
+                    "top_p": top_p,
+                    "top_k": top_k,
+                    "min_p": min_p,
+                    "max_tokens": max_tokens,
+                    "stop": stop,
+                    **kwargs,
+                },
+                response_format=response_format,
+            )
+
+        # Replay answers every call offline, ahead of the cache and the network
+        if self.cassette and self.cassette.replaying:
+            return LLMResponse(**self.cassette.replay(name, request_key, response_format))
+
+        # Serve byte-identical requests from the response cache
+        cache_key = request_key if use_cache else None
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                if self.logger:
+                    self.logger.debug(
+                        f"LLM response cache hit for {name}",
+                        extra={
+                            "extras": {
+                                "event_type": "llm_cache_hit",
+                                "component": name,
+                                "model": model,
+                            }
+                        },
+                    )
+                result = LLMResponse(**cached)
+                self._record_exchange(name, request_key, model, messages, response_format, result)
+                return result
+
         # Check circuit breaker
         if self.circuit_breaker and not self.circuit_breaker.can_execute():
             error_msg = (
@@ -359,25 +468,38 @@ class LLMClient:
             self.retry_config["max_retries"] + 1
         ):  # +1 for initial attempt
             try:
-                result = self._make_request(
-                    model=model,
-                    messages=messages,
-                    temperature=temperature,
-                    top_p=top_p,
-                    top_k=top_k,
-                    min_p=min_p,
-                    max_tokens=max_tokens,
-                    stop=stop,
-                    response_format=response_format,
-                    extra_headers=extra_headers,
-                    name=name,
-                    **kwargs,
-                )
+                with (
+                    self.request_limiter.slot()
+                    if self.request_limiter
+                    else contextlib.nullcontext()
+                ):
+                    result = self._make_request(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        top_p=top_p,
+                        top_k=top_k,
+                        min_p=min_p,
+                        max_tokens=max_tokens,
+                        stop=stop,
+                        response_format=response_format,
+                        extra_headers=extra_headers,
+                        name=name,
+                        **kwargs,
+                    )
 
                 # Record success in circuit breaker
                 if self.circuit_breaker:
                     self.circuit_breaker.call_succeeded()
 
+                if cache_key:
+                    self.response_cache.put(
+                        cache_key, result.content, result.model, result.usage
+                    )
+
+                self.prompt_cache_stats.record(name, self._extract_usage_details(result.usage))
+
+                self._record_exchange(name, request_key, model, messages, response_format, result)
                 return result
 
             except RetryableError as e:
@@ -394,6 +516,10 @@ class LLMClient:
                 # Calculate backoff delay
                 delay = self._calculate_backoff_delay(attempt)
 
+                # Make every process sharing the limiter back off, not just this one
+                if self.request_limiter and isinstance(e, RateLimitError):
+                    self.request_limiter.note_rate_limit(delay)
+
                 # Log retry attempt with proper logging if available
                 retry_msg = f"API call failed (attempt {attempt + 1}/{self.retry_config['max_retries'] + 1}): {e}"
                 backoff_msg = f"Retrying in {delay:.2f} seconds..."
@@ -438,6 +564,31 @@ class LLMClient:
             f"LLM API request failed after {self.retry_config['max_retries'] + 1} attempts. Last error: {last_exception}"
         )
 
+    def _record_exchange(
+        self,
+        name: Optional[str],
+        request_key: Optional[str],
+        model: str,
+        messages: List[Dict[str, str]],
+        response_format: Optional[Dict[str, Any]],
+        result: "LLMResponse",
+    ) -> None:
+        """Append a completed call to the cassette when recording."""
+        if not self.cassette or self.cassette.replaying:
+            return
+        try:
+            self.cassette.record(
+                name, request_key, model, messages, response_format,
+                result.content, result.model, result.usage,
+            )
+        except OSError as e:
+            # A recording failure must never fail the call itself
+            if self.logger:
+                self.logger.warning(
+                    f"Failed to record LLM exchange: {e}",
+                    extra={"extras": {"event_type": "llm_cassette_record_failed", "error": str(e)}},
+                )
+
     def _make_request(
         self,
         model: str,
@@ -463,6 +614,9 @@ class LLMClient:
 
         # Add default headers
         headers.update(self.default_headers)
+        # Only a CassetteServer needs the component; real providers never see it
+        if name and is_cassette_server(self.base_url):
+            headers[COMPONENT_HEADER] = name
 
         # Add any extra headers (will override defaults if same key)
         if extra_headers:
@@ -614,6 +768,10 @@ class LLMClient:
            - cache_creation_input_tokens (tokens written to cache)
            - cache_read_input_tokens (tokens read from cache)
 
+        3. Cache hits reported by other providers, as cache_read_input_tokens:
+           - prompt_tokens_details.cached_tokens (OpenAI, OpenRouter)
+           - prompt_cache_hit_tokens (DeepSeek)
+
         Edge cases handled:
         - None or empty usage: Returns None
         - Invalid types (string, int, list, etc.): Returns None with warning
@@ -702,6 +860,12 @@ class LLMClient:
             usage_details["cache_creation_input_tokens"] = usage["cache_creation_input_tokens"]
         if "cache_read_input_tokens" in usage:
             usage_details["cache_read_input_tokens"] = usage["cache_read_input_tokens"]
+        else:
+            prompt_details = usage.get("prompt_tokens_details")
+            if isinstance(prompt_details, dict) and "cached_tokens" in prompt_details:
+                usage_details["cache_read_input_tokens"] = prompt_details["cached_tokens"]
+            elif "prompt_cache_hit_tokens" in usage:
+                usage_details["cache_read_input_tokens"] = usage["prompt_cache_hit_tokens"]
 
         # Return None if no fields were extracted (empty usage dict or all unknown fields)
         return usage_details if usage_details else None
@@ -727,7 +891,7 @@ class LLMClient:
             LLMResponse with content and usage information
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 headers=headers,
                 json=payload,
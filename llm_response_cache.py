@@ -0,0 +1,348 @@
+"""
+Content-addressed response cache for LLM calls.
+
+Episodes repeatedly send byte-identical prompts: extractor prompts for the
+same room description, critic evaluations of the same action in the same
+state. This module lets LLMClient answer those from a cache instead of
+making another API round-trip.
+
+Entries are keyed on a SHA-256 of (model, messages, sampling parameters,
+response_format) and stored in two tiers:
+- An in-memory LRU for hits within a run
+- A SQLite file under zork_game_workdir that persists across episodes
+
+Both tiers honour a TTL; the disk tier is capped by entry count and evicts
+least-recently-used rows first.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from session.game_configuration import GameConfiguration
+
+# Components whose output is sampled for exploration rather than evaluated.
+# Even when opted in, they are only cached for greedy (temperature 0) calls,
+# otherwise a cache hit would silently remove the intended randomness.
+SAMPLING_SENSITIVE_COMPONENTS = {"Agent"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    model TEXT NOT NULL,
+    usage TEXT,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+class LLMResponseCache:
+    """
+    Two-tier (memory LRU + SQLite) cache of LLM completions.
+
+    Thread-safe: one instance is shared by every LLMClient in the process,
+    including batched calls running on worker threads.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str],
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_memory_entries: int = 512,
+        max_disk_entries: int = 20000,
+        logger=None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: SQLite file for the persistent tier (None = memory only)
+            ttl_seconds: Entry lifetime; 0 or less disables expiry
+            max_memory_entries: Capacity of the in-memory LRU tier
+            max_disk_entries: Row cap for the SQLite tier
+            logger: Logger instance for eviction/open failures
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.logger = logger
+
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_entries = 0
+
+        # Counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        if db_path:
+            self._open_db(db_path)
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: Any,
+        sampling: Dict[str, Any],
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build the content address for a request.
+
+        Args:
+            model: Model name
+            messages: Chat messages exactly as sent
+            sampling: Sampling parameters (None values are dropped)
+            response_format: Structured output schema, if any
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        material = {
+            "model": model,
+            "messages": messages,
+            "sampling": {k: v for k, v in sampling.items() if v is not None},
+            "response_format": response_format,
+        }
+        encoded = json.dumps(material, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Returns:
+            Dict with "content", "model" and "usage", or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, payload = entry
+                if not self._expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return payload
+                del self._memory[key]
+
+            payload = self._disk_get(key, now)
+            if payload is not None:
+                self.disk_hits += 1
+                return payload
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, content: str, model: str, usage: Optional[Dict[str, Any]]) -> None:
+        """Store a successful response in both tiers."""
+        now = time.time()
+        payload = {"content": content, "model": model, "usage": usage}
+        with self._lock:
+            self._memory_put(key, now, payload)
+            self._disk_put(key, now, payload)
+            self.stores += 1
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+                self._disk_entries = 0
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for status reporting."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory),
+            "disk_entries": self._disk_entries,
+            "persistent": self._conn is not None,
+        }
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def _memory_put(self, key: str, created_at: float, payload: Dict[str, Any]) -> None:
+        self._memory[key] = (created_at, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _open_db(self, db_path: str) -> None:
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)"
+            )
+            if self.ttl_seconds > 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (time.time() - self.ttl_seconds,),
+                )
+            self._conn.commit()
+            self._disk_entries = self._conn.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+        except sqlite3.Error as e:
+            self._conn = None
+            if self.logger:
+                self.logger.warning(
+                    f"LLM response cache disk tier unavailable, using memory only: {e}",
+                    extra={"event_type": "llm_cache_disk_unavailable", "db_path": db_path},
+                )
+
+    def _disk_get(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT content, model, usage, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        content, model, usage, created_at = row
+        if self._expired(created_at, now):
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            self._disk_entries -= 1
+            return None
+
+        self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        payload = {
+            "content": content,
+            "model": model,
+            "usage": json.loads(usage) if usage else None,
+        }
+        self._memory_put(key, created_at, payload)
+        return payload
+
+    def _disk_put(self, key: str, now: float, payload: Dict[str, Any]) -> None:
+        if self._conn is None:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, content, model, usage, created_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                payload["content"],
+                payload["model"],
+                json.dumps(payload["usage"]) if payload["usage"] else None,
+                now,
+                now,
+            ),
+        )
+        # Over-counts replaced keys; corrected by the exact recount at the cap
+        self._disk_entries += 1
+        if self._disk_entries > self.max_disk_entries:
+            self._disk_entries = self._conn.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+            overflow = self._disk_entries - self.max_disk_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self._disk_entries -= overflow
+                self.evictions += overflow
+        self._conn.commit()
+
+
+# One cache per database file, shared by every LLMClient in the process
+_response_caches: Dict[str, LLMResponseCache] = {}
+_response_caches_lock = threading.Lock()
+
+
+def get_response_cache(config: GameConfiguration, logger=None) -> Optional[LLMResponseCache]:
+    """
+    Get the shared response cache for a configuration.
+
+    Args:
+        config: GameConfiguration instance
+        logger: Logger instance (used only when the cache is first created)
+
+    Returns:
+        LLMResponseCache, or None when caching is disabled
+    """
+    if not config.llm_cache_enabled:
+        return None
+
+    db_path = (
+        str(Path(config.zork_game_workdir) / config.llm_cache_file)
+        if config.llm_cache_file
+        else ""
+    )
+    with _response_caches_lock:
+        cache = _response_caches.get(db_path)
+        if cache is None:
+            cache = LLMResponseCache(
+                db_path=db_path or None,
+                ttl_seconds=config.llm_cache_ttl_seconds,
+                max_memory_entries=config.llm_cache_max_memory_entries,
+                max_disk_entries=config.llm_cache_max_disk_entries,
+                logger=logger,
+            )
+            _response_caches[db_path] = cache
+        return cache
+
+
+def close_response_caches() -> None:
+    """Close and forget all shared caches (e.g., in tests)."""
+    with _response_caches_lock:
+        for cache in _response_caches.values():
+            cache.close()
+        _response_caches.clear()
+
+
+def is_cacheable(
+    config: GameConfiguration, name: Optional[str], temperature: Optional[float]
+) -> bool:
+    """
+    Decide whether a call from a component may use the cache.
+
+    Args:
+        config: GameConfiguration instance
+        name: Component name passed to chat_completions_create (e.g., "Critic")
+        temperature: Sampling temperature of the call (None: provider default)
+
+    Returns:
+        True if the component opted in (and, for sampling-sensitive
+        components, the call explicitly uses temperature 0)
+    """
+    if not name or name not in config.llm_cache_components:
+        return False
+    # None means the provider default, which is not greedy
+    if name in SAMPLING_SENSITIVE_COMPONENTS and temperature != 0:
+        return False
+    return True
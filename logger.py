@@ -1,7 +1,10 @@
 import json
 import logging
+import os
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from episode_log_index import get_log_index
 
 
 class JSONFormatter(logging.Formatter):
@@ -175,6 +178,43 @@ class FilteringFileHandler(logging.FileHandler):
             self.handleError(record)
 
 
+class IndexedJSONFileHandler(logging.FileHandler):
+    """
+    JSON file handler that records each line's byte offset in the shared
+    EpisodeLogIndex for the file as it writes, so readers can seek straight to
+    a turn window or event type without re-reading the log.
+    """
+
+    def __init__(self, filename, mode="a", encoding="utf-8"):
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self.log_index = get_log_index(self.baseFilename)
+
+    def emit(self, record):
+        try:
+            line = self.format(record) + self.terminator
+            data = line.encode(self.encoding or "utf-8")
+            turn = getattr(record, "turn", None)
+
+            with self.log_index.lock:
+                # Index anything written before this handler opened the file
+                self.log_index.refresh()
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.flush()
+                offset = os.fstat(self.stream.fileno()).st_size
+                self.stream.write(line)
+                self.flush()
+                self.log_index.add_line(
+                    offset,
+                    len(data),
+                    getattr(record, "event_type", ""),
+                    getattr(record, "episode_id", None),
+                    turn if isinstance(turn, int) else None,
+                )
+        except Exception:
+            self.handleError(record)
+
+
 def setup_logging(
     episode_log_file: str, json_log_file: str, log_level: int = logging.INFO
 ):
@@ -204,7 +244,7 @@ def setup_logging(
     logger.addHandler(file_handler)
 
     # JSON file handler
-    json_handler = logging.FileHandler(json_log_file, mode="a", encoding="utf-8")
+    json_handler = IndexedJSONFileHandler(json_log_file, mode="a", encoding="utf-8")
     json_handler.setLevel(log_level)
     json_handler.setFormatter(JSONFormatter())
     json_handler.is_json_handler = True  # Mark for identification
@@ -249,8 +289,8 @@ def setup_episode_logging(
             logger.removeHandler(handler)
             handler.close()
 
-    # Create episode-specific JSON handler
-    json_handler = logging.FileHandler(episode_log_file, mode="a", encoding="utf-8")
+    # Create episode-specific JSON handler (maintains the episode log index)
+    json_handler = IndexedJSONFileHandler(episode_log_file, mode="a", encoding="utf-8")
     json_handler.setFormatter(JSONFormatter())
     json_handler.setLevel(log_level)
     json_handler.is_json_handler = True  # Mark for identification
@@ -285,22 +325,42 @@ def parse_episode_logs(
     Returns:
         List of log entries for the episode
     """
+    return list(iter_episode_logs(episode_id, workdir))
+
+
+def iter_episode_logs(
+    episode_id: str,
+    workdir: str = "game_files",
+    start_turn: Optional[int] = None,
+    end_turn: Optional[int] = None,
+    event_types: Optional[Iterable[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream log entries from a specific episode without loading the whole log.
+
+    Uses the episode log index to seek to the requested turn window and to
+    decode only lines of the requested event types.
+
+    Args:
+        episode_id: The episode identifier
+        workdir: Working directory for game files
+        start_turn: First turn to include (None for the beginning)
+        end_turn: Last turn to include (None for the end)
+        event_types: Only yield entries with these event types (None for all)
+
+    Yields:
+        Log entries in file order
+    """
     from pathlib import Path
 
     episode_log_file = Path(workdir) / "episodes" / episode_id / "episode_log.jsonl"
 
     if not episode_log_file.exists():
-        return []
+        return
 
-    logs = []
     try:
-        with open(episode_log_file, "r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    logs.append(json.loads(line.strip()))
-                except json.JSONDecodeError:
-                    continue
+        index = get_log_index(episode_log_file)
+        for _, entry in index.iter_entries(start_turn, end_turn, event_types):
+            yield entry
     except IOError:
-        pass
-
-    return logs
+        return
@@ -0,0 +1,159 @@
+"""
+Loop detection over a stream of game states or actions.
+
+LoopDetector keeps the last `window` keys (state digests, action strings) in
+a deque, plus a dict from key to the turn it was first and last seen while
+inside the window. Each observation is O(1) in the window size:
+
+- revisit: the key is already in the window (an exact return to an earlier
+  state); the distance since it was last seen is the loop length
+- cycle: the newest keys repeat with period k (e.g. "north, south, north,
+  south" has k=2), checked for k in [min_cycle_length, max_cycle_length]
+  by comparing the last 2k keys
+
+StateManager feeds it JerichoInterface.get_state_digest() once per turn;
+ContextManager.detect_loops_in_recent_actions uses find_cycle on the action
+history.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Hashable, Optional, Sequence
+
+
+def find_cycle(
+    items: Sequence[Any], min_length: int = 1, max_length: int = 4
+) -> Optional[int]:
+    """
+    Find the shortest period k such that the last k items repeat the k before them.
+
+    Args:
+        items: Sequence supporting negative indexing (list or deque), newest last
+        min_length: Shortest period to check
+        max_length: Longest period to check
+
+    Returns:
+        The period, or None if the newest items do not repeat
+    """
+    for k in range(max(1, min_length), max_length + 1):
+        if len(items) < 2 * k:
+            break
+        if all(items[-i] == items[-i - k] for i in range(1, k + 1)):
+            return k
+    return None
+
+
+@dataclass
+class LoopObservation:
+    """Result of observing one key."""
+
+    key: Hashable
+    turn: int
+    revisit: bool = False
+    first_seen_turn: Optional[int] = None
+    last_seen_turn: Optional[int] = None
+    cycle_length: Optional[int] = None
+
+    @property
+    def revisit_distance(self) -> Optional[int]:
+        """Turns since the key was last seen (None for a new key)."""
+        if self.last_seen_turn is None:
+            return None
+        return self.turn - self.last_seen_turn
+
+
+class LoopDetector:
+    """
+    Rolling-window revisit and cycle detection with O(1) membership checks.
+
+    Usage:
+        detector = LoopDetector(window=1000)
+        observation = detector.observe(digest, turn)
+        if observation.revisit: ...
+    """
+
+    def __init__(self, window: int = 1000, min_cycle_length: int = 1, max_cycle_length: int = 4):
+        """
+        Initialize the detector.
+
+        Args:
+            window: Keys remembered for revisit detection
+            min_cycle_length: Shortest period reported as a cycle
+            max_cycle_length: Longest period reported as a cycle
+        """
+        self.window = window
+        self.min_cycle_length = min_cycle_length
+        self.max_cycle_length = max_cycle_length
+        self.history: Deque[Hashable] = deque()
+        self._first_seen: Dict[Hashable, int] = {}
+        self._last_seen: Dict[Hashable, int] = {}
+        self._counts: Dict[Hashable, int] = {}
+        self._turn = 0
+        self.revisits = 0
+        self.cycles = 0
+
+    def __len__(self) -> int:
+        return len(self.history)
+
+    def observe(self, key: Hashable, turn: Optional[int] = None) -> LoopObservation:
+        """
+        Record a key and report whether it closes a loop.
+
+        Args:
+            key: State digest, action, or any hashable
+            turn: Turn number (defaults to a running count of observations)
+
+        Returns:
+            LoopObservation for this key
+        """
+        self._turn = turn if turn is not None else self._turn + 1
+        observation = LoopObservation(key=key, turn=self._turn)
+
+        if key in self._counts:
+            observation.revisit = True
+            observation.first_seen_turn = self._first_seen[key]
+            observation.last_seen_turn = self._last_seen[key]
+            self.revisits += 1
+
+        self.history.append(key)
+        self._counts[key] = self._counts.get(key, 0) + 1
+        self._first_seen.setdefault(key, self._turn)
+        self._last_seen[key] = self._turn
+        if len(self.history) > self.window:
+            self._evict(self.history.popleft())
+
+        observation.cycle_length = find_cycle(
+            self.history, self.min_cycle_length, self.max_cycle_length
+        )
+        if observation.cycle_length:
+            self.cycles += 1
+        return observation
+
+    def reset(self) -> None:
+        """Forget all keys (e.g., at the start of an episode)."""
+        self.history.clear()
+        self._first_seen.clear()
+        self._last_seen.clear()
+        self._counts.clear()
+        self._turn = 0
+        self.revisits = 0
+        self.cycles = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters for status reporting."""
+        return {
+            "window": self.window,
+            "tracked": len(self.history),
+            "unique": len(self._counts),
+            "revisits": self.revisits,
+            "cycles": self.cycles,
+        }
+
+    def _evict(self, key: Hashable) -> None:
+        remaining = self._counts[key] - 1
+        if remaining:
+            self._counts[key] = remaining
+        else:
+            del self._counts[key]
+            del self._first_seen[key]
+            del self._last_seen[key]
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
-from orchestration import ZorkOrchestratorV2
+from episode_finalization import get_episode_finalizer
+from orchestration import ParallelEpisodeRunner, ZorkOrchestratorV2
+from session.game_configuration import GameConfiguration
 import time
 import argparse
 import signal
@@ -73,10 +75,12 @@ def run_episode(episode_id=None, max_turns=None):
                     final_score = orchestrator.game_state.previous_zork_score
                     print("  ⚠ Jericho not running, using last known score")
 
-                # Finalize episode (knowledge synthesis, etc.)
+                # Finalize episode (knowledge synthesis, etc.); inline, since
+                # the process is about to exit
                 orchestrator.episode_synthesizer.finalize_episode(
                     final_score=final_score,
                     critic_confidence_history=orchestrator.critic_confidence_history,
+                    background=False,
                 )
                 print("  ✓ Episode finalized")
 
@@ -146,7 +150,9 @@ def run_episode(episode_id=None, max_turns=None):
         final_update_eligible = turns_since_last >= min_final_threshold
 
         print(f"  - Regular knowledge updates: {regular_updates}")
-        if final_update_eligible:
+        if get_episode_finalizer().has_pending():
+            print("  - Final update: ⏳ (running in the background)")
+        elif final_update_eligible:
             print(f"  - Final update: ✅ (analyzed {turns_since_last} turns)")
         else:
             print(
@@ -159,7 +165,10 @@ def run_episode(episode_id=None, max_turns=None):
         for manager_name, manager_status in status["managers"].items():
             print(f"  - {manager_name}: {manager_status.get('component', 'N/A')}")
 
-        # Show the final knowledge base
+        # Show the final knowledge base (unless it is still being updated)
+        if get_episode_finalizer().has_pending():
+            print("\n📚 Final knowledge base update is still running in the background")
+            return
         try:
             knowledge_path = Path(orchestrator.config.zork_game_workdir) / orchestrator.config.knowledge_file
             with open(knowledge_path, "r") as f:
@@ -177,6 +186,35 @@ def run_episode(episode_id=None, max_turns=None):
             print("\n📚 No knowledge base file found")
 
 
+def run_parallel_episodes(num_episodes, workers, max_turns=None):
+    """Run a batch of episodes concurrently, one process per episode."""
+    config = GameConfiguration.from_toml()
+    runner = ParallelEpisodeRunner(config, max_workers=workers, max_turns=max_turns)
+
+    print(f"⚡ Running {num_episodes} episodes, {runner.max_workers} at a time", flush=True)
+    if config.llm_shared_request_slots:
+        print(f"  - Shared LLM request slots: {config.llm_shared_request_slots}", flush=True)
+    else:
+        print("  - ⚠ llm shared_request_slots is 0: workers do not coordinate rate limits", flush=True)
+
+    def report(result):
+        if result["error"] is None:
+            print(
+                f"🎯 Episode {result['episode_id']} complete: score {result['score']}, "
+                f"{result['turns']} turns",
+                flush=True,
+            )
+        else:
+            print(f"❌ Episode {result['episode_id']} failed: {result['error']}", flush=True)
+
+    results = runner.run(num_episodes, on_result=report)
+    completed = [r for r in results if r["error"] is None]
+    print(f"\n✅ {len(completed)} of {len(results)} episodes completed", flush=True)
+    if completed:
+        print(f"  - Scores: {[r['score'] for r in completed]}", flush=True)
+    return results
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run ZorkGPT episodes")
     parser.add_argument(
@@ -191,6 +229,15 @@ if __name__ == "__main__":
     parser.add_argument(
         "--episodes", type=int, default=1, help="Number of episodes to run"
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        nargs="?",
+        const=0,
+        default=None,
+        help="Run episodes concurrently, N at a time "
+        "(bare --parallel uses orchestrator.max_parallel_episodes)",
+    )
 
     args = parser.parse_args()
 
@@ -208,7 +255,22 @@ if __name__ == "__main__":
         print(f"📏 Max turns per episode: {args.max_turns}", flush=True)
     print(flush=True)
 
-    if args.continuous:
+    if args.parallel is not None:
+        # Parallel mode: batches of episodes, one process each
+        workers = args.parallel or None
+        try:
+            if args.continuous:
+                while True:
+                    run_parallel_episodes(
+                        workers or GameConfiguration.from_toml().max_parallel_episodes,
+                        workers,
+                        args.max_turns,
+                    )
+            else:
+                run_parallel_episodes(args.episodes, workers, args.max_turns)
+        except KeyboardInterrupt:
+            print("\n\n🛑 Parallel mode interrupted by user (Ctrl-C)")
+    elif args.continuous:
         # Continuous mode
         try:
             while True:
@@ -253,3 +315,9 @@ if __name__ == "__main__":
             import traceback
 
             traceback.print_exc()
+
+    # Let a background episode finalization finish before the process exits
+    finalizer = get_episode_finalizer()
+    if finalizer.has_pending():
+        print("⏳ Waiting for episode finalization to finish...", flush=True)
+        finalizer.wait("process_exit")
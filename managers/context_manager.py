@@ -16,6 +16,8 @@ from datetime import datetime
 from managers.base_manager import BaseManager
 from session.game_state import GameState
 from session.game_configuration import GameConfiguration
+from token_budget import ContextBudgeter, ContextSection
+from loop_detector import find_cycle
 
 
 class ContextManager(BaseManager):
@@ -35,6 +37,8 @@ class ContextManager(BaseManager):
         super().__init__(logger, config, game_state, "context_manager")
         self.simple_memory = None  # Injected by orchestrator
         self.room_description_age_window = config.room_description_age_window if config else 10
+        # Report from the last agent context fitted to a token budget
+        self.last_context_budget: Dict[str, Any] = {}
 
     def reset_episode(self) -> None:
         """Reset context manager state for a new episode."""
@@ -154,6 +158,15 @@ class ContextManager(BaseManager):
                 except Exception:
                     context["available_exits"] = []
 
+            # Add route to the nearest room with unexplored exits
+            if game_map and location_id is not None and self.config.enable_route_hint:
+                try:
+                    route_hint = game_map.describe_route_to_unexplored(location_id)
+                    if route_hint:
+                        context["route_to_unexplored"] = route_hint
+                except Exception as e:
+                    self.log_warning(f"Failed to get route to unexplored exits: {e}")
+
             # Add room transition context
             context["previous_room"] = self.game_state.prev_room_for_prompt_context
             context["action_to_current_room"] = (
@@ -214,10 +227,15 @@ class ContextManager(BaseManager):
                 context["room_description"] = room_desc["text"]
                 context["room_description_age"] = room_desc["turns_ago"]
 
-            # Add current map as mermaid diagram
+            # Add current map as mermaid diagram (only the nearby part on large maps)
             if game_map and hasattr(game_map, "render_mermaid"):
                 try:
-                    mermaid_map = game_map.render_mermaid()
+                    if self.config.map_prompt_max_rooms and location_id is not None:
+                        mermaid_map = game_map.render_mermaid_compact(
+                            location_id, self.config.map_prompt_max_rooms
+                        )
+                    else:
+                        mermaid_map = game_map.render_mermaid()
                     if mermaid_map and mermaid_map.strip():
                         context["current_map"] = mermaid_map
                         self.log_debug(
@@ -532,55 +550,124 @@ class ContextManager(BaseManager):
         except Exception as e:
             self.log_error(f"Failed to update location context: {e}")
 
+    def get_agent_reference_context(self, context: Dict, game_state_text: str = "") -> str:
+        """
+        Format the reference layer (the world map) of the agent prompt.
+
+        The map changes only when a room or exit is discovered, so the agent
+        sends it as its own cached message ahead of the per-turn context.
+
+        Args:
+            context: Context dictionary from get_agent_context()
+            game_state_text: Current game state text (counts toward the budget)
+
+        Returns:
+            Formatted map section, or "" if there is no map or it does not
+            fit the agent context token budget
+        """
+        for section in self._get_budgeted_agent_sections(context, game_state_text):
+            if section.name == "map":
+                return section.render()
+        return ""
+
     def get_formatted_agent_prompt_context(
         self,
         context: Dict,
-        game_state_text: str = ""
+        game_state_text: str = "",
+        include_map: bool = True,
     ) -> str:
         """
         Format agent prompt context with information ordered by urgency.
         Most urgent information appears LAST to leverage recency bias.
 
+        With agent_context_token_budget set, low-priority sections are
+        truncated or dropped to fit (see _build_agent_sections).
+
         Args:
             context: Context dictionary from get_agent_context()
             game_state_text: Current game state text (most urgent)
+            include_map: Include the reference layer; pass False when it is
+                sent separately via get_agent_reference_context()
 
         Returns:
             Formatted prompt string with proper information hierarchy
         """
+        sections = self._get_budgeted_agent_sections(context, game_state_text)
+        return "\n\n".join(
+            section.render() for section in sections if include_map or section.name != "map"
+        )
+
+    def _get_budgeted_agent_sections(self, context: Dict, game_state_text: str) -> List[ContextSection]:
+        """Build the agent prompt sections and fit them to the configured token budget."""
+        sections = self._build_agent_sections(context, game_state_text)
+        # Configs predating the budget settings (or spec'd test mocks) mean no budget
+        budget = getattr(self.config, "agent_context_token_budget", 0)
+        caps = getattr(self.config, "context_section_token_caps", None)
+        if not budget and not caps:
+            return sections
+
+        budgeter = ContextBudgeter(budget, caps, tokenizer=self.config.context_tokenizer)
+        sections, report = budgeter.fit(sections)
+        self.last_context_budget = report.to_dict()
+        if report.dropped or report.truncated:
+            self.log_debug(
+                f"Agent context fitted to budget: {report.original_tokens} -> {report.used_tokens} tokens",
+                details=f"dropped={report.dropped}, truncated={report.truncated}",
+            )
+        return sections
+
+    def _build_agent_sections(self, context: Dict, game_state_text: str) -> List[ContextSection]:
+        """
+        Build the agent prompt sections in prompt order.
+
+        Priorities decide what goes first when over budget: the map, then
+        older reasoning and location memory; the game response, location,
+        exits and combat status are required.
+        """
         sections = []
 
         # REFERENCE LAYER (lowest priority - for planning)
         if context.get("current_map"):
-            sections.append(
-                "CURRENT WORLD MAP:\n"
+            sections.append(ContextSection(
+                "map",
+                f"```mermaid\n{context['current_map']}\n```",
+                priority=10,
+                header="CURRENT WORLD MAP:\n"
                 "(Note: This shows only locations you have discovered so far. "
-                "There may be other rooms and exits yet undiscovered.)\n"
-                f"```mermaid\n{context['current_map']}\n```"
-            )
+                "There may be other rooms and exits yet undiscovered.)",
+            ))
 
         # STRATEGIC LAYER (location-specific knowledge)
         if context.get("location_memory"):
-            sections.append(f"LOCATION MEMORY:\n{context['location_memory']}")
+            sections.append(ContextSection(
+                "location_memory", context["location_memory"], priority=40,
+                truncate="head", header="LOCATION MEMORY:",
+            ))
 
         # HISTORICAL LAYER (recent reasoning for continuity)
         recent_reasoning = self.get_recent_reasoning_formatted(num_turns=3)
         if recent_reasoning:
-            sections.append(f"## Previous Reasoning and Actions\n\n{recent_reasoning}")
+            # Oldest turn first, so truncation keeps the most recent
+            sections.append(ContextSection(
+                "reasoning", recent_reasoning, priority=30,
+                truncate="tail", header="## Previous Reasoning and Actions\n",
+            ))
 
         # OBJECTIVE LAYER (goals to achieve)
         if context.get("discovered_objectives"):
             objectives = context["discovered_objectives"][:5]
             if objectives:
-                sections.append(
-                    "CURRENT OBJECTIVES:\n" +
-                    "\n".join(f"  - {obj}" for obj in objectives)
-                )
+                sections.append(ContextSection(
+                    "objectives", "\n".join(f"  - {obj}" for obj in objectives),
+                    priority=55, truncate="head", header="CURRENT OBJECTIVES:",
+                ))
 
         # CONSTRAINT LAYER (known failures)
         failed_actions = context.get("failed_actions_here", [])
         if failed_actions:
-            sections.append(f"FAILED ACTIONS HERE: {', '.join(failed_actions)}")
+            sections.append(ContextSection(
+                "failed_actions", f"FAILED ACTIONS HERE: {', '.join(failed_actions)}", priority=70,
+            ))
 
         # RESOURCE LAYER (what you have)
         if context.get("inventory_objects"):
@@ -590,13 +677,15 @@ class ContextManager(BaseManager):
                 attr_str = ", ".join([k for k, v in attrs.items() if v])
                 inventory_lines.append(f"  - {obj['name']} (ID:{obj['id']}, {attr_str})")
             if inventory_lines:
-                sections.append(
-                    "INVENTORY DETAILS:\n" +
-                    "\n".join(inventory_lines)
-                )
+                sections.append(ContextSection(
+                    "inventory", "\n".join(inventory_lines), priority=75,
+                    truncate="head", header="INVENTORY DETAILS:",
+                ))
         elif context.get("inventory"):
             if context["inventory"]:
-                sections.append(f"INVENTORY: {', '.join(context['inventory'])}")
+                sections.append(ContextSection(
+                    "inventory", f"INVENTORY: {', '.join(context['inventory'])}", priority=75,
+                ))
 
         # ENVIRONMENT LAYER (objects in room)
         visible_objects = context.get("visible_objects", [])
@@ -606,48 +695,66 @@ class ContextManager(BaseManager):
                 attrs = obj.get("attributes", {})
                 attr_str = ", ".join([k for k, v in attrs.items() if v])
                 visible_lines.append(f"  - {obj['name']} (ID:{obj['id']}, {attr_str})")
-            sections.append(
-                "VISIBLE OBJECTS:\n" +
-                "\n".join(visible_lines)
-            )
+            sections.append(ContextSection(
+                "visible_objects", "\n".join(visible_lines), priority=65,
+                truncate="head", header="VISIBLE OBJECTS:",
+            ))
 
         # ACTION LAYER (available verbs)
         vocab = context.get("action_vocabulary", [])
         if vocab:
-            sections.append(f"VALID ACTIONS: {len(vocab)} verbs available")
+            sections.append(ContextSection(
+                "action_vocabulary", f"VALID ACTIONS: {len(vocab)} verbs available", priority=20,
+            ))
 
         # PROGRESS LAYER (score tracking)
-        sections.append(f"SCORE: {self.game_state.previous_zork_score}")
+        sections.append(ContextSection(
+            "score", f"SCORE: {self.game_state.previous_zork_score}", priority=60,
+        ))
 
         # OBSERVATION LAYER (recent room description)
         if context.get("room_description"):
             age = context.get("room_description_age", 0)
             if age == 0:
-                sections.append(f"ROOM DESCRIPTION:\n{context['room_description']}")
+                header = "ROOM DESCRIPTION:"
             else:
-                sections.append(
-                    f"ROOM DESCRIPTION ({age} turn{'s' if age != 1 else ''} ago):\n"
-                    f"{context['room_description']}"
-                )
+                header = f"ROOM DESCRIPTION ({age} turn{'s' if age != 1 else ''} ago):"
+            sections.append(ContextSection(
+                "room_description", context["room_description"], priority=68,
+                truncate="head", header=header,
+            ))
 
         # NAVIGATION LAYER (movement options)
+        if context.get("route_to_unexplored"):
+            sections.append(ContextSection(
+                "route_to_unexplored",
+                f"NEAREST UNEXPLORED EXITS: {context['route_to_unexplored']}",
+                priority=80,
+            ))
+
         exits = context.get("available_exits", [])
         if exits:
-            sections.append(f"AVAILABLE EXITS: {', '.join(exits)}")
+            sections.append(ContextSection(
+                "exits", f"AVAILABLE EXITS: {', '.join(exits)}", required=True,
+            ))
 
         # POSITION LAYER (current location)
         if context.get("current_location"):
-            sections.append(f"CURRENT LOCATION: {context['current_location']}")
+            sections.append(ContextSection(
+                "location", f"CURRENT LOCATION: {context['current_location']}", required=True,
+            ))
 
         # COMBAT LAYER (immediate danger)
         if context.get("in_combat"):
-            sections.append("STATUS: IN COMBAT")
+            sections.append(ContextSection("combat", "STATUS: IN COMBAT", required=True))
 
         # MOST URGENT LAYER (immediate game response)
         if game_state_text:
-            sections.append(f"GAME RESPONSE: {game_state_text}")
+            sections.append(ContextSection(
+                "game_response", f"GAME RESPONSE: {game_state_text}", required=True,
+            ))
 
-        return "\n\n".join(sections)
+        return sections
 
     def get_context_summary_for_export(self) -> Dict[str, Any]:
         """Get context summary for state export."""
@@ -676,24 +783,21 @@ class ContextManager(BaseManager):
             if len(recent_actions) < 4:
                 return False
 
-            # Check for repeated action sequences
-            actions_only = [action for action, _ in recent_actions]
-
-            # Look for patterns of length 2-4
-            for pattern_length in range(2, 5):
-                if len(actions_only) >= pattern_length * 2:
-                    # Check if the last pattern_length actions repeat
-                    recent_pattern = actions_only[-pattern_length:]
-                    previous_pattern = actions_only[
-                        -pattern_length * 2 : -pattern_length
-                    ]
+            # History entries are ActionHistoryEntry objects (tuples in older callers)
+            actions_only = [
+                entry.action if hasattr(entry, "action") else entry[0]
+                for entry in recent_actions
+            ]
 
-                    if recent_pattern == previous_pattern:
-                        self.log_warning(
-                            f"Loop detected: pattern of length {pattern_length} repeated",
-                            details=f"Pattern: {recent_pattern}",
-                        )
-                        return True
+            # Look for the last 2-k actions repeating the k before them
+            max_length = getattr(self.config, "loop_max_cycle_length", 4)
+            pattern_length = find_cycle(actions_only, min_length=2, max_length=max_length)
+            if pattern_length:
+                self.log_warning(
+                    f"Loop detected: pattern of length {pattern_length} repeated",
+                    details=f"Pattern: {actions_only[-pattern_length:]}",
+                )
+                return True
 
             return False
 
@@ -713,6 +817,7 @@ class ContextManager(BaseManager):
                 ),
                 "current_location": self.game_state.current_room_name_for_map,
                 "previous_location": self.game_state.prev_room_for_prompt_context,
+                "context_budget": self.last_context_budget,
             }
         )
         return status
@@ -10,9 +10,11 @@ Handles all episode-level coordination and synthesis responsibilities:
 - Inter-episode learning and wisdom synthesis
 """
 
-from typing import List, Dict, Any
+import copy
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from episode_finalization import get_episode_finalizer
 from managers.base_manager import BaseManager
 from session.game_state import GameState
 from session.game_configuration import GameConfiguration
@@ -120,9 +122,20 @@ class EpisodeSynthesizer(BaseManager):
             return f"{episode_id}_error"
 
     def finalize_episode(
-        self, final_score: int, critic_confidence_history: List[float] = None
+        self,
+        final_score: int,
+        critic_confidence_history: List[float] = None,
+        background: Optional[bool] = None,
     ) -> None:
-        """Finalize the current episode with synthesis and cleanup."""
+        """
+        Finalize the current episode with synthesis and cleanup.
+
+        Args:
+            final_score: Score at episode end
+            critic_confidence_history: Critic confidences for synthesis criteria
+            background: Run the knowledge update, synthesis and summary on the
+                episode finalizer (defaults to config.enable_background_finalization)
+        """
         try:
             self.log_progress(
                 f"Finalizing episode {self.game_state.episode_id}",
@@ -135,6 +148,56 @@ class EpisodeSynthesizer(BaseManager):
             if is_death:
                 self.game_state.death_count += 1
 
+            if critic_confidence_history is None:
+                critic_confidence_history = []
+
+            if background is None:
+                background = self.config.enable_background_finalization
+            if not background:
+                self._complete_finalization(final_score, critic_confidence_history, is_death)
+                return
+
+            # The next episode resets GameState and the managers in place, so the
+            # job runs on copies bound to a snapshot of this episode's state
+            finalizer = get_episode_finalizer()
+            finalizer.configure(self.config.wait_for_knowledge, self.logger)
+            finalizer.submit(
+                self.game_state.episode_id,
+                self._detached()._complete_finalization,
+                final_score,
+                list(critic_confidence_history),
+                is_death,
+            )
+
+            self.logger.info(
+                f"Episode finalization queued: {self.game_state.episode_id}",
+                extra={
+                    "event_type": "episode_finalization_queued",
+                    "episode_id": self.game_state.episode_id,
+                    "turn": self.game_state.turn_count,
+                    "final_score": final_score,
+                    "wait_for_knowledge": self.config.wait_for_knowledge,
+                },
+            )
+
+        except Exception as e:
+            self.log_error(f"Failed to finalize episode: {e}")
+
+    def _detached(self) -> "EpisodeSynthesizer":
+        """Copy this synthesizer and its knowledge manager onto a deep copy of GameState."""
+        game_state = copy.deepcopy(self.game_state)
+        synthesizer = copy.copy(self)
+        synthesizer.game_state = game_state
+        if self.knowledge_manager:
+            synthesizer.knowledge_manager = copy.copy(self.knowledge_manager)
+            synthesizer.knowledge_manager.game_state = game_state
+        return synthesizer
+
+    def _complete_finalization(
+        self, final_score: int, critic_confidence_history: List[float], is_death: bool
+    ) -> None:
+        """Final knowledge update, inter-episode synthesis and episode summary."""
+        try:
             # Perform final knowledge update if knowledge manager available
             if self.knowledge_manager:
                 self.knowledge_manager.perform_final_update(
@@ -142,9 +205,6 @@ class EpisodeSynthesizer(BaseManager):
                 )
 
             # Perform inter-episode synthesis if appropriate
-            if critic_confidence_history is None:
-                critic_confidence_history = []
-
             self.perform_inter_episode_synthesis(final_score, critic_confidence_history)
 
             # Note: State export is handled by orchestrator coordination
@@ -15,6 +15,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Any
 
+from episode_finalization import get_episode_finalizer
 from managers.base_manager import BaseManager
 from session.game_state import GameState
 from session.game_configuration import GameConfiguration
@@ -71,6 +72,9 @@ class KnowledgeManager(BaseManager):
         # Reset object event tracking (Phase 6)
         self.object_events.clear()
 
+        # Incremental updates start from turn 1 again
+        self.adaptive_knowledge_manager.rolling_summaries.clear()
+
     def track_object_event(
         self,
         event_type: str,
@@ -244,15 +248,11 @@ class KnowledgeManager(BaseManager):
             except Exception as e:
                 self.log_warning(f"Failed to get map quality metrics: {e}")
 
-            # Perform the knowledge update using "Method 2" - entire episode analysis
-            self.log_debug(
-                "Calling adaptive knowledge manager update_knowledge_from_turns"
-            )
-            success = self.adaptive_knowledge_manager.update_knowledge_from_turns(
-                episode_id=self.game_state.episode_id,
-                start_turn=1,
-                end_turn=self.game_state.turn_count,
-                is_final_update=False,
+            success = self._run_knowledge_update(is_final_update=False)
+            update_method = (
+                "periodic_incremental"
+                if self.config.knowledge_update_mode == "incremental"
+                else "periodic_full_episode"
             )
 
             if success:
@@ -271,7 +271,7 @@ class KnowledgeManager(BaseManager):
                         "event_type": "knowledge_update_success",
                         "episode_id": self.game_state.episode_id,
                         "turn": self.game_state.turn_count,
-                        "update_method": "periodic_full_episode",
+                        "update_method": update_method,
                     },
                 )
 
@@ -290,7 +290,7 @@ class KnowledgeManager(BaseManager):
                         "event_type": "knowledge_update_failed",
                         "episode_id": self.game_state.episode_id,
                         "turn": self.game_state.turn_count,
-                        "update_method": "periodic_full_episode",
+                        "update_method": update_method,
                     },
                 )
 
@@ -350,12 +350,7 @@ class KnowledgeManager(BaseManager):
                     self.log_warning(f"Failed to get map quality metrics: {e}")
 
                 # Perform final knowledge update
-                success = self.adaptive_knowledge_manager.update_knowledge_from_turns(
-                    episode_id=self.game_state.episode_id,
-                    start_turn=1,
-                    end_turn=self.game_state.turn_count,
-                    is_final_update=True,
-                )
+                success = self._run_knowledge_update(is_final_update=True)
 
                 if success:
                     self.log_progress(
@@ -380,6 +375,39 @@ class KnowledgeManager(BaseManager):
                 details=f"Final knowledge update failed with exception: {e}",
             )
 
+    def _run_knowledge_update(self, is_final_update: bool) -> bool:
+        """
+        Run a knowledge update in the configured mode.
+
+        "full" analyzes the entire episode so far ("Method 2"); "incremental"
+        analyzes only the turns since the last successful update.
+
+        Returns:
+            bool: True if the knowledge base was updated
+        """
+        # Never overlap a background final update of the previous episode
+        get_episode_finalizer().knowledge_barrier("knowledge_update", force=True)
+
+        if self.config.knowledge_update_mode == "incremental":
+            self.log_debug(
+                "Calling adaptive knowledge manager update_knowledge_incrementally"
+            )
+            return self.adaptive_knowledge_manager.update_knowledge_incrementally(
+                episode_id=self.game_state.episode_id,
+                end_turn=self.game_state.turn_count,
+                is_final_update=is_final_update,
+            )
+
+        self.log_debug(
+            "Calling adaptive knowledge manager update_knowledge_from_turns"
+        )
+        return self.adaptive_knowledge_manager.update_knowledge_from_turns(
+            episode_id=self.game_state.episode_id,
+            start_turn=1,
+            end_turn=self.game_state.turn_count,
+            is_final_update=is_final_update,
+        )
+
     def reload_agent_knowledge(self) -> None:
         """Reload knowledge base in agent for immediate use."""
         try:
@@ -430,6 +458,8 @@ class KnowledgeManager(BaseManager):
                 self.log_debug("Skipping inter-episode synthesis - criteria not met")
                 return
 
+            get_episode_finalizer().knowledge_barrier("inter_episode_synthesis", force=True)
+
             self.log_progress(
                 f"Starting inter-episode wisdom synthesis for episode {self.game_state.episode_id}",
                 stage="wisdom_synthesis",
@@ -572,6 +602,7 @@ class KnowledgeManager(BaseManager):
                 "turns_since_last_update": self.game_state.turn_count
                 - self.last_knowledge_update_turn,
                 "knowledge_update_interval": self.config.knowledge_update_interval,
+                "knowledge_update_mode": self.config.knowledge_update_mode,
                 "has_adaptive_manager": self.adaptive_knowledge_manager is not None,
                 "has_llm_client": self.get_llm_client() is not None,
                 "object_events_tracked": len(self.object_events),
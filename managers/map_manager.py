@@ -18,6 +18,7 @@ from session.game_state import GameState
 from session.game_configuration import GameConfiguration
 from map_graph import MapGraph
 from movement_analyzer import MovementAnalyzer
+from shared_store import store_lock
 
 
 class MapManager(BaseManager):
@@ -359,7 +360,17 @@ class MapManager(BaseManager):
         """
         try:
             filepath = str(Path(self.config.zork_game_workdir) / self.config.map_state_file)
-            success = self.game_map.save_to_json(filepath)
+            with store_lock(filepath):
+                # Keep what parallel episodes saved since this map was loaded
+                saved_map = MapGraph.load_from_json(filepath)
+                if saved_map is not None:
+                    merged = self.game_map.merge_from(saved_map)
+                    if merged["rooms_added"] or merged["connections_added"]:
+                        self.log_info(
+                            f"Merged saved map state: +{merged['rooms_added']} rooms, "
+                            f"+{merged['connections_added']} connections"
+                        )
+                success = self.game_map.save_to_json(filepath)
             if success:
                 self.log_info(
                     f"Map state saved to {filepath} for cross-episode persistence"
@@ -389,6 +400,7 @@ class MapManager(BaseManager):
             {
                 "current_room": self.game_state.current_room_name_for_map,
                 **quality_metrics,
+                "routing": self.game_map.get_routing_stats(),
             }
         )
         return status
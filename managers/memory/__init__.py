@@ -14,6 +14,7 @@ from .formatting import HistoryFormatter
 from .triggers import SynthesisTrigger
 from .cache_manager import MemoryCacheManager
 from .file_operations import MemoryFileParser, MemoryFileWriter
+from .memory_store import MemoryLogStore
 from .synthesis import MemorySynthesizer
 
 __all__ = [
@@ -27,5 +28,6 @@ __all__ = [
     "MemoryCacheManager",
     "MemoryFileParser",
     "MemoryFileWriter",
+    "MemoryLogStore",
     "MemorySynthesizer",
 ]
@@ -1,6 +1,6 @@
 """
 ABOUTME: File I/O operations for ZorkGPT memory system - reading and writing Memories.md.
-ABOUTME: Provides file operations with backups and atomic writes for single-threaded application.
+ABOUTME: Provides file operations with backups, guarded by a cross-process file lock.
 """
 
 import re
@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from .models import Memory, MemoryStatus, MemoryStatusType, INVALIDATION_MARKER
 from .cache_manager import MemoryCacheManager
 from session.game_configuration import GameConfiguration
+from shared_store import store_lock
 
 
 class MemoryFileParser:
@@ -411,7 +412,7 @@ class MemoryFileWriter:
     Writes memories to Memories.md with file locking and backups.
 
     Responsible for:
-    - Thread-safe file writes with filelock library
+    - Process-safe read-modify-write under a file lock (parallel episodes)
     - Atomic backup creation before modifications
     - Memory entry formatting with persistence markers
     - Location section management (append vs create)
@@ -443,8 +444,8 @@ class MemoryFileWriter:
         """
         Write memory to file with locking and backup.
 
-        Thread-safe write operation:
-        1. Acquire file lock (10 second timeout)
+        Process-safe write operation:
+        1. Acquire file lock (shared_store.LOCK_TIMEOUT_SECONDS)
         2. Create timestamped backup
         3. Read current file content
         4. Add/update memory in content
@@ -461,25 +462,26 @@ class MemoryFileWriter:
         memories_path = Path(self.config.zork_game_workdir) / "Memories.md"
 
         try:
-            # Create backup before write
-            self._create_backup(memories_path)
+            with store_lock(memories_path):
+                # Create backup before write
+                self._create_backup(memories_path)
 
-            # Read existing content or start fresh
-            if memories_path.exists():
-                content = memories_path.read_text(encoding="utf-8")
-            else:
-                content = "# Location Memories\n\n"
-
-            # Update content with new memory
-            updated_content = self._add_memory_to_content(
-                content,
-                location_id,
-                location_name,
-                memory
-            )
+                # Read existing content or start fresh
+                if memories_path.exists():
+                    content = memories_path.read_text(encoding="utf-8")
+                else:
+                    content = "# Location Memories\n\n"
+
+                # Update content with new memory
+                updated_content = self._add_memory_to_content(
+                    content,
+                    location_id,
+                    location_name,
+                    memory
+                )
 
-            # Write atomically
-            memories_path.write_text(updated_content, encoding="utf-8")
+                # Write atomically
+                memories_path.write_text(updated_content, encoding="utf-8")
 
             self.logger.info(
                 f"Added {memory.persistence} memory to file: [{memory.category}] {memory.title} to location {location_id}",
@@ -544,6 +546,187 @@ class MemoryFileWriter:
         """
         memories_path = Path(self.config.zork_game_workdir) / "Memories.md"
 
+        if not self.validate_status_update(
+            location_id, memory_title, new_status, superseded_by,
+            superseded_at_turn, invalidation_reason
+        ):
+            return False
+
+        try:
+            with store_lock(memories_path):
+                # Backup before modification
+                self._create_backup(memories_path)
+
+                # Read entire file
+                if not memories_path.exists():
+                    self.logger.warning(f"Cannot update memory: Memories.md not found")
+                    return False
+
+                content = memories_path.read_text(encoding="utf-8")
+                lines = content.split("\n")
+
+                # Determine reference line format based on workflow
+                if invalidation_reason:
+                    # Standalone invalidation
+                    reference_line = f'[Invalidated at T{superseded_at_turn}: "{invalidation_reason}"]'
+                else:
+                    # Traditional supersession
+                    reference_line = f'[Superseded at T{superseded_at_turn} by "{superseded_by}"]'
+
+                # Find the memory entry and update it
+                updated_lines = []
+                in_target_location = False
+                in_target_memory = False
+                memory_found = False
+                i = 0
+
+                while i < len(lines):
+                    line = lines[i]
+
+                    # Check for location header
+                    location_match = self.LOCATION_HEADER_PATTERN.match(line)
+                    if location_match:
+                        loc_id = int(location_match.group(1))
+                        in_target_location = (loc_id == location_id)
+                        in_target_memory = False
+                        updated_lines.append(line)
+                        i += 1
+                        continue
+
+                    # Check for memory entry header (only in target location)
+                    if in_target_location:
+                        memory_match = self.MEMORY_ENTRY_PATTERN.match(line)
+                        if memory_match:
+                            # Parse header with new regex groups
+                            category = memory_match.group(1)
+                            second_field = memory_match.group(2)
+                            third_field = memory_match.group(3)
+                            title = memory_match.group(4).strip()
+                            metadata = memory_match.group(5).strip()
+
+                            # Determine current persistence marker
+                            persistence_marker = None
+                            if third_field:
+                                # Format is: CATEGORY - PERSISTENCE - STATUS
+                                if second_field and second_field.upper() in ["CORE", "PERMANENT", "EPHEMERAL"]:
+                                    persistence_marker = second_field.upper()
+                            elif second_field:
+                                # Format is: CATEGORY - (PERSISTENCE or STATUS)
+                                if second_field.upper() in ["CORE", "PERMANENT", "EPHEMERAL"]:
+                                    persistence_marker = second_field.upper()
+
+                            # Check if this is the memory to update (exact or substring match)
+                            if memory_title in title or title in memory_title:
+                                # Found the memory - update header
+                                memory_found = True
+                                in_target_memory = True
+
+                                # Format new header preserving persistence marker
+                                if persistence_marker:
+                                    updated_header = f"**[{category} - {persistence_marker} - {new_status}] {title}** *({metadata})*"
+                                else:
+                                    updated_header = f"**[{category} - {new_status}] {title}** *({metadata})*"
+                                updated_lines.append(updated_header)
+
+                                # Add reference line (supersession or invalidation)
+                                updated_lines.append(reference_line)
+
+                                i += 1
+
+                                # Now collect and update the memory text lines
+                                while i < len(lines):
+                                    text_line = lines[i]
+
+                                    # Stop at next memory or section end
+                                    if (text_line.startswith("**[") or
+                                        text_line.strip() == "---" or
+                                        text_line.startswith("##")):
+                                        in_target_memory = False
+                                        break
+
+                                    # Skip existing supersession/invalidation references
+                                    if text_line.strip().startswith("[Superseded at") or text_line.strip().startswith("[Invalidated at"):
+                                        i += 1
+                                        continue
+
+                                    # Wrap text in strikethrough if not already
+                                    if text_line.strip() and not text_line.strip().startswith("~~"):
+                                        text_line = f"~~{text_line}~~"  # Preserve original formatting
+
+                                    updated_lines.append(text_line)
+                                    i += 1
+
+                                continue
+                            else:
+                                # Not the target memory - keep as is
+                                in_target_memory = False
+                                updated_lines.append(line)
+                                i += 1
+                                continue
+
+                    # Default: keep line as-is
+                    updated_lines.append(line)
+                    i += 1
+
+                if not memory_found:
+                    self.logger.warning(
+                        f"Memory '{memory_title}' not found at location {location_id}",
+                        extra={
+                            "location_id": location_id,
+                            "memory_title": memory_title
+                        }
+                    )
+                    return False
+
+                # Write updated content
+                memories_path.write_text("\n".join(updated_lines), encoding="utf-8")
+
+            # Log with appropriate context
+            log_context = {
+                "location_id": location_id,
+                "memory_title": memory_title,
+                "new_status": new_status,
+            }
+            if superseded_by:
+                log_context["superseded_by"] = superseded_by
+            if invalidation_reason:
+                log_context["invalidation_reason"] = invalidation_reason
+
+            self.logger.info(
+                f"Updated memory status: '{memory_title}' → {new_status}",
+                extra=log_context
+            )
+
+            return True
+
+        except Exception as e:
+            self.logger.error(
+                f"Failed to update memory status: {e}",
+                extra={
+                    "location_id": location_id,
+                    "memory_title": memory_title,
+                    "error": str(e)
+                }
+            )
+            return False
+
+    def validate_status_update(
+        self,
+        location_id: int,
+        memory_title: str,
+        new_status: str,
+        superseded_by: Optional[str],
+        superseded_at_turn: Optional[int],
+        invalidation_reason: Optional[str]
+    ) -> bool:
+        """
+        Validate status update arguments, logging the reason for any rejection.
+
+        Shared with MemoryLogStore so both backends accept the same updates.
+
+        Returns:
+            True if the update is well-formed
+        """
         # Validate that exactly one of superseded_by or invalidation_reason is provided
         if not superseded_by and not invalidation_reason:
             self.logger.error("Either superseded_by or invalidation_reason must be provided")
@@ -593,162 +776,7 @@ class MemoryFileWriter:
                 )
                 return False
 
-        try:
-            # Backup before modification
-            self._create_backup(memories_path)
-
-            # Read entire file
-            if not memories_path.exists():
-                self.logger.warning(f"Cannot update memory: Memories.md not found")
-                return False
-
-            content = memories_path.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            # Determine reference line format based on workflow
-            if invalidation_reason:
-                # Standalone invalidation
-                reference_line = f'[Invalidated at T{superseded_at_turn}: "{invalidation_reason}"]'
-            else:
-                # Traditional supersession
-                reference_line = f'[Superseded at T{superseded_at_turn} by "{superseded_by}"]'
-
-            # Find the memory entry and update it
-            updated_lines = []
-            in_target_location = False
-            in_target_memory = False
-            memory_found = False
-            i = 0
-
-            while i < len(lines):
-                line = lines[i]
-
-                # Check for location header
-                location_match = self.LOCATION_HEADER_PATTERN.match(line)
-                if location_match:
-                    loc_id = int(location_match.group(1))
-                    in_target_location = (loc_id == location_id)
-                    in_target_memory = False
-                    updated_lines.append(line)
-                    i += 1
-                    continue
-
-                # Check for memory entry header (only in target location)
-                if in_target_location:
-                    memory_match = self.MEMORY_ENTRY_PATTERN.match(line)
-                    if memory_match:
-                        # Parse header with new regex groups
-                        category = memory_match.group(1)
-                        second_field = memory_match.group(2)
-                        third_field = memory_match.group(3)
-                        title = memory_match.group(4).strip()
-                        metadata = memory_match.group(5).strip()
-
-                        # Determine current persistence marker
-                        persistence_marker = None
-                        if third_field:
-                            # Format is: CATEGORY - PERSISTENCE - STATUS
-                            if second_field and second_field.upper() in ["CORE", "PERMANENT", "EPHEMERAL"]:
-                                persistence_marker = second_field.upper()
-                        elif second_field:
-                            # Format is: CATEGORY - (PERSISTENCE or STATUS)
-                            if second_field.upper() in ["CORE", "PERMANENT", "EPHEMERAL"]:
-                                persistence_marker = second_field.upper()
-
-                        # Check if this is the memory to update (exact or substring match)
-                        if memory_title in title or title in memory_title:
-                            # Found the memory - update header
-                            memory_found = True
-                            in_target_memory = True
-
-                            # Format new header preserving persistence marker
-                            if persistence_marker:
-                                updated_header = f"**[{category} - {persistence_marker} - {new_status}] {title}** *({metadata})*"
-                            else:
-                                updated_header = f"**[{category} - {new_status}] {title}** *({metadata})*"
-                            updated_lines.append(updated_header)
-
-                            # Add reference line (supersession or invalidation)
-                            updated_lines.append(reference_line)
-
-                            i += 1
-
-                            # Now collect and update the memory text lines
-                            while i < len(lines):
-                                text_line = lines[i]
-
-                                # Stop at next memory or section end
-                                if (text_line.startswith("**[") or
-                                    text_line.strip() == "---" or
-                                    text_line.startswith("##")):
-                                    in_target_memory = False
-                                    break
-
-                                # Skip existing supersession/invalidation references
-                                if text_line.strip().startswith("[Superseded at") or text_line.strip().startswith("[Invalidated at"):
-                                    i += 1
-                                    continue
-
-                                # Wrap text in strikethrough if not already
-                                if text_line.strip() and not text_line.strip().startswith("~~"):
-                                    text_line = f"~~{text_line}~~"  # Preserve original formatting
-
-                                updated_lines.append(text_line)
-                                i += 1
-
-                            continue
-                        else:
-                            # Not the target memory - keep as is
-                            in_target_memory = False
-                            updated_lines.append(line)
-                            i += 1
-                            continue
-
-                # Default: keep line as-is
-                updated_lines.append(line)
-                i += 1
-
-            if not memory_found:
-                self.logger.warning(
-                    f"Memory '{memory_title}' not found at location {location_id}",
-                    extra={
-                        "location_id": location_id,
-                        "memory_title": memory_title
-                    }
-                )
-                return False
-
-            # Write updated content
-            memories_path.write_text("\n".join(updated_lines), encoding="utf-8")
-
-            # Log with appropriate context
-            log_context = {
-                "location_id": location_id,
-                "memory_title": memory_title,
-                "new_status": new_status,
-            }
-            if superseded_by:
-                log_context["superseded_by"] = superseded_by
-            if invalidation_reason:
-                log_context["invalidation_reason"] = invalidation_reason
-
-            self.logger.info(
-                f"Updated memory status: '{memory_title}' → {new_status}",
-                extra=log_context
-            )
-
-            return True
-
-        except Exception as e:
-            self.logger.error(
-                f"Failed to update memory status: {e}",
-                extra={
-                    "location_id": location_id,
-                    "memory_title": memory_title,
-                    "error": str(e)
-                }
-            )
-            return False
+        return True
 
     def _create_backup(self, memories_path: Path) -> None:
         """
@@ -939,14 +967,42 @@ class MemoryFileWriter:
             memories: List of memories
             episode: Current episode number
 
+        Returns:
+            Formatted location section
+        """
+        return self.format_location_section(
+            location_id, location_name, memories, visits=1, episodes=[episode]
+        )
+
+    def format_location_section(
+        self,
+        location_id: int,
+        location_name: str,
+        memories: List[Memory],
+        visits: int,
+        episodes: List[int]
+    ) -> str:
+        """
+        Format a location section with explicit visit metadata.
+
+        Used directly by MemoryLogStore when rendering Memories.md from its index.
+
+        Args:
+            location_id: Location ID
+            location_name: Location name
+            memories: Memories in display order
+            visits: Visit count for the header
+            episodes: Episodes the location was seen in
+
         Returns:
             Formatted location section
         """
         lines = []
 
         # Location header
+        episodes_list = ", ".join(str(e) for e in sorted(set(episodes)))
         lines.append(f"## Location {location_id}: {location_name}")
-        lines.append(f"**Visits:** 1 | **Episodes:** {episode}")
+        lines.append(f"**Visits:** {visits} | **Episodes:** {episodes_list}")
         lines.append("")
         lines.append("### Memories")
         lines.append("")
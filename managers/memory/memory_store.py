@@ -0,0 +1,482 @@
+"""
+ABOUTME: Append-only JSONL store for persistent memories with an in-memory location/title index.
+ABOUTME: Replaces the Memories.md read-modify-write cycle; Memories.md becomes a rendered export.
+"""
+
+import json
+import os
+from dataclasses import asdict, fields, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from filelock import Timeout
+
+from .models import Memory, INVALIDATION_MARKER
+from .cache_manager import MemoryCacheManager
+from .file_operations import MemoryFileParser, MemoryFileWriter
+from session.game_configuration import GameConfiguration
+from shared_store import atomic_write_text, store_lock
+
+# Small logs are never worth rewriting
+COMPACTION_MIN_RECORDS = 64
+
+_MEMORY_FIELDS = {f.name for f in fields(Memory)}
+
+
+class MemoryLogStore:
+    """
+    Persistent memory backend built on an append-only JSONL log.
+
+    MemoryFileWriter re-reads, regex-parses and rewrites the whole of
+    Memories.md (plus a backup copy) for every add, supersede or invalidate.
+    This store instead appends one record per change and keeps an index of
+    location -> memories plus location -> title -> slot, so each operation is
+    a single small write (status records address memories by slot because a
+    superseded title can be reused):
+
+        {"op": "add", "location_id": 15, "location_name": "...", "memory": {...}}
+        {"op": "status", "location_id": 15, "slot": 2, "title": "...", "status": "SUPERSEDED", ...}
+        {"op": "location", "location_id": 15, "location_name": "...", "visits": 3, "episodes": [1, 2]}
+
+    Replaying the log rebuilds the index at startup. Once the log holds more
+    than compaction_ratio records per live memory it is rewritten with one
+    record per memory. Memories.md is only rendered on request (export_markdown);
+    on first use an existing Memories.md is imported so no history is lost.
+
+    Several processes (parallel episodes) may share one log. Every write holds
+    the log's file lock and first applies records other processes appended
+    since this store last read the log, so slots always follow log order.
+    Memories added by other processes reach the index (and so compaction and
+    the Memories.md export) but not this episode's memory cache.
+    """
+
+    def __init__(self, logger, config: GameConfiguration, file_writer: MemoryFileWriter):
+        """
+        Initialize the store.
+
+        Args:
+            logger: Logger instance for debugging
+            config: GameConfiguration for file paths and compaction settings
+            file_writer: MemoryFileWriter used for validation and markdown rendering
+        """
+        self.logger = logger
+        self.config = config
+        self.file_writer = file_writer
+
+        workdir = Path(config.zork_game_workdir)
+        self.log_path = workdir / config.simple_memory_log_file
+        self.markdown_path = workdir / "Memories.md"
+        self.compaction_ratio = config.simple_memory_compaction_ratio
+
+        # location_id -> memories in write order; slot = position in this list
+        self._index: Dict[int, List[Memory]] = {}
+        # location_id -> title -> first slot holding that title
+        self._titles: Dict[int, Dict[str, int]] = {}
+        # location_id -> {"name": str, "visits": int, "episodes": set}
+        self._locations: Dict[int, Dict[str, Any]] = {}
+        self._record_count = 0
+        self.compactions = 0
+
+        # Read position in the log; the inode detects another process's compaction
+        self._lock = store_lock(self.log_path)
+        self._log_offset = 0
+        self._log_inode: Optional[int] = None
+        self.records_from_other_processes = 0
+
+    def load_into(self, cache_manager: MemoryCacheManager) -> None:
+        """
+        Rebuild the index from the log and populate the persistent cache.
+
+        Falls back to importing Memories.md when no log exists yet. Cached
+        Memory objects are copies, so cache-side status updates never race
+        with the store's own records.
+
+        Args:
+            cache_manager: MemoryCacheManager to populate
+        """
+        with self._lock:
+            if self.log_path.exists():
+                self._replay()
+            elif self.markdown_path.exists():
+                self._import_markdown()
+
+        for location_id, memories in self._index.items():
+            for memory in memories:
+                cache_manager.add_to_cache(location_id, replace(memory))
+
+        if self._should_compact():
+            self.compact()
+
+        self.logger.info(
+            f"Loaded {self.get_total_memories()} memories from {len(self._index)} locations",
+            extra={
+                "event_type": "memory_store_loaded",
+                "locations": len(self._index),
+                "total_memories": self.get_total_memories(),
+                "log_records": self._record_count,
+            }
+        )
+
+    def write_memory(self, memory: Memory, location_id: int, location_name: str) -> bool:
+        """
+        Append a new memory to the log.
+
+        Args:
+            memory: Memory object to write
+            location_id: Integer location ID from Z-machine
+            location_name: Location name for display
+
+        Returns:
+            True if successful, False if the append failed
+        """
+        record = {
+            "op": "add",
+            "location_id": location_id,
+            "location_name": location_name,
+            "memory": asdict(memory),
+        }
+        try:
+            with self._lock:
+                self._catch_up()
+                self._append(record)
+                self._apply(record)
+        except (OSError, Timeout) as e:
+            self.logger.error(
+                f"Failed to add memory to location {location_id}: {e}",
+                extra={"location_id": location_id, "error": str(e)}
+            )
+            return False
+
+        self.logger.info(
+            f"Added {memory.persistence} memory to log: [{memory.category}] {memory.title} to location {location_id}",
+            extra={
+                "location_id": location_id,
+                "location_name": location_name,
+                "category": memory.category,
+                "title": memory.title,
+                "persistence": memory.persistence
+            }
+        )
+
+        if self._should_compact():
+            self.compact()
+        return True
+
+    def update_memory_status(
+        self,
+        location_id: int,
+        memory_title: str,
+        new_status: str,
+        superseded_by: Optional[str] = None,
+        superseded_at_turn: Optional[int] = None,
+        invalidation_reason: Optional[str] = None
+    ) -> bool:
+        """
+        Record a status change for an existing memory.
+
+        Same contract as MemoryFileWriter.update_memory_status, including its
+        exact-or-substring title matching.
+
+        Returns:
+            True if successful, False if memory not found or update failed
+        """
+        if not self.file_writer.validate_status_update(
+            location_id, memory_title, new_status, superseded_by,
+            superseded_at_turn, invalidation_reason
+        ):
+            return False
+
+        record = None
+        try:
+            with self._lock:
+                # Slots must be resolved against the log as other processes left it
+                self._catch_up()
+                slot = self._resolve_slot(location_id, memory_title)
+                if slot is not None:
+                    record = {
+                        "op": "status",
+                        "location_id": location_id,
+                        "slot": slot,
+                        "title": self._index[location_id][slot].title,
+                        "status": new_status,
+                        "superseded_by": INVALIDATION_MARKER if invalidation_reason else superseded_by,
+                        "superseded_at_turn": superseded_at_turn,
+                        "invalidation_reason": invalidation_reason,
+                    }
+                    self._append(record)
+                    self._apply(record)
+        except (OSError, Timeout) as e:
+            self.logger.error(
+                f"Failed to update memory status: {e}",
+                extra={"location_id": location_id, "memory_title": memory_title, "error": str(e)}
+            )
+            return False
+
+        if record is None:
+            self.logger.warning(
+                f"Memory '{memory_title}' not found at location {location_id}",
+                extra={"location_id": location_id, "memory_title": memory_title}
+            )
+            return False
+
+        self.logger.info(
+            f"Updated memory status: '{memory_title}' → {new_status}",
+            extra={
+                "location_id": location_id,
+                "memory_title": memory_title,
+                "new_status": new_status,
+            }
+        )
+
+        if self._should_compact():
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """Rewrite the log with one record per live memory (atomic replace)."""
+        with self._lock:
+            # Never drop records another process appended since our last read
+            self._catch_up()
+            previous = self._record_count
+            self._rewrite_log()
+
+        self.compactions += 1
+        self.logger.info(
+            f"Compacted memory log from {previous} to {self._record_count} records",
+            extra={
+                "event_type": "memory_store_compacted",
+                "records_before": previous,
+                "records_after": self._record_count,
+            }
+        )
+
+    def _rewrite_log(self) -> None:
+        """Write the index as one record per memory and swap it in (caller holds the lock)."""
+        tmp_path = self.log_path.with_name(f"{self.log_path.name}.{os.getpid()}.tmp")
+        records = 0
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for location_id, memories in self._index.items():
+                info = self._locations[location_id]
+                for memory in memories:
+                    f.write(json.dumps({
+                        "op": "add",
+                        "location_id": location_id,
+                        "location_name": info["name"],
+                        "memory": asdict(memory),
+                    }) + "\n")
+                    records += 1
+                # Written after the adds so its absolute counts win on replay
+                f.write(json.dumps({
+                    "op": "location",
+                    "location_id": location_id,
+                    "location_name": info["name"],
+                    "visits": info["visits"],
+                    "episodes": sorted(info["episodes"]),
+                }) + "\n")
+                records += 1
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.log_path)
+
+        stat = self.log_path.stat()
+        self._log_offset = stat.st_size
+        self._log_inode = stat.st_ino
+        self._record_count = records
+
+    def render_markdown(self) -> str:
+        """Render the indexed memories in the Memories.md format."""
+        sections = ["# Location Memories\n"]
+        for location_id, memories in self._index.items():
+            info = self._locations[location_id]
+            sections.append(self.file_writer.format_location_section(
+                location_id,
+                info["name"],
+                memories,
+                visits=info["visits"],
+                episodes=sorted(info["episodes"]),
+            ))
+        return "\n".join(sections)
+
+    def export_markdown(self, path: Optional[Path] = None) -> Path:
+        """
+        Write the rendered Memories.md view.
+
+        Args:
+            path: Destination (defaults to Memories.md in the game workdir)
+
+        Returns:
+            Path that was written
+        """
+        target = Path(path) if path else self.markdown_path
+        with self._lock:
+            self._catch_up()
+            atomic_write_text(target, self.render_markdown())
+        return target
+
+    def get_total_memories(self) -> int:
+        """Total number of indexed memories (all statuses)."""
+        return sum(len(memories) for memories in self._index.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics for status reporting."""
+        return {
+            "backend": "log",
+            "log_file": str(self.log_path),
+            "log_records": self._record_count,
+            "total_memories": self.get_total_memories(),
+            "compactions": self.compactions,
+            "records_from_other_processes": self.records_from_other_processes,
+        }
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append one record to the log (caller holds the lock and has caught up)."""
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            self._log_offset = f.tell()
+        self._log_inode = os.stat(self.log_path).st_ino
+        self._record_count += 1
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply one log record to the index."""
+        op = record["op"]
+        location_id = int(record["location_id"])
+
+        if op == "add":
+            memory = Memory(**{k: v for k, v in record["memory"].items() if k in _MEMORY_FIELDS})
+            info = self._location_info(location_id, record.get("location_name", ""))
+            info["visits"] += 1
+            info["episodes"].add(memory.episode)
+            memories = self._index.setdefault(location_id, [])
+            self._titles.setdefault(location_id, {}).setdefault(memory.title, len(memories))
+            memories.append(memory)
+
+        elif op == "status":
+            memories = self._index.get(location_id, [])
+            slot = record["slot"]
+            if not 0 <= slot < len(memories) or memories[slot].title != record["title"]:
+                raise KeyError(f"status record for unknown memory '{record['title']}'")
+            memory = memories[slot]
+            memory.status = record["status"]
+            memory.superseded_by = record.get("superseded_by")
+            memory.superseded_at_turn = record.get("superseded_at_turn")
+            memory.invalidation_reason = record.get("invalidation_reason")
+
+        elif op == "location":
+            info = self._location_info(location_id, record.get("location_name", ""))
+            info["visits"] = record["visits"]
+            info["episodes"] = set(record["episodes"])
+
+        else:
+            raise ValueError(f"unknown op '{op}'")
+
+    def _location_info(self, location_id: int, location_name: str) -> Dict[str, Any]:
+        """Get (creating if needed) the metadata entry for a location."""
+        info = self._locations.get(location_id)
+        if info is None:
+            info = {"name": location_name, "visits": 0, "episodes": set()}
+            self._locations[location_id] = info
+        elif location_name:
+            info["name"] = location_name
+        return info
+
+    def _resolve_slot(self, location_id: int, memory_title: str) -> Optional[int]:
+        """
+        Find the slot for an exact or substring title match.
+
+        Mirrors MemoryCacheManager's first-match rule so the log and the cache
+        always update the same memory.
+        """
+        slot = self._titles.get(location_id, {}).get(memory_title)
+        memories = self._index.get(location_id, [])
+        # An earlier substring match would win in the cache; only scan up to the exact hit
+        limit = slot if slot is not None else len(memories)
+        for i in range(limit):
+            title = memories[i].title
+            if memory_title in title or title in memory_title:
+                return i
+        return slot
+
+    def _replay(self) -> None:
+        """Rebuild the index from the whole log, skipping corrupt lines."""
+        self._index = {}
+        self._titles = {}
+        self._locations = {}
+        self._record_count = 0
+        self._log_offset = 0
+        self._log_inode = os.stat(self.log_path).st_ino
+        self._read_from_offset()
+
+    def _catch_up(self) -> None:
+        """
+        Apply records appended to the log since this store last read it.
+
+        A log replaced by another process's compaction is replayed in full.
+        Caller holds the lock.
+        """
+        if not self.log_path.exists():
+            return
+        inode = os.stat(self.log_path).st_ino
+        if self._log_inode is not None and inode != self._log_inode:
+            self._replay()
+            return
+        self._log_inode = inode
+        before = self._record_count
+        self._read_from_offset()
+        self.records_from_other_processes += self._record_count - before
+
+    def _read_from_offset(self) -> None:
+        """Apply the complete lines after the current read position."""
+        with open(self.log_path, "rb") as f:
+            f.seek(self._log_offset)
+            data = f.read()
+
+        # A torn final line is left for the next read
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            line_num = self._record_count + 1
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError, TypeError) as e:
+                self.logger.warning(
+                    f"Skipping malformed memory log record at line {line_num}: {e}",
+                    extra={"line_num": line_num, "error": str(e)}
+                )
+            self._record_count += 1
+        self._log_offset += end
+
+    def _import_markdown(self) -> None:
+        """Seed the log from an existing Memories.md (one-time migration)."""
+        content = self.markdown_path.read_text(encoding="utf-8")
+        parsed = MemoryCacheManager()
+        MemoryFileParser(self.logger, self.config, parsed)._parse_memories_content(content)
+        sections = self.file_writer._parse_location_sections(content)
+
+        for location_id, memories in parsed._memory_cache.items():
+            name = sections.get(location_id, {}).get("name", "")
+            for memory in memories:
+                self._apply({
+                    "op": "add",
+                    "location_id": location_id,
+                    "location_name": name,
+                    "memory": asdict(memory),
+                })
+
+        self.compact()
+        self.logger.info(
+            f"Imported {self.get_total_memories()} memories from {self.markdown_path} into {self.log_path}",
+            extra={
+                "event_type": "memory_store_imported",
+                "total_memories": self.get_total_memories(),
+            }
+        )
+
+    def _should_compact(self) -> bool:
+        """Check whether the log has grown enough to be worth rewriting."""
+        live = self.get_total_memories() + len(self._locations)
+        return (
+            self._record_count > COMPACTION_MIN_RECORDS
+            and self._record_count > self.compaction_ratio * live
+        )
@@ -6,6 +6,8 @@ ABOUTME: Pure boolean logic using ground truth state changes (no LLM calls) for
 from typing import Dict, Any, Optional
 import logging
 
+from action_outcome_store import get_outcome_store
+
 
 class SynthesisTrigger:
     """
@@ -38,6 +40,11 @@ class SynthesisTrigger:
         """
         Main entry point - determines if any trigger condition is met.
 
+        An outcome already seen from the same state (outcome_known, from the
+        action outcome store) was synthesized when it was first seen, so it is
+        skipped unless it killed the player or outcome_store_skip_known_memories
+        is off.
+
         Args:
             z_machine_context: Dict with keys:
                 - score_before, score_after, score_delta
@@ -46,11 +53,27 @@ class SynthesisTrigger:
                 - died (bool)
                 - response_length (int)
                 - first_visit (bool)
+                - outcome_known (bool, optional)
 
         Returns:
             True if LLM synthesis should be invoked, False otherwise
         """
-        # Check all individual triggers in priority order
+        if not self._any_trigger(z_machine_context):
+            return False
+
+        if z_machine_context.get('outcome_known') and not z_machine_context.get('died'):
+            store = get_outcome_store(self.config)
+            if store is not None:
+                skip = self.config.outcome_store_skip_known_memories
+                store.count_skip("memory_synthesis", skipped=skip)
+                if skip:
+                    self._log_debug("Skip: Outcome already known from this state")
+                    return False
+
+        return True
+
+    def _any_trigger(self, z_machine_context: Dict[str, Any]) -> bool:
+        """Check all individual triggers in priority order."""
         if self._check_score_change(z_machine_context):
             return True
 
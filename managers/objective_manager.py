@@ -8,17 +8,18 @@ Handles the complete lifecycle of objective management:
 - Refinement when too many objectives accumulate
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from pydantic import BaseModel
 from pathlib import Path
-from collections import deque
 from contextlib import nullcontext
 
+from episode_finalization import get_episode_finalizer
 from managers.base_manager import BaseManager
 from session.game_state import GameState
 from session.game_configuration import GameConfiguration
 from knowledge import AdaptiveKnowledgeManager
 from shared_utils import create_json_schema, strip_markdown_json_fences, extract_json_from_text, estimate_tokens
+from token_budget import ContextBudgeter, ContextSection
 
 
 class ObjectiveDiscoveryResponse(BaseModel):
@@ -72,6 +73,9 @@ class ObjectiveManager(BaseManager):
         # Objective refinement tracking
         self.last_objective_refinement_turn = 0
 
+        # Report from the last objective context fitted to a token budget
+        self.last_context_budget: Dict[str, Any] = {}
+
     def reset_episode(self) -> None:
         """Reset objective manager state for a new episode."""
         self.last_objective_refinement_turn = 0
@@ -274,6 +278,13 @@ class ObjectiveManager(BaseManager):
             map_context = self._get_map_context()
             gameplay_context = self._get_gameplay_context()
 
+            # Fit the sections to the objective context token budget (if set)
+            knowledge_content, memories_content, map_context, gameplay_context = (
+                self._fit_objective_context(
+                    knowledge_content, memories_content, map_context, gameplay_context
+                )
+            )
+
             # Log token counts for each context section
             knowledge_tokens = estimate_tokens(knowledge_content)
             memories_tokens = estimate_tokens(memories_content)
@@ -1191,6 +1202,7 @@ Example valid response:
         Returns:
             Complete contents of knowledge base file or fallback message
         """
+        get_episode_finalizer().knowledge_barrier("objective_knowledge")
         kb_path = Path(self.config.zork_game_workdir) / self.config.knowledge_file
         if kb_path.exists():
             return kb_path.read_text(encoding="utf-8")
@@ -1210,25 +1222,24 @@ Example valid response:
         if from_id == to_id:
             return 0
 
-        if not self.map_manager or not hasattr(self.map_manager, 'game_map'):
-            return float('inf')
+        return self._get_distance_map(from_id).get(to_id, float('inf'))
 
-        visited = {from_id}
-        queue = deque([(from_id, 0)])  # (location_id, distance)
+    def _get_distance_map(self, from_id: int) -> Dict[int, int]:
+        """
+        Get hop counts from a location to every reachable location.
+
+        Uses the map's cached routing index.
 
-        while queue:
-            current_id, dist = queue.popleft()
+        Args:
+            from_id: Starting location ID
 
-            # Check outgoing connections
-            if current_id in self.map_manager.game_map.connections:
-                for exit_action, dest_id in self.map_manager.game_map.connections[current_id].items():
-                    if dest_id == to_id:
-                        return dist + 1
-                    if dest_id not in visited:
-                        visited.add(dest_id)
-                        queue.append((dest_id, dist + 1))
+        Returns:
+            Dict mapping reachable location ID to hop count
+        """
+        if not self.map_manager or not hasattr(self.map_manager, 'game_map'):
+            return {}
 
-        return float('inf')  # Unreachable
+        return self.map_manager.game_map.distances_from(from_id)
 
     def _get_all_memories_by_distance(self, current_location_id: int) -> str:
         """
@@ -1247,7 +1258,8 @@ Example valid response:
         if not self.simple_memory or not self.map_manager:
             return "No memory data available"
 
-        # Calculate distances to all locations with strategic memories
+        # Calculate distances to all locations with strategic memories (one BFS)
+        distances = self._get_distance_map(current_location_id)
         location_distances = []
         for loc_id, memories in self.simple_memory.memory_cache.items():
             # Filter to ACTIVE memories only (strategic filtering)
@@ -1261,7 +1273,7 @@ Example valid response:
             ]
 
             if strategic_memories:  # Only include location if it has strategic memories
-                distance = self._calculate_distance_bfs(current_location_id, loc_id)
+                distance = distances.get(loc_id, float('inf'))
                 location_distances.append((distance, loc_id, strategic_memories))
 
         # Sort by distance (closest first)
@@ -1389,6 +1401,40 @@ Example valid response:
 
         return "\n".join(lines)
 
+    def _fit_objective_context(
+        self, knowledge: str, memories: str, map_context: str, gameplay: str
+    ) -> Tuple[str, str, str, str]:
+        """
+        Fit the objective discovery context to objective_context_token_budget.
+
+        Recent gameplay is kept longest; then memories (nearest locations
+        first, so distant ones go first), the knowledge base and the map.
+        A dropped section is replaced by a placeholder so the prompt keeps
+        its headings.
+
+        Returns:
+            (knowledge, memories, map_context, gameplay), possibly shortened
+        """
+        # Configs predating the budget settings (or spec'd test mocks) mean no budget
+        budget = getattr(self.config, "objective_context_token_budget", 0)
+        caps = getattr(self.config, "context_section_token_caps", None)
+        if not budget and not caps:
+            return knowledge, memories, map_context, gameplay
+
+        sections = [
+            ContextSection("knowledge", knowledge, priority=30, truncate="head"),
+            ContextSection("memories", memories, priority=40, truncate="head"),
+            ContextSection("map", map_context, priority=20, truncate="head"),
+            ContextSection("gameplay", gameplay, priority=60, truncate="tail"),
+        ]
+        budgeter = ContextBudgeter(budget, caps, tokenizer=self.config.context_tokenizer)
+        fitted, report = budgeter.fit(sections)
+        self.last_context_budget = report.to_dict()
+
+        texts = {section.name: section.text for section in fitted}
+        placeholder = "(Omitted to fit the context budget)"
+        return tuple(texts.get(section.name, placeholder) for section in sections)
+
     def get_status(self) -> Dict[str, Any]:
         """Get current objective manager status."""
         status = super().get_status()
@@ -1403,6 +1449,7 @@ Example valid response:
                 "staleness_tracker_size": len(
                     self.game_state.objective_staleness_tracker
                 ),
+                "context_budget": self.last_context_budget,
             }
         )
         return status
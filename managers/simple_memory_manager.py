@@ -12,6 +12,7 @@ This module implements the Simple Memory System:
 """
 
 import re
+from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
 from managers.base_manager import BaseManager
@@ -24,6 +25,7 @@ from managers.memory import (
     MemoryCacheManager,
     MemoryFileParser,
     MemoryFileWriter,
+    MemoryLogStore,
     HistoryFormatter,
     MemorySynthesizer,
 )
@@ -46,7 +48,7 @@ class SimpleMemoryManager(BaseManager):
     Manages location-based memory system for ZorkGPT with multi-step synthesis.
 
     Responsibilities:
-    - Parse Memories.md file format on initialization
+    - Load persistent memories on initialization (memory log or Memories.md)
     - Maintain in-memory cache of memories per location ID
     - Synthesize memories with multi-step procedure detection (prerequisites, delayed consequences)
     - Manage memory status lifecycle (ACTIVE, TENTATIVE, SUPERSEDED)
@@ -74,6 +76,11 @@ class SimpleMemoryManager(BaseManager):
         self.file_parser = MemoryFileParser(self.logger, self.config, self.cache_manager)
         self.file_writer = MemoryFileWriter(self.logger, self.config)
 
+        # Append-only log backend; when enabled Memories.md is only an export view
+        self.memory_store: Optional[MemoryLogStore] = None
+        if self.config.simple_memory_store == "log":
+            self.memory_store = MemoryLogStore(self.logger, self.config, self.file_writer)
+
         # Store LLM client (lazy initialization)
         self._llm_client = llm_client
         self._llm_client_initialized = llm_client is not None
@@ -88,8 +95,11 @@ class SimpleMemoryManager(BaseManager):
             llm_client=self._llm_client  # Note: may be None (lazy init)
         )
 
-        # Parse Memories.md file on initialization
-        self.file_parser.load_from_file()
+        # Load persistent memories on initialization
+        if self.memory_store:
+            self.memory_store.load_into(self.cache_manager)
+        else:
+            self.file_parser.load_from_file()
 
     @property
     def llm_client(self):
@@ -141,6 +151,25 @@ class SimpleMemoryManager(BaseManager):
         """
         self.cache_manager._ephemeral_memory_cache = value
 
+    @property
+    def _persistent_backend(self):
+        """Backend that persists CORE/PERMANENT memories (log store or Memories.md writer)."""
+        return self.memory_store or self.file_writer
+
+    def export_markdown(self) -> Path:
+        """
+        Render Memories.md from the memory log.
+
+        With the markdown backend the file is already current, so this only
+        returns its path.
+
+        Returns:
+            Path to Memories.md
+        """
+        if self.memory_store:
+            return self.memory_store.export_markdown()
+        return Path(self.config.zork_game_workdir) / "Memories.md"
+
     def reset_episode(self) -> None:
         """
         Reset manager state for new episode.
@@ -189,6 +218,9 @@ class SimpleMemoryManager(BaseManager):
             "locations_tracked": self.cache_manager.get_locations_tracked(),
             "total_memories": self.cache_manager.get_total_memories(),
             "cache_populated": self.cache_manager.get_locations_tracked() > 0,
+            "memory_store": (
+                self.memory_store.get_stats() if self.memory_store else {"backend": "markdown"}
+            ),
         })
 
         return status
@@ -247,7 +279,7 @@ class SimpleMemoryManager(BaseManager):
         1. Checks for exact duplicate titles (safety net for LLM hallucination)
         2. Routes based on memory.persistence value
         3. Ephemeral: In-memory only (ephemeral_cache)
-        4. Core/Permanent: File write with lock, backup, and atomic write (via file_writer)
+        4. Core/Permanent: Persisted via the configured backend (log append or Memories.md rewrite)
 
         Args:
             location_id: Integer location ID from Z-machine
@@ -294,8 +326,8 @@ class SimpleMemoryManager(BaseManager):
 
             return True
 
-        # Core/Permanent memories: delegate to file_writer
-        success = self.file_writer.write_memory(memory, location_id, location_name)
+        # Core/Permanent memories: delegate to the persistent backend
+        success = self._persistent_backend.write_memory(memory, location_id, location_name)
 
         if success:
             # Update cache after successful write via cache_manager
@@ -448,8 +480,8 @@ class SimpleMemoryManager(BaseManager):
             )
             return False
 
-        # Delegate to file_writer
-        success = self.file_writer.update_memory_status(
+        # Delegate to the persistent backend
+        success = self._persistent_backend.update_memory_status(
             location_id=location_id,
             memory_title=memory_title,
             new_status=MemoryStatus.SUPERSEDED,
@@ -570,7 +602,7 @@ class SimpleMemoryManager(BaseManager):
         """
         Update the status of an existing memory in file and cache.
 
-        Delegates to file_writer.update_memory_status() for file operations.
+        Delegates to the persistent backend's update_memory_status().
 
         Args:
             location_id: Location where memory exists
@@ -583,8 +615,8 @@ class SimpleMemoryManager(BaseManager):
         Returns:
             True if successful, False if memory not found or update failed
         """
-        # Delegate to file_writer
-        success = self.file_writer.update_memory_status(
+        # Delegate to the persistent backend
+        success = self._persistent_backend.update_memory_status(
             location_id=location_id,
             memory_title=memory_title,
             new_status=new_status,
@@ -11,13 +11,17 @@ Handles all state management responsibilities:
 """
 
 import json
-import pickle
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from managers.base_manager import BaseManager
 from session.game_state import GameState
 from session.game_configuration import GameConfiguration
+from state_exporter import FilesystemBucket, StateExporter
+from shared_store import atomic_write_text
+from state_journal import MANIFEST_FILE, EpisodeExportLog, StateJournal
+from loop_detector import LoopDetector, LoopObservation
 
 # Import boto3 only when needed
 try:
@@ -48,7 +52,9 @@ class StateManager(BaseManager):
 
         # S3 client for state uploads
         self.s3_client = None
-        if config.s3_bucket and BOTO3_AVAILABLE:
+        if config.s3_bucket and config.s3_local_dir:
+            self.s3_client = FilesystemBucket(config.s3_local_dir)
+        elif config.s3_bucket and BOTO3_AVAILABLE:
             try:
                 self.s3_client = boto3.client("s3")
             except Exception as e:
@@ -58,9 +64,23 @@ class StateManager(BaseManager):
                 "S3 bucket configured but boto3 not available. Install with: uv sync --extra s3"
             )
 
-        # State loop detection (Phase 6)
-        self.state_history: List[int] = []  # Track state hashes for loop detection
-        self.max_state_history_size: int = 1000  # Prevent unbounded memory growth
+        # State loop detection (Phase 6): digests of recent states, bounded window
+        self.state_loops = LoopDetector(
+            window=config.state_loop_window,
+            min_cycle_length=1,
+            max_cycle_length=config.loop_max_cycle_length,
+        )
+        self.last_state_observation: Optional[LoopObservation] = None
+
+        # Delta export journal and uploaded-snapshot summary for the episode
+        self.episode_exports = EpisodeExportLog()
+
+        # File writes and uploads (background thread when enabled, otherwise inline)
+        self.exporter = StateExporter(
+            enabled=config.enable_background_state_export,
+            max_pending=config.state_export_queue_size,
+            logger=logger,
+        )
 
     def reset_episode(self) -> None:
         """Reset episode-specific state for a new episode."""
@@ -71,7 +91,11 @@ class StateManager(BaseManager):
         # This method only resets StateManager's internal state
 
         # Reset state loop detection (Phase 6)
-        self.state_history.clear()
+        self.state_loops.reset()
+        self.last_state_observation = None
+
+        # Next export starts a new journal with a keyframe
+        self.episode_exports.reset()
 
         self.log_debug("Episode state reset completed")
 
@@ -85,13 +109,30 @@ class StateManager(BaseManager):
         """Check if state needs processing this turn."""
         return False  # No turn-by-turn processing needed
 
+    @property
+    def state_history(self) -> List[str]:
+        """State digests in the loop detection window, oldest first."""
+        return list(self.state_loops.history)
+
+    @state_history.setter
+    def state_history(self, digests: List[str]) -> None:
+        self.state_loops.reset()
+        for digest in digests:
+            self.state_loops.observe(digest)
+
+    @property
+    def max_state_history_size(self) -> int:
+        return self.state_loops.window
+
     def track_state_hash(self, jericho_interface) -> Optional[bool]:
         """
-        Track current game state hash and detect loops.
+        Track current game state digest and detect loops.
 
-        Uses Jericho's state tuple to generate a hash and detect if we've
-        returned to an exact previous game state, which indicates the agent
-        is stuck in a loop.
+        Uses a compact digest of the game-relevant Z-machine state (object tree
+        and special RAM) to detect if we've returned to an exact previous game
+        state, which indicates the agent is stuck in a loop. Each check is a
+        dict lookup; the cycle length (e.g. 2 for "north, south, north,
+        south") is reported with the loop.
 
         Args:
             jericho_interface: JerichoInterface instance for accessing game state
@@ -100,44 +141,37 @@ class StateManager(BaseManager):
             True if loop detected, False if no loop, None on error
         """
         try:
-            # Get state hash from Jericho (hash of state tuple)
-            state_tuple = jericho_interface.save_state()
-            # Serialize the state tuple to bytes (handles numpy arrays inside)
-            # and hash the bytes for consistent comparison
-            state_hash = hash(pickle.dumps(state_tuple))
-
-            # Check for loop
-            if state_hash in self.state_history:
-                loop_index = self.state_history.index(state_hash)
-                turns_in_loop = len(self.state_history) - loop_index
+            digest = jericho_interface.get_state_digest()
+            observation = self.state_loops.observe(digest, self.game_state.turn_count)
+            self.last_state_observation = observation
 
+            if observation.revisit:
                 self.logger.warning(
                     "Exact game state loop detected",
                     extra={
                         "event_type": "state_loop_detected",
                         "episode_id": self.game_state.episode_id,
                         "turn": self.game_state.turn_count,
-                        "state_hash": state_hash,
-                        "loop_start_turn": loop_index + 1,
-                        "turns_in_loop": turns_in_loop,
+                        "state_hash": digest,
+                        "loop_start_turn": observation.last_seen_turn,
+                        "first_seen_turn": observation.first_seen_turn,
+                        "turns_in_loop": observation.revisit_distance,
+                        "cycle_length": observation.cycle_length,
                     },
                 )
                 return True
 
-            # Add to history (with size limit)
-            self.state_history.append(state_hash)
-            if len(self.state_history) > self.max_state_history_size:
-                self.state_history.pop(0)  # Remove oldest
-
             return False
 
         except Exception as e:
             self.log_error(f"Failed to track state hash: {e}")
             return None
 
-
     def get_current_state(
-        self, map_data: Dict[str, Any] = None, knowledge_data: Dict[str, Any] = None
+        self,
+        map_data: Dict[str, Any] = None,
+        knowledge_data: Dict[str, Any] = None,
+        timing_data: Dict[str, Any] = None,
     ) -> Dict[str, Any]:
         """Get comprehensive current state for export."""
         try:
@@ -186,6 +220,10 @@ class StateManager(BaseManager):
             if knowledge_data:
                 state_data["knowledge_base"] = knowledge_data
 
+            # Add per-phase turn timing percentiles if provided
+            if timing_data:
+                state_data["turn_timing"] = timing_data
+
             return state_data
 
         except Exception as e:
@@ -193,32 +231,42 @@ class StateManager(BaseManager):
             return {}
 
     def export_current_state(
-        self, map_data: Dict[str, Any] = None, knowledge_data: Dict[str, Any] = None
+        self,
+        map_data: Dict[str, Any] = None,
+        knowledge_data: Dict[str, Any] = None,
+        force_keyframe: bool = False,
+        timing_data: Dict[str, Any] = None,
     ) -> bool:
-        """Export current state to file and optionally to S3."""
+        """
+        Export current state to file and optionally to S3.
+
+        Args:
+            map_data: Map export from MapManager
+            knowledge_data: Knowledge export from KnowledgeManager
+            force_keyframe: In delta mode, write a full keyframe (episode end)
+            timing_data: Turn timing summary from the orchestrator's TurnTimer
+        """
         try:
             if not self.config.enable_state_export:
                 return True
 
             state_data = self.get_current_state(
-                map_data=map_data, knowledge_data=knowledge_data
+                map_data=map_data, knowledge_data=knowledge_data, timing_data=timing_data
             )
             if not state_data:
                 return False
 
-            # Export to local file
-            with open(self.config.state_export_file, "w") as f:
-                json.dump(state_data, f, indent=2)
+            if self.config.state_export_mode == "delta":
+                return self._export_state_delta(state_data, force_keyframe)
 
-            self.log_debug(f"State exported to {self.config.state_export_file}")
+            # Serialize now; the exporter may write after state_data has moved on
+            json_content = json.dumps(state_data, indent=2)
+            self._queue_state_file(json_content)
 
             # Upload to S3 if configured
             if self.config.s3_bucket and self.s3_client:
-                success = self.upload_state_to_s3(state_data)
-                if success:
-                    self.log_debug("State uploaded to S3")
-                else:
-                    self.log_warning("Failed to upload state to S3")
+                self._queue_state_upload(json_content)
+                self.episode_exports.track_snapshot(self.game_state.turn_count, state_data)
 
             return True
 
@@ -226,63 +274,170 @@ class StateManager(BaseManager):
             self.log_error(f"Failed to export current state: {e}")
             return False
 
-    def upload_state_to_s3(self, state_data: Dict[str, Any]) -> bool:
+    def _export_state_delta(
+        self, state_data: Dict[str, Any], force_keyframe: bool
+    ) -> bool:
         """
-        Upload current state to S3 using dual strategy for web viewer compatibility.
+        Append this turn to the episode's state journal.
 
-        This method uploads the state data to two S3 locations:
-        1. current_state.json - Always overwritten, used for live monitoring by zork_viewer.html
-        2. snapshots/{episode_id}/turn_{turn}.json - Historical preservation organized by episode
+        Only keyframes rewrite current_state.json and upload full snapshots;
+        other turns write just the changed sections, locally and to
+        snapshots/{episode_id}/delta_{turn}.json on S3.
+        """
+        journal = self._get_state_journal()
+        record = journal.record(
+            self.game_state.turn_count, state_data, force_keyframe=force_keyframe
+        )
+
+        if record["type"] == "keyframe":
+            json_content = json.dumps(state_data, indent=2)
+            self._queue_state_file(json_content)
+            if self.config.s3_bucket and self.s3_client:
+                self._queue_state_upload(json_content)
+                self.episode_exports.track_snapshot(self.game_state.turn_count, state_data)
+        elif self.config.s3_bucket and self.s3_client:
+            self._queue_delta_upload(record)
+            self.episode_exports.track_snapshot(self.game_state.turn_count, state_data)
+
+        return True
+
+    def export_episode_manifest(self) -> bool:
+        """
+        Queue snapshots/{episode_id}/manifest.json summarizing the episode's uploads.
 
-        This structure matches what the web viewer expects for both live monitoring
-        and historical episode browsing functionality.
+        Called once the final state export is queued, so generate_episode_index
+        can read one small object per finished episode instead of listing and
+        downloading its snapshots.
 
         Returns:
-            bool: True if at least one upload succeeded, False if both failed or S3 not configured
+            bool: True if a manifest was queued
         """
-        try:
-            if not self.s3_client or not self.config.s3_bucket:
-                return False
+        if not (self.config.s3_bucket and self.s3_client):
+            return False
 
-            json_content = json.dumps(state_data, indent=2)
-            upload_success_count = 0
+        manifest = self.episode_exports.manifest(self.game_state.episode_id)
+        if manifest is None:
+            return False
+        manifest["finalized_at"] = datetime.now().isoformat()
 
-            # 1. Upload current state (always overwritten for live monitoring)
-            current_state_key = f"{self.config.s3_key_prefix}current_state.json"
-            try:
-                self.s3_client.put_object(
-                    Bucket=self.config.s3_bucket,
-                    Key=current_state_key,
-                    Body=json_content,
-                    ContentType="application/json",
-                    CacheControl="no-cache, must-revalidate",  # Force fresh data for live monitoring
-                )
-                self.log_debug(f"Uploaded current state to S3: {current_state_key}")
-                upload_success_count += 1
-            except Exception as e:
-                self.log_warning(f"Failed to upload current state to S3: {e}")
+        manifest_key = (
+            f"{self.config.s3_key_prefix}snapshots/"
+            f"{self.game_state.episode_id}/{MANIFEST_FILE}"
+        )
+        self.exporter.submit(
+            f"s3:{manifest_key}",
+            self._put_state_object,
+            manifest_key,
+            json.dumps(manifest, indent=2),
+        )
+        return True
 
-            # 2. Upload historical snapshot (organized by episode and turn)
-            turn_count = self.game_state.turn_count
-            snapshot_key = f"{self.config.s3_key_prefix}snapshots/{self.game_state.episode_id}/turn_{turn_count}.json"
-            try:
-                self.s3_client.put_object(
-                    Bucket=self.config.s3_bucket,
-                    Key=snapshot_key,
-                    Body=json_content,
-                    ContentType="application/json",
-                )
-                self.log_debug(f"Uploaded snapshot to S3: {snapshot_key}")
-                upload_success_count += 1
-            except Exception as e:
-                self.log_warning(f"Failed to upload snapshot to S3: {e}")
+    def _queue_state_file(self, json_content: str) -> None:
+        """Queue the local current-state file write (coalesced to the newest)."""
+        path = self.config.state_export_file
+        self.exporter.submit(f"file:{path}", self._write_state_file, path, json_content)
 
-            # Return True if at least one upload succeeded
-            return upload_success_count > 0
+    def queue_metrics_file(self, path: str, text: str) -> None:
+        """Queue an atomic write of a metrics file (coalesced to the newest)."""
+        self.exporter.submit(f"file:{path}", atomic_write_text, path, text)
 
-        except Exception as e:
-            self.log_error(f"Failed to upload state to S3: {e}")
-            return False
+    def _write_state_file(self, path: str, json_content: str) -> None:
+        with open(path, "w") as f:
+            f.write(json_content)
+        self.log_debug(f"State exported to {path}")
+
+    def _queue_state_upload(self, json_content: str) -> None:
+        """
+        Queue the current_state.json and turn snapshot uploads.
+
+        Keys are resolved now so a late upload still lands under the turn and
+        episode it describes; pending current_state.json uploads coalesce.
+        """
+        current_state_key, snapshot_key = self._state_upload_keys()
+        self.exporter.submit(
+            f"s3:{current_state_key}",
+            self._put_state_object,
+            current_state_key,
+            json_content,
+            CacheControl="no-cache, must-revalidate",
+        )
+        self.exporter.submit(
+            f"s3:{snapshot_key}", self._put_state_object, snapshot_key, json_content
+        )
+
+    def _state_upload_keys(self) -> tuple:
+        """Get the (current_state, turn snapshot) S3 keys for the current turn."""
+        prefix = self.config.s3_key_prefix
+        return (
+            f"{prefix}current_state.json",
+            f"{prefix}snapshots/{self.game_state.episode_id}/turn_{self.game_state.turn_count}.json",
+        )
+
+    def _queue_delta_upload(self, record: Dict[str, Any]) -> None:
+        """
+        Queue a delta journal record upload next to the episode's keyframe snapshots.
+
+        Readers rebuild turn N by loading turn_{keyframe_turn}.json and applying
+        delta_{keyframe_turn + 1}.json .. delta_{N}.json in order.
+        """
+        delta_key = (
+            f"{self.config.s3_key_prefix}snapshots/"
+            f"{self.game_state.episode_id}/delta_{record['turn']}.json"
+        )
+        self.exporter.submit(
+            f"s3:{delta_key}",
+            self._put_state_object,
+            delta_key,
+            json.dumps(record, separators=(",", ":")),
+        )
+
+    def _put_state_object(self, key: str, body: str, **kwargs) -> None:
+        """Upload one JSON object to the state bucket (raises on failure)."""
+        self.s3_client.put_object(
+            Bucket=self.config.s3_bucket,
+            Key=key,
+            Body=body,
+            ContentType="application/json",
+            **kwargs,
+        )
+        self.log_debug(f"Uploaded state object to S3: {key}")
+
+    def flush_exports(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued state writes and uploads to finish.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if everything was written within the timeout
+        """
+        return self.exporter.flush(timeout=timeout)
+
+    def close(self) -> None:
+        """Flush queued state writes and stop the exporter thread."""
+        self.exporter.close()
+
+    def _get_state_journal(self) -> StateJournal:
+        """Get the journal for the current episode, starting a new one if needed."""
+        journal_path = (
+            Path(self.config.zork_game_workdir)
+            / "episodes"
+            / self.game_state.episode_id
+            / "state_journal.jsonl"
+        )
+        journal = self.episode_exports.journal
+        if journal is None or journal.path != journal_path:
+            journal = StateJournal(
+                journal_path, keyframe_interval=self.config.state_keyframe_interval
+            )
+            self.episode_exports.journal = journal
+        return journal
+
+    @property
+    def state_journal(self) -> Optional[StateJournal]:
+        """The current episode's state journal (None before the first export)."""
+        return self.episode_exports.journal
 
     def get_recent_log(self, num_entries: int = 10) -> List[Dict[str, Any]]:
         """Get recent game log entries with reasoning."""
@@ -422,9 +577,15 @@ class StateManager(BaseManager):
                 "memory_entries": len(self.game_state.memory_log_history),
                 "action_history_length": len(self.game_state.action_history),
                 "export_enabled": self.config.enable_state_export,
+                "export_mode": self.config.state_export_mode,
+                "state_journal": (
+                    self.state_journal.get_stats() if self.state_journal else None
+                ),
                 "s3_configured": self.s3_client is not None,
-                "state_history_size": len(self.state_history),
+                "exporter": self.exporter.get_stats(),
+                "state_history_size": len(self.state_loops),
                 "loop_detection_enabled": True,
+                "state_loops": self.state_loops.get_stats(),
             }
         )
         return status
@@ -1,7 +1,9 @@
-from typing import List, Dict, Set, Tuple, Optional, Any
+from typing import List, Dict, Set, Tuple, Optional, Any, Callable
+from collections import deque
 import json
 import os
 from datetime import datetime, timezone
+from shared_store import atomic_write_text
 
 DIRECTION_MAPPING = {
     "n": "north",
@@ -232,6 +234,14 @@ class MapGraph:
         self.exit_failure_counts: Dict[Tuple[int, str], int] = {}
         # Track exits that have been permanently pruned to avoid re-adding them
         self.pruned_exits: Dict[int, Set[str]] = {}
+        # Routing index: source room_id -> (distances, parents), built lazily by BFS
+        # distances[room_id] = hops; parents[room_id] = (previous room_id, exit taken)
+        self._routes: Dict[int, Tuple[Dict[int, int], Dict[int, Tuple[int, str]]]] = {}
+        self.route_cache_hits = 0
+        self.route_cache_misses = 0
+        # Bumped by every mutating method; memoized renderings are keyed on it
+        self.version = 0
+        self._render_cache: Dict[Any, Tuple[int, Any]] = {}
 
     def _get_opposite_direction(self, direction: str) -> str:
         opposites = {
@@ -269,6 +279,7 @@ class MapGraph:
         if room_id not in self.rooms:
             self.rooms[room_id] = Room(room_id=room_id, name=room_name)
             self.room_names[room_id] = room_name
+            self.version += 1
         return self.rooms[room_id]
 
     def update_room_exits(self, room_id: int, new_exits: List[str]):
@@ -296,6 +307,7 @@ class MapGraph:
 
         # Filter out exits that have been permanently pruned
         pruned_exits_for_room = self.pruned_exits.get(room_id, set())
+        exit_count = len(self.rooms[room_id].exits)
 
         for exit_name in normalized_new_exits:
             # Don't re-add exits that have been pruned as invalid
@@ -313,6 +325,9 @@ class MapGraph:
                         },
                     )
 
+        if len(self.rooms[room_id].exits) != exit_count:
+            self.version += 1
+
     def track_exit_failure(self, room_id: int, exit_name: str) -> int:
         """
         Track a failed exit attempt and return the current failure count.
@@ -333,6 +348,7 @@ class MapGraph:
         self.exit_failure_counts[failure_key] = (
             self.exit_failure_counts.get(failure_key, 0) + 1
         )
+        self.version += 1
 
         failure_count = self.exit_failure_counts[failure_key]
         if self.logger:
@@ -364,6 +380,9 @@ class MapGraph:
                 )
             return
 
+        # Every path below records something (verification, conflict or new exit)
+        self.version += 1
+
         # Use basic normalization for standard directions only
         # Let LLM layers handle semantic equivalence
         normalized_action = normalize_direction(exit_taken)
@@ -507,6 +526,12 @@ class MapGraph:
         # Add the forward connection
         if from_room_id not in self.connections:
             self.connections[from_room_id] = {}
+        previous_destination = self.connections[from_room_id].get(processed_exit_taken)
+        if previous_destination is None:
+            self._invalidate_routes(from_room_id, to_room_id)
+        elif previous_destination != to_room_id:
+            # Replaced exit: routes through the old destination may be gone
+            self._invalidate_routes(from_room_id)
         self.connections[from_room_id][processed_exit_taken] = to_room_id
         self.rooms[from_room_id].add_exit(
             processed_exit_taken
@@ -522,6 +547,7 @@ class MapGraph:
             # Only add reverse connection if it doesn't overwrite an existing one from that direction
             # This handles cases where "north" from A leads to B, but "south" from B leads to C (unlikely but possible)
             if opposite_exit not in self.connections[to_room_id]:
+                self._invalidate_routes(to_room_id, from_room_id)
                 self.connections[to_room_id][opposite_exit] = from_room_id
                 # Set confidence for reverse connection (slightly lower since it's inferred)
                 self.connection_confidence[reverse_connection_key] = confidence * 0.9
@@ -575,6 +601,188 @@ class MapGraph:
         room = self.rooms[room_id]
         return sorted(list(room.exits))
 
+    def distances_from(self, source_id: int) -> Dict[int, int]:
+        """
+        Get hop counts from a room to every room reachable from it.
+
+        Built by one BFS over confirmed connections (skipping pruned exits) and
+        cached per source until a map change could alter it. The returned dict
+        is shared with the cache and must not be modified.
+
+        Args:
+            source_id: Starting location ID
+
+        Returns:
+            Dict mapping reachable location ID to hop count (source included as 0)
+        """
+        return self._get_routes(source_id)[0]
+
+    def get_distance(self, from_id: int, to_id: int) -> float:
+        """
+        Get the shortest path length between two rooms.
+
+        Args:
+            from_id: Starting location ID
+            to_id: Target location ID
+
+        Returns:
+            Hop count, or float('inf') if unreachable
+        """
+        if from_id == to_id:
+            return 0
+        return self.distances_from(from_id).get(to_id, float("inf"))
+
+    def find_route(self, from_id: int, to_id: int) -> Optional[List[Tuple[str, int]]]:
+        """
+        Reconstruct a shortest route between two rooms.
+
+        Args:
+            from_id: Starting location ID
+            to_id: Target location ID
+
+        Returns:
+            List of (exit, room_id arrived at) steps ([] if from_id == to_id),
+            or None if to_id is unreachable
+        """
+        if from_id == to_id:
+            return []
+        distances, parents = self._get_routes(from_id)
+        if to_id not in distances:
+            return None
+
+        steps = []
+        room_id = to_id
+        while room_id != from_id:
+            previous_id, exit_name = parents[room_id]
+            steps.append((exit_name, room_id))
+            room_id = previous_id
+        steps.reverse()
+        return steps
+
+    def find_nearest(
+        self, from_id: int, predicate: Callable[[int], bool]
+    ) -> Optional[Tuple[int, List[Tuple[str, int]]]]:
+        """
+        Find the closest room (including from_id itself) matching a predicate.
+
+        Args:
+            from_id: Starting location ID
+            predicate: Called with a location ID
+
+        Returns:
+            (room_id, route) for the nearest match, or None if no reachable room matches
+        """
+        distances = self.distances_from(from_id)
+        # Dicts keep BFS insertion order, so the first match is the nearest
+        for room_id in distances:
+            if predicate(room_id):
+                return room_id, self.find_route(from_id, room_id)
+        return None
+
+    def get_unexplored_exits(self, room_id: int) -> List[str]:
+        """
+        Get exits known for a room that have not been mapped to a destination yet.
+
+        Args:
+            room_id: Z-machine location ID
+
+        Returns:
+            Sorted list of exit names not yet confirmed by movement
+        """
+        if room_id not in self.rooms:
+            return []
+        mapped = self.connections.get(room_id, {})
+        pruned = self.pruned_exits.get(room_id, set())
+        return sorted(
+            exit_name for exit_name in self.rooms[room_id].exits
+            if exit_name not in mapped and exit_name not in pruned
+        )
+
+    def describe_route_to_unexplored(self, from_id: int) -> str:
+        """
+        Describe the route to the nearest other room with unexplored exits.
+
+        Args:
+            from_id: Current location ID
+
+        Returns:
+            One-line navigation hint, or "" if the current room still has
+            unexplored exits or none are reachable
+        """
+        if from_id is None or from_id not in self.rooms:
+            return ""
+        nearest = self.find_nearest(from_id, self.get_unexplored_exits)
+        if nearest is None or nearest[0] == from_id:
+            return ""
+
+        room_id, route = nearest
+        room_name = self.room_names.get(room_id, f"Room#{room_id}")
+        moves = ", ".join(exit_name for exit_name, _ in route)
+        return (
+            f"{room_name} ({len(route)} move{'s' if len(route) != 1 else ''}: {moves}) "
+            f"has unexplored exits: {', '.join(self.get_unexplored_exits(room_id))}"
+        )
+
+    def get_routing_stats(self) -> Dict[str, int]:
+        """Get routing index counters for status reporting."""
+        return {
+            "cached_sources": len(self._routes),
+            "cache_hits": self.route_cache_hits,
+            "cache_misses": self.route_cache_misses,
+        }
+
+    def _memoized(self, key: Any, build: Callable[[], Any]) -> Any:
+        """Return build()'s result, reusing it until the map version changes."""
+        cached = self._render_cache.get(key)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        value = build()
+        self._render_cache[key] = (self.version, value)
+        return value
+
+    def _get_routes(self, source_id: int) -> Tuple[Dict[int, int], Dict[int, Tuple[int, str]]]:
+        routes = self._routes.get(source_id)
+        if routes is not None:
+            self.route_cache_hits += 1
+            return routes
+
+        self.route_cache_misses += 1
+        distances = {source_id: 0}
+        parents: Dict[int, Tuple[int, str]] = {}
+        queue = deque([source_id])
+        while queue:
+            room_id = queue.popleft()
+            pruned = self.pruned_exits.get(room_id, ())
+            # Sorted so equal-length routes are chosen deterministically
+            for exit_name, dest_id in sorted(self.connections.get(room_id, {}).items()):
+                if dest_id not in distances and exit_name not in pruned:
+                    distances[dest_id] = distances[room_id] + 1
+                    parents[dest_id] = (room_id, exit_name)
+                    queue.append(dest_id)
+
+        routes = (distances, parents)
+        self._routes[source_id] = routes
+        return routes
+
+    def _invalidate_routes(self, room_id: int, new_destination: Optional[int] = None) -> None:
+        """
+        Drop cached routes that a change to room_id's exits could alter.
+
+        Only sources that reach room_id are affected. When a new exit is
+        added (new_destination given) a source that already reaches the
+        destination at least as quickly keeps its routes.
+        """
+        stale = []
+        for source_id, (distances, _) in self._routes.items():
+            hops = distances.get(room_id)
+            if hops is None:
+                continue
+            if new_destination is not None and distances.get(new_destination, hops + 2) <= hops + 1:
+                continue
+            stale.append(source_id)
+        for source_id in stale:
+            del self._routes[source_id]
+
     def get_context_for_prompt(
         self,
         current_room_id: int,
@@ -673,19 +881,56 @@ class MapGraph:
         """
         Render the map as a Mermaid diagram using actual location IDs.
 
+        Memoized until the map next changes.
+
         Returns:
             Mermaid diagram syntax as a string
         """
         if not self.rooms:
             return "graph LR\n    A[No rooms mapped yet]"
+        return self._memoized("mermaid", lambda: self._render_mermaid(self.rooms.keys()))
 
+    def render_mermaid_compact(self, current_room_id: int, max_rooms: int) -> str:
+        """
+        Render only the part of the map nearest the current room.
+
+        Keeps prompts from growing with every explored room: the max_rooms
+        rooms closest to current_room_id (by routing distance) are drawn, and
+        exits leading out of that neighbourhood end in "(not shown)" nodes.
+        Small maps, an unknown current room or max_rooms <= 0 get the full
+        diagram.
+
+        Args:
+            current_room_id: Location ID to center the rendering on
+            max_rooms: Maximum number of rooms to draw
+
+        Returns:
+            Mermaid diagram syntax as a string
+        """
+        if max_rooms <= 0 or len(self.rooms) <= max_rooms or current_room_id not in self.rooms:
+            return self.render_mermaid()
+
+        def render() -> str:
+            nearby = [room_id for room_id in self.distances_from(current_room_id) if room_id in self.rooms]
+            diagram = self._render_mermaid(nearby[:max_rooms], outside_label="not shown")
+            header, body = diagram.split("\n", 1)
+            note = (
+                f"    %% {min(len(nearby), max_rooms)} of {len(self.rooms)} rooms shown "
+                f"(nearest to L{current_room_id})"
+            )
+            return f"{header}\n{note}\n{body}"
+
+        return self._memoized(("mermaid_compact", current_room_id, max_rooms), render)
+
+    def _render_mermaid(self, room_ids, outside_label: str = "Unknown") -> str:
+        """Render the given rooms; destinations outside them are labeled with outside_label."""
         lines = ["graph LR"]
 
         # Create node definitions with sanitized IDs
         room_id_to_node = {}
 
         # First pass: create node IDs and definitions using actual location IDs
-        sorted_room_ids = sorted(self.rooms.keys())
+        sorted_room_ids = sorted(room_ids)
         for room_id in sorted_room_ids:
             node_id = f"L{room_id}"  # Use actual location ID
             room_id_to_node[room_id] = node_id
@@ -722,7 +967,7 @@ class MapGraph:
                             .replace("[", "\\[")
                             .replace("]", "\\]")
                         )
-                        lines.append(f'    {unknown_id}["{sanitized_dest} (Unknown)"]')
+                        lines.append(f'    {unknown_id}["{sanitized_dest} ({outside_label})"]')
                         sanitized_action = exit_action.replace('"', '\\"')
                         connection_lines.append(
                             f'    {from_id} -->|"{sanitized_action}"| {unknown_id}'
@@ -786,6 +1031,9 @@ class MapGraph:
 
     def get_map_quality_metrics(self) -> Dict[str, float]:
         """Get metrics about the overall quality of the map."""
+        return dict(self._memoized("quality_metrics", self._compute_map_quality_metrics))
+
+    def _compute_map_quality_metrics(self) -> Dict[str, float]:
         if not self.connection_confidence:
             return {
                 "average_confidence": 0.0,
@@ -812,7 +1060,10 @@ class MapGraph:
         }
 
     def render_confidence_report(self) -> str:
-        """Generate a detailed confidence report for the map."""
+        """Generate a detailed confidence report for the map (memoized until the map changes)."""
+        return self._memoized("confidence_report", self._render_confidence_report)
+
+    def _render_confidence_report(self) -> str:
         metrics = self.get_map_quality_metrics()
 
         report = [
@@ -880,7 +1131,16 @@ class MapGraph:
 
         Note:
             connection_conflicts are NOT persisted as they are episode-specific.
+            The body is memoized until the map next changes (only the metadata
+            timestamp is fresh), so treat the result as read-only.
         """
+        data = self._memoized("to_dict", self._build_dict)
+        return {
+            **data,
+            "metadata": {**data["metadata"], "timestamp": datetime.now(timezone.utc).isoformat()},
+        }
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "rooms": {
                 str(room_id): {
@@ -1085,8 +1345,8 @@ class MapGraph:
         """
         try:
             data = self.to_dict()
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            # Atomic replace: a parallel episode may be loading the file right now
+            atomic_write_text(filepath, json.dumps(data, indent=2))
 
             if self.logger:
                 self.logger.info(
@@ -1198,6 +1458,59 @@ class MapGraph:
 
 
 
+    def merge_from(self, other: 'MapGraph') -> Dict[str, int]:
+        """
+        Fold another map of the same game into this one.
+
+        Used when parallel episodes save to the same map_state.json: rooms,
+        exits, connections and pruned exits are unioned. Where both maps know
+        a connection this map's destination is kept, confidence and counters
+        take the larger value, and pruned exits are never re-added.
+
+        Args:
+            other: Map to merge in (not modified)
+
+        Returns:
+            Dict with the number of rooms and connections added
+        """
+        added_rooms = 0
+        added_connections = 0
+
+        for room_id, exits in other.pruned_exits.items():
+            self.pruned_exits.setdefault(room_id, set()).update(exits)
+
+        for room_id, other_room in other.rooms.items():
+            room = self.rooms.get(room_id)
+            if room is None:
+                room = self.rooms[room_id] = Room(room_id=room_id, name=other_room.name)
+                added_rooms += 1
+            room.exits.update(other_room.exits - self.pruned_exits.get(room_id, set()))
+
+        for room_id, name in other.room_names.items():
+            self.room_names.setdefault(room_id, name)
+
+        for room_id, connections in other.connections.items():
+            pruned = self.pruned_exits.get(room_id, set())
+            ours = self.connections.setdefault(room_id, {})
+            for exit_name, destination in connections.items():
+                if exit_name not in ours and exit_name not in pruned:
+                    ours[exit_name] = destination
+                    added_connections += 1
+
+        if added_connections or other.pruned_exits:
+            self._routes.clear()
+        self.version += 1
+
+        for counts, other_counts in (
+            (self.connection_confidence, other.connection_confidence),
+            (self.connection_verifications, other.connection_verifications),
+            (self.exit_failure_counts, other.exit_failure_counts),
+        ):
+            for key, value in other_counts.items():
+                counts[key] = max(counts.get(key, value), value)
+
+        return {"rooms_added": added_rooms, "connections_added": added_connections}
+
     def prune_invalid_exits(self, room_id: int, min_failure_count: int = 3) -> int:
         """
         Remove exits that have been tried multiple times and consistently failed.
@@ -1248,6 +1561,8 @@ class MapGraph:
             pruned_count += 1
 
         if pruned_count > 0:
+            self._invalidate_routes(room_id)
+            self.version += 1
             if self.logger:
                 room_name = self.room_names.get(room_id, f"Room#{room_id}")
                 self.logger.info(
@@ -1308,9 +1623,14 @@ class MapGraph:
         """
         Generate a detailed report on exit failures and pruning.
 
+        Memoized until the map next changes.
+
         Returns:
             Human-readable report of exit failure status
         """
+        return self._memoized("exit_failure_report", self._render_exit_failure_report)
+
+    def _render_exit_failure_report(self) -> str:
         if not self.exit_failure_counts and not self.pruned_exits:
             return (
                 "🔍 EXIT FAILURE REPORT\n" + "=" * 30 + "\nNo exit failures recorded."
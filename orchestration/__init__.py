@@ -1,5 +1,6 @@
 """Orchestration layer for ZorkGPT."""
 
 from .zork_orchestrator_v2 import ZorkOrchestratorV2
+from .parallel_runner import ParallelEpisodeRunner
 
-__all__ = ["ZorkOrchestratorV2"]
+__all__ = ["ZorkOrchestratorV2", "ParallelEpisodeRunner"]
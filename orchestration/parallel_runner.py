@@ -0,0 +1,220 @@
+"""
+ParallelEpisodeRunner for ZorkGPT orchestration.
+
+Plays several episodes at once, one process per episode. A turn is dominated
+by LLM latency while the Jericho engine is nearly idle, so N episodes on one
+box give close to N times the throughput of run_multiple_episodes.
+
+Isolation:
+- Each episode runs in a fresh spawned process (max_tasks_per_child=1) with
+  its own ZorkOrchestratorV2, GameState, Jericho interface and managers.
+- Its human-readable log, JSON log and current_state.json are redirected into
+  episodes/<episode_id>/ so workers never append to the same log file.
+
+Shared state (knowledgebase.md, Memories.md or memories.jsonl, map_state.json)
+stays in zork_game_workdir. Every writer holds the file's shared_store lock
+and re-reads the file before writing, merging in what other episodes wrote
+since it was loaded.
+
+Rate limits: set llm_shared_request_slots to cap in-flight LLM requests across
+all workers; a 429 in any worker then pauses requests in all of them.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from session.game_configuration import GameConfiguration
+
+
+def episode_worker_config(config: GameConfiguration, episode_id: str) -> GameConfiguration:
+    """
+    Copy a configuration with per-episode log and export paths.
+
+    Args:
+        config: Base configuration
+        episode_id: Episode the worker will play
+
+    Returns:
+        Configuration whose episode_log_file, json_log_file and
+        state_export_file live in the episode directory
+    """
+    episode_dir = Path(config.zork_game_workdir) / "episodes" / episode_id
+    return config.model_copy(
+        update={
+            "episode_log_file": str(episode_dir / "episode_log.txt"),
+            "json_log_file": str(episode_dir / "episode_log.jsonl"),
+            "state_export_file": str(episode_dir / "current_state.json"),
+        }
+    )
+
+
+def run_episode_worker(
+    episode_id: str, config: GameConfiguration, max_turns: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Play one episode in the current (worker) process.
+
+    Errors are returned rather than raised so one failed episode does not
+    abort the batch.
+
+    Returns:
+        Dict with episode_id, score, turns, seconds and error (None on success)
+    """
+    # Imported here so the parent process does not need Jericho loaded
+    from episode_finalization import get_episode_finalizer
+    from orchestration.zork_orchestrator_v2 import ZorkOrchestratorV2
+
+    worker_config = episode_worker_config(config, episode_id)
+    Path(worker_config.episode_log_file).parent.mkdir(parents=True, exist_ok=True)
+
+    start = time.monotonic()
+    result = {"episode_id": episode_id, "score": None, "turns": None, "error": None}
+    try:
+        orchestrator = ZorkOrchestratorV2(
+            episode_id=episode_id, max_turns_per_episode=max_turns, config=worker_config
+        )
+        result["score"] = orchestrator.play_episode()
+        result["turns"] = orchestrator.game_state.turn_count
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    # One episode per process: a background finalization must finish before it exits
+    get_episode_finalizer().wait("worker_exit")
+    result["seconds"] = round(time.monotonic() - start, 3)
+    return result
+
+
+class ParallelEpisodeRunner:
+    """
+    Runs episodes concurrently in a process pool.
+
+    At most max_workers episodes are in flight; the rest queue and start as
+    earlier ones finish.
+    """
+
+    def __init__(
+        self,
+        config: GameConfiguration,
+        max_workers: Optional[int] = None,
+        max_turns: Optional[int] = None,
+        logger=None,
+        worker: Callable[..., Dict[str, Any]] = run_episode_worker,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            config: Base configuration (each worker gets an episode-specific copy)
+            max_workers: Concurrent episodes (defaults to config.max_parallel_episodes)
+            max_turns: Optional max_turns_per_episode override
+            logger: Logger for batch progress
+            worker: Picklable callable(episode_id, config, max_turns) -> result dict
+        """
+        self.config = config
+        self.max_workers = max_workers or config.max_parallel_episodes
+        self.max_turns = max_turns
+        self.logger = logger
+        self.worker = worker
+
+    @staticmethod
+    def make_episode_ids(num_episodes: int) -> List[str]:
+        """Generate distinct episode IDs for one batch (shared timestamp plus index)."""
+        stamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        return [f"{stamp}-p{i + 1}" for i in range(num_episodes)]
+
+    def run(
+        self,
+        num_episodes: int,
+        episode_ids: Optional[List[str]] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Play a batch of episodes.
+
+        Args:
+            num_episodes: Number of episodes to play
+            episode_ids: Explicit episode IDs (generated if omitted)
+            on_result: Called with each result as its episode finishes
+
+        Returns:
+            Result dicts in episode order (see run_episode_worker)
+        """
+        episode_ids = episode_ids or self.make_episode_ids(num_episodes)
+        workers = max(1, min(self.max_workers, len(episode_ids)))
+        start = time.monotonic()
+
+        if self.logger:
+            self.logger.info(
+                f"Starting {len(episode_ids)} episodes with {workers} parallel workers",
+                extra={
+                    "event_type": "parallel_run_start",
+                    "episodes": len(episode_ids),
+                    "workers": workers,
+                    "shared_request_slots": self.config.llm_shared_request_slots,
+                },
+            )
+
+        results: Dict[str, Dict[str, Any]] = {}
+        # spawn: workers must not inherit the parent's open logs, sessions or Jericho state
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=1,
+        ) as pool:
+            futures = {
+                pool.submit(self.worker, episode_id, self.config, self.max_turns): episode_id
+                for episode_id in episode_ids
+            }
+            try:
+                for future in as_completed(futures):
+                    episode_id = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # The worker process itself died (e.g., killed or out of memory)
+                        result = {
+                            "episode_id": episode_id,
+                            "score": None,
+                            "turns": None,
+                            "error": f"{type(e).__name__}: {e}",
+                        }
+                    results[episode_id] = result
+                    self._log_result(result, len(results), len(episode_ids))
+                    if on_result:
+                        on_result(result)
+            except KeyboardInterrupt:
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        ordered = [results[episode_id] for episode_id in episode_ids]
+        if self.logger:
+            completed = [r for r in ordered if r["error"] is None]
+            self.logger.info(
+                f"Parallel run finished: {len(completed)}/{len(ordered)} episodes completed",
+                extra={
+                    "event_type": "parallel_run_complete",
+                    "episodes": len(ordered),
+                    "completed": len(completed),
+                    "scores": [r["score"] for r in ordered],
+                    "wall_seconds": round(time.monotonic() - start, 3),
+                },
+            )
+        return ordered
+
+    def _log_result(self, result: Dict[str, Any], done: int, total: int) -> None:
+        """Log one finished episode."""
+        if not self.logger:
+            return
+        if result["error"] is None:
+            self.logger.info(
+                f"Episode {result['episode_id']} finished ({done}/{total}): score {result['score']}",
+                extra={"event_type": "parallel_episode_complete", **result},
+            )
+        else:
+            self.logger.error(
+                f"Episode {result['episode_id']} failed ({done}/{total}): {result['error']}",
+                extra={"event_type": "parallel_episode_failed", **result},
+            )
@@ -0,0 +1,172 @@
+"""
+TurnPipeline for ZorkGPT orchestration.
+
+Runs post-action work whose result the next agent prompt does not need
+(memory synthesis, objective completion checks, state export) on a single
+background worker, so those LLM round-trips overlap with the next turn's
+agent and critic calls.
+
+Ordering guarantees:
+- Jobs execute strictly in submission order (one worker thread), so a turn's
+  memory write always lands before its objective check and state export.
+- barrier() blocks until every submitted job has finished, then runs each
+  job's on_complete callback on the calling thread in submission order. The
+  orchestrator places barriers before any code that mutates or reads what the
+  jobs write.
+
+When disabled, submit() runs the job inline and barrier() is a no-op. This is
+the deterministic fallback used by tests and by the default configuration.
+"""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class TurnPipeline:
+    """
+    Single-worker background executor with explicit barriers.
+
+    Failures inside background jobs are logged and never propagate to the
+    game loop. In inline mode jobs behave exactly like direct calls, including
+    raising their exceptions to the caller.
+    """
+
+    def __init__(self, enabled: bool, logger=None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            enabled: Run jobs on a background worker (True) or inline (False)
+            logger: Logger instance for job failures and barrier timing
+        """
+        self.enabled = enabled
+        self.logger = logger
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Tuple[str, Future, Optional[Callable]]] = []
+
+        # Instrumentation
+        self.jobs_submitted = 0
+        self.jobs_failed = 0
+        self.barrier_count = 0
+        self.barrier_wait_seconds = 0.0
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable,
+        *args,
+        on_complete: Optional[Callable[[Any], None]] = None,
+        **kwargs,
+    ) -> Future:
+        """
+        Schedule a job.
+
+        Args:
+            name: Job name for logging (e.g., "memory_synthesis")
+            fn: Callable to run
+            *args, **kwargs: Arguments for fn
+            on_complete: Called with fn's result on the thread that waits for
+                the job (barrier(), or submit() itself when disabled); skipped
+                when the job failed or returned None
+
+        Returns:
+            Future for the job (already resolved when the pipeline is disabled)
+
+        Raises:
+            Exception: Whatever fn raises, but only when the pipeline is disabled
+        """
+        self.jobs_submitted += 1
+
+        if not self.enabled:
+            future: Future = Future()
+            future.set_result(fn(*args, **kwargs))
+            self._complete(future, on_complete)
+            return future
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="zorkgpt-turn-pipeline"
+            )
+
+        future = self._executor.submit(self._run_job, name, fn, args, kwargs)
+        self._pending.append((name, future, on_complete))
+        return future
+
+    def barrier(self, reason: str) -> None:
+        """
+        Wait for all submitted jobs to finish.
+
+        Args:
+            reason: Why the caller needs the results (logged with wait time)
+        """
+        if not self._pending:
+            return
+
+        start = time.perf_counter()
+        pending, self._pending = self._pending, []
+        for _, future, on_complete in pending:
+            self._complete(future, on_complete)
+        waited = time.perf_counter() - start
+
+        self.barrier_count += 1
+        self.barrier_wait_seconds += waited
+
+        if self.logger:
+            self.logger.debug(
+                f"Turn pipeline barrier '{reason}' waited {waited:.3f}s for {len(pending)} job(s)",
+                extra={
+                    "event_type": "turn_pipeline_barrier",
+                    "reason": reason,
+                    "jobs": [name for name, _, _ in pending],
+                    "wait_seconds": waited,
+                },
+            )
+
+    def has_pending(self) -> bool:
+        """Check whether any submitted job has not been waited on yet."""
+        return bool(self._pending)
+
+    def shutdown(self) -> None:
+        """Drain outstanding jobs and stop the worker thread."""
+        self.barrier("shutdown")
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get pipeline statistics for orchestrator status reporting."""
+        return {
+            "enabled": self.enabled,
+            "jobs_submitted": self.jobs_submitted,
+            "jobs_failed": self.jobs_failed,
+            "jobs_pending": len(self._pending),
+            "barrier_count": self.barrier_count,
+            "barrier_wait_seconds": round(self.barrier_wait_seconds, 3),
+        }
+
+    @staticmethod
+    def _complete(future: Future, on_complete: Optional[Callable]) -> None:
+        """Wait for a job and hand its result to on_complete."""
+        result = future.result()
+        if on_complete is not None and result is not None:
+            on_complete(result)
+
+    def _run_job(self, name: str, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Execute a background job, logging (not raising) any failure."""
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            self.jobs_failed += 1
+            if self.logger:
+                self.logger.error(
+                    f"Turn pipeline job '{name}' failed: {e}",
+                    extra={
+                        "event_type": "turn_pipeline_job_failed",
+                        "job": name,
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                    },
+                    exc_info=True,
+                )
+            return None
@@ -0,0 +1,208 @@
+"""
+TurnTimer for ZorkGPT orchestration.
+
+Measures how long each phase of a turn takes (agent call, critic loop,
+get_valid_exits, extraction, memory synthesis, state export, ...) and keeps a
+rolling latency histogram per phase.
+
+Usage:
+    with timer.phase("agent"):
+        ...
+    job = timer.timed("memory_synthesis", job)
+
+    @timed_phase("periodic_updates")   # on a method of an object with .turn_timer
+    def _check_periodic_updates(self): ...
+
+Phases are wall-clock (time.perf_counter) and inclusive: a phase timed inside
+another is counted in both. Percentiles cover the last `window` samples of a
+phase; count and total cover the whole run.
+
+Reports:
+- get_summary(): p50/p95/p99/mean/max per phase, used by
+  get_orchestrator_status() and the state export
+- render_prometheus(): Prometheus text exposition (one summary metric with a
+  phase label), written to a file for a node-exporter textfile collector
+
+When disabled, phase() returns a shared no-op context manager and timed()
+returns the function unchanged, so instrumented code pays one method call.
+"""
+
+import functools
+import math
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Any, Callable, Deque, Dict, Optional
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+PROMETHEUS_METRIC = "zorkgpt_turn_phase_seconds"
+
+_NULL_PHASE = nullcontext()
+
+
+class LatencyHistogram:
+    """Rolling window of durations for one phase, plus lifetime count and total."""
+
+    def __init__(self, window: int):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantiles(self) -> Dict[float, float]:
+        """Nearest-rank quantiles of the current window."""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {q: 0.0 for q in QUANTILES}
+        return {q: ordered[max(0, math.ceil(q * len(ordered)) - 1)] for q in QUANTILES}
+
+
+class _Phase:
+    """Context manager recording one timed phase."""
+
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer: "TurnTimer", name: str):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timer.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class TurnTimer:
+    """
+    Per-phase latency histograms for the turn loop.
+
+    Thread-safe: post-action jobs may be timed on the turn pipeline worker.
+    """
+
+    def __init__(self, enabled: bool, window: int = 512):
+        """
+        Initialize the timer.
+
+        Args:
+            enabled: Record timings (False makes every hook a no-op)
+            window: Samples per phase kept for percentiles
+        """
+        self.enabled = enabled
+        self.window = max(1, window)
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def phase(self, name: str):
+        """Context manager timing the enclosed block as `name`."""
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def timed(self, name: str, fn: Callable) -> Callable:
+        """Wrap fn so each call is timed as `name` (fn itself when disabled)."""
+        if not self.enabled:
+            return fn
+
+        def timed_call(*args, **kwargs):
+            with _Phase(self, name):
+                return fn(*args, **kwargs)
+
+        return timed_call
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one duration to a phase's histogram."""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram(self.window)
+            histogram.add(seconds)
+
+    def reset(self) -> None:
+        """Drop all recorded timings (e.g., between episodes)."""
+        with self._lock:
+            self._histograms.clear()
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Summarize every phase.
+
+        Returns:
+            Dict with "enabled", "window" and "phases": phase name to count,
+            total_s, mean_ms, p50_ms, p95_ms, p99_ms and max_ms
+        """
+        phases = {}
+        for name, histogram, quantiles in self._snapshot():
+            phases[name] = {
+                "count": histogram.count,
+                "total_s": round(histogram.total, 3),
+                "mean_ms": round(histogram.total * 1000 / histogram.count, 2),
+                "p50_ms": round(quantiles[0.5] * 1000, 2),
+                "p95_ms": round(quantiles[0.95] * 1000, 2),
+                "p99_ms": round(quantiles[0.99] * 1000, 2),
+                "max_ms": round(histogram.max * 1000, 2),
+            }
+        return {"enabled": self.enabled, "window": self.window, "phases": phases}
+
+    def render_prometheus(self, labels: Optional[Dict[str, str]] = None) -> str:
+        """
+        Render the histograms in the Prometheus text exposition format.
+
+        Args:
+            labels: Extra labels for every sample (e.g., episode_id)
+
+        Returns:
+            Text for a .prom file
+        """
+        base = "".join(f'{key}="{_escape_label(value)}",' for key, value in (labels or {}).items())
+        lines = [
+            f"# HELP {PROMETHEUS_METRIC} Latency of orchestrator turn phases "
+            f"(quantiles over the last {self.window} samples)",
+            f"# TYPE {PROMETHEUS_METRIC} summary",
+        ]
+        for name, histogram, quantiles in self._snapshot():
+            phase_labels = f'{base}phase="{_escape_label(name)}"'
+            for q in QUANTILES:
+                lines.append(
+                    f'{PROMETHEUS_METRIC}{{{phase_labels},quantile="{q}"}} {quantiles[q]:.6f}'
+                )
+            lines.append(f"{PROMETHEUS_METRIC}_sum{{{phase_labels}}} {histogram.total:.6f}")
+            lines.append(f"{PROMETHEUS_METRIC}_count{{{phase_labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def _snapshot(self):
+        """(name, histogram, quantiles) per phase, sorted by name, taken under the lock."""
+        with self._lock:
+            return [
+                (name, self._histograms[name], self._histograms[name].quantiles())
+                for name in sorted(self._histograms)
+            ]
+
+
+def timed_phase(name: str) -> Callable:
+    """Method decorator timing each call as `name` with the instance's turn_timer."""
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.turn_timer.phase(name):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
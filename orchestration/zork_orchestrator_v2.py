@@ -1,8 +1,11 @@
 
+import copy
+import dataclasses
 import time
 import logging
 from collections import deque
 from contextlib import nullcontext
+from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
 
 from session.game_state import GameState
@@ -18,10 +21,17 @@ from managers import (
 )
 from managers.simple_memory_manager import SimpleMemoryManager
 from zork_agent import ZorkAgent
-from zork_critic import ZorkCritic
+from zork_critic import ZorkCritic, CriticResponse
 from hybrid_zork_extractor import HybridZorkExtractor
 from game_interface.core.jericho_interface import JerichoInterface
+from episode_finalization import get_episode_finalizer
 from logger import setup_logging
+from llm_cassette import get_cassette
+from llm_response_cache import get_response_cache
+from action_outcome_store import get_outcome_store
+from orchestration.turn_pipeline import TurnPipeline
+from orchestration.turn_timing import TurnTimer, timed_phase
+from prompt_cache import get_prompt_cache_stats
 
 # Langfuse for observability
 try:
@@ -49,11 +59,17 @@ class ZorkOrchestratorV2:
         self,
         episode_id: str,
         max_turns_per_episode: int = None,
+        config: Optional[GameConfiguration] = None,
     ):
-        """Initialize the orchestrator with configuration loaded from TOML."""
+        """
+        Initialize the orchestrator.
+
+        Configuration is loaded from TOML unless given (ParallelEpisodeRunner
+        passes each worker a copy with episode-specific log and export paths).
+        """
 
         # Load configuration from TOML file
-        self.config = GameConfiguration.from_toml()
+        self.config = config or GameConfiguration.from_toml()
 
         # Override max_turns_per_episode if explicitly provided
         if max_turns_per_episode is not None:
@@ -103,6 +119,8 @@ class ZorkOrchestratorV2:
         self.jericho_interface = JerichoInterface(
             game_file_path=self.config.game_file_path, logger=self.logger
         )
+        # Record every executed command in the cross-episode outcome store (if enabled)
+        self.jericho_interface.outcome_store = get_outcome_store(self.config, self.logger)
 
         # Initialize core game components
         self._initialize_game_components()
@@ -113,6 +131,16 @@ class ZorkOrchestratorV2:
         # Track critic confidence for synthesis decisions
         self.critic_confidence_history = []
 
+        # Background executor for post-action work (inline unless pipelining is enabled)
+        self.turn_pipeline = TurnPipeline(
+            enabled=self.config.enable_pipelined_turns, logger=self.logger
+        )
+
+        # Per-phase latency histograms (every hook is a no-op when disabled)
+        self.turn_timer = TurnTimer(
+            enabled=self.config.enable_turn_timing, window=self.config.turn_timing_window
+        )
+
         self.logger.info(
             "ZorkOrchestrator v2 initialized with Jericho",
             extra={
@@ -125,6 +153,7 @@ class ZorkOrchestratorV2:
                 "critic_enabled": self.config.enable_critic,
                 "info_ext_model": self.config.info_ext_model,
                 "max_turns": self.config.max_turns_per_episode,
+                "pipelined_turns": self.config.enable_pipelined_turns,
             },
         )
 
@@ -244,6 +273,10 @@ class ZorkOrchestratorV2:
             Final score achieved in the episode
         """
         try:
+            # Count cached prompt tokens and LLM-free extractions per episode
+            get_prompt_cache_stats().reset()
+            self.extractor.reset_stats()
+
             # Initialize new episode across all managers
             self.episode_synthesizer.initialize_episode(
                 episode_id=self.game_state.episode_id,
@@ -291,6 +324,60 @@ class ZorkOrchestratorV2:
             # Run the main game loop
             final_score = self._run_game_loop(initial_game_state)
 
+            # Wait for the last turn's background work before finalizing
+            self.turn_pipeline.barrier("episode_end")
+
+            # Report how many ground-truth exit probes the oracle saved this episode
+            self.logger.info(
+                "Exit oracle statistics for episode",
+                extra={
+                    "event_type": "exit_oracle_stats",
+                    "episode_id": self.game_state.episode_id,
+                    **self.jericho_interface.exit_oracle.get_stats(),
+                },
+            )
+
+            # Report how many critic LLM calls the lookahead simulator settled
+            self.logger.info(
+                "Lookahead statistics for episode",
+                extra={
+                    "event_type": "lookahead_stats",
+                    "episode_id": self.game_state.episode_id,
+                    **self._lookahead_stats(),
+                },
+            )
+
+            outcome_store = self.jericho_interface.outcome_store
+            if outcome_store is not None:
+                self.logger.info(
+                    "Action outcome store statistics for episode",
+                    extra={
+                        "event_type": "outcome_store_stats",
+                        "episode_id": self.game_state.episode_id,
+                        **outcome_store.get_stats(),
+                    },
+                )
+
+            # Report how much of the prompt the provider served from its cache
+            self.logger.info(
+                "Prompt cache statistics for episode",
+                extra={
+                    "event_type": "prompt_cache_stats",
+                    "episode_id": self.game_state.episode_id,
+                    **get_prompt_cache_stats().get_stats(),
+                },
+            )
+
+            # Report how many extractions were served without an LLM call
+            self.logger.info(
+                "Extractor fast path statistics for episode",
+                extra={
+                    "event_type": "extractor_fast_path_stats",
+                    "episode_id": self.game_state.episode_id,
+                    **self.extractor.get_stats(),
+                },
+            )
+
             # Finalize episode
             self.episode_synthesizer.finalize_episode(
                 final_score=final_score,
@@ -298,11 +385,17 @@ class ZorkOrchestratorV2:
             )
 
             # Export final coordinated state (including map data)
-            self._export_coordinated_state()
+            self._export_coordinated_state(final=True)
+            self.turn_pipeline.barrier("final_export")
+            self.state_manager.export_episode_manifest()
+            self.state_manager.flush_exports()
 
             # Save map state for cross-episode persistence
             self.map_manager.save_map_state()
 
+            # Render Memories.md from the memory log (no-op for the markdown backend)
+            self.simple_memory.export_markdown()
+
             # Flush Langfuse traces if available (BEFORE closing Jericho to ensure delivery)
             if self.langfuse_client:
                 try:
@@ -339,6 +432,10 @@ class ZorkOrchestratorV2:
             )
             return self.game_state.previous_zork_score
         finally:
+            # Drain background work before tearing down the game interface
+            self.turn_pipeline.shutdown()
+            self.state_manager.close()
+
             # Ensure Jericho interface is always closed, even on exceptions
             if hasattr(self, 'jericho_interface') and self.jericho_interface:
                 try:
@@ -624,6 +721,17 @@ class ZorkOrchestratorV2:
         warning_parts.append("• Explore unexplored exits")
         warning_parts.append("• Consider abandoning your current strategy")
 
+        # Point out a repeating cycle found by state loop detection
+        observation = self.state_manager.last_state_observation
+        if observation and observation.cycle_length:
+            if observation.cycle_length == 1:
+                warning_parts.append("• Your recent actions have not changed the game state at all")
+            else:
+                warning_parts.append(
+                    f"• You are repeating a {observation.cycle_length}-turn cycle that keeps "
+                    f"returning to the same game state"
+                )
+
         warning_parts.extend([
             "",
             "SURVIVAL DEPENDS ON MAKING PROGRESS." if has_objectives else "SURVIVAL DEPENDS ON SCORE INCREASE.",
@@ -793,40 +901,42 @@ class ZorkOrchestratorV2:
             if self.config.turn_delay_seconds > 0:
                 time.sleep(self.config.turn_delay_seconds)
 
-            # Run a single turn
-            action_taken, next_game_state = self._run_turn(current_game_state)
-
-            if next_game_state:
-                current_game_state = next_game_state
-
-            # Track score for progress detection
-            self._track_score_for_progress_detection()
-
-            # Check for stuck behavior (every N turns)
-            if self.game_state.turn_count % self.config.stuck_check_interval == 0:
-                turns_stuck = self._get_turns_since_score_change()
-
-                if turns_stuck >= self.config.max_turns_stuck:
-                    self.logger.warning(
-                        f"Terminating episode: no progress for {turns_stuck} turns "
-                        f"(score stuck at {self.game_state.previous_zork_score})",
-                        extra={
-                            "event_type": "stuck_termination",
-                            "episode_id": self.game_state.episode_id,
-                            "turn": self.game_state.turn_count,
-                            "score": self.game_state.previous_zork_score,
-                            "turns_stuck": turns_stuck,
-                        }
-                    )
-                    self.game_state.game_over_flag = True
-                    self.game_state.termination_reason = "stuck_no_progress"
-                    return self.game_state.previous_zork_score
+            with self.turn_timer.phase("turn"):
+                # Run a single turn
+                action_taken, next_game_state = self._run_turn(current_game_state)
+
+                if next_game_state:
+                    current_game_state = next_game_state
+
+                # Track score for progress detection
+                self._track_score_for_progress_detection()
+
+                # Check for stuck behavior (every N turns)
+                if self.game_state.turn_count % self.config.stuck_check_interval == 0:
+                    turns_stuck = self._get_turns_since_score_change()
+
+                    if turns_stuck >= self.config.max_turns_stuck:
+                        self.logger.warning(
+                            f"Terminating episode: no progress for {turns_stuck} turns "
+                            f"(score stuck at {self.game_state.previous_zork_score})",
+                            extra={
+                                "event_type": "stuck_termination",
+                                "episode_id": self.game_state.episode_id,
+                                "turn": self.game_state.turn_count,
+                                "score": self.game_state.previous_zork_score,
+                                "turns_stuck": turns_stuck,
+                                "state_loops": self.state_manager.state_loops.get_stats(),
+                            }
+                        )
+                        self.game_state.game_over_flag = True
+                        self.game_state.termination_reason = "stuck_no_progress"
+                        return self.game_state.previous_zork_score
 
-            # Check periodic updates for managers
-            self._check_periodic_updates()
+                # Check periodic updates for managers
+                self._check_periodic_updates()
 
-            # Export state after every turn for live monitoring
-            self._export_coordinated_state()
+                # Export state after every turn for live monitoring
+                self._export_coordinated_state()
 
         # Log episode completion
         self.logger.info(
@@ -918,12 +1028,14 @@ class ZorkOrchestratorV2:
         log_level = logging.DEBUG if should_trace else logging.INFO
 
         # Get critic context with ground-truth exits from Jericho (god-like view)
+        with self.turn_timer.phase("valid_exits"):
+            available_exits = self.jericho_interface.get_valid_exits()
         critic_context = self.context_manager.get_critic_context(
             current_state=current_state,
             proposed_action=proposed_action,
             location=self.game_state.current_room_name_for_map,
             location_id=self.game_state.current_room_id,
-            available_exits=self.jericho_interface.get_valid_exits(),  # Ground truth for validation
+            available_exits=available_exits,  # Ground truth for validation
             failed_actions=self.game_state.failed_actions_by_location.get(
                 self.game_state.current_room_name_for_map, []
             ),
@@ -974,41 +1086,23 @@ class ZorkOrchestratorV2:
                 enhanced_current_state = current_state
 
             # Initial critic evaluation (with exploration hints influencing evaluation)
-            if self.config.enable_critic:
-                # Run full LLM-based critic evaluation
-                critic_result = self.critic.evaluate_action(
-                    game_state_text=enhanced_current_state,
-                    proposed_action=proposed_action,
-                    available_exits=critic_context.get("available_exits", []),
-                    action_counts=self.game_state.action_counts,
-                    current_location_name=self.game_state.current_room_name_for_map,
-                    failed_actions_by_location=self.game_state.failed_actions_by_location,
-                    previous_actions_and_responses=self.game_state.action_history[-3:],
-                    jericho_interface=self.jericho_interface,
-                    inventory=self.game_state.current_inventory,
-                )
-            else:
-                # Critic disabled - run object tree validation only
-                from zork_critic import CriticResponse
-                validation_result = self.critic.validate_against_object_tree(
-                    proposed_action,
-                    self.jericho_interface
-                )
-
-                if not validation_result.valid:
-                    # Object tree rejected - return rejection with validation reason
-                    critic_result = CriticResponse(
-                        score=0.0,
-                        justification=f"[Object Tree Validation] {validation_result.reason}",
-                        confidence=validation_result.confidence
+            with self.turn_timer.phase("critic_evaluate"):
+                if self.config.enable_critic:
+                    # Run full LLM-based critic evaluation
+                    critic_result = self.critic.evaluate_action(
+                        game_state_text=enhanced_current_state,
+                        proposed_action=proposed_action,
+                        available_exits=critic_context.get("available_exits", []),
+                        action_counts=self.game_state.action_counts,
+                        current_location_name=self.game_state.current_room_name_for_map,
+                        failed_actions_by_location=self.game_state.failed_actions_by_location,
+                        previous_actions_and_responses=self.game_state.action_history[-3:],
+                        jericho_interface=self.jericho_interface,
+                        inventory=self.game_state.current_inventory,
                     )
                 else:
-                    # Object tree passed - auto-accept
-                    critic_result = CriticResponse(
-                        score=1.0,
-                        justification="Critic disabled - action accepted (passed object tree validation)",
-                        confidence=1.0
-                    )
+                    # Critic disabled - run object tree validation only
+                    critic_result = self._object_tree_verdict(proposed_action)
 
             # Track initial attempt (if tracing)
             if attempt_details is not None:
@@ -1097,19 +1191,7 @@ class ZorkOrchestratorV2:
                     break  # Action is acceptable
 
                 # Check if we should override the rejection
-                override_context = {
-                    "recent_locations": [
-                        getattr(entry, "current_location_name", "")
-                        for entry in self.game_state.memory_log_history[-10:]
-                        if hasattr(entry, "current_location_name")
-                    ],
-                    "recent_actions": [
-                        entry.action for entry in self.game_state.action_history[-8:]
-                    ],
-                    "previous_actions_and_responses": self.game_state.action_history[-8:],
-                    "turns_since_movement": self.rejection_manager.state.turns_since_movement,
-                    "critic_confidence": critic_result.confidence,
-                }
+                override_context = self._build_override_context(critic_result.confidence)
 
                 # DEBUG: Log before override check
                 self.logger.log(
@@ -1123,14 +1205,18 @@ class ZorkOrchestratorV2:
                     },
                 )
 
-                should_override, override_reason = (
-                    self.rejection_manager.should_override_rejection(
-                        action=action_to_take,
-                        current_location=self.game_state.current_room_name_for_map,
-                        failed_actions_by_location=self.game_state.failed_actions_by_location,
-                        context=override_context,
+                if critic_result.from_lookahead:
+                    # A simulated outcome is not a judgment call; never override it
+                    should_override, override_reason = False, "lookahead verdict"
+                else:
+                    should_override, override_reason = (
+                        self.rejection_manager.should_override_rejection(
+                            action=action_to_take,
+                            current_location=self.game_state.current_room_name_for_map,
+                            failed_actions_by_location=self.game_state.failed_actions_by_location,
+                            context=override_context,
+                        )
                     )
-                )
 
                 # DEBUG: Log override decision
                 self.logger.log(
@@ -1212,10 +1298,14 @@ class ZorkOrchestratorV2:
                 )
 
                 # Get new action with rejection context
-                agent_result = self.agent.get_action_with_reasoning(
-                    game_state_text=current_state + rejection_feedback,
-                    relevant_memories=formatted_context,
-                )
+                with self.turn_timer.phase("agent_retry"):
+                    agent_result = self.agent.get_action_with_reasoning(
+                        game_state_text=current_state + rejection_feedback,
+                        relevant_memories=formatted_context,
+                        reference_context=self.context_manager.get_agent_reference_context(
+                            agent_context, game_state_text=current_state
+                        ),
+                    )
 
                 action_to_take = agent_result["action"]
                 agent_reasoning = agent_result.get("reasoning", "")
@@ -1247,41 +1337,23 @@ class ZorkOrchestratorV2:
                     enhanced_current_state = current_state
 
                 # Re-evaluate new action (with exploration hints)
-                if self.config.enable_critic:
-                    # Run full LLM-based critic evaluation
-                    critic_result = self.critic.evaluate_action(
-                        game_state_text=enhanced_current_state,
-                        proposed_action=action_to_take,
-                        available_exits=critic_context.get("available_exits", []),
-                        action_counts=self.game_state.action_counts,
-                        current_location_name=self.game_state.current_room_name_for_map,
-                        failed_actions_by_location=self.game_state.failed_actions_by_location,
-                        previous_actions_and_responses=self.game_state.action_history[-3:],
-                        jericho_interface=self.jericho_interface,
-                        inventory=self.game_state.current_inventory,
-                    )
-                else:
-                    # Critic disabled - run object tree validation only
-                    from zork_critic import CriticResponse
-                    validation_result = self.critic.validate_against_object_tree(
-                        action_to_take,
-                        self.jericho_interface
-                    )
-
-                    if not validation_result.valid:
-                        # Object tree rejected - return rejection with validation reason
-                        critic_result = CriticResponse(
-                            score=0.0,
-                            justification=f"[Object Tree Validation] {validation_result.reason}",
-                            confidence=validation_result.confidence
+                with self.turn_timer.phase("critic_evaluate"):
+                    if self.config.enable_critic:
+                        # Run full LLM-based critic evaluation
+                        critic_result = self.critic.evaluate_action(
+                            game_state_text=enhanced_current_state,
+                            proposed_action=action_to_take,
+                            available_exits=critic_context.get("available_exits", []),
+                            action_counts=self.game_state.action_counts,
+                            current_location_name=self.game_state.current_room_name_for_map,
+                            failed_actions_by_location=self.game_state.failed_actions_by_location,
+                            previous_actions_and_responses=self.game_state.action_history[-3:],
+                            jericho_interface=self.jericho_interface,
+                            inventory=self.game_state.current_inventory,
                         )
                     else:
-                        # Object tree passed - auto-accept
-                        critic_result = CriticResponse(
-                            score=1.0,
-                            justification="Critic disabled - action accepted (passed object tree validation)",
-                            confidence=1.0
-                        )
+                        # Critic disabled - run object tree validation only
+                        critic_result = self._object_tree_verdict(action_to_take)
 
                 # Track re-evaluation (if tracing)
                 if attempt_details is not None:
@@ -1360,6 +1432,262 @@ class ZorkOrchestratorV2:
                 rejected_actions_this_turn,
             )
 
+    def _execute_candidate_selection(
+        self,
+        current_state: str,
+        candidates: List[str],
+    ) -> Tuple[str, float, str, float, bool, Optional[str], List[Dict]]:
+        """Pick the best acceptable action from the agent's ranked candidates.
+
+        Candidate-mode counterpart of _execute_critic_evaluation_loop: every
+        candidate is scored in one critic request (object tree validation runs
+        locally first) and no further agent or critic calls are made.
+
+        Returns:
+            Same tuple as _execute_critic_evaluation_loop
+        """
+        should_trace = self.langfuse_client is not None
+        available_exits = self.jericho_interface.get_valid_exits()
+
+        # Exploration hints for all candidates, without repeating shared lines
+        unexplored_info = self._detect_unexplored_exits()
+        hint_lines = []
+        for candidate in candidates:
+            hints = self._build_exploration_hints(
+                candidate, self._detect_action_novelty(candidate), unexplored_info
+            )
+            for line in hints.strip().split("\n"):
+                if line and line not in hint_lines:
+                    hint_lines.append(line)
+        enhanced_current_state = current_state
+        if hint_lines:
+            enhanced_current_state = current_state + "\n\n" + "\n".join(hint_lines) + "\n"
+
+        if should_trace:
+            tracing_context = self.langfuse_client.start_as_current_span(
+                name="critic-candidate-selection",
+                input={
+                    "candidates": candidates,
+                    "current_location": self.game_state.current_room_name_for_map,
+                    "available_exits": available_exits,
+                },
+                metadata={"turn_number": self.game_state.turn_count},
+            )
+        else:
+            tracing_context = nullcontext()
+
+        with tracing_context as critic_span:
+            if self.config.enable_critic:
+                evaluations = self.critic.evaluate_candidates(
+                    game_state_text=enhanced_current_state,
+                    candidates=candidates,
+                    available_exits=available_exits,
+                    action_counts=self.game_state.action_counts,
+                    current_location_name=self.game_state.current_room_name_for_map,
+                    failed_actions_by_location=self.game_state.failed_actions_by_location,
+                    previous_actions_and_responses=self.game_state.action_history[-3:],
+                    jericho_interface=self.jericho_interface,
+                    inventory=self.game_state.current_inventory,
+                )
+            else:
+                evaluations = [self._object_tree_verdict(c) for c in candidates]
+
+            # Location revisit penalty applies to every candidate alike
+            self._track_location_history()
+            revisit_info = self._detect_location_revisit()
+            penalty_reason = ""
+            for evaluation in evaluations:
+                evaluation.confidence, penalty_reason = self._apply_location_revisit_penalty(
+                    base_score=evaluation.confidence, revisit_info=revisit_info
+                )
+            if penalty_reason:
+                self.logger.info(
+                    f"Applied location penalty to {len(evaluations)} candidates",
+                    extra={
+                        "event_type": "location_penalty_applied",
+                        "turn": self.game_state.turn_count,
+                        "reason": penalty_reason,
+                        "location_id": revisit_info["location_id"],
+                        "recent_visits": revisit_info["recent_visits"],
+                    }
+                )
+
+            self.rejection_manager.start_new_turn()
+            rejection_threshold = self.rejection_manager.get_rejection_threshold()
+
+            # Highest critic score wins; the agent's ranking breaks ties
+            ranked = sorted(
+                range(len(candidates)), key=lambda i: (-evaluations[i].score, i)
+            )
+            chosen = next(
+                (i for i in ranked if evaluations[i].score >= rejection_threshold), None
+            )
+
+            was_overridden = False
+            final_override_reason = None
+            if chosen is None:
+                for i in ranked:
+                    if evaluations[i].from_lookahead:
+                        continue  # Simulated outcomes are never overridden
+                    should_override, override_reason = (
+                        self.rejection_manager.should_override_rejection(
+                            action=candidates[i],
+                            current_location=self.game_state.current_room_name_for_map,
+                            failed_actions_by_location=self.game_state.failed_actions_by_location,
+                            context=self._build_override_context(evaluations[i].confidence),
+                        )
+                    )
+                    if should_override:
+                        chosen = i
+                        was_overridden = True
+                        final_override_reason = override_reason
+                        self.logger.info(
+                            f"Overriding critic rejection: {override_reason}",
+                            extra={
+                                "event_type": "critic_override",
+                                "episode_id": self.game_state.episode_id,
+                                "reason": override_reason,
+                                "turn": self.game_state.turn_count,
+                                "original_action": candidates[i],
+                                "original_score": evaluations[i].score,
+                                "original_reasoning": evaluations[i].justification,
+                            },
+                        )
+                        break
+
+            exhausted_attempts = chosen is None
+            if exhausted_attempts:
+                chosen = ranked[0]
+                self.logger.warning(
+                    f"All {len(candidates)} candidates rejected, proceeding with best: "
+                    f"{candidates[chosen]} (score: {evaluations[chosen].score:.2f})",
+                    extra={
+                        "event_type": "rejection_attempts_exhausted",
+                        "episode_id": self.game_state.episode_id,
+                        "turn": self.game_state.turn_count,
+                        "final_action": candidates[chosen],
+                        "final_score": evaluations[chosen].score,
+                        "threshold": rejection_threshold,
+                    },
+                )
+
+            rejected_actions_this_turn = []
+            for i in ranked:
+                if i == chosen or evaluations[i].score >= rejection_threshold:
+                    continue
+                rejected_actions_this_turn.append(
+                    {
+                        "action": candidates[i],
+                        "score": evaluations[i].score,
+                        "justification": evaluations[i].justification,
+                    }
+                )
+                self.rejection_manager.add_rejected_action(
+                    candidates[i], evaluations[i].score, evaluations[i].justification
+                )
+                self.logger.info(
+                    f"Critic rejected action: {candidates[i]} (score: {evaluations[i].score:.2f})",
+                    extra={
+                        "event_type": "action_rejected",
+                        "episode_id": self.game_state.episode_id,
+                        "turn": self.game_state.turn_count,
+                        "action": candidates[i],
+                        "score": evaluations[i].score,
+                        "justification": evaluations[i].justification,
+                        "candidate_rank": i + 1,
+                    },
+                )
+
+            final = evaluations[chosen]
+            self.logger.info(
+                f"Selected candidate {chosen + 1}/{len(candidates)}: {candidates[chosen]} "
+                f"(score: {final.score:.2f})",
+                extra={
+                    "event_type": "candidate_selection",
+                    "episode_id": self.game_state.episode_id,
+                    "turn": self.game_state.turn_count,
+                    "candidates": [
+                        {"action": c, "score": e.score} for c, e in zip(candidates, evaluations)
+                    ],
+                    "chosen_rank": chosen + 1,
+                    "rejection_threshold": rejection_threshold,
+                },
+            )
+
+            if should_trace:
+                if was_overridden:
+                    outcome = "overridden"
+                elif exhausted_attempts:
+                    outcome = "exhausted_attempts"
+                else:
+                    outcome = "accepted"
+                critic_span.update(
+                    output={
+                        "final_action": candidates[chosen],
+                        "final_score": final.score,
+                        "final_confidence": final.confidence,
+                        "outcome": outcome,
+                        "chosen_rank": chosen + 1,
+                        "rejected_actions": rejected_actions_this_turn,
+                    },
+                    metadata={
+                        "evaluations": [e.model_dump() for e in evaluations],
+                        "rejection_threshold": rejection_threshold,
+                    },
+                )
+
+            return (
+                candidates[chosen],
+                final.score,
+                final.justification,
+                final.confidence,
+                was_overridden,
+                final_override_reason,
+                rejected_actions_this_turn,
+            )
+
+    def _object_tree_verdict(self, action: str) -> CriticResponse:
+        """Critic result from object tree validation and lookahead alone (critic disabled)."""
+        validation_result = self.critic.validate_against_object_tree(
+            action,
+            self.jericho_interface
+        )
+
+        if not validation_result.valid:
+            # Object tree rejected - return rejection with validation reason
+            return CriticResponse(
+                score=0.0,
+                justification=f"[Object Tree Validation] {validation_result.reason}",
+                confidence=validation_result.confidence
+            )
+
+        lookahead_result = self.critic.evaluate_with_lookahead([action], self.jericho_interface)[0]
+        if lookahead_result is not None:
+            return lookahead_result
+
+        # Object tree passed - auto-accept
+        return CriticResponse(
+            score=1.0,
+            justification="Critic disabled - action accepted (passed object tree validation)",
+            confidence=1.0
+        )
+
+    def _build_override_context(self, critic_confidence: float) -> Dict[str, Any]:
+        """Context for RejectionManager.should_override_rejection."""
+        return {
+            "recent_locations": [
+                getattr(entry, "current_location_name", "")
+                for entry in self.game_state.memory_log_history[-10:]
+                if hasattr(entry, "current_location_name")
+            ],
+            "recent_actions": [
+                entry.action for entry in self.game_state.action_history[-8:]
+            ],
+            "previous_actions_and_responses": self.game_state.action_history[-8:],
+            "turns_since_movement": self.rejection_manager.state.turns_since_movement,
+            "critic_confidence": critic_confidence,
+        }
+
     def _sync_inventory_from_z_machine(self) -> None:
         """Sync game_state inventory with Z-machine reality every turn.
 
@@ -1384,36 +1712,54 @@ class ZorkOrchestratorV2:
     def _execute_turn_logic(self, current_state: str) -> Tuple[str, str]:
         """Execute the main turn logic (with or without Langfuse tracing)."""
         # Generate action using agent
-        agent_context = self.context_manager.get_agent_context(
-            current_state=current_state,
-            inventory=self.game_state.current_inventory,
-            location=self.game_state.current_room_name_for_map,
-            location_id=self.game_state.current_room_id,
-            game_map=self.map_manager.game_map,
-            in_combat=self.state_manager.get_combat_status(),
-            failed_actions=self.game_state.failed_actions_by_location.get(
-                self.game_state.current_room_name_for_map, []
-            ),
-            discovered_objectives=self.game_state.discovered_objectives,
-            jericho_interface=self.jericho_interface,  # NEW: Pass Jericho interface for structured data
-        )
+        with self.turn_timer.phase("agent_context"):
+            agent_context = self.context_manager.get_agent_context(
+                current_state=current_state,
+                inventory=self.game_state.current_inventory,
+                location=self.game_state.current_room_name_for_map,
+                location_id=self.game_state.current_room_id,
+                game_map=self.map_manager.game_map,
+                in_combat=self.state_manager.get_combat_status(),
+                failed_actions=self.game_state.failed_actions_by_location.get(
+                    self.game_state.current_room_name_for_map, []
+                ),
+                discovered_objectives=self.game_state.discovered_objectives,
+                jericho_interface=self.jericho_interface,  # NEW: Pass Jericho interface for structured data
+            )
 
-        # Format context for agent (including game response)
-        formatted_context = self.context_manager.get_formatted_agent_prompt_context(
-            agent_context,
-            game_state_text=current_state
-        )
+            # Format context for agent (including game response); the map is
+            # sent separately as a cached reference message
+            reference_context = self.context_manager.get_agent_reference_context(
+                agent_context, game_state_text=current_state
+            )
+            formatted_context = self.context_manager.get_formatted_agent_prompt_context(
+                agent_context,
+                game_state_text=current_state,
+                include_map=False,
+            )
 
-        # CRITICAL: Add stuck countdown warning (highest priority)
-        stuck_warning = self._build_stuck_countdown_warning()
-        if stuck_warning:
-            formatted_context = stuck_warning + "\n" + formatted_context
+            # CRITICAL: Add stuck countdown warning (highest priority)
+            stuck_warning = self._build_stuck_countdown_warning()
+            if stuck_warning:
+                formatted_context = stuck_warning + "\n" + formatted_context
 
         # Get agent action (game_state_text no longer needed separately since it's in formatted_context)
-        agent_result = self.agent.get_action_with_reasoning(
-            game_state_text="",  # Empty since game response is now in formatted_context
-            relevant_memories=formatted_context,
-        )
+        candidate_mode = self.config.agent_candidate_count > 1
+        with self.turn_timer.phase("agent"):
+            if candidate_mode:
+                # One agent call proposing ranked candidates, scored by one critic call
+                agent_result = self.agent.get_action_candidates(
+                    game_state_text="",
+                    relevant_memories=formatted_context,
+                    num_candidates=self.config.agent_candidate_count,
+                    reference_context=reference_context,
+                )
+            else:
+                agent_result = self.agent.get_action_with_reasoning(
+                    game_state_text="",  # Empty since game response is now in formatted_context
+                    relevant_memories=formatted_context,
+                    reference_context=reference_context,
+                )
 
         proposed_action = agent_result["action"]
         agent_reasoning = agent_result.get("reasoning", "")
@@ -1424,18 +1770,29 @@ class ZorkOrchestratorV2:
         # Extract and process agent-declared objective (if any)
         new_objective = agent_result.get("new_objective")
         if new_objective:
+            # Previous turn's completion check may still be editing the objective list
+            self.turn_pipeline.barrier("agent_objective")
             self.objective_manager.add_agent_objective(new_objective)
             self.logger.info(f"Agent declared new objective: {new_objective}")
 
         # Execute critic evaluation with optional tracing
-        action_to_take, final_critic_score, final_critic_justification, final_critic_confidence, was_overridden, override_reason, rejected_actions_this_turn = (
-            self._execute_critic_evaluation_loop(
-                current_state=current_state,
-                proposed_action=proposed_action,
-                agent_context=agent_context,
-                formatted_context=formatted_context,
-            )
-        )
+        with self.turn_timer.phase("critic"):
+            if candidate_mode:
+                action_to_take, final_critic_score, final_critic_justification, final_critic_confidence, was_overridden, override_reason, rejected_actions_this_turn = (
+                    self._execute_candidate_selection(
+                        current_state=current_state,
+                        candidates=agent_result["candidates"],
+                    )
+                )
+            else:
+                action_to_take, final_critic_score, final_critic_justification, final_critic_confidence, was_overridden, override_reason, rejected_actions_this_turn = (
+                    self._execute_critic_evaluation_loop(
+                        current_state=current_state,
+                        proposed_action=proposed_action,
+                        agent_context=agent_context,
+                        formatted_context=formatted_context,
+                    )
+                )
 
         # Store rejected actions for this turn
         if rejected_actions_this_turn:
@@ -1488,6 +1845,11 @@ class ZorkOrchestratorV2:
         #
         # This enables cross-episode learning: Episode 2 benefits from Episode 1 discoveries
         # when agent returns to same locations with prior knowledge.
+        #
+        # Previous turn's memory/objective/export jobs must land before this turn's
+        # post-action phase mutates game state again.
+        self.turn_pipeline.barrier("pre_action")
+
         score_before, _ = self.jericho_interface.get_score()
         location_before = self.jericho_interface.get_location_structured()
         location_id_before = location_before.num if location_before else 0
@@ -1495,10 +1857,11 @@ class ZorkOrchestratorV2:
         inventory_before = self.jericho_interface.get_inventory_structured()
 
         # Execute action using Jericho
-        next_game_state = self.jericho_interface.send_command(action_to_take)
+        with self.turn_timer.phase("game_command"):
+            next_game_state = self.jericho_interface.send_command(action_to_take)
 
-        # Sync inventory with Z-machine reality after every action
-        self._sync_inventory_from_z_machine()
+            # Sync inventory with Z-machine reality after every action
+            self._sync_inventory_from_z_machine()
 
         # Track action after execution (for novelty detection)
         self._track_action_history(action_to_take)
@@ -1544,8 +1907,9 @@ class ZorkOrchestratorV2:
         )
 
         # Extract information from response
-        extracted_info = self.extractor.extract_info(next_game_state)
-        self._process_extraction(extracted_info, action_to_take, next_game_state)
+        with self.turn_timer.phase("extraction"):
+            extracted_info = self.extractor.extract_info(next_game_state)
+            self._process_extraction(extracted_info, action_to_take, next_game_state)
 
         # Store room description if extractor flagged it
         if extracted_info.is_room_description:
@@ -1585,13 +1949,20 @@ class ZorkOrchestratorV2:
             'inventory_changed': set(o.name for o in inventory_before) != set(o.name for o in inventory_after),
             'died': self.game_state.game_over_flag,
             'response_length': len(clean_response),
-            'first_visit': location_id_after not in self.simple_memory.memory_cache
+            'first_visit': location_id_after not in self.simple_memory.memory_cache,
+            # Same response from the same state in an earlier turn or episode
+            'outcome_known': bool(
+                self.jericho_interface.last_outcome and self.jericho_interface.last_outcome.cached
+            ),
         }
 
         # Record action outcome for memory synthesis
         # CRITICAL: Use location_id_before and location_name_before (SOURCE location)
         # NOT current location (destination). See Phase 0 comments above for rationale.
-        self.simple_memory.record_action_outcome(
+        self._submit_post_action_work(
+            "memory_synthesis",
+            self.simple_memory,
+            "record_action_outcome",
             location_id=location_id_before,      # SOURCE location (where action was taken)
             location_name=location_name_before,  # SOURCE location name
             action=action_to_take,
@@ -1612,7 +1983,10 @@ class ZorkOrchestratorV2:
         self.game_state.extracted_info_history.append(extracted_dict)
 
         # Check for objective completion
-        self.objective_manager.check_objective_completion(
+        self._submit_post_action_work(
+            "objective_completion",
+            self.objective_manager,
+            "check_objective_completion",
             action_taken=action_to_take,
             game_response=next_game_state,
             extracted_info=extracted_info,
@@ -1633,14 +2007,18 @@ class ZorkOrchestratorV2:
         )
 
         # Track state for loop detection (Phase 6)
-        loop_detected = self.state_manager.track_state_hash(self.jericho_interface)
+        with self.turn_timer.phase("loop_detection"):
+            loop_detected = self.state_manager.track_state_hash(self.jericho_interface)
         if loop_detected:
+            observation = self.state_manager.last_state_observation
             self.logger.info(
                 "State loop detected - agent may be stuck",
                 extra={
                     "event_type": "stuck_behavior_detected",
                     "episode_id": self.game_state.episode_id,
                     "turn": self.game_state.turn_count,
+                    "turns_in_loop": observation.revisit_distance,
+                    "cycle_length": observation.cycle_length,
                 },
             )
 
@@ -1730,8 +2108,16 @@ class ZorkOrchestratorV2:
                 except Exception as e:
                     self.logger.warning(f"Failed to track failed action: {e}")
 
+    @timed_phase("periodic_updates")
     def _check_periodic_updates(self) -> None:
         """Check and run periodic updates for managers."""
+        # Objective and knowledge updates read memories/objectives written by pipeline jobs
+        if (
+            self.objective_manager.should_process_turn()
+            or self.knowledge_manager.should_process_turn()
+        ):
+            self.turn_pipeline.barrier("periodic_updates")
+
         # Map manager periodic check (currently no-op; map updates happen in real-time)
         self.map_manager.process_turn()
 
@@ -1742,11 +2128,13 @@ class ZorkOrchestratorV2:
                 current_reasoning = self.game_state.action_reasoning_history[-1].get(
                     "reasoning", ""
                 )
-            self.objective_manager.process_periodic_updates(current_reasoning)
+            with self.turn_timer.phase("objective_update"):
+                self.objective_manager.process_periodic_updates(current_reasoning)
 
         # Knowledge updates
         if self.knowledge_manager.should_process_turn():
-            self.knowledge_manager.check_periodic_update()
+            with self.turn_timer.phase("knowledge_update"):
+                self.knowledge_manager.check_periodic_update()
 
         # State management (context overflow)
         self.state_manager.process_turn()
@@ -1780,8 +2168,13 @@ class ZorkOrchestratorV2:
                 }
             )
 
-    def _export_coordinated_state(self) -> None:
-        """Coordinate data gathering from managers and export complete state."""
+    def _export_coordinated_state(self, final: bool = False) -> None:
+        """
+        Coordinate data gathering from managers and export complete state.
+
+        Args:
+            final: End-of-episode export (forces a keyframe in delta export mode)
+        """
         try:
             # Gather data from specialized managers (orchestrator coordination)
             map_data = self.map_manager.get_export_data()
@@ -1791,9 +2184,23 @@ class ZorkOrchestratorV2:
             # Store rejection state in GameState for persistence
             self.game_state.rejection_state = rejection_data
 
+            # Timing percentiles ride along with the state export
+            timing_data = self.turn_timer.get_summary() if self.turn_timer.enabled else None
+            if timing_data and self.config.turn_timing_prometheus_file:
+                self.state_manager.queue_metrics_file(
+                    str(Path(self.config.zork_game_workdir) / self.config.turn_timing_prometheus_file),
+                    self.turn_timer.render_prometheus({"episode_id": self.game_state.episode_id}),
+                )
+
             # Pass to StateManager for assembly and export (delegation)
-            self.state_manager.export_current_state(
-                map_data=map_data, knowledge_data=knowledge_data
+            self._submit_post_action_work(
+                "state_export",
+                self.state_manager,
+                "export_current_state",
+                map_data=map_data,
+                knowledge_data=knowledge_data,
+                force_keyframe=final,
+                timing_data=timing_data,
             )
 
         except Exception as e:
@@ -1807,6 +2214,67 @@ class ZorkOrchestratorV2:
                 },
             )
 
+    def _submit_post_action_work(
+        self, job_name: str, manager, method_name: str, **kwargs
+    ) -> None:
+        """Run a manager method now, or on the turn pipeline when pipelining is enabled.
+
+        Background jobs run against a shallow copy of the manager bound to a
+        snapshot of GameState taken at submission time. Scalars (turn count,
+        location, score) and append-only histories are frozen so the job sees
+        this turn even after the main thread moves on; objective lists and
+        manager caches stay shared, so in-place changes land in the live state.
+        Attributes the job rebinds on the copies (e.g. a replaced objective
+        list or an updated turn marker) are returned and applied to the live
+        GameState and manager on the main thread at the next barrier.
+        """
+        if not self.turn_pipeline.enabled:
+            job = self.turn_timer.timed(job_name, getattr(manager, method_name))
+            self.turn_pipeline.submit(job_name, job, **kwargs)
+            return
+
+        game_state_view = self._snapshot_game_state()
+        manager_view = copy.copy(manager)
+        manager_view.game_state = game_state_view
+        method = self.turn_timer.timed(job_name, getattr(manager_view, method_name))
+        state_before = vars(game_state_view).copy()
+        manager_before = vars(manager_view).copy()
+
+        def job(**job_kwargs) -> Dict[str, Dict[str, Any]]:
+            method(**job_kwargs)
+            return {
+                "game_state": self._rebound_attributes(game_state_view, state_before),
+                "manager": self._rebound_attributes(manager_view, manager_before),
+            }
+
+        def apply_writes(writes: Dict[str, Dict[str, Any]]) -> None:
+            for name, value in writes["game_state"].items():
+                setattr(self.game_state, name, value)
+            for name, value in writes["manager"].items():
+                setattr(manager, name, value)
+
+        self.turn_pipeline.submit(job_name, job, on_complete=apply_writes, **kwargs)
+
+    def _snapshot_game_state(self) -> GameState:
+        """Copy GameState, freezing the histories the main thread keeps appending to."""
+        return dataclasses.replace(
+            self.game_state,
+            action_history=list(self.game_state.action_history),
+            action_reasoning_history=list(self.game_state.action_reasoning_history),
+            memory_log_history=list(self.game_state.memory_log_history),
+            critic_evaluation_history=list(self.game_state.critic_evaluation_history),
+            extracted_info_history=list(self.game_state.extracted_info_history),
+        )
+
+    @staticmethod
+    def _rebound_attributes(view, before: Dict[str, Any]) -> Dict[str, Any]:
+        """Attributes a background job assigned on a view since `before` was taken."""
+        return {
+            name: value
+            for name, value in vars(view).items()
+            if name not in before or before[name] is not value
+        }
+
     def run_multiple_episodes(self, num_episodes: int = 1) -> List[int]:
         """
         Run multiple episodes sequentially.
@@ -1841,6 +2309,15 @@ class ZorkOrchestratorV2:
 
         return scores
 
+    def _lookahead_stats(self) -> Dict[str, Any]:
+        """Lookahead simulator statistics plus the critic LLM evaluations it replaced."""
+        return {
+            **self.jericho_interface.lookahead.get_stats(),
+            "critic_evaluations_skipped": (
+                self.critic.lookahead_verdicts if self.config.enable_critic else 0
+            ),
+        }
+
     def get_orchestrator_status(self) -> Dict[str, Any]:
         """Get comprehensive orchestrator status."""
         status = {
@@ -1857,4 +2334,26 @@ class ZorkOrchestratorV2:
             manager_name = manager.__class__.__name__
             status["managers"][manager_name] = manager.get_status()
 
+        status["turn_pipeline"] = self.turn_pipeline.get_status()
+        status["exit_oracle"] = self.jericho_interface.exit_oracle.get_stats()
+        status["lookahead"] = self._lookahead_stats()
+
+        outcome_store = self.jericho_interface.outcome_store
+        status["outcome_store"] = (
+            outcome_store.get_stats() if outcome_store else {"enabled": False}
+        )
+
+        response_cache = get_response_cache(self.config)
+        status["llm_response_cache"] = (
+            response_cache.get_stats() if response_cache else {"enabled": False}
+        )
+
+        cassette = get_cassette(self.config)
+        status["llm_cassette"] = cassette.get_stats() if cassette else {"enabled": False}
+
+        status["turn_timing"] = self.turn_timer.get_summary()
+        status["prompt_cache"] = get_prompt_cache_stats().get_stats()
+        status["extractor"] = self.extractor.get_stats()
+        status["episode_finalizer"] = get_episode_finalizer().get_status()
+
         return status
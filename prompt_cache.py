@@ -0,0 +1,165 @@
+"""
+Cache-aware prompt layout and prompt-cache accounting for LLM calls.
+
+Providers with prompt caching (Anthropic through OpenRouter/LiteLLM, OpenAI,
+DeepSeek, ...) only reuse the unchanged *prefix* of a request. Content is
+therefore laid out from most to least stable, one message per tier:
+
+1. static     - system prompt files (agent.md, critic.md, ...); never change
+2. knowledge  - knowledge base; changes when it is reloaded between episodes
+3. reference  - slow-moving turn context such as the map; changes when the
+                map does
+4. turn       - everything else; changes every call
+
+Every message except the turn message carries a cache_control breakpoint
+(at most three, within Anthropic's limit of four), so a map change only
+invalidates the reference tier onward and a knowledge reload leaves the
+static prompt cached.
+
+PromptCacheStats totals provider-reported cached prompt tokens per component
+(normalized by LLMClient._extract_usage_details), so the effect of a layout
+change is visible in get_orchestrator_status() as cached tokens per episode.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+TIERS = ("static", "knowledge", "reference", "turn")
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+class PromptBuilder:
+    """
+    Builds chat messages ordered from stable to volatile with cache breakpoints.
+
+    Usage:
+        messages = (
+            PromptBuilder(model)
+            .add("static", system_prompt)
+            .add("knowledge", knowledge_section)
+            .add("turn", user_prompt)
+            .build()
+        )
+    """
+
+    def __init__(self, model: str = ""):
+        """
+        Initialize the builder.
+
+        Args:
+            model: Model name; o1 models get every tier as a user message
+        """
+        self.model = model or ""
+        self._segments: Dict[str, List[str]] = {tier: [] for tier in TIERS}
+
+    def add(self, tier: str, text: Optional[str]) -> "PromptBuilder":
+        """
+        Add text to a tier (empty text is skipped).
+
+        Args:
+            tier: One of TIERS
+            text: Content; several segments in one tier are joined by blank lines
+
+        Returns:
+            The builder, for chaining
+        """
+        if tier not in self._segments:
+            raise ValueError(f"Unknown prompt tier: {tier!r}")
+        if text:
+            self._segments[tier].append(text)
+        return self
+
+    def build(self) -> List[Dict[str, Any]]:
+        """
+        Build the messages, one per non-empty tier.
+
+        Returns:
+            Chat messages; static/knowledge are system messages (user for o1
+            models), reference/turn are user messages
+        """
+        messages = []
+        for tier in TIERS:
+            if not self._segments[tier]:
+                continue
+            role = "system" if tier in ("static", "knowledge") and "o1" not in self.model else "user"
+            message = {"role": role, "content": "\n\n".join(self._segments[tier])}
+            if tier != "turn":
+                message["cache_control"] = dict(CACHE_CONTROL)
+            messages.append(message)
+        return messages
+
+
+class PromptCacheStats:
+    """
+    Per-component totals of prompt tokens and provider-reported cache hits.
+
+    Thread-safe: calls complete on worker threads (batched critic scoring,
+    pipelined post-action jobs).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._components: Dict[str, Dict[str, int]] = {}
+
+    def record(self, component: Optional[str], usage_details: Optional[Dict[str, Any]]) -> None:
+        """
+        Add one call's usage.
+
+        Args:
+            component: Component name passed to the client (e.g., "Agent")
+            usage_details: Output of LLMClient._extract_usage_details
+        """
+        if not usage_details:
+            return
+        with self._lock:
+            totals = self._components.setdefault(
+                component or "unnamed",
+                {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "cache_write_tokens": 0},
+            )
+            totals["calls"] += 1
+            totals["prompt_tokens"] += _as_int(usage_details.get("input"))
+            totals["cached_tokens"] += _as_int(usage_details.get("cache_read_input_tokens"))
+            totals["cache_write_tokens"] += _as_int(usage_details.get("cache_creation_input_tokens"))
+
+    def reset(self) -> None:
+        """Drop all totals (e.g., at the start of an episode)."""
+        with self._lock:
+            self._components.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get totals for status reporting.
+
+        Returns:
+            Dict with overall calls/prompt_tokens/cached_tokens/cache_write_tokens/
+            hit_rate and the same figures per component
+        """
+        with self._lock:
+            components = {name: dict(totals) for name, totals in self._components.items()}
+
+        overall = {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "cache_write_tokens": 0}
+        for totals in components.values():
+            for key in overall:
+                overall[key] += totals[key]
+            totals["hit_rate"] = _hit_rate(totals)
+        overall["hit_rate"] = _hit_rate(overall)
+        return {**overall, "components": components}
+
+
+def _hit_rate(totals: Dict[str, int]) -> float:
+    if not totals["prompt_tokens"]:
+        return 0.0
+    return round(totals["cached_tokens"] / totals["prompt_tokens"], 3)
+
+
+def _as_int(value: Any) -> int:
+    return value if isinstance(value, int) else 0
+
+
+_prompt_cache_stats = PromptCacheStats()
+
+
+def get_prompt_cache_stats() -> PromptCacheStats:
+    """Get the process-wide prompt cache totals shared by every LLMClient."""
+    return _prompt_cache_stats
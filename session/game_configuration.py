@@ -7,7 +7,7 @@ loading directly from pyproject.toml and environment variables.
 
 import tomllib
 import warnings
-from typing import Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -87,6 +87,16 @@ class GameConfiguration(BaseSettings):
     client_api_key: Optional[str] = Field(
         default=None, description="API key for LLM client"
     )
+    llm_http_pool_maxsize: int = Field(
+        default=8,
+        description="Keep-alive connections retained per LLM endpoint",
+    )
+    llm_shared_request_slots: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum in-flight LLM requests across all processes sharing "
+        "zork_game_workdir, with a shared rate-limit cooldown (0 = no cap)",
+    )
 
     # Model specifications
     agent_model: str = Field(
@@ -122,6 +132,78 @@ class GameConfiguration(BaseSettings):
         default=None, description="Optional base URL for memory model"
     )
 
+    # LLM response cache
+    llm_cache_enabled: bool = Field(
+        default=False, description="Serve repeated identical LLM requests from cache"
+    )
+    llm_cache_components: List[str] = Field(
+        default_factory=lambda: ["Extractor", "Critic"],
+        description="Component names (the 'name' passed to the LLM client) that use the cache",
+    )
+    llm_cache_file: str = Field(
+        default="llm_response_cache.sqlite3",
+        description="SQLite file for the persistent cache tier, relative to zork_game_workdir (empty = memory only)",
+    )
+    llm_cache_ttl_seconds: float = Field(
+        default=604800.0, description="Cache entry lifetime in seconds (0 = never expire)"
+    )
+    llm_cache_max_memory_entries: int = Field(
+        default=512, description="Capacity of the in-memory LRU tier"
+    )
+    llm_cache_max_disk_entries: int = Field(
+        default=20000, description="Row cap for the SQLite tier"
+    )
+
+    # Cross-episode action outcome store
+    outcome_store_enabled: bool = Field(
+        default=False,
+        description="Record every command's outcome per (world state, action) across episodes",
+    )
+    outcome_store_file: str = Field(
+        default="action_outcomes.sqlite3",
+        description="SQLite file for the outcome store, relative to zork_game_workdir (empty = memory only)",
+    )
+    outcome_store_max_entries: int = Field(
+        default=50000, ge=1, description="Row cap for the outcome store (LRU eviction)"
+    )
+    outcome_store_skip_known_memories: bool = Field(
+        default=True,
+        description="Skip memory synthesis for outcomes the store has already seen",
+    )
+
+    # LLM record/replay
+    llm_cassette_mode: str = Field(
+        default="off",
+        description="'off', 'record' (write every LLM exchange to llm_cassette_file) or "
+        "'replay' (answer LLM calls from llm_cassette_file without the network)",
+    )
+    llm_cassette_file: str = Field(
+        default="llm_cassette.jsonl",
+        description="Cassette JSONL file, relative to zork_game_workdir",
+    )
+
+    # Context token budgets
+    context_tokenizer: str = Field(
+        default="auto",
+        description="Tokenizer for prompt budgets: 'auto' (tiktoken if installed, else "
+        "heuristic), 'tiktoken' or 'heuristic'",
+    )
+    agent_context_token_budget: int = Field(
+        default=0,
+        ge=0,
+        description="Token budget for the agent's per-turn context and map (0 = unlimited)",
+    )
+    objective_context_token_budget: int = Field(
+        default=0,
+        ge=0,
+        description="Token budget for the objective discovery context sections (0 = unlimited)",
+    )
+    context_section_token_caps: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Token cap per prompt section name (e.g., map, reasoning, memories), "
+        "applied before the budget",
+    )
+
     # Retry configuration
     retry: dict = Field(
         default_factory=_default_retry_config,
@@ -132,6 +214,15 @@ class GameConfiguration(BaseSettings):
     knowledge_update_interval: int = Field(
         default=100, description="Interval for knowledge base updates"
     )
+    knowledge_update_mode: str = Field(
+        default="full",
+        description="'full' re-analyzes turns 1..N on every update; 'incremental' analyzes "
+        "only turns since the last update and merges revised sections",
+    )
+    knowledge_prompt_token_budget: int = Field(
+        default=24000,
+        description="Estimated prompt token cap for incremental knowledge updates",
+    )
     objective_update_interval: int = Field(
         default=25, description="Interval for objective discovery updates"
     )
@@ -168,12 +259,33 @@ class GameConfiguration(BaseSettings):
     enable_state_export: bool = Field(
         default=True, description="Enable state export functionality"
     )
+    state_export_mode: str = Field(
+        default="full",
+        description="'full' rewrites current_state.json every turn; 'delta' appends per-turn "
+        "diffs to episodes/<id>/state_journal.jsonl and writes full keyframes periodically",
+    )
+    state_keyframe_interval: int = Field(
+        default=10, description="Turns between full keyframes in delta export mode"
+    )
+    enable_background_state_export: bool = Field(
+        default=False,
+        description="Write current_state.json and S3 uploads on a background thread, "
+        "coalescing pending writes to the same destination",
+    )
+    state_export_queue_size: int = Field(
+        default=32,
+        description="Distinct pending export writes before the game loop blocks",
+    )
     s3_bucket: Optional[str] = Field(
         default=None, description="S3 bucket for state export"
     )
     s3_key_prefix: str = Field(
         default="zorkgpt/", description="S3 key prefix for exports"
     )
+    s3_local_dir: Optional[str] = Field(
+        default=None,
+        description="Write S3 objects to <dir>/<bucket>/<key> instead of S3 (tests, offline runs)",
+    )
 
     # Gameplay settings
     critic_rejection_threshold: float = Field(
@@ -188,6 +300,30 @@ class GameConfiguration(BaseSettings):
     exit_failure_threshold: int = Field(
         default=2, description="Number of failures before pruning an exit"
     )
+    map_prompt_max_rooms: int = Field(
+        default=0,
+        ge=0,
+        description="Draw only this many rooms nearest the agent in the prompt map (0 = whole map)",
+    )
+    enable_route_hint: bool = Field(
+        default=False,
+        description="Tell the agent the shortest route to the nearest room with unexplored exits",
+    )
+    extractor_fast_path: bool = Field(
+        default=False,
+        description="Derive exits, combat and room descriptions from the Z-machine state, "
+        "calling the extractor LLM only when the rules are ambiguous",
+    )
+    extractor_memo_size: int = Field(
+        default=512,
+        ge=0,
+        description="Extractor LLM answers memoized per normalized response text (0 = off)",
+    )
+    enable_lookahead: bool = Field(
+        default=False,
+        description="Dry-run proposed actions on a saved Z-machine state and settle parser "
+        "rejections, blocked moves, deaths and score increases without the critic LLM",
+    )
     zork_save_filename_template: str = Field(
         default="zorkgpt_save_{timestamp}", description="Template for save file names"
     )
@@ -196,6 +332,37 @@ class GameConfiguration(BaseSettings):
     enable_inter_episode_synthesis: bool = Field(
         default=True, description="Enable inter-episode wisdom synthesis"
     )
+    enable_pipelined_turns: bool = Field(
+        default=False,
+        description="Run memory synthesis, objective completion checks and state export "
+        "on a background worker overlapping the next agent call",
+    )
+    enable_background_finalization: bool = Field(
+        default=False,
+        description="Run the final knowledge update, inter-episode synthesis and episode "
+        "summary in the background so the next episode can start immediately",
+    )
+    wait_for_knowledge: bool = Field(
+        default=True,
+        description="With background finalization, wait for the previous episode's knowledge "
+        "update where knowledgebase.md is first read (false: start on the previous knowledge base)",
+    )
+    max_parallel_episodes: int = Field(
+        default=1,
+        ge=1,
+        description="Episodes run concurrently (one process each) by ParallelEpisodeRunner",
+    )
+    enable_turn_timing: bool = Field(
+        default=False,
+        description="Record per-phase turn latency histograms (status, state export, Prometheus file)",
+    )
+    turn_timing_window: int = Field(
+        default=512, ge=1, description="Samples per phase kept for p50/p95/p99"
+    )
+    turn_timing_prometheus_file: str = Field(
+        default="",
+        description="Prometheus text file for turn timings, relative to zork_game_workdir (empty = none)",
+    )
 
     # Simple memory settings
     simple_memory_file: str = Field(
@@ -204,6 +371,19 @@ class GameConfiguration(BaseSettings):
     simple_memory_max_shown: int = Field(
         default=10, description="Maximum number of memories to show"
     )
+    simple_memory_store: str = Field(
+        default="markdown",
+        description="Persistent memory backend: 'markdown' rewrites Memories.md on every "
+        "change, 'log' appends to an indexed JSONL log and renders Memories.md on export",
+    )
+    simple_memory_log_file: str = Field(
+        default="memories.jsonl",
+        description="Append-only memory log (relative to zork_game_workdir) for the 'log' store",
+    )
+    simple_memory_compaction_ratio: float = Field(
+        default=2.0,
+        description="Compact the memory log once it holds this many records per live memory",
+    )
 
     # Room description settings
     room_description_age_window: int = Field(
@@ -215,6 +395,25 @@ class GameConfiguration(BaseSettings):
         default=True,
         description="Enable LLM-based critic evaluation (object tree validation always runs)"
     )
+    agent_candidate_count: int = Field(
+        default=1,
+        ge=1,
+        le=8,
+        description="Candidate actions the agent proposes per turn; above 1 the critic scores "
+        "them all in one request and the best acceptable one is taken without retries",
+    )
+
+    # State loop detection
+    state_loop_window: int = Field(
+        default=1000,
+        ge=1,
+        description="Recent game state digests remembered for loop detection",
+    )
+    loop_max_cycle_length: int = Field(
+        default=4,
+        ge=1,
+        description="Longest repeating cycle (in turns) reported by state and action loop detection",
+    )
 
     # Progress Velocity Detection
     max_turns_stuck: int = Field(
@@ -376,6 +575,10 @@ class GameConfiguration(BaseSettings):
         aws_config = zorkgpt_config.get("aws", {})
         simple_memory_config = zorkgpt_config.get("simple_memory", {})
         retry_config = zorkgpt_config.get("retry", {})
+        llm_cache_config = zorkgpt_config.get("llm_cache", {})
+        llm_cassette_config = zorkgpt_config.get("llm_cassette", {})
+        outcome_store_config = zorkgpt_config.get("outcome_store", {})
+        context_budget_config = zorkgpt_config.get("context_budget", {})
         objective_completion_config = zorkgpt_config.get("objective_completion", {})
         loop_break_config = zorkgpt_config.get("loop_break", {})
 
@@ -402,6 +605,8 @@ class GameConfiguration(BaseSettings):
             "game_file_path": files_config.get("game_file_path"),
             # LLM client settings
             "client_base_url": llm_config.get("client_base_url"),
+            "llm_http_pool_maxsize": llm_config.get("http_pool_maxsize", 8),
+            "llm_shared_request_slots": llm_config.get("shared_request_slots", 0),
             # Model specifications
             "agent_model": llm_config.get("agent_model"),
             "critic_model": llm_config.get("critic_model"),
@@ -414,10 +619,34 @@ class GameConfiguration(BaseSettings):
             "critic_base_url": llm_config.get("critic_base_url"),
             "analysis_base_url": llm_config.get("analysis_base_url"),
             "memory_base_url": llm_config.get("memory_base_url"),
+            # LLM response cache
+            "llm_cache_enabled": llm_cache_config.get("enabled", False),
+            "llm_cache_components": llm_cache_config.get("components", ["Extractor", "Critic"]),
+            "llm_cache_file": llm_cache_config.get("cache_file", "llm_response_cache.sqlite3"),
+            "llm_cache_ttl_seconds": llm_cache_config.get("ttl_seconds", 604800.0),
+            "llm_cache_max_memory_entries": llm_cache_config.get("max_memory_entries", 512),
+            "llm_cache_max_disk_entries": llm_cache_config.get("max_disk_entries", 20000),
+            # Cross-episode action outcome store
+            "outcome_store_enabled": outcome_store_config.get("enabled", False),
+            "outcome_store_file": outcome_store_config.get("store_file", "action_outcomes.sqlite3"),
+            "outcome_store_max_entries": outcome_store_config.get("max_entries", 50000),
+            "outcome_store_skip_known_memories": outcome_store_config.get("skip_known_memories", True),
+            # LLM record/replay
+            "llm_cassette_mode": llm_cassette_config.get("mode", "off"),
+            "llm_cassette_file": llm_cassette_config.get("cassette_file", "llm_cassette.jsonl"),
+            # Context token budgets
+            "context_tokenizer": context_budget_config.get("tokenizer", "auto"),
+            "agent_context_token_budget": context_budget_config.get("agent_token_budget", 0),
+            "objective_context_token_budget": context_budget_config.get("objective_token_budget", 0),
+            "context_section_token_caps": context_budget_config.get("section_token_caps", {}),
             # Retry configuration
             "retry": retry_config,
             # Update intervals
             "knowledge_update_interval": orchestrator_config.get("knowledge_update_interval"),
+            "knowledge_update_mode": orchestrator_config.get("knowledge_update_mode", "full"),
+            "knowledge_prompt_token_budget": orchestrator_config.get(
+                "knowledge_prompt_token_budget", 24000
+            ),
             "objective_update_interval": orchestrator_config.get("objective_update_interval"),
             # Objective refinement
             "enable_objective_refinement": orchestrator_config.get("enable_objective_refinement"),
@@ -431,19 +660,42 @@ class GameConfiguration(BaseSettings):
             "completion_include_memories": objective_completion_config.get("include_memories", True),
             # State export
             "enable_state_export": orchestrator_config.get("enable_state_export"),
+            "state_export_mode": orchestrator_config.get("state_export_mode", "full"),
+            "enable_background_state_export": orchestrator_config.get(
+                "enable_background_state_export", False
+            ),
+            "state_export_queue_size": orchestrator_config.get("state_export_queue_size", 32),
+            "state_keyframe_interval": orchestrator_config.get("state_keyframe_interval", 10),
             "s3_key_prefix": aws_config.get("s3_key_prefix"),
+            "s3_local_dir": aws_config.get("s3_local_dir"),
             # Gameplay settings
             "critic_rejection_threshold": gameplay_config.get("critic_rejection_threshold"),
             "enable_critic": gameplay_config.get("enable_critic", True),
+            "agent_candidate_count": gameplay_config.get("agent_candidate_count", 1),
             "min_knowledge_quality": gameplay_config.get("min_knowledge_quality"),
             "enable_exit_pruning": gameplay_config.get("enable_exit_pruning"),
             "exit_failure_threshold": gameplay_config.get("exit_failure_threshold"),
+            "map_prompt_max_rooms": gameplay_config.get("map_prompt_max_rooms", 0),
+            "enable_route_hint": gameplay_config.get("enable_route_hint", False),
+            "extractor_fast_path": gameplay_config.get("extractor_fast_path", False),
+            "extractor_memo_size": gameplay_config.get("extractor_memo_size", 512),
+            "enable_lookahead": gameplay_config.get("enable_lookahead", False),
             "zork_save_filename_template": gameplay_config.get("zork_save_filename_template"),
             # Orchestrator settings
             "enable_inter_episode_synthesis": orchestrator_config.get("enable_inter_episode_synthesis"),
+            "enable_pipelined_turns": orchestrator_config.get("enable_pipelined_turns", False),
+            "enable_background_finalization": orchestrator_config.get("enable_background_finalization", False),
+            "wait_for_knowledge": orchestrator_config.get("wait_for_knowledge", True),
+            "max_parallel_episodes": orchestrator_config.get("max_parallel_episodes", 1),
+            "enable_turn_timing": orchestrator_config.get("enable_turn_timing", False),
+            "turn_timing_window": orchestrator_config.get("turn_timing_window", 512),
+            "turn_timing_prometheus_file": orchestrator_config.get("turn_timing_prometheus_file", ""),
             # Simple memory settings
             "simple_memory_file": simple_memory_config.get("memory_file"),
             "simple_memory_max_shown": simple_memory_config.get("max_memories_shown"),
+            "simple_memory_store": simple_memory_config.get("store", "markdown"),
+            "simple_memory_log_file": simple_memory_config.get("log_file", "memories.jsonl"),
+            "simple_memory_compaction_ratio": simple_memory_config.get("compaction_ratio", 2.0),
             # Sampling parameters
             "agent_sampling": agent_sampling,
             "critic_sampling": critic_sampling,
@@ -453,6 +705,10 @@ class GameConfiguration(BaseSettings):
         }
 
         # Add optional progress velocity detection settings (only if present in TOML)
+        if loop_break_config.get("state_loop_window") is not None:
+            config_dict["state_loop_window"] = loop_break_config.get("state_loop_window")
+        if loop_break_config.get("loop_max_cycle_length") is not None:
+            config_dict["loop_max_cycle_length"] = loop_break_config.get("loop_max_cycle_length")
         if loop_break_config.get("max_turns_stuck") is not None:
             config_dict["max_turns_stuck"] = loop_break_config.get("max_turns_stuck")
         if loop_break_config.get("stuck_check_interval") is not None:
@@ -0,0 +1,190 @@
+# ABOUTME: Cross-process coordination for files shared by concurrently running episodes
+# ABOUTME: Per-path file locks, atomic writes and an LLM request limiter with a shared rate-limit cooldown
+
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+from filelock import FileLock, Timeout
+
+from session.game_configuration import GameConfiguration
+
+# How long a writer waits for another process before giving up on a shared file
+LOCK_TIMEOUT_SECONDS = 60.0
+
+# Directory (under zork_game_workdir) holding the request limiter's lock files
+LIMITER_DIR = ".llm_limiter"
+
+PathLike = Union[str, Path]
+
+# One FileLock per path so nested acquisitions in a process are re-entrant.
+# FileLock is thread-local, so threads of one process still exclude each other.
+_locks: Dict[str, FileLock] = {}
+_locks_lock = threading.Lock()
+
+
+def store_lock(path: PathLike) -> FileLock:
+    """
+    Get the cross-process lock guarding a shared file.
+
+    The lock lives next to the file as <name>.lock. Every read-modify-write of
+    a file shared between episodes (knowledgebase.md, Memories.md, the memory
+    log, map_state.json) holds this lock.
+
+    Args:
+        path: Path of the shared file
+
+    Returns:
+        FileLock (use as a context manager)
+    """
+    key = os.path.abspath(path)
+    with _locks_lock:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = FileLock(key + ".lock", timeout=LOCK_TIMEOUT_SECONDS)
+            _locks[key] = lock
+        return lock
+
+
+def atomic_write_text(path: PathLike, text: str) -> None:
+    """Write a text file via a per-process temp file and atomic rename."""
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class SharedRequestLimiter:
+    """
+    Caps in-flight LLM requests across every process sharing a workdir.
+
+    Each of the N slots is a lock file; a request holds one slot while it is
+    on the wire. When any process hits a rate limit it records a cooldown
+    deadline that every process honours before sending its next request, so
+    N concurrent episodes back off together instead of each retrying into
+    the same limit.
+    """
+
+    def __init__(self, directory: PathLike, slots: int, poll_interval: float = 0.05):
+        """
+        Initialize the limiter.
+
+        Args:
+            directory: Directory for the slot and cooldown files
+            slots: Maximum concurrent requests
+            poll_interval: Sleep between attempts when every slot is taken
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.poll_interval = poll_interval
+        self._slots = [
+            FileLock(str(self.directory / f"slot_{i}.lock")) for i in range(slots)
+        ]
+        self._cooldown_path = self.directory / "cooldown"
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.waited_seconds = 0.0
+        self.cooldowns_set = 0
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one request slot, waiting out any shared cooldown first."""
+        start = time.monotonic()
+        self.wait_for_cooldown()
+
+        acquired: Optional[FileLock] = None
+        while acquired is None:
+            # Random starting slot spreads processes over the lock files
+            offset = random.randrange(len(self._slots))
+            for i in range(len(self._slots)):
+                lock = self._slots[(offset + i) % len(self._slots)]
+                try:
+                    lock.acquire(timeout=0)
+                except Timeout:
+                    continue
+                acquired = lock
+                break
+            else:
+                time.sleep(self.poll_interval)
+
+        with self._stats_lock:
+            self.requests += 1
+            self.waited_seconds += time.monotonic() - start
+        try:
+            yield
+        finally:
+            acquired.release()
+
+    def _read_deadline(self) -> float:
+        """Epoch time the shared cooldown ends (0 if none was recorded)."""
+        try:
+            return float(self._cooldown_path.read_text(encoding="utf-8") or 0)
+        except (OSError, ValueError):
+            return 0.0
+
+    def cooldown_remaining(self) -> float:
+        """Seconds until the shared cooldown expires (0 if none is active)."""
+        return max(0.0, self._read_deadline() - time.time())
+
+    def wait_for_cooldown(self) -> None:
+        """Sleep until the shared cooldown has expired."""
+        remaining = self.cooldown_remaining()
+        while remaining > 0:
+            time.sleep(remaining)
+            # Another process may have extended it meanwhile
+            remaining = self.cooldown_remaining()
+
+    def note_rate_limit(self, delay: float) -> None:
+        """
+        Record a rate limit so every process pauses for at least delay seconds.
+
+        An existing later deadline is kept.
+        """
+        deadline = time.time() + delay
+        with store_lock(self._cooldown_path):
+            if deadline > self._read_deadline():
+                atomic_write_text(self._cooldown_path, repr(deadline))
+        with self._stats_lock:
+            self.cooldowns_set += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get limiter statistics for status reporting."""
+        with self._stats_lock:
+            return {
+                "slots": len(self._slots),
+                "requests": self.requests,
+                "waited_seconds": round(self.waited_seconds, 3),
+                "cooldowns_set": self.cooldowns_set,
+                "cooldown_remaining": round(self.cooldown_remaining(), 3),
+            }
+
+
+# One limiter per workdir, shared by every LLMClient in the process
+_limiters: Dict[str, SharedRequestLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_request_limiter(config: GameConfiguration) -> Optional[SharedRequestLimiter]:
+    """
+    Get the shared request limiter for a configuration.
+
+    Args:
+        config: GameConfiguration instance
+
+    Returns:
+        SharedRequestLimiter, or None when llm_shared_request_slots is 0
+    """
+    if config.llm_shared_request_slots <= 0:
+        return None
+
+    directory = os.path.abspath(Path(config.zork_game_workdir) / LIMITER_DIR)
+    with _limiters_lock:
+        limiter = _limiters.get(directory)
+        if limiter is None:
+            limiter = SharedRequestLimiter(directory, config.llm_shared_request_slots)
+            _limiters[directory] = limiter
+        return limiter
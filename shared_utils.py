@@ -5,10 +5,12 @@ This module contains common utility functions used across multiple components
 to avoid code duplication.
 """
 
-from typing import Dict, Any, Type, Union, List, Optional
+import os
+from typing import Dict, Any, Type, Union, List, Optional, Tuple
 from pydantic import BaseModel
 from pathlib import Path
 from session.game_configuration import GameConfiguration
+from token_budget import get_tokenizer
 
 
 def create_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
@@ -36,8 +38,9 @@ def estimate_tokens(content: Union[str, List[Any], Dict[Any, Any]]) -> int:
     """
     Estimate the number of tokens in given content.
 
-    Uses a rough approximation of 4 characters per token, which works reasonably
-    well for English text and structured data.
+    Counts with the shared "auto" tokenizer from token_budget (tiktoken when
+    installed, else its offline BPE approximation); counts are cached per
+    string.
 
     Args:
         content: Text string, list of objects, or dictionary to estimate tokens for
@@ -45,12 +48,13 @@ def estimate_tokens(content: Union[str, List[Any], Dict[Any, Any]]) -> int:
     Returns:
         Estimated number of tokens
     """
-    if isinstance(content, str):
-        return len(content) // 4
-    elif isinstance(content, (list, dict)):
-        return len(str(content)) // 4
-    else:
-        return len(str(content)) // 4
+    if not isinstance(content, str):
+        content = str(content)
+    return get_tokenizer().count(content)
+
+
+# Knowledge base token counts keyed by path, valid while (mtime_ns, size) match
+_knowledge_token_counts: Dict[str, Tuple[Tuple[int, int], int]] = {}
 
 
 def strip_markdown_json_fences(content: str) -> str:
@@ -184,14 +188,31 @@ def estimate_context_tokens(
             raise ValueError("config parameter is required when knowledge_base_path is None")
         knowledge_base_path = str(Path(config.zork_game_workdir) / config.knowledge_file)
 
-    try:
-        with open(knowledge_base_path, "r", encoding="utf-8") as f:
-            total_tokens += estimate_tokens(f.read())
-    except FileNotFoundError:
-        pass
+    total_tokens += _knowledge_base_tokens(knowledge_base_path)
 
     # Count additional content
     if additional_content:
         total_tokens += estimate_tokens(additional_content)
 
     return total_tokens
+
+
+def _knowledge_base_tokens(path: str) -> int:
+    """Token count of a knowledge base file, re-read only when it changes on disk."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return 0
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _knowledge_token_counts.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tokens = estimate_tokens(f.read())
+    except FileNotFoundError:
+        return 0
+    _knowledge_token_counts[path] = (signature, tokens)
+    return tokens
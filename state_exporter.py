@@ -0,0 +1,298 @@
+# ABOUTME: Background writer for state exports and S3 uploads, plus a filesystem stand-in for S3
+# ABOUTME: Pending writes to the same destination coalesce so only the newest body is written
+
+import io
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class FilesystemBucket:
+    """
+    Local stand-in for the subset of the boto3 S3 client used for state export.
+
+    Objects are stored at <root>/<Bucket>/<Key>, so a directory written by a
+    test or an offline run has the same layout as the real bucket.
+    """
+
+    def __init__(self, root: str):
+        """
+        Initialize the bucket root.
+
+        Args:
+            root: Directory holding one subdirectory per bucket
+        """
+        self.root = Path(root)
+
+    def put_object(self, Bucket: str, Key: str, Body, **kwargs) -> Dict[str, Any]:
+        """Write an object atomically (ContentType, CacheControl etc. are ignored)."""
+        path = self._path(Bucket, Key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = Body.encode("utf-8") if isinstance(Body, str) else Body
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return {}
+
+    def get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        """Read an object; raises FileNotFoundError if it does not exist."""
+        return {"Body": io.BytesIO(self._path(Bucket, Key).read_bytes())}
+
+    def list_objects_v2(self, Bucket: str, Prefix: str = "", **kwargs) -> Dict[str, Any]:
+        """List every object under a prefix in key order, as a single page."""
+        bucket_root = self.root / Bucket
+        # Walk only the deepest directory the prefix names
+        start = bucket_root / Prefix.rpartition("/")[0]
+        contents = []
+        if start.is_dir():
+            for path in start.rglob("*"):
+                if not path.is_file() or path.name.startswith(".tmp-"):
+                    continue
+                key = path.relative_to(bucket_root).as_posix()
+                if key.startswith(Prefix):
+                    stat = path.stat()
+                    contents.append(
+                        {
+                            "Key": key,
+                            "LastModified": datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+                            "Size": stat.st_size,
+                        }
+                    )
+        contents.sort(key=lambda obj: obj["Key"])
+        page = {"KeyCount": len(contents)}
+        if contents:
+            page["Contents"] = contents
+        return page
+
+    def get_paginator(self, operation_name: str) -> "_ListObjectsPaginator":
+        """Get a paginator (only "list_objects_v2" is supported)."""
+        if operation_name != "list_objects_v2":
+            raise NotImplementedError(f"FilesystemBucket has no paginator for {operation_name}")
+        return _ListObjectsPaginator(self)
+
+    def _path(self, bucket: str, key: str) -> Path:
+        return self.root / bucket / key
+
+
+class _ListObjectsPaginator:
+    """list_objects_v2 paginator over a FilesystemBucket (pages of up to 1000 keys, like S3)."""
+
+    PAGE_SIZE = 1000
+
+    def __init__(self, bucket: FilesystemBucket):
+        self.bucket = bucket
+
+    def paginate(self, Bucket: str, Prefix: str = "", **kwargs) -> Iterator[Dict[str, Any]]:
+        contents = self.bucket.list_objects_v2(Bucket=Bucket, Prefix=Prefix).get("Contents", [])
+        if not contents:
+            yield {"KeyCount": 0}
+            return
+        for start in range(0, len(contents), self.PAGE_SIZE):
+            page = contents[start : start + self.PAGE_SIZE]
+            yield {"Contents": page, "KeyCount": len(page)}
+
+
+class StateExporter:
+    """
+    Single background worker that performs state writes off the game loop.
+
+    Each write is submitted under a destination key ("file:current_state.json",
+    "s3:zorkgpt/current_state.json", ...). A write whose key is already queued
+    replaces the queued body in place, so a slow upload target only ever sees
+    the newest current_state.json; writes to distinct keys (per-turn snapshots,
+    deltas) are all kept and run in submission order. The worker drains every
+    pending write in one batch per wake-up.
+
+    The queue is bounded: when max_pending distinct keys are waiting, submit()
+    blocks until the worker catches up and the wait is recorded as backpressure.
+
+    Failed writes are logged and counted, never raised, in both modes. When
+    disabled, submit() runs the write inline and flush()/close() return
+    immediately.
+    """
+
+    def __init__(self, enabled: bool, max_pending: int = 32, logger=None):
+        """
+        Initialize the exporter.
+
+        Args:
+            enabled: Run writes on a background thread (True) or inline (False)
+            max_pending: Maximum distinct destination keys waiting to be written
+            logger: Logger instance for write failures and backpressure
+        """
+        self.enabled = enabled
+        self.max_pending = max(1, max_pending)
+        self.logger = logger
+
+        self._pending: "OrderedDict[str, tuple]" = OrderedDict()
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        # Instrumentation
+        self.writes_submitted = 0
+        self.writes_coalesced = 0
+        self.writes_completed = 0
+        self.writes_failed = 0
+        self.batches = 0
+        self.max_batch_size = 0
+        self.write_seconds = 0.0
+        self.backpressure_waits = 0
+        self.backpressure_wait_seconds = 0.0
+
+    def submit(self, key: str, fn: Callable, *args, **kwargs) -> None:
+        """
+        Queue a write, replacing any queued write for the same key.
+
+        Args:
+            key: Destination identifier used for coalescing
+            fn: Callable performing the write
+            *args, **kwargs: Arguments for fn (must not be mutated afterwards)
+        """
+        with self._condition:
+            self.writes_submitted += 1
+
+        if not self.enabled:
+            self._run_write(key, fn, args, kwargs)
+            return
+
+        with self._condition:
+            if key in self._pending:
+                self._pending[key] = (fn, args, kwargs)
+                self.writes_coalesced += 1
+                return
+
+            if len(self._pending) >= self.max_pending:
+                start = time.perf_counter()
+                while len(self._pending) >= self.max_pending and not self._closed:
+                    self._condition.wait()
+                waited = time.perf_counter() - start
+                self.backpressure_waits += 1
+                self.backpressure_wait_seconds += waited
+                if self.logger:
+                    self.logger.warning(
+                        f"State exporter queue full; waited {waited:.3f}s",
+                        extra={
+                            "event_type": "state_export_backpressure",
+                            "max_pending": self.max_pending,
+                            "wait_seconds": waited,
+                        },
+                    )
+
+            self._pending[key] = (fn, args, kwargs)
+            self._ensure_worker()
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued write has finished.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if the queue drained within the timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and self._in_flight == 0, timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush outstanding writes and stop the worker thread."""
+        drained = self.flush(timeout=timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=timeout)
+        with self._condition:
+            self._closed = False
+        return drained
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get exporter statistics for status reporting."""
+        with self._condition:
+            return {
+                "enabled": self.enabled,
+                "pending": len(self._pending),
+                "in_flight": self._in_flight,
+                "max_pending": self.max_pending,
+                "writes_submitted": self.writes_submitted,
+                "writes_coalesced": self.writes_coalesced,
+                "writes_completed": self.writes_completed,
+                "writes_failed": self.writes_failed,
+                "batches": self.batches,
+                "max_batch_size": self.max_batch_size,
+                "write_seconds": round(self.write_seconds, 3),
+                "backpressure_waits": self.backpressure_waits,
+                "backpressure_wait_seconds": round(self.backpressure_wait_seconds, 3),
+            }
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use (caller holds the condition)."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._worker, name="zorkgpt-state-exporter", daemon=True
+            )
+            self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, OrderedDict()
+                self._in_flight = len(batch)
+                self.batches += 1
+                self.max_batch_size = max(self.max_batch_size, len(batch))
+                # Room in the queue again: release any submitter under backpressure
+                self._condition.notify_all()
+
+            for key, (fn, args, kwargs) in batch.items():
+                self._run_write(key, fn, args, kwargs)
+
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+    def _run_write(self, key: str, fn: Callable, args: tuple, kwargs: dict) -> None:
+        """Execute one write, logging (not raising) any failure."""
+        start = time.perf_counter()
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            with self._condition:
+                self.writes_failed += 1
+            if self.logger:
+                self.logger.error(
+                    f"State export write '{key}' failed: {e}",
+                    extra={
+                        "event_type": "state_export_write_failed",
+                        "key": key,
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                    },
+                )
+            return
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._condition:
+                self.write_seconds += elapsed
+
+        with self._condition:
+            self.writes_completed += 1
@@ -0,0 +1,295 @@
+# ABOUTME: Append-only per-episode state journal of keyframes and per-turn section deltas
+# ABOUTME: Written by StateManager's delta export mode; readers rebuild any turn by keyframe + replay
+# ABOUTME: Also defines the per-episode manifest summarizing an episode's snapshots
+
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Diff the export document down to this many key levels ("map", then "map.rooms").
+# Anything deeper is replaced wholesale when it changes.
+DELTA_DEPTH = 2
+
+# Written next to an episode's turn_N.json / delta_N.json snapshots when the
+# episode is finalized; holds the episode_summary() of its first and last turns
+MANIFEST_FILE = "manifest.json"
+
+
+def diff_state(
+    previous: Dict[str, Any], current: Dict[str, Any], depth: int = DELTA_DEPTH
+) -> List[Dict[str, Any]]:
+    """
+    Compute the operations that turn one export document into the next.
+
+    Args:
+        previous: Document written for the previous record
+        current: Document for this turn
+        depth: Number of nested dict levels to diff before replacing values whole
+
+    Returns:
+        List of {"op": "set", "path": [...], "value": ...} and
+        {"op": "del", "path": [...]} operations (paths use JSON string keys)
+    """
+    ops: List[Dict[str, Any]] = []
+    _diff(previous, current, [], depth, ops)
+    return ops
+
+
+def _diff(
+    previous: Dict[str, Any],
+    current: Dict[str, Any],
+    path: List[str],
+    depth: int,
+    ops: List[Dict[str, Any]],
+) -> None:
+    for key, value in current.items():
+        key_path = path + [str(key)]
+        if key not in previous:
+            ops.append({"op": "set", "path": key_path, "value": value})
+        elif previous[key] != value:
+            if depth > 1 and isinstance(value, dict) and isinstance(previous[key], dict):
+                _diff(previous[key], value, key_path, depth - 1, ops)
+            else:
+                ops.append({"op": "set", "path": key_path, "value": value})
+
+    for key in previous:
+        if key not in current:
+            ops.append({"op": "del", "path": path + [str(key)]})
+
+
+def apply_delta(state: Dict[str, Any], ops: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply diff_state operations to a (JSON-decoded) document in place.
+
+    Returns:
+        The updated document
+    """
+    for op in ops:
+        *parents, leaf = op["path"]
+        target = state
+        for key in parents:
+            target = target.setdefault(key, {})
+        if op["op"] == "set":
+            target[leaf] = op["value"]
+        else:
+            target.pop(leaf, None)
+    return state
+
+
+def reconstruct_state(
+    records: Iterable[Dict[str, Any]], turn: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild the export document for a turn from journal records.
+
+    Args:
+        records: Journal records in write order
+        turn: Turn to rebuild (None for the latest record)
+
+    Returns:
+        The document as of the last record at or before `turn`, or None if
+        no keyframe precedes it
+    """
+    state: Optional[Dict[str, Any]] = None
+    for record in records:
+        if turn is not None and record["turn"] > turn:
+            break
+        if record["type"] == "keyframe":
+            state = copy.deepcopy(record["state"])
+        elif state is not None:
+            apply_delta(state, record["ops"])
+    return state
+
+
+def episode_summary(
+    episode_id: str,
+    first_state: Dict[str, Any],
+    last_state: Dict[str, Any],
+    snapshot_count: int,
+    first_turn: int,
+    last_turn: int,
+) -> Dict[str, Any]:
+    """
+    Summarize an episode from its first and last export documents.
+
+    This is the body of an episode manifest and the core of an episode index entry.
+    """
+    first_metadata = first_state.get("metadata", {})
+    last_metadata = last_state.get("metadata", {})
+    return {
+        "episode_id": episode_id,
+        "start_time": first_metadata.get("timestamp", episode_id),
+        "end_time": last_metadata.get("timestamp", ""),
+        "total_turns": last_metadata.get("turn_count", snapshot_count),
+        "final_score": last_metadata.get("score", 0),
+        "death_count": last_state.get("current_state", {}).get("death_count", 0),
+        "models": last_metadata.get("models", {}),
+        "snapshot_count": snapshot_count,
+        "first_turn": first_turn,
+        "last_turn": last_turn,
+    }
+
+
+def read_journal(path: Path) -> List[Dict[str, Any]]:
+    """Read journal records, skipping a torn final line from an interrupted write."""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+class StateJournal:
+    """
+    Writer for one episode's state journal.
+
+    Each record is a single JSON line:
+        {"type": "keyframe", "turn": 10, "state": {...full document...}}
+        {"type": "delta", "turn": 11, "keyframe_turn": 10, "ops": [...]}
+
+    The first record, every keyframe_interval-th turn and any forced record
+    are keyframes; all others carry only the sections that changed since the
+    previous record, so a turn costs O(change) bytes rather than a full dump
+    of the map, knowledge base and log.
+    """
+
+    def __init__(self, path: Path, keyframe_interval: int = 10):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Journal file (appended to; parent directories are created)
+            keyframe_interval: Turns between keyframes
+        """
+        self.path = Path(path)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._previous: Optional[Dict[str, Any]] = None
+        self._keyframe_turn: Optional[int] = None
+
+        self.keyframes_written = 0
+        self.deltas_written = 0
+        self.bytes_written = 0
+
+    def record(
+        self, turn: int, state: Dict[str, Any], force_keyframe: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Append the record for one export.
+
+        Args:
+            turn: Turn the document describes
+            state: Full export document
+            force_keyframe: Write a keyframe regardless of the interval
+
+        Returns:
+            The record that was written
+        """
+        is_keyframe = (
+            force_keyframe
+            or self._previous is None
+            or turn - self._keyframe_turn >= self.keyframe_interval
+        )
+
+        if is_keyframe:
+            record = {"type": "keyframe", "turn": turn, "state": state}
+            self._keyframe_turn = turn
+            self.keyframes_written += 1
+        else:
+            record = {
+                "type": "delta",
+                "turn": turn,
+                "keyframe_turn": self._keyframe_turn,
+                "ops": diff_state(self._previous, state),
+            }
+            self.deltas_written += 1
+
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+        self.bytes_written += len(line)
+
+        # Keep a private copy (managers hand out live structures that keep
+        # changing); between keyframes only the changed sections are copied
+        if is_keyframe:
+            self._previous = copy.deepcopy(state)
+        else:
+            apply_delta(self._previous, copy.deepcopy(record["ops"]))
+        return record
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get journal statistics for status reporting."""
+        return {
+            "path": str(self.path),
+            "keyframe_interval": self.keyframe_interval,
+            "keyframes_written": self.keyframes_written,
+            "deltas_written": self.deltas_written,
+            "bytes_written": self.bytes_written,
+        }
+
+
+class EpisodeExportLog:
+    """
+    Per-episode export bookkeeping: the delta journal and the snapshot summary.
+
+    StateManager keeps one instance and updates it in place, so exports run on
+    a shallow copy of the manager land in the same log. Only the fields the
+    episode manifest reads are kept from the first and last uploaded
+    snapshots, not the documents themselves.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the current episode; the next export starts a new journal."""
+        self.journal: Optional[StateJournal] = None
+        self.snapshot_count = 0
+        self.first_turn: Optional[int] = None
+        self.last_turn: Optional[int] = None
+        self._first_state: Dict[str, Any] = {}
+        self._last_state: Dict[str, Any] = {}
+
+    def track_snapshot(self, turn: int, state: Dict[str, Any]) -> None:
+        """Record an uploaded turn snapshot or delta for the episode manifest."""
+        if not self.snapshot_count:
+            self.first_turn = turn
+            self._first_state = _summary_fields(state)
+        self._last_state = _summary_fields(state)
+        self.last_turn = turn
+        self.snapshot_count += 1
+
+    def manifest(self, episode_id: str) -> Optional[Dict[str, Any]]:
+        """Summarize the episode's uploads (None if nothing was uploaded)."""
+        if not self.snapshot_count:
+            return None
+        return episode_summary(
+            episode_id,
+            self._first_state,
+            self._last_state,
+            snapshot_count=self.snapshot_count,
+            first_turn=self.first_turn,
+            last_turn=self.last_turn,
+        )
+
+
+def _summary_fields(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy just the parts of an export document that episode_summary reads."""
+    metadata = state.get("metadata", {})
+    fields = {
+        "metadata": {
+            key: copy.deepcopy(metadata[key])
+            for key in ("timestamp", "turn_count", "score", "models")
+            if key in metadata
+        }
+    }
+    if "death_count" in state.get("current_state", {}):
+        fields["current_state"] = {"death_count": state["current_state"]["death_count"]}
+    return fields
@@ -0,0 +1,178 @@
+"""
+Tests for the persistent cross-episode action outcome store.
+
+Store tests use in-memory and temporary SQLite files. Integration tests run
+the real Zork I ROM: JerichoInterface records executed commands and the
+critic, the extractor and the synthesis trigger reuse known outcomes.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from action_outcome_store import ActionOutcomeStore, close_outcome_stores, get_outcome_store
+from game_interface.core.jericho_interface import JerichoInterface
+from game_interface.core.lookahead import NO_OP, PARSER_REJECTION, LookaheadOutcome
+from hybrid_zork_extractor import HybridZorkExtractor
+from managers.memory.triggers import SynthesisTrigger
+from session.game_configuration import GameConfiguration
+from zork_critic import ZorkCritic
+
+
+def _outcome(action="up", response="You can't go that way.", kind=NO_OP):
+    return LookaheadOutcome(action=action, kind=kind, response=response, is_direction=True)
+
+
+@pytest.fixture
+def config(tmp_path):
+    yield GameConfiguration.from_toml().model_copy(
+        update={"outcome_store_enabled": True, "zork_game_workdir": str(tmp_path)}
+    )
+    close_outcome_stores()
+
+
+@pytest.fixture
+def store(config):
+    return get_outcome_store(config)
+
+
+def _episode(store):
+    """Start a fresh game recording into the store."""
+    interface = JerichoInterface("jericho-game-suite/zork1.z5")
+    interface.outcome_store = store
+    interface.start()
+    return interface
+
+
+class TestActionOutcomeStore:
+    """Outcomes are keyed by state digest and normalized action."""
+
+    def test_record_and_lookup(self):
+        store = ActionOutcomeStore(":memory:")
+
+        assert store.record("digest", _outcome()) is False
+        assert store.record("digest", _outcome(action="U")) is True
+
+        found = store.lookup("digest", "go up")
+        assert found.cached and found.kind == NO_OP and found.action == "go up"
+        assert store.lookup("other", "up") is None
+        stats = store.get_stats()
+        assert (stats["entries"], stats["known_outcomes"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_different_response_replaces_entry(self):
+        store = ActionOutcomeStore(":memory:")
+        store.record("digest", _outcome())
+        store.set_extraction("digest", "up", {"exits": []})
+
+        assert store.record("digest", _outcome(response="Up a tree.")) is False
+
+        assert store.lookup("digest", "up").response == "Up a tree."
+        assert store.get_extraction("digest", "up") is None
+
+    def test_least_recently_used_entries_are_evicted(self):
+        store = ActionOutcomeStore(":memory:", max_entries=2)
+        store.record("a", _outcome())
+        store.record("b", _outcome())
+        store.lookup("a", "up")
+        store.record("c", _outcome())
+
+        assert store.lookup("b", "up") is None
+        assert store.lookup("a", "up") is not None
+        assert store.get_stats()["evictions"] == 1
+
+    def test_entries_persist_across_processes(self, config):
+        get_outcome_store(config).record("digest", _outcome())
+        close_outcome_stores()
+
+        reopened = get_outcome_store(config)
+
+        assert reopened.get_stats()["persistent"]
+        assert reopened.lookup("digest", "up").kind == NO_OP
+
+    def test_disabled_by_default(self, test_config):
+        assert get_outcome_store(test_config) is None
+
+
+class TestRecordingExecutedCommands:
+    """JerichoInterface records each command with the digest before it."""
+
+    def test_replayed_opening_is_known(self, store):
+        first = _episode(store)
+        first.send_command("open mailbox")
+        assert not first.last_outcome.cached
+        first.close()
+
+        second = _episode(store)
+        digest = second.get_state_digest()
+        second.send_command("open mailbox")
+
+        assert second.last_outcome.cached
+        assert second.last_outcome_digest == digest
+        assert store.lookup(digest, "open mailbox").response.startswith("Opening")
+        second.close()
+
+
+class TestKnownOutcomeConsumers:
+    """Known outcomes replace critic, extractor and synthesis LLM calls."""
+
+    def test_critic_uses_stored_outcome_without_simulating(self, config, store):
+        interface = _episode(store)
+        digest = interface.get_state_digest()
+        rejection = _outcome("frobnicate", "I don't know the word", kind=PARSER_REJECTION)
+        store.record(digest, rejection)
+        client = Mock()
+        critic = ZorkCritic(
+            config=config.model_copy(update={"enable_lookahead": False}), client=client
+        )
+
+        result = critic.evaluate_action(
+            game_state_text="West of House", proposed_action="frobnicate", jericho_interface=interface
+        )
+
+        assert result.score == -1.0
+        client.chat.completions.create.assert_not_called()
+        assert interface.lookahead.get_stats()["simulations"] == 0
+        assert store.get_stats()["llm_evaluations_skipped"] == {"critic": 1}
+        interface.close()
+
+    def test_extractor_reuses_extraction_of_known_outcome(self, config, store):
+        def extractor(interface):
+            client = Mock()
+            client.chat.completions.create.return_value = Mock(
+                content='{"exits": ["north"], "in_combat": false, "is_room_description": false}'
+            )
+            return HybridZorkExtractor(
+                jericho_interface=interface,
+                config=config.model_copy(update={"extractor_fast_path": False}),
+                client=client,
+            )
+
+        first = _episode(store)
+        extractor(first).extract_info(first.send_command("jump"))
+        first.close()
+
+        second = _episode(store)
+        replay = extractor(second)
+        info = replay.extract_info(second.send_command("jump"))
+
+        assert info.exits == ["north"]
+        replay.client.chat.completions.create.assert_not_called()
+        assert replay.get_stats()["store_hits"] == 1
+        assert store.get_stats()["llm_evaluations_skipped"] == {"extractor": 1}
+        second.close()
+
+    def test_trigger_skips_known_outcomes_but_not_deaths(self, config, store):
+        trigger = SynthesisTrigger(config)
+        context = {"location_changed": True, "outcome_known": True}
+
+        assert trigger.should_synthesize(context) is False
+        assert trigger.should_synthesize({**context, "died": True}) is True
+        assert trigger.should_synthesize({**context, "outcome_known": False}) is True
+
+        counting_only = SynthesisTrigger(
+            config.model_copy(update={"outcome_store_skip_known_memories": False})
+        )
+        assert counting_only.should_synthesize(context) is True
+        stats = store.get_stats()
+        assert stats["llm_evaluations_skippable"] == {"memory_synthesis": 2}
+        assert stats["llm_evaluations_skipped"] == {"memory_synthesis": 1}
@@ -0,0 +1,271 @@
+# ABOUTME: Tests for candidate mode: ranked agent proposals scored by one batched critic request
+# ABOUTME: Covers candidate parsing, batch scoring with object tree prefiltering and orchestrator selection
+
+import json
+import logging
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from managers.rejection_manager import RejectionManager
+from orchestration.zork_orchestrator_v2 import ZorkOrchestratorV2
+from session.game_state import GameState
+from zork_agent import ZorkAgent
+from zork_critic import CriticResponse, ValidationResult, ZorkCritic
+
+
+def _llm_response(payload):
+    content = payload if isinstance(payload, str) else json.dumps(payload)
+    return SimpleNamespace(content=content)
+
+
+class TestAgentCandidates:
+    """ZorkAgent.get_action_candidates."""
+
+    @pytest.fixture
+    def agent(self, test_config):
+        return ZorkAgent(config=test_config, client=Mock())
+
+    def test_candidates_are_cleaned_deduplicated_and_capped(self, agent):
+        agent.client.chat.completions.create.return_value = _llm_response(
+            {
+                "thinking": "Options",
+                "candidates": ["Open Mailbox", "open mailbox.", "north", "take leaflet", "west"],
+            }
+        )
+
+        result = agent.get_action_candidates("", "context", num_candidates=3)
+
+        assert result["candidates"] == ["open mailbox", "north", "take leaflet"]
+        assert result["action"] == "open mailbox"
+        assert result["reasoning"] == "Options"
+        messages = agent.client.chat.completions.create.call_args.kwargs["messages"]
+        assert messages[-1]["content"].startswith("context")
+        assert "up to 3 DISTINCT candidate actions" in messages[-1]["content"]
+
+    def test_unparseable_response_falls_back_to_look(self, agent):
+        agent.client.chat.completions.create.return_value = _llm_response("not json")
+
+        result = agent.get_action_candidates("state", num_candidates=3)
+
+        assert result["candidates"] == ["look"]
+
+
+class TestBatchCritic:
+    """ZorkCritic.evaluate_candidates scores all candidates in one request."""
+
+    @pytest.fixture
+    def critic(self, test_config):
+        return ZorkCritic(config=test_config, client=Mock())
+
+    def test_single_request_for_all_candidates(self, critic):
+        critic.client.chat.completions.create.return_value = _llm_response(
+            {
+                "evaluations": [
+                    {"action": "north", "score": 0.6, "justification": "New area"},
+                    {"action": "open mailbox", "score": 0.9, "justification": "Useful", "confidence": 0.95},
+                ]
+            }
+        )
+
+        results = critic.evaluate_candidates(
+            "West of House", ["open mailbox", "north"], action_counts=Counter({"north": 5})
+        )
+
+        assert critic.client.chat.completions.create.call_count == 1
+        assert [(r.score, r.justification) for r in results] == [(0.9, "Useful"), (0.6, "New area")]
+        assert results[0].confidence == 0.95
+        prompt = critic.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        assert "1. open mailbox\n2. north\n   Globally, 'north' has been tried 5 times." in prompt
+
+    def test_object_tree_rejections_are_not_sent(self, critic, monkeypatch):
+        monkeypatch.setattr(
+            critic,
+            "validate_against_object_tree",
+            lambda action, _: ValidationResult(valid=action != "take dragon", reason="no dragon"),
+        )
+        critic.client.chat.completions.create.return_value = _llm_response(
+            {"evaluations": [{"action": "whatever", "score": 0.4, "justification": "ok"}]}
+        )
+
+        results = critic.evaluate_candidates("state", ["take dragon", "look"], jericho_interface=object())
+
+        assert results[0].score == 0.0
+        assert results[0].justification == "[Object Tree Validation] no dragon"
+        # Single survivor is matched by position when the action text differs
+        assert results[1].score == 0.4
+        prompt = critic.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        assert "take dragon" not in prompt
+
+    def test_all_candidates_rejected_locally_makes_no_request(self, critic, monkeypatch):
+        monkeypatch.setattr(
+            critic,
+            "validate_against_object_tree",
+            lambda action, _: ValidationResult(valid=False, reason="absent"),
+        )
+
+        results = critic.evaluate_candidates("state", ["take a", "take b"], jericho_interface=object())
+
+        assert [r.score for r in results] == [0.0, 0.0]
+        critic.client.chat.completions.create.assert_not_called()
+
+    def test_token_budget_scales_with_candidates(self, critic):
+        critic.client.chat.completions.create.return_value = _llm_response({"evaluations": []})
+
+        critic.evaluate_candidates("state", ["north", "south", "east"])
+
+        max_tokens = critic.client.chat.completions.create.call_args.kwargs["max_tokens"]
+        assert max_tokens == critic.max_tokens * 4
+
+    def test_missing_evaluations_are_logged(self, test_config):
+        critic = ZorkCritic(config=test_config, client=Mock(), logger=Mock(spec=logging.Logger))
+        critic.client.chat.completions.create.return_value = _llm_response(
+            {"evaluations": [{"action": "north", "score": 0.5, "justification": "fine"}]}
+        )
+
+        critic.evaluate_candidates("state", ["north", "south"])
+
+        warned = [c.kwargs["extra"]["candidate"] for c in critic.logger.warning.call_args_list]
+        assert warned == ["south"]
+
+    def test_missing_and_failed_evaluations_score_zero(self, critic):
+        critic.client.chat.completions.create.return_value = _llm_response(
+            {"evaluations": [{"action": "north", "score": 0.5, "justification": "fine"}]}
+        )
+        results = critic.evaluate_candidates("state", ["north", "south", "east"])
+        assert [r.score for r in results] == [0.5, 0.0, 0.0]
+        assert results[1].justification == "Critic evaluation error (parsing)."
+
+        critic.client.chat.completions.create.side_effect = RuntimeError("down")
+        results = critic.evaluate_candidates("state", ["north"])
+        assert results[0].justification == "Critic evaluation error (API)."
+
+
+@pytest.fixture
+def orchestrator():
+    """Orchestrator with just the collaborators candidate selection uses."""
+    orch = ZorkOrchestratorV2.__new__(ZorkOrchestratorV2)
+    orch.config = SimpleNamespace(
+        enable_critic=True,
+        enable_exploration_hints=False,
+        enable_location_penalty=False,
+        location_revisit_window=5,
+        action_novelty_window=10,
+        critic_rejection_threshold=-0.2,
+    )
+    orch.logger = Mock(spec=logging.Logger)
+    orch.langfuse_client = None
+    orch.game_state = GameState()
+    orch.game_state.current_room_name_for_map = "West of House"
+    orch.jericho_interface = Mock()
+    orch.jericho_interface.get_valid_exits.return_value = ["north"]
+    orch.jericho_interface.get_location_structured.return_value = SimpleNamespace(num=1)
+    orch.map_manager = SimpleNamespace(game_map=SimpleNamespace(rooms={}, connections={}))
+    orch.rejection_manager = RejectionManager(orch.logger, orch.config, orch.game_state)
+    orch.critic = Mock()
+    orch.critic.evaluate_with_lookahead.side_effect = lambda actions, _: [None] * len(actions)
+    return orch
+
+
+def _scores(*scores):
+    return [CriticResponse(score=s, justification=f"score {s}") for s in scores]
+
+
+class TestCandidateSelection:
+    """ZorkOrchestratorV2._execute_candidate_selection."""
+
+    def test_picks_best_acceptable_candidate(self, orchestrator):
+        orchestrator.critic.evaluate_candidates.return_value = _scores(-0.9, 0.4, 0.7)
+
+        action, score, _, _, overridden, _, rejected = orchestrator._execute_candidate_selection(
+            "state", ["take sword", "north", "open mailbox"]
+        )
+
+        assert (action, score, overridden) == ("open mailbox", 0.7, False)
+        assert rejected == [{"action": "take sword", "score": -0.9, "justification": "score -0.9"}]
+        assert orchestrator.rejection_manager.rejected_actions_this_turn == ["take sword"]
+        assert orchestrator.critic.evaluate_candidates.call_count == 1
+
+    def test_agent_rank_breaks_ties(self, orchestrator):
+        orchestrator.critic.evaluate_candidates.return_value = _scores(0.5, 0.5)
+
+        action = orchestrator._execute_candidate_selection("state", ["north", "south"])[0]
+
+        assert action == "north"
+
+    def test_all_rejected_takes_best_scoring(self, orchestrator, monkeypatch):
+        orchestrator.critic.evaluate_candidates.return_value = _scores(-0.8, -0.5)
+        monkeypatch.setattr(
+            orchestrator.rejection_manager,
+            "should_override_rejection",
+            lambda **kwargs: (False, ""),
+        )
+
+        action, score, _, _, overridden, _, rejected = orchestrator._execute_candidate_selection(
+            "state", ["west", "east"]
+        )
+
+        assert (action, score, overridden) == ("east", -0.5, False)
+        assert [r["action"] for r in rejected] == ["west"]
+        events = [c.kwargs["extra"]["event_type"] for c in orchestrator.logger.warning.call_args_list]
+        assert "rejection_attempts_exhausted" in events
+
+    def test_override_picks_overridden_candidate(self, orchestrator, monkeypatch):
+        orchestrator.critic.evaluate_candidates.return_value = _scores(-0.8, -0.5)
+        monkeypatch.setattr(
+            orchestrator.rejection_manager,
+            "should_override_rejection",
+            lambda **kwargs: (kwargs["action"] == "west", "stuck"),
+        )
+
+        action, _, _, _, overridden, reason, rejected = orchestrator._execute_candidate_selection(
+            "state", ["west", "east"]
+        )
+
+        assert (action, overridden, reason) == ("west", True, "stuck")
+        assert [r["action"] for r in rejected] == ["east"]
+
+    def test_lookahead_rejections_are_never_overridden(self, orchestrator, monkeypatch):
+        orchestrator.critic.evaluate_candidates.return_value = [
+            CriticResponse(score=-1.0, justification="leads nowhere", from_lookahead=True),
+            CriticResponse(score=-0.5, justification="score -0.5"),
+        ]
+        monkeypatch.setattr(
+            orchestrator.rejection_manager,
+            "should_override_rejection",
+            lambda **kwargs: (True, "stuck"),
+        )
+
+        action, _, _, _, overridden, _, _ = orchestrator._execute_candidate_selection(
+            "state", ["up", "east"]
+        )
+
+        assert (action, overridden) == ("east", True)
+
+    def test_lookahead_prefix_in_llm_justification_is_not_a_verdict(self, orchestrator, monkeypatch):
+        orchestrator.critic.evaluate_candidates.return_value = [
+            CriticResponse(score=-0.9, justification="[Lookahead] says the LLM"),
+            CriticResponse(score=-0.5, justification="score -0.5"),
+        ]
+        monkeypatch.setattr(
+            orchestrator.rejection_manager,
+            "should_override_rejection",
+            lambda **kwargs: (True, "stuck"),
+        )
+
+        action = orchestrator._execute_candidate_selection("state", ["up", "east"])[0]
+
+        assert action == "east"
+
+    def test_critic_disabled_uses_object_tree_only(self, orchestrator):
+        orchestrator.config.enable_critic = False
+        orchestrator.critic.validate_against_object_tree.side_effect = (
+            lambda action, _: ValidationResult(valid=action != "take dragon", reason="absent")
+        )
+
+        action = orchestrator._execute_candidate_selection("state", ["take dragon", "look"])[0]
+
+        assert action == "look"
+        orchestrator.critic.evaluate_candidates.assert_not_called()
@@ -0,0 +1,177 @@
+"""
+Tests for background episode finalization.
+
+Covers the EpisodeFinalizer barrier policy (reader waits, forced writer waits,
+no-op on the worker thread) and EpisodeSynthesizer running the final update
+on a snapshot while the next episode resets GameState.
+"""
+
+import logging
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from episode_finalization import EpisodeFinalizer
+from managers import episode_synthesizer as synthesizer_module
+from managers.episode_synthesizer import EpisodeSynthesizer
+from session.game_configuration import GameConfiguration
+from session.game_state import GameState
+
+
+def _blocked_job(finalizer):
+    """Submit a job that runs until the returned event is set."""
+    release = threading.Event()
+    finalizer.submit("episode-1", release.wait, 5)
+    return release
+
+
+class TestEpisodeFinalizerBarrier:
+    """Readers follow the wait policy; writers always wait."""
+
+    def test_reader_waits_for_pending_job(self):
+        finalizer = EpisodeFinalizer()
+        release = _blocked_job(finalizer)
+        threading.Timer(0.05, release.set).start()
+
+        finalizer.knowledge_barrier("reader")
+
+        assert not finalizer.has_pending()
+        assert finalizer.get_status()["barrier_count"] == 1
+
+    def test_reader_skips_wait_without_wait_for_knowledge(self):
+        finalizer = EpisodeFinalizer()
+        finalizer.configure(wait_for_knowledge=False)
+        release = _blocked_job(finalizer)
+
+        finalizer.knowledge_barrier("reader")
+
+        assert finalizer.has_pending()
+        release.set()
+        finalizer.wait("cleanup")
+
+    def test_writer_waits_regardless_of_policy(self):
+        finalizer = EpisodeFinalizer()
+        finalizer.configure(wait_for_knowledge=False)
+        release = _blocked_job(finalizer)
+        threading.Timer(0.05, release.set).start()
+
+        finalizer.knowledge_barrier("writer", force=True)
+
+        assert not finalizer.has_pending()
+
+    def test_barrier_is_noop_on_worker_thread(self):
+        finalizer = EpisodeFinalizer()
+        first = _blocked_job(finalizer)
+
+        # A queued job that hits a writer barrier must not wait on itself
+        # (or on the job ahead of it, which has already finished)
+        second = finalizer.submit(
+            "episode-2", finalizer.knowledge_barrier, "writer", force=True
+        )
+        first.set()
+
+        assert second.result(timeout=5) is None
+        assert finalizer.get_status()["jobs_failed"] == 0
+
+    def test_second_waiter_is_not_released_early(self):
+        finalizer = EpisodeFinalizer()
+        release = _blocked_job(finalizer)
+        first = threading.Thread(target=finalizer.wait, args=("first",))
+        second = threading.Thread(target=finalizer.wait, args=("second",))
+
+        first.start()
+        first.join(timeout=0.05)
+        second.start()
+        second.join(timeout=0.1)
+
+        assert second.is_alive()
+        release.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+        assert not finalizer.has_pending()
+        assert finalizer.get_status()["barrier_count"] == 2
+
+    def test_job_failure_is_logged_not_raised(self):
+        logger = Mock(spec=logging.Logger)
+        finalizer = EpisodeFinalizer(logger=logger)
+
+        def boom():
+            raise RuntimeError("analysis failed")
+
+        finalizer.submit("episode-1", boom)
+        finalizer.wait("test")
+
+        assert finalizer.get_status()["jobs_failed"] == 1
+        assert (
+            logger.error.call_args.kwargs["extra"]["event_type"]
+            == "episode_finalization_failed"
+        )
+
+
+class _RecordingKnowledgeManager:
+    """Knowledge manager stand-in that records the state its jobs saw."""
+
+    def __init__(self, game_state, started, release):
+        self.game_state = game_state
+        self.started = started
+        self.release = release
+        self.seen = []
+
+    def perform_final_update(self, death_count=0):
+        self.started.set()
+        self.release.wait(5)
+        self.seen.append(
+            (self.game_state.episode_id, self.game_state.turn_count, death_count)
+        )
+
+    def perform_inter_episode_synthesis(self, **kwargs):
+        pass
+
+
+class TestBackgroundFinalization:
+    """EpisodeSynthesizer hands the final update to the finalizer."""
+
+    @pytest.fixture
+    def finalizer(self, monkeypatch):
+        finalizer = EpisodeFinalizer()
+        monkeypatch.setattr(synthesizer_module, "get_episode_finalizer", lambda: finalizer)
+        return finalizer
+
+    def _synthesizer(self, background):
+        config = GameConfiguration.from_toml().model_copy(
+            update={"enable_background_finalization": background}
+        )
+        game_state = GameState()
+        game_state.episode_id = "episode-1"
+        game_state.turn_count = 42
+        started, release = threading.Event(), threading.Event()
+        knowledge = _RecordingKnowledgeManager(game_state, started, release)
+        synthesizer = EpisodeSynthesizer(
+            Mock(spec=logging.Logger), config, game_state, knowledge_manager=knowledge
+        )
+        return synthesizer, knowledge
+
+    def test_job_runs_on_snapshot_of_finished_episode(self, finalizer):
+        synthesizer, knowledge = self._synthesizer(background=True)
+
+        synthesizer.finalize_episode(final_score=10)
+        assert knowledge.started.wait(5)
+
+        # The next episode resets the shared state while the job is running
+        synthesizer.game_state.reset_episode()
+        synthesizer.game_state.episode_id = "episode-2"
+        knowledge.release.set()
+        finalizer.wait("test")
+
+        assert knowledge.seen == [("episode-1", 42, 0)]
+        assert knowledge.game_state.episode_id == "episode-2"
+
+    def test_foreground_finalization_runs_inline(self, finalizer):
+        synthesizer, knowledge = self._synthesizer(background=True)
+        knowledge.release.set()
+
+        synthesizer.finalize_episode(final_score=10, background=False)
+
+        assert knowledge.seen == [("episode-1", 42, 0)]
+        assert finalizer.get_status()["jobs_submitted"] == 0
@@ -0,0 +1,137 @@
+# ABOUTME: Tests for episode manifests and incremental, parallel episode index generation
+# ABOUTME: Runs StateManager and EpisodeIndexGenerator against the filesystem S3 stand-in
+
+import json
+import logging
+
+import pytest
+from unittest.mock import Mock
+
+from generate_episode_index import EpisodeIndexGenerator
+from managers.state_manager import StateManager
+from session.game_configuration import GameConfiguration
+from session.game_state import GameState
+from state_exporter import FilesystemBucket
+from state_journal import MANIFEST_FILE
+
+
+@pytest.fixture
+def bucket_config(tmp_path):
+    return GameConfiguration(
+        max_turns_per_episode=100,
+        zork_game_workdir=str(tmp_path),
+        state_export_file=str(tmp_path / "current_state.json"),
+        s3_bucket="test-bucket",
+        s3_local_dir=str(tmp_path / "bucket"),
+    )
+
+
+def _play_episode(config, episode_id, turns, final_score=0):
+    """Export `turns` turns of an episode, then write its manifest."""
+    game_state = GameState()
+    game_state.episode_id = episode_id
+    manager = StateManager(logger=Mock(spec=logging.Logger), config=config, game_state=game_state)
+    for turn in range(1, turns + 1):
+        game_state.turn_count = turn
+        game_state.previous_zork_score = final_score if turn == turns else 0
+        manager.export_current_state()
+    manager.export_episode_manifest()
+    manager.close()
+
+
+def _generator(config, **kwargs):
+    return EpisodeIndexGenerator(
+        s3_bucket=config.s3_bucket,
+        s3_key_prefix=config.s3_key_prefix,
+        local_snapshots_dir="/nonexistent",
+        s3_client=FilesystemBucket(config.s3_local_dir),
+        **kwargs,
+    )
+
+
+def _snapshots_dir(config):
+    return FilesystemBucket(config.s3_local_dir)._path(
+        config.s3_bucket, f"{config.s3_key_prefix}snapshots"
+    )
+
+
+class TestEpisodeManifest:
+    """StateManager summarizes uploaded snapshots at finalization."""
+
+    def test_manifest_summarizes_the_episode(self, bucket_config):
+        _play_episode(bucket_config, "ep1", turns=3, final_score=15)
+
+        manifest = json.loads((_snapshots_dir(bucket_config) / "ep1" / MANIFEST_FILE).read_text())
+
+        assert manifest["episode_id"] == "ep1"
+        assert (manifest["first_turn"], manifest["last_turn"]) == (1, 3)
+        assert manifest["snapshot_count"] == 3
+        assert manifest["final_score"] == 15
+        assert "finalized_at" in manifest
+
+    def test_no_manifest_without_uploads(self, bucket_config):
+        bucket_config.s3_bucket = None
+        manager = StateManager(
+            logger=Mock(spec=logging.Logger), config=bucket_config, game_state=GameState()
+        )
+
+        assert manager.export_episode_manifest() is False
+
+    def test_reset_episode_starts_a_new_summary(self, bucket_config):
+        game_state = GameState()
+        game_state.episode_id = "ep1"
+        manager = StateManager(logger=Mock(spec=logging.Logger), config=bucket_config, game_state=game_state)
+        game_state.turn_count = 1
+        manager.export_current_state()
+
+        manager.reset_episode()
+
+        assert manager.episode_exports.manifest("ep1") is None
+        manager.close()
+
+
+class TestIncrementalIndex:
+    """Manifests, previous-index reuse and the legacy snapshot scan."""
+
+    def test_manifest_is_read_instead_of_snapshots(self, bucket_config):
+        _play_episode(bucket_config, "ep1", turns=4, final_score=10)
+        generator = _generator(bucket_config)
+        generator._get_s3_snapshot = Mock(wraps=generator._get_s3_snapshot)
+
+        episode = generator.generate_index()["episodes"][0]
+
+        assert episode["final_score"] == 10 and episode["last_turn"] == 4
+        assert generator._get_s3_snapshot.call_count == 1
+        assert generator.stats == {"reused": 0, "from_manifest": 1, "from_snapshots": 0}
+
+    def test_legacy_episodes_without_manifest_are_scanned(self, bucket_config):
+        for episode_id in ("ep1", "ep2", "ep3"):
+            _play_episode(bucket_config, episode_id, turns=2, final_score=5)
+            (_snapshots_dir(bucket_config) / episode_id / MANIFEST_FILE).unlink()
+
+        index = _generator(bucket_config, max_workers=3).generate_index()
+
+        assert index["total_episodes"] == 3
+        assert all(episode["final_score"] == 5 for episode in index["episodes"])
+
+    def test_unchanged_episodes_are_reused(self, bucket_config):
+        _play_episode(bucket_config, "ep1", turns=2)
+        previous = json.loads(json.dumps(_generator(bucket_config).generate_index(), default=str))
+        _play_episode(bucket_config, "ep2", turns=2)
+
+        generator = _generator(bucket_config)
+        index = generator.generate_index(previous)
+
+        assert index["total_episodes"] == 2
+        assert generator.stats == {"reused": 1, "from_manifest": 1, "from_snapshots": 0}
+
+    def test_changed_episode_is_reread(self, bucket_config):
+        _play_episode(bucket_config, "ep1", turns=2)
+        previous = json.loads(json.dumps(_generator(bucket_config).generate_index(), default=str))
+        (_snapshots_dir(bucket_config) / "ep1" / MANIFEST_FILE).unlink()
+
+        generator = _generator(bucket_config)
+        generator.generate_index(previous)
+
+        assert generator.stats["reused"] == 0
+        assert generator.stats["from_snapshots"] == 1
@@ -0,0 +1,208 @@
+# ABOUTME: Tests for the episode log index, the indexing JSON handler and streaming log readers
+# ABOUTME: Verifies turn-window seeks decode only the window and match full-scan extraction
+
+import json
+import logging
+
+import pytest
+
+from episode_log_index import ALL_EPISODES, MAX_LOG_INDEXES, EpisodeLogIndex, get_log_index
+from knowledge.turn_extraction import extract_turn_window_data
+from logger import IndexedJSONFileHandler, JSONFormatter, iter_episode_logs, parse_episode_logs
+
+
+def _log_turns(logger, episode_id, turns):
+    for turn in range(1, turns + 1):
+        logger.info(
+            "action",
+            extra={
+                "event_type": "final_action_selection",
+                "episode_id": episode_id,
+                "turn": turn,
+                "agent_action": f"action {turn}",
+            },
+        )
+        logger.info("noise", extra={"event_type": "agent_llm_response", "episode_id": episode_id})
+        logger.info(
+            "response",
+            extra={"event_type": "zork_response", "episode_id": episode_id, "zork_response": f"r{turn}"},
+        )
+        logger.info(
+            "score",
+            extra={"event_type": "experience", "episode_id": episode_id, "zork_score": turn * 5},
+        )
+        logger.info(
+            "done", extra={"event_type": "turn_completed", "episode_id": episode_id, "turn": turn}
+        )
+
+
+@pytest.fixture
+def episode_logger(tmp_path):
+    log_file = tmp_path / "episodes" / "ep1" / "episode_log.jsonl"
+    log_file.parent.mkdir(parents=True)
+
+    logger = logging.getLogger(f"test_episode_log_index.{tmp_path.name}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = IndexedJSONFileHandler(str(log_file))
+    handler.setFormatter(JSONFormatter())
+    logger.addHandler(handler)
+
+    yield logger, log_file
+
+    logger.removeHandler(handler)
+    handler.close()
+
+
+class TestIndexedHandler:
+    """The handler indexes lines as it writes them."""
+
+    def test_handler_lines_need_no_scan(self, episode_logger):
+        logger, log_file = episode_logger
+        _log_turns(logger, "ep1", 3)
+
+        index = get_log_index(log_file)
+        index.refresh()
+        stats = index.get_stats()
+
+        assert stats["lines"] == 15
+        assert stats["lines_from_handler"] == 15
+        assert stats["lines_scanned"] == 0
+        assert stats["indexed_bytes"] == log_file.stat().st_size
+
+    def test_offsets_point_at_lines(self, episode_logger):
+        logger, log_file = episode_logger
+        _log_turns(logger, "ep1", 2)
+
+        raw = log_file.read_bytes()
+        for line in get_log_index(log_file).lines:
+            entry = json.loads(raw[line.offset : line.offset + line.length])
+            assert entry["event_type"] == line.event_type
+
+    def test_existing_content_is_indexed_before_appending(self, tmp_path):
+        log_file = tmp_path / "existing.jsonl"
+        log_file.write_text(json.dumps({"event_type": "turn_completed", "turn": 7}) + "\n")
+
+        handler = IndexedJSONFileHandler(str(log_file))
+        handler.setFormatter(JSONFormatter())
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+        record.event_type = "zork_response"
+        handler.emit(record)
+        handler.close()
+
+        index = get_log_index(log_file)
+        assert [line.event_type for line in index.lines] == ["turn_completed", "zork_response"]
+        assert [turn for turn, _ in index.iter_entries()] == [7, 7]
+
+
+    def test_shared_indexes_are_bounded(self, tmp_path):
+        first = get_log_index(tmp_path / "ep0.jsonl")
+        second = get_log_index(tmp_path / "ep1.jsonl")
+        for i in range(2, MAX_LOG_INDEXES):
+            get_log_index(tmp_path / f"ep{i}.jsonl")
+
+        # Touching ep0 makes ep1 the least recently used
+        assert get_log_index(tmp_path / "ep0.jsonl") is first
+        get_log_index(tmp_path / "new.jsonl")
+
+        assert get_log_index(tmp_path / "ep0.jsonl") is first
+        assert get_log_index(tmp_path / "ep1.jsonl") is not second
+
+
+class TestWindowReads:
+    """iter_entries seeks to the window and filters by event type."""
+
+    def test_window_decodes_only_requested_lines(self, episode_logger):
+        logger, log_file = episode_logger
+        _log_turns(logger, "ep1", 50)
+        index = get_log_index(log_file)
+
+        entries = list(index.iter_entries(40, 42, event_types=["final_action_selection"]))
+
+        assert [(turn, e["agent_action"]) for turn, e in entries] == [
+            (40, "action 40"),
+            (41, "action 41"),
+            (42, "action 42"),
+        ]
+        assert index.get_stats()["lines_decoded"] == 3
+
+    def test_external_appends_and_torn_lines(self, tmp_path):
+        log_file = tmp_path / "log.jsonl"
+        log_file.write_text(json.dumps({"event_type": "final_action_selection", "turn": 1}) + "\n")
+        index = EpisodeLogIndex(log_file)
+        assert len(list(index.iter_entries())) == 1
+
+        with open(log_file, "a") as f:
+            f.write(json.dumps({"event_type": "final_action_selection", "turn": 2}) + "\n")
+            f.write('{"event_type": "zork_res')
+        assert [turn for turn, _ in index.iter_entries()] == [1, 2]
+
+        with open(log_file, "a") as f:
+            f.write('ponse"}\n')
+        assert [e["event_type"] for _, e in index.iter_entries(2, 2)] == [
+            "final_action_selection",
+            "zork_response",
+        ]
+
+    def test_truncated_file_is_reindexed(self, tmp_path):
+        log_file = tmp_path / "log.jsonl"
+        log_file.write_text(json.dumps({"event_type": "a"}) + "\n" + json.dumps({"event_type": "b"}) + "\n")
+        index = EpisodeLogIndex(log_file)
+        index.refresh()
+
+        log_file.write_text(json.dumps({"event_type": "c"}) + "\n")
+
+        assert [e["event_type"] for _, e in index.iter_entries()] == ["c"]
+
+    def test_monolithic_log_is_windowed_per_episode(self, tmp_path):
+        log_file = tmp_path / "zork_episode_log.jsonl"
+        lines = [
+            {"event_type": "final_action_selection", "episode_id": "a", "turn": 1},
+            {"event_type": "final_action_selection", "episode_id": "b", "turn": 9},
+            {"event_type": "zork_response", "episode_id": "a"},
+            {"event_type": "zork_response", "episode_id": "b"},
+        ]
+        log_file.write_text("".join(json.dumps(line) + "\n" for line in lines))
+        index = EpisodeLogIndex(log_file)
+
+        assert [turn for turn, _ in index.iter_entries(episode_id="a")] == [1, 1]
+        assert [turn for turn, _ in index.iter_entries(episode_id=ALL_EPISODES)] == [1, 9, 9, 9]
+
+
+class TestStreamingReaders:
+    """Knowledge extraction and parse_episode_logs read through the index."""
+
+    def test_extract_turn_window_data(self, episode_logger, tmp_path):
+        logger, log_file = episode_logger
+        _log_turns(logger, "ep1", 30)
+
+        turn_data = extract_turn_window_data(
+            "ep1", 10, 12, log_file=str(tmp_path / "missing.jsonl"), workdir=str(tmp_path)
+        )
+
+        assert [a["action"] for a in turn_data["actions_and_responses"]] == [
+            "action 10",
+            "action 11",
+            "action 12",
+        ]
+        assert [a["response"] for a in turn_data["actions_and_responses"]] == ["r10", "r11", "r12"]
+        # Window-local score tracking starts from zero, as with a full scan
+        assert turn_data["score_changes"][0] == {
+            "turn": 10,
+            "from_score": 0,
+            "to_score": 50,
+            "change": 50,
+        }
+        assert get_log_index(log_file).get_stats()["lines_decoded"] == 9
+
+    def test_iter_and_parse_episode_logs(self, episode_logger, tmp_path):
+        logger, _ = episode_logger
+        _log_turns(logger, "ep1", 4)
+
+        window = list(
+            iter_episode_logs("ep1", str(tmp_path), start_turn=2, end_turn=3, event_types=["zork_response"])
+        )
+
+        assert [e["zork_response"] for e in window] == ["r2", "r3"]
+        assert len(parse_episode_logs("ep1", str(tmp_path))) == 20
+        assert list(iter_episode_logs("missing", str(tmp_path))) == []
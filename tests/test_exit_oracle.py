@@ -0,0 +1,155 @@
+"""
+Tests for the ExitOracle cache behind JerichoInterface.get_valid_exits.
+
+Unit tests cover the LRU/serialization/verification logic; integration tests
+run against the real Zork I ROM to check that cached results match a fresh
+probe and that world changes (opening a window) produce a new probe.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from game_interface.core.exit_oracle import ExitOracle
+from game_interface.core.jericho_interface import JerichoInterface
+
+
+class TestExitOracleCache:
+    """Cache bookkeeping without a game engine."""
+
+    def test_miss_then_hit(self):
+        oracle = ExitOracle()
+        assert oracle.lookup(10, "h1") is None
+
+        oracle.store(10, "h1", ["south", "north"], directions_probed=12)
+        oracle.record_hit_savings(12)
+
+        assert oracle.lookup(10, "h1") == ["north", "south"]
+        stats = oracle.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["probes_run"] == 12
+        assert stats["probes_avoided"] == 12
+
+    def test_world_hash_is_part_of_key(self):
+        oracle = ExitOracle()
+        oracle.store(10, "closed", ["north"], directions_probed=12)
+
+        assert oracle.lookup(10, "open") is None
+
+    def test_lru_bound(self):
+        oracle = ExitOracle(max_entries=2)
+        oracle.store(1, "h", ["n"], 1)
+        oracle.store(2, "h", ["s"], 1)
+        oracle.lookup(1, "h")
+        oracle.store(3, "h", ["e"], 1)
+
+        assert oracle.lookup(2, "h") is None
+        assert oracle.lookup(1, "h") == ["n"]
+
+    def test_lookup_returns_copy(self):
+        oracle = ExitOracle()
+        oracle.store(1, "h", ["north"], 1)
+        oracle.lookup(1, "h").append("mutated")
+
+        assert oracle.lookup(1, "h") == ["north"]
+
+    def test_round_trip_serialization(self):
+        oracle = ExitOracle()
+        oracle.store(1, "h1", ["north"], 12)
+        oracle.store(2, "h2", ["east", "west"], 12)
+
+        restored = ExitOracle.from_dict(oracle.to_dict())
+
+        assert restored.lookup(1, "h1") == ["north"]
+        assert restored.lookup(2, "h2") == ["east", "west"]
+
+    def test_verify_move_consistent(self):
+        oracle = ExitOracle()
+        oracle.store(1, "h", ["north"], 12)
+
+        assert oracle.verify_move(1, "h", "north", moved=True)
+        assert oracle.verify_move(1, "h", "south", moved=False)
+        assert oracle.get_stats()["stale_invalidations"] == 0
+
+    def test_verify_move_contradiction_invalidates_location(self):
+        logger = Mock()
+        oracle = ExitOracle(logger=logger)
+        oracle.store(1, "h1", ["north"], 12)
+        oracle.store(1, "h2", ["north"], 12)
+        oracle.store(2, "h1", ["south"], 12)
+
+        # A cached exit that did not move the player means the entry is stale
+        assert not oracle.verify_move(1, "h1", "north", moved=False)
+
+        assert oracle.lookup(1, "h1") is None
+        assert oracle.lookup(1, "h2") is None
+        assert oracle.lookup(2, "h1") == ["south"]
+        assert oracle.get_stats()["stale_invalidations"] == 1
+        assert logger.info.call_args.kwargs["extra"]["event_type"] == "exit_oracle_stale_entry"
+
+
+class TestJerichoExitOracleIntegration:
+    """get_valid_exits served from the oracle on the real Zork I ROM."""
+
+    @pytest.fixture
+    def jericho_interface(self):
+        interface = JerichoInterface(game_file_path="jericho-game-suite/zork1.z5")
+        interface.start()
+        yield interface
+        interface.close()
+
+    def test_second_call_is_cache_hit_with_same_result(self, jericho_interface):
+        first = jericho_interface.get_valid_exits()
+        second = jericho_interface.get_valid_exits()
+
+        assert first == second
+        stats = jericho_interface.exit_oracle.get_stats()
+        assert stats["hits"] == 1
+        assert stats["probes_avoided"] == stats["probes_run"] > 0
+
+    def test_returning_to_a_room_is_a_cache_hit(self, jericho_interface):
+        first = jericho_interface.get_valid_exits()
+        jericho_interface.send_command("north")
+        jericho_interface.get_valid_exits()
+        jericho_interface.send_command("west")
+
+        assert jericho_interface.get_valid_exits() == first
+        assert jericho_interface.exit_oracle.get_stats()["hits"] == 1
+
+    def test_cached_result_matches_fresh_probe(self, jericho_interface):
+        for command in ["north", "east"]:
+            jericho_interface.send_command(command)
+            cached = jericho_interface.get_valid_exits()
+            location = jericho_interface.env.get_player_location()
+            fresh = sorted(
+                jericho_interface._probe_exits(
+                    location, jericho_interface._get_direction_words()
+                )
+            )
+            assert cached == fresh
+
+    def test_probe_does_not_change_game_state(self, jericho_interface):
+        before = jericho_interface.get_location_structured().num
+        jericho_interface.get_valid_exits()
+        jericho_interface.get_valid_exits()
+
+        assert jericho_interface.get_location_structured().num == before
+
+    def test_world_change_triggers_new_probe(self, jericho_interface):
+        # Behind House: the kitchen window starts closed
+        jericho_interface.send_command("north")
+        jericho_interface.send_command("east")
+        closed_exits = jericho_interface.get_valid_exits()
+
+        jericho_interface.send_command("open window")
+        open_exits = jericho_interface.get_valid_exits()
+
+        assert "in" not in closed_exits
+        assert "in" in open_exits
+        assert jericho_interface.exit_oracle.get_stats()["misses"] == 2
+
+    def test_direction_word_normalization(self, jericho_interface):
+        assert jericho_interface._as_direction_word("north") == "north"
+        assert jericho_interface._as_direction_word("go north") == "north"
+        assert jericho_interface._as_direction_word("northeast") == "northe"
+        assert jericho_interface._as_direction_word("open window") is None
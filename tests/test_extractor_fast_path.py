@@ -0,0 +1,136 @@
+# ABOUTME: Tests for the rule-based extractor fast path and the memo of LLM extractions
+# ABOUTME: Runs HybridZorkExtractor on the real Zork I ROM with a mocked LLM client
+
+from unittest.mock import Mock
+
+import pytest
+
+from game_interface.core.jericho_interface import JerichoInterface
+from hybrid_zork_extractor import HybridZorkExtractor
+from session.game_configuration import GameConfiguration
+
+
+def _llm_response(exits="[]", in_combat="false", is_room_description="false"):
+    response = Mock()
+    response.content = (
+        f'{{"exits": {exits}, "in_combat": {in_combat}, '
+        f'"is_room_description": {is_room_description}}}'
+    )
+    return response
+
+
+@pytest.fixture
+def jericho_interface():
+    interface = JerichoInterface(game_file_path="jericho-game-suite/zork1.z5")
+    interface.start()
+    yield interface
+    interface.close()
+
+
+def _extractor(jericho_interface, **config):
+    client = Mock()
+    client.chat.completions.create.return_value = _llm_response()
+    return HybridZorkExtractor(
+        jericho_interface=jericho_interface,
+        config=GameConfiguration.from_toml().model_copy(
+            update={"extractor_fast_path": True, **config}
+        ),
+        client=client,
+    )
+
+
+class TestRuleBasedExtraction:
+    """Routine responses are answered from the Z-machine state without the LLM."""
+
+    def test_movement_and_actions_skip_the_llm(self, jericho_interface):
+        extractor = _extractor(jericho_interface)
+
+        first = extractor.extract_info(jericho_interface.send_command("look"))
+        moved = extractor.extract_info(jericho_interface.send_command("north"))
+        action = extractor.extract_info(jericho_interface.send_command("jump"))
+
+        assert first.is_room_description and moved.is_room_description
+        assert not action.is_room_description
+        assert moved.current_location_name == "North House"
+        assert moved.exits == jericho_interface.get_valid_exits()
+        assert not any(info.in_combat for info in (first, moved, action))
+        assert not extractor.client.chat.completions.create.called
+        assert extractor.get_stats()["llm_free_rate"] == 1.0
+
+    def test_entering_a_room_without_its_title_asks_the_llm(self, jericho_interface):
+        extractor = _extractor(jericho_interface)
+        extractor.extract_info(jericho_interface.send_command("look"))
+        jericho_interface.send_command("north")
+
+        info = extractor.extract_info("You hear a noise.")
+
+        assert extractor.client.chat.completions.create.call_count == 1
+        assert not info.is_room_description
+        assert extractor.get_stats()["llm_calls"] == 1
+
+    def test_villain_in_room_asks_the_llm_then_stays_on_rules(self, jericho_interface):
+        extractor = _extractor(jericho_interface)
+        extractor.extract_info(jericho_interface.send_command("look"))
+        extractor._get_visible_characters_from_jericho = Mock(return_value=["troll"])
+        extractor.client.chat.completions.create.return_value = _llm_response(in_combat="true")
+
+        first = extractor.extract_info("The troll swings his axe.")
+        second = extractor.extract_info("The troll swings again.")
+
+        assert first.in_combat and second.in_combat
+        assert extractor.client.chat.completions.create.call_count == 1
+
+    def test_disabled_fast_path_always_asks_the_llm(self, jericho_interface):
+        extractor = _extractor(jericho_interface, extractor_fast_path=False, extractor_memo_size=0)
+
+        for _ in range(2):
+            extractor.extract_info(jericho_interface.send_command("look"))
+
+        assert extractor.client.chat.completions.create.call_count == 2
+        assert extractor.get_stats()["llm_free_rate"] == 0.0
+
+    @pytest.mark.parametrize(
+        "text, name, expected",
+        [
+            ("West of House You are standing in an open field", "West House", True),
+            ("Living Room You are in the living room.", "Living ", True),
+            ("Dam Base, in the magic boat You are at the base", "Dam Base", True),
+            ("With great effort, you open the window", "Behind House", False),
+            ("House of cards", "West House", False),
+        ],
+    )
+    def test_room_title_matches_abbreviated_object_names(self, text, name, expected):
+        assert HybridZorkExtractor._starts_with_room_title(text, name) is expected
+
+
+class TestExtractionMemo:
+    """LLM answers are reused for the same normalized text in the same context."""
+
+    def test_repeated_text_is_served_from_the_memo(self, jericho_interface):
+        extractor = _extractor(jericho_interface, extractor_fast_path=False)
+
+        extractor.extract_info("It is pitch  black.")
+        extractor.extract_info("it is pitch black.\n")
+
+        assert extractor.client.chat.completions.create.call_count == 1
+        stats = extractor.get_stats()
+        assert (stats["memo_hits"], stats["memo_entries"]) == (1, 1)
+
+    def test_failed_llm_calls_are_not_memoized(self, jericho_interface):
+        extractor = _extractor(jericho_interface, extractor_fast_path=False)
+        extractor.client.chat.completions.create.side_effect = RuntimeError("timeout")
+
+        info = extractor.extract_info("It is pitch black.")
+
+        assert info.exits == []
+        assert extractor.get_stats()["memo_entries"] == 0
+
+    def test_reset_stats_keeps_the_memo(self, jericho_interface):
+        extractor = _extractor(jericho_interface, extractor_fast_path=False)
+        extractor.extract_info("It is pitch black.")
+
+        extractor.reset_stats()
+
+        assert extractor.get_stats()["turns"] == 0
+        extractor.extract_info("It is pitch black.")
+        assert extractor.get_stats()["memo_hits"] == 1
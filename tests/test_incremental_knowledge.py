@@ -0,0 +1,291 @@
+# ABOUTME: Tests for incremental knowledge updates (rolling summary, prompt budget, section merge)
+# ABOUTME: Verifies only turns since the last update are sent and untouched sections are preserved
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from knowledge import AdaptiveKnowledgeManager
+from knowledge.incremental import (
+    MIN_WINDOW_ACTIONS,
+    RollingSummary,
+    fit_prompt_to_budget,
+    merge_section_updates,
+)
+from knowledge.knowledge_generation import format_turn_data_for_prompt
+from knowledge.section_utils import split_sections
+from session.game_configuration import GameConfiguration
+
+EXISTING_KNOWLEDGE = """# Zork Game World Knowledge Base
+
+## UNIVERSAL GAME MECHANICS
+- Parser accepts VERB NOUN commands; articles are optional and ignored by the game.
+- Containers must be opened before their contents can be taken or examined closely.
+- Light sources are required underground; moving in darkness risks a grue death.
+
+## DANGER CATEGORIES
+- Combat with armed creatures is dangerous without a weapon, so avoid the troll early.
+- Darkness is lethal: always carry a lit lamp before descending into any cellar.
+
+## STRATEGIC PRINCIPLES
+- Collect treasure systematically and return it to the trophy case for points.
+- Examine unusual objects because puzzle solutions often depend on specific items.
+- Keep inventory light enough to pick up new treasure found deeper in the dungeon.
+
+## DEATH & DANGER ANALYSIS
+- Deaths from grue attacks happen after several turns in unlit rooms without a lamp.
+
+## LESSONS LEARNED
+- Repeating a failed command rarely works; try a different verb or examine first.
+
+## CROSS-EPISODE INSIGHTS
+- Preserved insight from earlier episodes.
+"""
+
+
+def _turn_data(start, end, actions_per_turn=1, response="Nothing happens here at all."):
+    actions = [
+        {
+            "turn": turn,
+            "action": f"action {turn}",
+            "reasoning": "",
+            "critic_score": 0,
+            "response": response,
+        }
+        for turn in range(start, end + 1)
+        for _ in range(actions_per_turn)
+    ]
+    return {
+        "episode_id": "ep",
+        "start_turn": start,
+        "end_turn": end,
+        "actions_and_responses": actions,
+        "score_changes": [],
+        "location_changes": [],
+        "death_events": [],
+    }
+
+
+def _write_episode_log(workdir, episode_id, turns):
+    log_file = workdir / "episodes" / episode_id / "episode_log.jsonl"
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_file, "w") as f:
+        for turn in range(1, turns + 1):
+            for entry in (
+                {"event_type": "final_action_selection", "turn": turn, "agent_action": f"go {turn}"},
+                {"event_type": "zork_response", "zork_response": f"You are in room {turn}."},
+                {"event_type": "turn_completed", "turn": turn},
+            ):
+                f.write(json.dumps({"episode_id": episode_id, **entry}) + "\n")
+
+
+class TestRollingSummary:
+    """Deterministic summary of turns already analyzed."""
+
+    def test_empty_summary(self):
+        assert "No earlier turns" in RollingSummary("ep").render()
+
+    def test_absorb_and_render(self):
+        summary = RollingSummary("ep")
+        window = _turn_data(1, 10)
+        window["score_changes"] = [{"turn": 4, "from_score": 0, "to_score": 10, "change": 10}]
+        window["location_changes"] = [
+            {"turn": 2, "from_location": "West of House", "to_location": "North of House"},
+            {"turn": 3, "from_location": "North of House", "to_location": "Behind House"},
+        ]
+        window["death_events"] = [{"turn": 9, "reason": "Eaten by a grue", "action_taken": "north"}]
+
+        summary.absorb(window)
+        summary.absorb(_turn_data(11, 20))
+        text = summary.render()
+
+        assert summary.last_turn == 20
+        assert "Turns 1-20 (20 actions, 2 update(s))" in text
+        assert "Score reached: 10; changes: T4: 0→10" in text
+        assert "North of House, Behind House" in text
+        assert "T9: Eaten by a grue (action: north)" in text
+
+    def test_render_keeps_newest_list_entries(self):
+        summary = RollingSummary("ep")
+        window = _turn_data(1, 5)
+        window["location_changes"] = [
+            {"turn": i, "from_location": "", "to_location": f"Room {i}"} for i in range(1, 6)
+        ]
+        summary.absorb(window)
+
+        assert "Locations discovered: (+3 earlier) Room 4, Room 5" in summary.render(list_limit=2)
+
+
+class TestPromptBudget:
+    """fit_prompt_to_budget trims the oldest new actions first."""
+
+    @staticmethod
+    def _build(window, summary_text):
+        return summary_text + "\n" + format_turn_data_for_prompt(window)
+
+    def test_prompt_within_budget_is_untouched(self):
+        prompt, report = fit_prompt_to_budget(self._build, _turn_data(1, 10), RollingSummary("ep"), 10_000)
+
+        assert report["dropped_actions"] == 0
+        assert report["over_budget"] is False
+        assert "Turn 1:" in prompt
+
+    def test_oldest_actions_dropped_to_fit(self):
+        turn_data = _turn_data(1, 200, response="A long and winding response. " * 10)
+
+        prompt, report = fit_prompt_to_budget(self._build, turn_data, RollingSummary("ep"), 2_000)
+
+        assert report["dropped_actions"] > 0
+        assert report["estimated_tokens"] <= 2_000
+        assert "Turn 200:" in prompt
+        assert "Turn 1:" not in prompt
+        # The caller's turn data is not modified
+        assert len(turn_data["actions_and_responses"]) == 200
+
+    def test_minimum_window_is_kept(self):
+        turn_data = _turn_data(1, 50, response="x" * 2_000)
+
+        prompt, report = fit_prompt_to_budget(self._build, turn_data, RollingSummary("ep"), 100)
+
+        assert report["dropped_actions"] == 50 - MIN_WINDOW_ACTIONS
+        assert report["over_budget"] is True
+        assert prompt.count("Turn ") == MIN_WINDOW_ACTIONS
+
+
+class TestSectionMerge:
+    """Revised sections replace their originals; everything else is untouched."""
+
+    def test_split_sections(self):
+        sections = split_sections("# Title\n\n## A\nalpha\n\n## B\nbeta")
+
+        assert sections == {"A": "alpha", "B": "beta"}
+
+    def test_merge_replaces_only_returned_sections(self):
+        response = "## DANGER CATEGORIES\n- Revised danger list.\n\n## NEW SECTION\n- Added."
+
+        merged, updated = merge_section_updates(EXISTING_KNOWLEDGE, response)
+        sections = split_sections(merged)
+
+        assert updated == ["DANGER CATEGORIES", "NEW SECTION"]
+        assert sections["DANGER CATEGORIES"] == "- Revised danger list."
+        assert sections["NEW SECTION"] == "- Added."
+        assert sections["STRATEGIC PRINCIPLES"] == split_sections(EXISTING_KNOWLEDGE)["STRATEGIC PRINCIPLES"]
+
+    def test_merge_ignores_cross_episode_and_empty_sections(self):
+        response = "## CROSS-EPISODE INSIGHTS\n- Hallucinated.\n\n## LESSONS LEARNED\n"
+
+        merged, updated = merge_section_updates(EXISTING_KNOWLEDGE, response)
+
+        assert updated == []
+        assert merged == EXISTING_KNOWLEDGE
+
+
+@pytest.fixture
+def manager(tmp_path):
+    config = GameConfiguration(
+        max_turns_per_episode=100,
+        zork_game_workdir=str(tmp_path),
+        knowledge_update_mode="incremental",
+    )
+    manager = AdaptiveKnowledgeManager(
+        config=config,
+        log_file=str(tmp_path / "missing.jsonl"),
+        output_file=str(tmp_path / "knowledgebase.md"),
+        logger=Mock(),
+        workdir=str(tmp_path),
+    )
+    manager.client = Mock()
+    return manager
+
+
+def _respond(manager, content):
+    manager.client.chat.completions.create.return_value = SimpleNamespace(content=content)
+
+
+def _sent_prompt(manager):
+    return manager.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+
+
+class TestUpdateKnowledgeIncrementally:
+    """AdaptiveKnowledgeManager.update_knowledge_incrementally."""
+
+    def test_first_update_falls_back_to_full_generation(self, manager, tmp_path):
+        _write_episode_log(tmp_path, "ep", 10)
+        _respond(manager, EXISTING_KNOWLEDGE)
+
+        assert manager.update_knowledge_incrementally("ep", 10)
+
+        assert "EARLIER IN THIS EPISODE" not in _sent_prompt(manager)
+        assert manager.rolling_summaries["ep"].last_turn == 10
+
+    def test_only_new_turns_are_sent(self, manager, tmp_path):
+        _write_episode_log(tmp_path, "ep", 20)
+        (tmp_path / "knowledgebase.md").write_text(EXISTING_KNOWLEDGE)
+        manager.rolling_summaries["ep"] = summary = RollingSummary("ep")
+        summary.absorb(_turn_data(1, 10))
+        _respond(manager, "## LESSONS LEARNED\n- Rooms are numbered in this test dungeon.")
+
+        assert manager.update_knowledge_incrementally("ep", 20)
+
+        prompt = _sent_prompt(manager)
+        assert "Turn 15:" in prompt
+        assert "Turn 3:" not in prompt
+        assert "Turns 1-10" in prompt
+        assert "Preserved insight" not in prompt
+
+        sections = split_sections((tmp_path / "knowledgebase.md").read_text())
+        assert sections["LESSONS LEARNED"] == "- Rooms are numbered in this test dungeon."
+        assert sections["DANGER CATEGORIES"] == split_sections(EXISTING_KNOWLEDGE)["DANGER CATEGORIES"]
+        assert sections["CROSS-EPISODE INSIGHTS"] == "- Preserved insight from earlier episodes."
+        assert summary.last_turn == 20
+
+    def test_skip_response_advances_summary(self, manager, tmp_path):
+        _write_episode_log(tmp_path, "ep", 20)
+        (tmp_path / "knowledgebase.md").write_text(EXISTING_KNOWLEDGE)
+        manager.rolling_summaries["ep"] = summary = RollingSummary("ep")
+        summary.absorb(_turn_data(1, 10))
+        _respond(manager, "SKIP: nothing new")
+
+        assert manager.update_knowledge_incrementally("ep", 20) is False
+
+        assert summary.last_turn == 20
+        assert (tmp_path / "knowledgebase.md").read_text() == EXISTING_KNOWLEDGE
+
+    def test_failed_generation_retries_window_next_time(self, manager, tmp_path):
+        _write_episode_log(tmp_path, "ep", 20)
+        (tmp_path / "knowledgebase.md").write_text(EXISTING_KNOWLEDGE)
+        manager.rolling_summaries["ep"] = summary = RollingSummary("ep")
+        summary.absorb(_turn_data(1, 10))
+        manager.client.chat.completions.create.side_effect = RuntimeError("timeout")
+
+        assert manager.update_knowledge_incrementally("ep", 20) is False
+
+        assert summary.last_turn == 10
+
+
+class TestKnowledgeManagerDispatch:
+    """KnowledgeManager picks the update path from knowledge_update_mode."""
+
+    @pytest.mark.parametrize("mode", ["full", "incremental"])
+    def test_dispatch(self, mode):
+        from managers.knowledge_manager import KnowledgeManager
+
+        manager = KnowledgeManager.__new__(KnowledgeManager)
+        manager.config = SimpleNamespace(knowledge_update_mode=mode)
+        manager.game_state = SimpleNamespace(episode_id="ep", turn_count=42)
+        manager.adaptive_knowledge_manager = Mock()
+        manager.log_debug = Mock()
+
+        manager._run_knowledge_update(is_final_update=True)
+
+        if mode == "incremental":
+            manager.adaptive_knowledge_manager.update_knowledge_incrementally.assert_called_once_with(
+                episode_id="ep", end_turn=42, is_final_update=True
+            )
+            manager.adaptive_knowledge_manager.update_knowledge_from_turns.assert_not_called()
+        else:
+            manager.adaptive_knowledge_manager.update_knowledge_from_turns.assert_called_once_with(
+                episode_id="ep", start_turn=1, end_turn=42, is_final_update=True
+            )
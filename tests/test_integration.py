@@ -54,7 +54,13 @@ class TestZorkOrchestratorV2Integration:
 
         jericho.get_inventory_structured.return_value = []
         jericho.get_all_objects.return_value = []
+        jericho.get_visible_objects_in_location.return_value = []
+        jericho.get_valid_verbs.return_value = ["open", "take", "go", "look"]
         jericho.get_score.return_value = (0, 350)
+        jericho.exit_oracle.get_stats.return_value = {}
+        jericho.lookahead.get_stats.return_value = {}
+        jericho.outcome_store = None
+        jericho.last_outcome = None
         jericho.is_game_over.return_value = (False, None)
 
         # Mock close method
@@ -270,6 +276,7 @@ class TestZorkOrchestratorV2Integration:
 
         # Export state
         success = orchestrator.state_manager.export_current_state()
+        orchestrator.state_manager.flush_exports()
 
         # Verify export was attempted
         assert success is True
@@ -383,8 +390,8 @@ class TestZorkOrchestratorV2Integration:
             orchestrator.state_manager.s3_client = mock_boto_client.return_value
 
             # Test state upload
-            test_state = {"episode_id": "test", "score": 100}
-            success = orchestrator.state_manager.upload_state_to_s3(test_state)
+            success = orchestrator.state_manager.export_current_state()
+            orchestrator.state_manager.flush_exports()
 
             # Verify S3 upload was attempted
             assert success is True
@@ -0,0 +1,201 @@
+# ABOUTME: Tests for LLM record/replay cassettes
+# ABOUTME: Covers recording through LLMClient, exact and in-order replay, streams and the HTTP stand-in server
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from llm_cassette import (
+    COMPONENT_HEADER,
+    CassetteMissError,
+    CassetteServer,
+    LLMCassette,
+    close_cassettes,
+    get_cassette,
+    stream_name,
+)
+from llm_client import LLMClient
+from shared_utils import create_json_schema
+from zork_critic import CriticResponse, FailureDetectionResponse
+
+MESSAGES = [{"role": "user", "content": "West of House"}]
+
+
+def _ok_response(content: str) -> Mock:
+    response = Mock()
+    response.ok = True
+    response.json.return_value = {
+        "model": "test-model",
+        "choices": [{"message": {"content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+    return response
+
+
+@pytest.fixture(autouse=True)
+def fresh_cassettes():
+    close_cassettes()
+    yield
+    close_cassettes()
+
+
+@pytest.fixture
+def cassette_config(test_config, tmp_path):
+    test_config.zork_game_workdir = str(tmp_path)
+    test_config.llm_cassette_file = "run.jsonl"
+    return test_config
+
+
+def _client(config, **kwargs):
+    return LLMClient(config=config, base_url="http://test.com", api_key="k", **kwargs)
+
+
+def _record(config, exchanges):
+    """Record (component, prompt, content) exchanges through a mocked endpoint."""
+    config.llm_cassette_mode = "record"
+    client = _client(config)
+    for component, prompt, content in exchanges:
+        with patch("requests.Session.post", return_value=_ok_response(content)):
+            client.chat_completions_create(
+                model="m", messages=[{"role": "user", "content": prompt}], name=component
+            )
+    close_cassettes()
+    config.llm_cassette_mode = "replay"
+
+
+class TestStreams:
+    """Exchanges are grouped by component and structured-output schema."""
+
+    def test_schema_title_separates_calls_of_one_component(self):
+        assert stream_name("Critic", create_json_schema(CriticResponse)) == "Critic/CriticResponse"
+        assert (
+            stream_name("Critic", create_json_schema(FailureDetectionResponse))
+            == "Critic/FailureDetectionResponse"
+        )
+        assert stream_name("EpisodeSynthesizer", None) == "EpisodeSynthesizer"
+        assert stream_name(None, None) == "unnamed"
+
+
+class TestRecordAndReplay:
+    """A recorded run replays offline through LLMClient."""
+
+    def test_disabled_by_default(self, test_config):
+        assert test_config.llm_cassette_mode == "off"
+        assert get_cassette(test_config) is None
+
+    def test_records_every_exchange(self, cassette_config, tmp_path):
+        _record(cassette_config, [("Agent", "West of House", "open mailbox")])
+
+        entry = json.loads((tmp_path / "run.jsonl").read_text().strip())
+        assert entry["stream"] == "Agent"
+        assert entry["messages"] == [{"role": "user", "content": "West of House"}]
+        assert entry["response"]["content"] == "open mailbox"
+        assert entry["response"]["usage"]["total_tokens"] == 15
+
+    def test_replay_never_touches_the_network(self, cassette_config):
+        _record(cassette_config, [("Agent", "West of House", "open mailbox")])
+        client = _client(cassette_config)
+
+        with patch("requests.Session.post") as mock_post:
+            response = client.chat_completions_create(model="m", messages=MESSAGES, name="Agent")
+
+        mock_post.assert_not_called()
+        assert response.content == "open mailbox"
+        assert client.cassette.get_stats()["exact_hits"] == 1
+
+    def test_exact_match_wins_over_recorded_order(self, cassette_config):
+        _record(
+            cassette_config,
+            [("Agent", "West of House", "open mailbox"), ("Agent", "Kitchen", "go west")],
+        )
+        client = _client(cassette_config)
+
+        response = client.chat_completions_create(
+            model="m", messages=[{"role": "user", "content": "Kitchen"}], name="Agent"
+        )
+
+        assert response.content == "go west"
+
+    def test_changed_prompts_replay_in_recorded_order(self, cassette_config):
+        _record(
+            cassette_config,
+            [("Agent", "turn 1", "north"), ("Critic", "turn 1", "0.9"), ("Agent", "turn 2", "east")],
+        )
+        client = _client(cassette_config)
+
+        actions = [
+            client.chat_completions_create(
+                model="m", messages=[{"role": "user", "content": f"drifted {i}"}], name="Agent"
+            ).content
+            for i in range(3)
+        ]
+
+        # The last entry of a used-up stream repeats
+        assert actions == ["north", "east", "east"]
+        stats = client.cassette.get_stats()
+        assert (stats["sequence_hits"], stats["repeats"]) == (2, 1)
+
+    def test_stream_without_entries_is_a_miss(self, cassette_config):
+        _record(cassette_config, [("Agent", "West of House", "open mailbox")])
+        client = _client(cassette_config)
+
+        with pytest.raises(CassetteMissError):
+            client.chat_completions_create(model="m", messages=MESSAGES, name="Extractor")
+        assert client.cassette.get_stats()["misses"] == 1
+
+    def test_clients_share_one_cassette_per_file(self, cassette_config):
+        _record(cassette_config, [("Agent", "a", "north"), ("Agent", "b", "east")])
+
+        first = _client(cassette_config).chat_completions_create(
+            model="m", messages=MESSAGES, name="Agent"
+        )
+        second = _client(cassette_config).chat_completions_create(
+            model="m", messages=MESSAGES, name="Agent"
+        )
+
+        assert (first.content, second.content) == ("north", "east")
+
+
+class TestCassetteServer:
+    """The HTTP stand-in answers an unmodified client pointed at its base URL."""
+
+    def test_component_header_goes_only_to_cassette_server(self, cassette_config):
+        cassette_config.llm_cassette_mode = "record"
+        client = _client(cassette_config)
+
+        with patch("requests.Session.post", return_value=_ok_response("ok")) as mock_post:
+            client.chat_completions_create(model="m", messages=MESSAGES, name="Agent")
+
+        assert COMPONENT_HEADER not in mock_post.call_args.kwargs["headers"]
+
+    def test_serves_recorded_responses_over_http(self, cassette_config, tmp_path):
+        _record(
+            cassette_config,
+            [("Agent", "West of House", "open mailbox"), ("Extractor", "West of House", "{}")],
+        )
+        cassette = LLMCassette(str(tmp_path / "run.jsonl"), "replay")
+        cassette_config.llm_cassette_mode = "off"
+
+        with CassetteServer(cassette) as server:
+            client = LLMClient(config=cassette_config, base_url=server.base_url, api_key="k")
+            agent = client.chat_completions_create(model="m", messages=MESSAGES, name="Agent")
+            extractor = client.chat_completions_create(
+                model="m", messages=[{"role": "user", "content": "changed"}], name="Extractor"
+            )
+
+        assert agent.content == "open mailbox"
+        assert agent.usage["total_tokens"] == 15
+        assert extractor.content == "{}"
+        stats = cassette.get_stats()
+        assert (stats["exact_hits"], stats["sequence_hits"]) == (1, 1)
+
+    def test_miss_is_an_http_error(self, cassette_config, tmp_path):
+        _record(cassette_config, [("Agent", "West of House", "open mailbox")])
+        cassette = LLMCassette(str(tmp_path / "run.jsonl"), "replay")
+        cassette_config.llm_cassette_mode = "off"
+
+        with CassetteServer(cassette) as server:
+            client = LLMClient(config=cassette_config, base_url=server.base_url, api_key="k")
+            with pytest.raises(Exception, match="404"):
+                client.chat_completions_create(model="m", messages=MESSAGES, name="Critic")
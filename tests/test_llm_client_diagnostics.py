@@ -26,7 +26,7 @@ class TestDiagnosticLoggingForEmptyResponses:
             "usage": {"prompt_tokens": 100, "completion_tokens": 0, "total_tokens": 100}
         }
 
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             url = "http://test.com/chat/completions"
             headers = {"Content-Type": "application/json"}
             payload = {"model": "gpt-4", "messages": [{"role": "user", "content": "test"}]}
@@ -58,7 +58,7 @@ class TestDiagnosticLoggingForEmptyResponses:
             "usage": {"prompt_tokens": 100, "completion_tokens": 0, "total_tokens": 100}
         }
 
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             url = "http://test.com/chat/completions"
             headers = {"Content-Type": "application/json"}
             payload = {"model": "deepseek-r1", "messages": [{"role": "user", "content": "test"}]}
@@ -91,7 +91,7 @@ class TestDiagnosticLoggingForEmptyResponses:
             "usage": {"prompt_tokens": 150, "completion_tokens": 0, "total_tokens": 150}
         }
 
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             url = "http://test.com/chat/completions"
             headers = {"Content-Type": "application/json"}
             payload = {"model": "gpt-4", "messages": [{"role": "user", "content": "test"}]}
@@ -124,7 +124,7 @@ class TestDiagnosticLoggingForEmptyResponses:
             "usage": {"prompt_tokens": 100, "completion_tokens": 5, "total_tokens": 105}
         }
 
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             url = "http://test.com/chat/completions"
             headers = {"Content-Type": "application/json"}
             payload = {"model": "gpt-4", "messages": [{"role": "user", "content": "test"}]}
@@ -173,7 +173,7 @@ class TestRetryDiagnosticLogging:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', side_effect=[mock_empty, mock_valid]):
+        with patch('requests.Session.post', side_effect=[mock_empty, mock_valid]):
             client.chat_completions_create(
                 model="gpt-4",
                 messages=[{"role": "user", "content": "test"}]
@@ -215,7 +215,7 @@ class TestRetryDiagnosticLogging:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', side_effect=[mock_empty, mock_valid]):
+        with patch('requests.Session.post', side_effect=[mock_empty, mock_valid]):
             # Don't specify max_tokens - should use default 8000
             client.chat_completions_create(
                 model="deepseek-r1",
@@ -257,7 +257,7 @@ class TestRetryDiagnosticLogging:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', side_effect=[mock_empty, mock_valid]):
+        with patch('requests.Session.post', side_effect=[mock_empty, mock_valid]):
             result = client.chat_completions_create(
                 model="gpt-4",
                 messages=[{"role": "user", "content": "test"}]
@@ -285,7 +285,7 @@ class TestRetryDiagnosticLogging:
             "usage": {"prompt_tokens": 100, "completion_tokens": 0, "total_tokens": 100}
         }
 
-        with patch('requests.post', return_value=mock_empty):
+        with patch('requests.Session.post', return_value=mock_empty):
             with pytest.raises(Exception):
                 client.chat_completions_create(
                     model="gpt-4",
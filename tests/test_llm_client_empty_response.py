@@ -102,7 +102,7 @@ class TestEmptyResponseDetection:
         headers = {"Content-Type": "application/json"}
         payload = {"model": "gpt-4", "messages": [{"role": "user", "content": "test"}]}
 
-        with patch('requests.post', return_value=mock_http_response_empty):
+        with patch('requests.Session.post', return_value=mock_http_response_empty):
             with pytest.raises(EmptyResponseError) as exc_info:
                 client._execute_request(url, headers, payload)
 
@@ -117,7 +117,7 @@ class TestEmptyResponseDetection:
         headers = {"Content-Type": "application/json"}
         payload = {"model": "deepseek-r1", "messages": [{"role": "user", "content": "test"}]}
 
-        with patch('requests.post', return_value=mock_http_response_whitespace):
+        with patch('requests.Session.post', return_value=mock_http_response_whitespace):
             with pytest.raises(EmptyResponseError) as exc_info:
                 client._execute_request(url, headers, payload)
 
@@ -132,7 +132,7 @@ class TestEmptyResponseDetection:
         headers = {"Content-Type": "application/json"}
         payload = {"model": "gpt-4", "messages": [{"role": "user", "content": "test"}]}
 
-        with patch('requests.post', return_value=mock_http_response_valid):
+        with patch('requests.Session.post', return_value=mock_http_response_valid):
             # Should not raise EmptyResponseError
             result = client._execute_request(url, headers, payload)
 
@@ -147,7 +147,7 @@ class TestEmptyResponseDetection:
         headers = {"Content-Type": "application/json"}
         payload = {"model": "gpt-4", "messages": [{"role": "user", "content": "test"}]}
 
-        with patch('requests.post', return_value=mock_http_response_empty):
+        with patch('requests.Session.post', return_value=mock_http_response_empty):
             with pytest.raises(EmptyResponseError) as exc_info:
                 client._execute_request(url, headers, payload)
 
@@ -196,7 +196,7 @@ class TestEmptyResponseRetryBehavior:
         # Override retry config to ensure retries are enabled
         client.retry_config["max_retries"] = 3
 
-        with patch('requests.post', side_effect=mock_http_empty_then_valid):
+        with patch('requests.Session.post', side_effect=mock_http_empty_then_valid):
             # Should succeed on second attempt
             result = client.chat_completions_create(
                 model="gpt-4",
@@ -224,7 +224,7 @@ class TestEmptyResponseRetryBehavior:
             "usage": {"prompt_tokens": 100, "completion_tokens": 0, "total_tokens": 100}
         }
 
-        with patch('requests.post', return_value=mock_empty):
+        with patch('requests.Session.post', return_value=mock_empty):
             # Should raise after exhausting retries
             with pytest.raises(Exception) as exc_info:
                 client.chat_completions_create(
@@ -242,7 +242,7 @@ class TestEmptyResponseRetryBehavior:
         # Override retry config to ensure retries are enabled
         client.retry_config["max_retries"] = 3
 
-        with patch('requests.post', side_effect=mock_http_empty_then_valid):
+        with patch('requests.Session.post', side_effect=mock_http_empty_then_valid):
             result = client.chat_completions_create(
                 model="gpt-4",
                 messages=[{"role": "user", "content": "test"}]
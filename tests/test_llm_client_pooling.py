@@ -0,0 +1,57 @@
+# ABOUTME: Tests for pooled keep-alive HTTP sessions
+# ABOUTME: Verifies per-endpoint session sharing and adapter pool sizing
+
+import pytest
+from unittest.mock import Mock, patch
+
+from llm_client import LLMClient, close_http_sessions, get_http_session
+
+
+def _ok_response(content: str) -> Mock:
+    response = Mock()
+    response.ok = True
+    response.json.return_value = {
+        "model": "test-model",
+        "choices": [{"message": {"content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+    return response
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    close_http_sessions()
+    yield
+    close_http_sessions()
+
+
+class TestHttpSessionPool:
+    """One keep-alive session per endpoint, shared by all clients."""
+
+    def test_same_endpoint_shares_session(self, test_config):
+        agent = LLMClient(config=test_config, base_url="http://a.test", api_key="k")
+        critic = LLMClient(config=test_config, base_url="http://a.test", api_key="k")
+
+        assert agent.session is critic.session
+
+    def test_different_endpoints_get_separate_sessions(self, test_config):
+        agent = LLMClient(config=test_config, base_url="http://a.test", api_key="k")
+        extractor = LLMClient(config=test_config, base_url="http://b.test", api_key="k")
+
+        assert agent.session is not extractor.session
+
+    def test_adapter_pool_size_from_config(self, test_config):
+        session = get_http_session("http://c.test", pool_maxsize=3)
+
+        assert session.get_adapter("http://c.test")._pool_maxsize == 3
+
+    def test_requests_go_through_session(self, test_config):
+        client = LLMClient(config=test_config, base_url="http://a.test", api_key="k")
+
+        with patch("requests.Session.post", return_value=_ok_response("hi")) as mock_post:
+            result = client.chat_completions_create(
+                model="test-model", messages=[{"role": "user", "content": "x"}]
+            )
+
+        assert result.content == "hi"
+        assert mock_post.call_args[0][0] == "http://a.test/chat/completions"
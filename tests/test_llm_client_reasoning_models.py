@@ -25,7 +25,7 @@ class TestReasoningModelDetection:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             client.chat_completions_create(
                 model="deepseek-r1",
                 messages=[{"role": "user", "content": "test"}]
@@ -53,7 +53,7 @@ class TestReasoningModelDetection:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             client.chat_completions_create(
                 model="deepseek-reasoner",
                 messages=[{"role": "user", "content": "test"}]
@@ -81,7 +81,7 @@ class TestReasoningModelDetection:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             client.chat_completions_create(
                 model="qwq-32b-preview",
                 messages=[{"role": "user", "content": "test"}]
@@ -109,7 +109,7 @@ class TestReasoningModelDetection:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             client.chat_completions_create(
                 model="o1-preview",
                 messages=[{"role": "user", "content": "test"}]
@@ -137,7 +137,7 @@ class TestReasoningModelDetection:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             client.chat_completions_create(
                 model="gpt-4",
                 messages=[
@@ -173,7 +173,7 @@ class TestReasoningModelMaxTokens:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             # Don't specify max_tokens
             client.chat_completions_create(
                 model="deepseek-r1",
@@ -200,7 +200,7 @@ class TestReasoningModelMaxTokens:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             # Explicitly specify max_tokens
             client.chat_completions_create(
                 model="qwq-32b-preview",
@@ -228,7 +228,7 @@ class TestReasoningModelMaxTokens:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             # Don't specify max_tokens for non-reasoning model
             client.chat_completions_create(
                 model="gpt-4",
@@ -256,7 +256,7 @@ class TestReasoningModelMaxTokens:
             "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
         }
 
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             # Don't specify max_tokens
             client.chat_completions_create(
                 model="deepseek-r1",
@@ -295,7 +295,7 @@ class TestReasoningModelMaxTokens:
         ]
 
         for model in reasoning_models:
-            with patch('requests.post', return_value=mock_response) as mock_post:
+            with patch('requests.Session.post', return_value=mock_response) as mock_post:
                 client.chat_completions_create(
                     model=model,
                     messages=[{"role": "user", "content": "test"}]
@@ -0,0 +1,202 @@
+# ABOUTME: Tests for the content-addressed LLM response cache
+# ABOUTME: Covers key stability, LRU/TTL/size eviction, SQLite persistence and LLMClient integration
+
+import pytest
+from unittest.mock import Mock, patch
+
+from llm_client import LLMClient
+from llm_response_cache import (
+    LLMResponseCache,
+    close_response_caches,
+    get_response_cache,
+    is_cacheable,
+)
+
+MESSAGES = [{"role": "user", "content": "West of House"}]
+
+
+def _ok_response(content: str) -> Mock:
+    response = Mock()
+    response.ok = True
+    response.json.return_value = {
+        "model": "test-model",
+        "choices": [{"message": {"content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+    return response
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    close_response_caches()
+    yield
+    close_response_caches()
+
+
+@pytest.fixture
+def cache_config(test_config, tmp_path):
+    test_config.llm_cache_enabled = True
+    test_config.zork_game_workdir = str(tmp_path)
+    return test_config
+
+
+class TestCacheKey:
+    """Keys are stable and sensitive to every request input."""
+
+    def test_identical_requests_share_key(self):
+        a = LLMResponseCache.make_key("m", MESSAGES, {"temperature": 0.1})
+        b = LLMResponseCache.make_key("m", list(MESSAGES), {"temperature": 0.1, "top_k": None})
+        assert a == b
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            ("m2", MESSAGES, {"temperature": 0.1}, None),
+            ("m", [{"role": "user", "content": "Kitchen"}], {"temperature": 0.1}, None),
+            ("m", MESSAGES, {"temperature": 0.2}, None),
+            ("m", MESSAGES, {"temperature": 0.1}, {"type": "json_object"}),
+        ],
+    )
+    def test_any_input_change_changes_key(self, other):
+        base = LLMResponseCache.make_key("m", MESSAGES, {"temperature": 0.1})
+        assert LLMResponseCache.make_key(*other) != base
+
+
+class TestCacheTiers:
+    """Memory LRU, SQLite persistence, TTL and size caps."""
+
+    def test_memory_hit(self):
+        cache = LLMResponseCache(db_path=None)
+        cache.put("k", "content", "m", {"total_tokens": 3})
+
+        assert cache.get("k") == {"content": "content", "model": "m", "usage": {"total_tokens": 3}}
+        assert cache.get_stats()["memory_hits"] == 1
+
+    def test_miss_counted(self):
+        cache = LLMResponseCache(db_path=None)
+        assert cache.get("missing") is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_memory_lru_eviction(self):
+        cache = LLMResponseCache(db_path=None, max_memory_entries=2)
+        cache.put("a", "1", "m", None)
+        cache.put("b", "2", "m", None)
+        cache.get("a")  # a is now most recently used
+        cache.put("c", "3", "m", None)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_disk_tier_survives_reopen(self, tmp_path):
+        db = str(tmp_path / "cache.sqlite3")
+        first = LLMResponseCache(db_path=db)
+        first.put("k", "persisted", "m", {"total_tokens": 1})
+        first.close()
+
+        second = LLMResponseCache(db_path=db)
+        assert second.get("k")["content"] == "persisted"
+        assert second.get_stats()["disk_hits"] == 1
+        # Promoted to memory on disk hit
+        second.get("k")
+        assert second.get_stats()["memory_hits"] == 1
+        second.close()
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = LLMResponseCache(db_path=str(tmp_path / "c.sqlite3"), ttl_seconds=10)
+        with patch("llm_response_cache.time.time", return_value=1000.0):
+            cache.put("k", "old", "m", None)
+        with patch("llm_response_cache.time.time", return_value=1011.0):
+            assert cache.get("k") is None
+        assert cache.get_stats()["disk_entries"] == 0
+        cache.close()
+
+    def test_disk_size_cap_evicts_least_recently_used(self, tmp_path):
+        cache = LLMResponseCache(
+            db_path=str(tmp_path / "c.sqlite3"),
+            ttl_seconds=0,
+            max_memory_entries=1,
+            max_disk_entries=2,
+        )
+        with patch("llm_response_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put("a", "1", "m", None)
+            cache.put("b", "2", "m", None)
+            cache.get("a")  # disk hit refreshes a's access time (memory holds only b)
+            cache.put("c", "3", "m", None)
+
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["disk_entries"] == 2
+        cache._memory.clear()
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        cache.close()
+
+
+class TestCacheability:
+    """Per-component opt-in with the sampled-agent exclusion."""
+
+    def test_opted_in_component(self, cache_config):
+        assert is_cacheable(cache_config, "Critic", 0.1)
+
+    def test_component_not_listed(self, cache_config):
+        assert not is_cacheable(cache_config, "SimpleMemory", 0.0)
+        assert not is_cacheable(cache_config, None, 0.0)
+
+    def test_agent_excluded_when_sampling(self, cache_config):
+        cache_config.llm_cache_components = ["Agent"]
+        assert not is_cacheable(cache_config, "Agent", 0.7)
+        assert not is_cacheable(cache_config, "Agent", None)
+        assert is_cacheable(cache_config, "Agent", 0.0)
+        assert is_cacheable(cache_config, "Agent", 0)
+
+    def test_disabled_config_has_no_cache(self, test_config):
+        assert get_response_cache(test_config) is None
+
+
+class TestLLMClientIntegration:
+    """chat_completions_create consults the cache before the network."""
+
+    def test_second_identical_call_skips_request(self, cache_config):
+        client = LLMClient(config=cache_config, base_url="http://a.test", api_key="k")
+
+        with patch("requests.Session.post", return_value=_ok_response("exits: north")) as mock_post:
+            first = client.chat_completions_create(
+                model="m", messages=MESSAGES, temperature=0.1, name="Extractor"
+            )
+            second = client.chat_completions_create(
+                model="m", messages=MESSAGES, temperature=0.1, name="Extractor"
+            )
+
+        assert mock_post.call_count == 1
+        assert second.content == first.content == "exits: north"
+        assert second.usage == first.usage
+        assert client.response_cache.get_stats()["memory_hits"] == 1
+
+    def test_uncached_component_always_calls_api(self, cache_config):
+        client = LLMClient(config=cache_config, base_url="http://a.test", api_key="k")
+
+        with patch("requests.Session.post", return_value=_ok_response("go north")) as mock_post:
+            for _ in range(2):
+                client.chat_completions_create(
+                    model="m", messages=MESSAGES, temperature=0.7, name="Agent"
+                )
+
+        assert mock_post.call_count == 2
+
+    def test_cache_hit_bypasses_open_circuit(self, cache_config):
+        client = LLMClient(config=cache_config, base_url="http://a.test", api_key="k")
+
+        with patch("requests.Session.post", return_value=_ok_response("cached")):
+            client.chat_completions_create(model="m", messages=MESSAGES, name="Critic")
+
+        client.circuit_breaker._open_circuit()
+        client.circuit_breaker.last_failure_time = float("inf")
+
+        result = client.chat_completions_create(model="m", messages=MESSAGES, name="Critic")
+        assert result.content == "cached"
+
+    def test_clients_share_one_cache(self, cache_config):
+        critic = LLMClient(config=cache_config, base_url="http://a.test", api_key="k")
+        extractor = LLMClient(config=cache_config, base_url="http://b.test", api_key="k")
+
+        assert critic.response_cache is extractor.response_cache
@@ -0,0 +1,180 @@
+"""
+Tests for the LookaheadSimulator and the critic's lookahead verdicts.
+
+Simulation tests run against the real Zork I ROM: outcomes are classified
+from an actual Z-machine step and the live state must be unchanged afterwards.
+Critic tests use a mock LLM client to check which actions never reach it.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from game_interface.core.jericho_interface import JerichoInterface
+from game_interface.core.lookahead import (
+    DEATH,
+    INVENTORY_CHANGE,
+    MOVEMENT,
+    NO_OP,
+    PARSER_REJECTION,
+    SCORE_CHANGE,
+    LookaheadOutcome,
+)
+from zork_critic import ZorkCritic
+
+
+@pytest.fixture
+def jericho():
+    interface = JerichoInterface("jericho-game-suite/zork1.z5")
+    interface.start()
+    yield interface
+    interface.close()
+
+
+class TestLookaheadSimulation:
+    """Outcomes are classified from a real step and the game is restored."""
+
+    def test_candidates_are_classified(self, jericho):
+        outcomes = jericho.lookahead.simulate_candidates(
+            ["north", "up", "frobnicate mailbox", "take leaflet"]
+        )
+
+        assert [o.kind for o in outcomes] == [MOVEMENT, NO_OP, PARSER_REJECTION, PARSER_REJECTION]
+        assert outcomes[1].blocked_move
+        assert not outcomes[0].blocked_move
+
+    def test_live_state_is_restored(self, jericho):
+        digest = jericho.get_state_digest()
+        location = jericho.get_location_structured().num
+
+        jericho.lookahead.simulate_candidates(["north", "open mailbox", "take all"])
+
+        assert jericho.get_state_digest() == digest
+        assert jericho.get_location_structured().num == location
+        assert "north of house" in jericho.send_command("north").lower()
+
+    def test_inventory_and_score_changes(self, jericho):
+        jericho.send_command("north")
+        jericho.send_command("east")
+        jericho.send_command("open window")
+
+        entering = jericho.lookahead.simulate("enter window")
+        assert entering.kind == SCORE_CHANGE
+        assert entering.score_delta == 10
+
+        jericho.send_command("enter window")
+        taking = jericho.lookahead.simulate("take sack")
+        assert taking.kind == INVENTORY_CHANGE
+        assert taking.inventory_gained == ["brown sack"]
+
+    def test_outcomes_are_memoized_per_state(self, jericho):
+        first = jericho.lookahead.simulate("up")
+        again = jericho.lookahead.simulate("  UP ")
+
+        assert not first.cached
+        assert again.cached and again.kind == NO_OP and again.action == "  UP "
+        stats = jericho.lookahead.get_stats()
+        assert stats["simulations"] == 1
+        assert stats["memo_hits"] == 1
+
+        jericho.send_command("north")
+        assert not jericho.lookahead.simulate("up").cached
+
+    def test_unsafe_commands_are_not_simulated(self, jericho):
+        assert jericho.lookahead.simulate_candidates(["save", "quit", "restart"]) == [None] * 3
+        assert jericho.lookahead.get_stats()["simulations"] == 0
+
+
+class TestCriticLookahead:
+    """Decided outcomes are answered without the critic LLM."""
+
+    @pytest.fixture
+    def critic(self, test_config):
+        client = Mock()
+        client.chat.completions.create.return_value = Mock(
+            content='{"score": 0.5, "justification": "LLM", "confidence": 0.8}'
+        )
+        return ZorkCritic(
+            config=test_config.model_copy(update={"enable_lookahead": True}), client=client
+        )
+
+    def test_blocked_move_is_rejected_without_llm(self, critic, jericho):
+        result = critic.evaluate_action(
+            game_state_text="West of House", proposed_action="up", jericho_interface=jericho
+        )
+
+        assert result.score == -1.0 and result.from_lookahead
+        assert result.justification.startswith(ZorkCritic.LOOKAHEAD_PREFIX)
+        assert "can't go that way" in result.justification
+        critic.client.chat.completions.create.assert_not_called()
+        assert critic.lookahead_verdicts == 1
+
+    def test_score_increase_is_accepted_without_llm(self, critic, jericho):
+        for command in ["north", "east", "open window"]:
+            jericho.send_command(command)
+
+        result = critic.evaluate_action(
+            game_state_text="Behind House", proposed_action="enter window", jericho_interface=jericho
+        )
+
+        assert result.score == 1.0
+        assert "score by 10" in result.justification
+        critic.client.chat.completions.create.assert_not_called()
+
+    def test_undecided_action_goes_to_llm(self, critic, jericho):
+        result = critic.evaluate_action(
+            game_state_text="West of House", proposed_action="north", jericho_interface=jericho
+        )
+
+        assert result.justification == "LLM"
+        critic.client.chat.completions.create.assert_called_once()
+
+    def test_llm_cannot_claim_a_lookahead_verdict(self, critic, jericho):
+        critic.client.chat.completions.create.return_value = Mock(
+            content='{"score": -1.0, "justification": "[Lookahead] no", "from_lookahead": true}'
+        )
+
+        result = critic.evaluate_action(
+            game_state_text="West of House", proposed_action="north", jericho_interface=jericho
+        )
+
+        assert not result.from_lookahead
+        schema = critic.client.chat.completions.create.call_args.kwargs["response_format"]
+        assert "from_lookahead" not in schema["json_schema"]["schema"]["properties"]
+
+    def test_lookahead_is_off_by_default(self, test_config, jericho):
+        client = Mock()
+        client.chat.completions.create.return_value = Mock(
+            content='{"score": 0.5, "justification": "LLM", "confidence": 0.8}'
+        )
+        critic = ZorkCritic(config=test_config, client=client)
+
+        result = critic.evaluate_action(
+            game_state_text="West of House", proposed_action="up", jericho_interface=jericho
+        )
+
+        assert result.justification == "LLM"
+
+    def test_batch_sends_only_undecided_candidates(self, critic, jericho):
+        critic.client.chat.completions.create.return_value = Mock(
+            content='{"evaluations": [{"action": "north", "score": 0.6, "justification": "LLM"}]}'
+        )
+
+        results = critic.evaluate_candidates(
+            game_state_text="West of House",
+            candidates=["up", "north", "frobnicate mailbox"],
+            jericho_interface=jericho,
+        )
+
+        assert [r.score for r in results] == [-1.0, 0.6, -1.0]
+        prompt = critic.client.chat.completions.create.call_args.kwargs["messages"][-1]["content"]
+        assert "frobnicate" not in str(prompt)
+
+    def test_verdicts_by_outcome_kind(self, critic):
+        def outcome(kind, **kwargs):
+            return LookaheadOutcome(action="x", kind=kind, response="The game says so.", **kwargs)
+
+        assert critic._lookahead_verdict(outcome(DEATH)).score == -1.0
+        assert critic._lookahead_verdict(outcome(PARSER_REJECTION)).score == -1.0
+        assert critic._lookahead_verdict(outcome(SCORE_CHANGE, score_delta=5)).score == 1.0
+        assert critic._lookahead_verdict(outcome(NO_OP)) is None
+        assert critic._lookahead_verdict(outcome(MOVEMENT, location_after=2)) is None
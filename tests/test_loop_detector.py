@@ -0,0 +1,154 @@
+# ABOUTME: Tests for rolling-window state and action loop detection
+# ABOUTME: Covers find_cycle, LoopDetector revisits/eviction and its use in StateManager, ContextManager and Jericho digests
+
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+from game_interface.core.jericho_interface import JerichoInterface
+from loop_detector import LoopDetector, find_cycle
+from managers.context_manager import ContextManager
+from managers.state_manager import StateManager
+from session.game_configuration import GameConfiguration
+from session.game_state import ActionHistoryEntry, GameState
+
+
+class TestFindCycle:
+    """The shortest repeating period of the newest items is reported."""
+
+    @pytest.mark.parametrize(
+        "items, expected",
+        [
+            (["n", "s", "n", "s"], 2),
+            (["look", "look"], 1),
+            (["a", "b", "c", "a", "b", "c"], 3),
+            (["n", "s", "e", "w"], None),
+            (["n"], None),
+        ],
+    )
+    def test_periods(self, items, expected):
+        assert find_cycle(items) == expected
+
+    def test_length_bounds(self):
+        assert find_cycle(["look", "look", "look", "look"], min_length=2) == 2
+        assert find_cycle(["a", "b", "c", "a", "b", "c"], max_length=2) is None
+
+
+class TestLoopDetector:
+    """Revisits are dict lookups over a bounded window."""
+
+    def test_revisit_reports_first_and_last_seen(self):
+        detector = LoopDetector(window=10)
+
+        for turn, key in enumerate(["A", "B", "A", "B"], start=1):
+            observation = detector.observe(key, turn)
+
+        assert observation.revisit
+        assert (observation.first_seen_turn, observation.last_seen_turn) == (2, 2)
+        assert observation.revisit_distance == 2
+        assert observation.cycle_length == 2
+        assert detector.get_stats() == {
+            "window": 10,
+            "tracked": 4,
+            "unique": 2,
+            "revisits": 2,
+            "cycles": 1,
+        }
+
+    def test_new_key_is_not_a_revisit(self):
+        observation = LoopDetector().observe("A")
+
+        assert not observation.revisit
+        assert observation.revisit_distance is None
+        assert observation.turn == 1
+
+    def test_keys_outside_the_window_are_forgotten(self):
+        detector = LoopDetector(window=2)
+
+        for key in ["A", "B", "C"]:
+            detector.observe(key)
+
+        assert list(detector.history) == ["B", "C"]
+        assert not detector.observe("A").revisit
+        assert detector.observe("C").revisit
+
+    def test_reset_clears_everything(self):
+        detector = LoopDetector()
+        detector.observe("A")
+        detector.observe("A")
+
+        detector.reset()
+
+        assert len(detector) == 0
+        assert not detector.observe("A").revisit
+        assert detector.get_stats()["revisits"] == 0
+
+
+class TestManagerLoopDetection:
+    """StateManager and ContextManager share the detector logic."""
+
+    @pytest.fixture
+    def config(self):
+        return GameConfiguration.from_toml().model_copy(
+            update={"state_loop_window": 4, "loop_max_cycle_length": 4}
+        )
+
+    def test_state_manager_reports_cycle_and_stats(self, config):
+        game_state = GameState()
+        manager = StateManager(Mock(spec=logging.Logger), config, game_state, llm_client=None)
+        jericho = Mock()
+
+        results = []
+        for turn, digest in enumerate(["room-a", "room-b", "room-a", "room-b"], start=1):
+            game_state.turn_count = turn
+            jericho.get_state_digest.return_value = digest
+            results.append(manager.track_state_hash(jericho))
+
+        assert results == [False, False, True, True]
+        assert manager.last_state_observation.cycle_length == 2
+        extra = manager.logger.warning.call_args.kwargs["extra"]
+        assert (extra["loop_start_turn"], extra["turns_in_loop"]) == (2, 2)
+        assert manager.get_status()["state_loops"]["tracked"] == 4
+
+        jericho.get_state_digest.return_value = "room-c"
+        manager.track_state_hash(jericho)
+        assert manager.state_history == ["room-b", "room-a", "room-b", "room-c"]
+
+    def test_action_history_entries_are_checked_for_cycles(self, config):
+        game_state = GameState()
+        game_state.action_history = [
+            ActionHistoryEntry(action=action, response="ok", location_id=1, location_name="Room")
+            for action in ["open door", "north", "south", "north", "south"]
+        ]
+        manager = ContextManager(Mock(spec=logging.Logger), config, game_state)
+
+        assert manager.detect_loops_in_recent_actions() is True
+
+        game_state.action_history[-1] = game_state.action_history[0]
+        assert manager.detect_loops_in_recent_actions() is False
+
+
+class TestJerichoStateDigest:
+    """The digest on the real Zork I ROM repeats when the world returns to a state."""
+
+    @pytest.fixture
+    def jericho_interface(self):
+        interface = JerichoInterface(game_file_path="jericho-game-suite/zork1.z5")
+        interface.start()
+        yield interface
+        interface.close()
+
+    def test_returning_to_a_room_repeats_the_digest(self, jericho_interface):
+        digests = [jericho_interface.get_state_digest()]
+        for command in ["north", "west", "north", "west"]:
+            jericho_interface.send_command(command)
+            digests.append(jericho_interface.get_state_digest())
+
+        assert digests[1] != digests[0]
+        assert digests[2:] == digests[:3]
+        assert find_cycle(digests) == 2
+
+    def test_digest_requires_a_started_game(self):
+        with pytest.raises(RuntimeError):
+            JerichoInterface(game_file_path="jericho-game-suite/zork1.z5").get_state_digest()
@@ -250,5 +250,247 @@ class TestMapGraph(unittest.TestCase):
         self.assertIn("north", self.map.connections[ROOM_C_ID])
 
 
+
+class TestMapRouting(unittest.TestCase):
+    """Cached BFS routing index: distances, routes and invalidation."""
+
+    def setUp(self):
+        self.map = MapGraph()
+        # 1 -north-> 2 -east-> 3 -north-> 4 (reverse exits are added automatically)
+        for room_id in range(1, 6):
+            self.map.add_room(room_id, f"Room {room_id}")
+        self.map.add_connection(1, "north", 2)
+        self.map.add_connection(2, "east", 3)
+        self.map.add_connection(3, "north", 4)
+
+    def _fresh_distances(self, source_id):
+        return MapGraph.from_dict(self.map.to_dict()).distances_from(source_id)
+
+    def test_distances_and_routes(self):
+        self.assertEqual(self.map.distances_from(1), {1: 0, 2: 1, 3: 2, 4: 3})
+        self.assertEqual(self.map.get_distance(4, 1), 3)
+        self.assertEqual(self.map.get_distance(1, 1), 0)
+        self.assertEqual(self.map.get_distance(1, 5), float("inf"))
+        self.assertEqual(
+            self.map.find_route(1, 4), [("north", 2), ("east", 3), ("north", 4)]
+        )
+        self.assertEqual(self.map.find_route(2, 2), [])
+        self.assertIsNone(self.map.find_route(1, 5))
+
+    def test_distance_map_is_cached_per_source(self):
+        self.map.distances_from(1)
+        self.map.get_distance(1, 4)
+        self.map.find_route(1, 3)
+
+        stats = self.map.get_routing_stats()
+        self.assertEqual(stats["cache_misses"], 1)
+        self.assertEqual(stats["cache_hits"], 2)
+        self.assertEqual(stats["cached_sources"], 1)
+
+    def test_shortcut_invalidates_affected_sources_only(self):
+        self.map.distances_from(1)
+        self.map.distances_from(5)
+
+        self.map.add_connection(1, "east", 4)
+
+        self.assertEqual(self.map.get_routing_stats()["cached_sources"], 1)
+        self.assertEqual(self.map.get_distance(1, 4), 1)
+        self.assertEqual(self.map.find_route(1, 4), [("east", 4)])
+
+    def test_redundant_exit_keeps_cached_routes(self):
+        self.map.distances_from(1)
+
+        # 2 is already one hop from 1, so a second exit there changes nothing
+        self.map.add_connection(1, "climb tree", 2)
+
+        self.assertEqual(self.map.get_routing_stats()["cached_sources"], 1)
+        self.assertEqual(self.map.distances_from(1), self._fresh_distances(1))
+
+    def test_replaced_exit_invalidates_routes(self):
+        self.assertEqual(self.map.get_distance(4, 1), 3)
+
+        # The inferred 3 -west-> 2 (confidence 0.9) is replaced by an observed 3 -west-> 5
+        self.map.add_connection(3, "west", 5, confidence=1.0)
+
+        self.assertEqual(self.map.get_distance(4, 1), float("inf"))
+        self.assertEqual(self.map.find_route(4, 5), [("south", 3), ("west", 5)])
+
+    def test_pruned_exits_are_not_routed_through(self):
+        self.map.distances_from(1)
+        for _ in range(3):
+            self.map.track_exit_failure(2, "east")
+
+        self.assertEqual(self.map.prune_invalid_exits(2), 1)
+
+        self.assertEqual(self.map.get_distance(1, 3), float("inf"))
+
+    def test_merge_resets_routes(self):
+        self.map.distances_from(1)
+        other = MapGraph()
+        other.add_room(1, "Room 1")
+        other.add_room(5, "Room 5")
+        other.add_connection(1, "down", 5)
+
+        self.map.merge_from(other)
+
+        self.assertEqual(self.map.get_distance(1, 5), 1)
+
+    def test_route_to_nearest_unexplored_exit(self):
+        self.map.update_room_exits(3, ["south", "west"])
+
+        self.assertEqual(self.map.get_unexplored_exits(3), ["south"])
+        self.assertEqual(
+            self.map.find_nearest(1, self.map.get_unexplored_exits),
+            (3, [("north", 2), ("east", 3)]),
+        )
+        self.assertEqual(
+            self.map.describe_route_to_unexplored(1),
+            "Room 3 (2 moves: north, east) has unexplored exits: south",
+        )
+        # Nothing to suggest when the current room still has unexplored exits
+        self.assertEqual(self.map.describe_route_to_unexplored(3), "")
+
+    def test_agent_context_route_hint_is_opt_in(self):
+        from unittest.mock import Mock
+
+        from managers.context_manager import ContextManager
+        from session.game_configuration import GameConfiguration
+        from session.game_state import GameState
+
+        self.map.update_room_exits(3, ["south", "west"])
+
+        def context(**config):
+            manager = ContextManager(
+                Mock(), GameConfiguration(max_turns_per_episode=100, **config), GameState()
+            )
+            return manager.get_agent_context(
+                current_state="", inventory=[], location="Room 1", location_id=1, game_map=self.map
+            )
+
+        self.assertNotIn("route_to_unexplored", context())
+        self.assertEqual(
+            context(enable_route_hint=True)["route_to_unexplored"],
+            "Room 3 (2 moves: north, east) has unexplored exits: south",
+        )
+
+    def test_cached_distances_match_fresh_bfs_after_mutations(self):
+        import random
+
+        rng = random.Random(7)
+        directions = ["north", "south", "east", "west", "up", "down", "enter window"]
+        for room_id in range(6, 30):
+            self.map.add_room(room_id, f"Room {room_id}")
+        for _ in range(120):
+            source_id = rng.randrange(1, 30)
+            self.map.distances_from(source_id)
+            self.map.add_connection(
+                source_id, rng.choice(directions), rng.randrange(1, 30),
+                confidence=rng.choice([0.5, 0.9, 1.0]),
+            )
+            for check_id in (1, source_id):
+                self.assertEqual(self.map.distances_from(check_id), self._fresh_distances(check_id))
+
+
+
+class TestMapRenderMemo(unittest.TestCase):
+    """Version counter and memoized renderings."""
+
+    def setUp(self):
+        self.map = MapGraph()
+        for room_id in range(1, 41):
+            self.map.add_room(room_id, f"Room {room_id}")
+        # A long east-west corridor: 1 - 2 - ... - 40
+        for room_id in range(1, 40):
+            self.map.add_connection(room_id, "east", room_id + 1)
+
+    def test_renderings_are_reused_until_the_map_changes(self):
+        mermaid = self.map.render_mermaid()
+        report = self.map.render_confidence_report()
+        failures = self.map.render_exit_failure_report()
+
+        self.assertIs(self.map.render_mermaid(), mermaid)
+        self.assertIs(self.map.render_confidence_report(), report)
+        self.assertIs(self.map.render_exit_failure_report(), failures)
+
+        self.map.track_exit_failure(1, "north")
+
+        self.assertIn("1 -> north (1 failures)", self.map.render_exit_failure_report())
+        self.assertEqual(self.map.render_mermaid(), mermaid)
+
+    def test_every_mutation_bumps_version(self):
+        mutations = [
+            lambda: self.map.add_room(41, "Room 41"),
+            lambda: self.map.update_room_exits(41, ["north"]),
+            lambda: self.map.add_connection(1, "east", 2),  # verification only
+            lambda: self.map.track_exit_failure(41, "north"),
+            lambda: self.map.prune_invalid_exits(41, min_failure_count=1),
+            lambda: self.map.merge_from(MapGraph()),
+        ]
+        for mutate in mutations:
+            version = self.map.version
+            mutate()
+            self.assertGreater(self.map.version, version)
+
+        # No-ops leave renderings valid
+        version = self.map.version
+        self.map.add_room(1, "Room 1")
+        self.map.update_room_exits(1, ["east"])
+        self.assertEqual(self.map.version, version)
+
+    def test_verification_refreshes_to_dict(self):
+        before = self.map.to_dict()
+
+        self.map.add_connection(1, "east", 2)
+
+        self.assertEqual(before["connection_verifications"]["1_east"], 1)
+        self.assertEqual(self.map.to_dict()["connection_verifications"]["1_east"], 2)
+
+    def test_to_dict_round_trips_with_fresh_timestamp(self):
+        first = self.map.to_dict()
+        second = self.map.to_dict()
+
+        self.assertEqual(
+            {k: v for k, v in first.items() if k != "metadata"},
+            {k: v for k, v in second.items() if k != "metadata"},
+        )
+        self.assertIn("timestamp", second["metadata"])
+        restored = MapGraph.from_dict(second)
+        self.assertEqual(restored.render_mermaid(), self.map.render_mermaid())
+
+    def test_compact_rendering_draws_nearest_rooms(self):
+        compact = self.map.render_mermaid_compact(20, max_rooms=5)
+
+        self.assertIn("%% 5 of 40 rooms shown (nearest to L20)", compact)
+        for room_id in (18, 19, 20, 21, 22):
+            self.assertIn(f'L{room_id}["Room {room_id}"]', compact)
+        self.assertNotIn('L5["Room 5"]', compact)
+        self.assertIn('L17["Room 17 (not shown)"]', compact)
+        self.assertLess(len(compact), len(self.map.render_mermaid()) / 4)
+        self.assertIs(self.map.render_mermaid_compact(20, max_rooms=5), compact)
+
+    def test_compact_rendering_falls_back_to_full_map(self):
+        full = self.map.render_mermaid()
+
+        self.assertIs(self.map.render_mermaid_compact(20, max_rooms=0), full)
+        self.assertIs(self.map.render_mermaid_compact(20, max_rooms=40), full)
+        self.assertIs(self.map.render_mermaid_compact(999, max_rooms=5), full)
+
+    def test_agent_context_uses_compact_map_when_configured(self):
+        from unittest.mock import Mock
+
+        from managers.context_manager import ContextManager
+        from session.game_configuration import GameConfiguration
+        from session.game_state import GameState
+
+        config = GameConfiguration(max_turns_per_episode=100, map_prompt_max_rooms=5)
+        manager = ContextManager(Mock(), config, GameState())
+
+        context = manager.get_agent_context(
+            current_state="", inventory=[], location="Room 20", location_id=20, game_map=self.map
+        )
+
+        self.assertEqual(context["current_map"], self.map.render_mermaid_compact(20, 5))
+
+
 if __name__ == "__main__":
     unittest.main()
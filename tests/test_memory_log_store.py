@@ -0,0 +1,211 @@
+# ABOUTME: Tests for the append-only memory log backend of SimpleMemoryManager
+# ABOUTME: Covers append/status records, replay, compaction, markdown import and rendered export
+
+import json
+import logging
+
+import pytest
+from unittest.mock import Mock
+
+from managers.memory import Memory, MemoryStatus, INVALIDATION_MARKER
+from managers.memory.memory_store import COMPACTION_MIN_RECORDS
+from managers.simple_memory_manager import SimpleMemoryManager
+from session.game_configuration import GameConfiguration
+from session.game_state import GameState
+
+
+def _memory(title, persistence="permanent", episode=1, turns="5"):
+    return Memory(
+        category="SUCCESS",
+        title=title,
+        episode=episode,
+        turns=turns,
+        score_change=0,
+        text=f"{title} works.",
+        persistence=persistence,
+    )
+
+
+@pytest.fixture
+def log_config(tmp_path):
+    return GameConfiguration(
+        max_turns_per_episode=100,
+        zork_game_workdir=str(tmp_path),
+        simple_memory_store="log",
+    )
+
+
+@pytest.fixture
+def make_manager(log_config):
+    def _make():
+        game_state = GameState()
+        game_state.episode_id = "ep_001"
+        game_state.turn_count = 10
+        return SimpleMemoryManager(
+            logger=Mock(spec=logging.Logger),
+            config=log_config,
+            game_state=game_state,
+            llm_client=Mock(),
+        )
+    return _make
+
+
+def _log_records(config):
+    path = config.zork_game_workdir + "/" + config.simple_memory_log_file
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestMemoryLogWrites:
+    """Each change is one appended record; Memories.md is not touched."""
+
+    def test_add_appends_single_record(self, make_manager, log_config, tmp_path):
+        manager = make_manager()
+
+        assert manager.add_memory(15, "West of House", _memory("Open window"))
+        assert manager.add_memory(15, "West of House", _memory("Take leaflet"))
+
+        records = _log_records(log_config)
+        assert [r["op"] for r in records] == ["add", "add"]
+        assert records[1]["memory"]["title"] == "Take leaflet"
+        assert not (tmp_path / "Memories.md").exists()
+
+    def test_ephemeral_memories_are_not_logged(self, make_manager, log_config, tmp_path):
+        manager = make_manager()
+        manager.add_memory(15, "West of House", _memory("Dropped sword", persistence="ephemeral"))
+
+        assert not (tmp_path / log_config.simple_memory_log_file).exists()
+
+    def test_supersede_appends_status_record(self, make_manager, log_config):
+        manager = make_manager()
+        manager.add_memory(15, "West of House", _memory("Window locked"))
+
+        assert manager.supersede_memory(
+            15, "West of House", "Window locked", _memory("Window opens", turns="20")
+        )
+
+        status = [r for r in _log_records(log_config) if r["op"] == "status"]
+        assert len(status) == 1
+        assert status[0]["title"] == "Window locked"
+        assert status[0]["superseded_by"] == "Window opens"
+        assert status[0]["superseded_at_turn"] == 20
+
+    def test_unknown_title_is_rejected(self, make_manager):
+        manager = make_manager()
+        manager.add_memory(15, "West of House", _memory("Open window"))
+
+        assert not manager.invalidate_memory(15, "Nonexistent", reason="Wrong", turn=3)
+
+
+class TestMemoryLogReplay:
+    """A new manager rebuilds its caches from the log."""
+
+    def test_status_changes_survive_restart(self, make_manager):
+        manager = make_manager()
+        manager.add_memory(15, "West of House", _memory("Troll is friendly"))
+        manager.add_memory(15, "West of House", _memory("Mailbox has leaflet"))
+        manager.invalidate_memory(15, "Troll is friendly", reason="Troll attacked", turn=12)
+
+        reloaded = make_manager()
+        memories = {m.title: m for m in reloaded.memory_cache[15]}
+
+        assert memories["Troll is friendly"].status == MemoryStatus.SUPERSEDED
+        assert memories["Troll is friendly"].superseded_by == INVALIDATION_MARKER
+        assert memories["Troll is friendly"].invalidation_reason == "Troll attacked"
+        assert memories["Mailbox has leaflet"].status == MemoryStatus.ACTIVE
+
+    def test_reused_title_updates_the_right_slot(self, make_manager):
+        manager = make_manager()
+        manager.add_memory(15, "West of House", _memory("Window locked"))
+        manager.supersede_memory(15, "West of House", "Window locked", _memory("Door opens", turns="6"))
+        manager.supersede_memory(15, "West of House", "Door opens", _memory("Window locked", turns="7"))
+
+        reloaded = make_manager()
+        statuses = [(m.title, m.status) for m in reloaded.memory_cache[15]]
+
+        assert statuses == [
+            ("Window locked", MemoryStatus.SUPERSEDED),
+            ("Door opens", MemoryStatus.SUPERSEDED),
+            ("Window locked", MemoryStatus.ACTIVE),
+        ]
+
+    def test_corrupt_line_is_skipped(self, make_manager, log_config, tmp_path):
+        manager = make_manager()
+        manager.add_memory(15, "West of House", _memory("Open window"))
+        with open(tmp_path / log_config.simple_memory_log_file, "a") as f:
+            f.write("{not json\n")
+        manager.add_memory(15, "West of House", _memory("Take leaflet"))
+
+        reloaded = make_manager()
+
+        assert [m.title for m in reloaded.memory_cache[15]] == ["Open window", "Take leaflet"]
+
+
+class TestMemoryLogCompaction:
+    """Churned logs are rewritten to one record per memory."""
+
+    def test_compaction_preserves_state(self, make_manager, log_config):
+        manager = make_manager()
+        manager.add_memory(15, "West of House", _memory("Open window"))
+        manager.add_memory(15, "West of House", _memory("Troll is friendly"))
+        for turn in range(1, COMPACTION_MIN_RECORDS + 1):
+            manager.invalidate_memory(15, "Troll is friendly", reason=f"Attacked on T{turn}", turn=turn)
+
+        store = manager.memory_store
+        assert store.compactions >= 1
+        assert len(_log_records(log_config)) < COMPACTION_MIN_RECORDS
+
+        reloaded = make_manager()
+        memories = {m.title: m for m in reloaded.memory_cache[15]}
+        assert memories["Open window"].status == MemoryStatus.ACTIVE
+        assert memories["Troll is friendly"].invalidation_reason == (
+            f"Attacked on T{COMPACTION_MIN_RECORDS}"
+        )
+
+
+class TestMemoryLogMarkdown:
+    """Memories.md is imported once and rendered on demand."""
+
+    def test_import_existing_markdown(self, make_manager, log_config, tmp_path):
+        (tmp_path / "Memories.md").write_text(
+            "# Location Memories\n\n"
+            "## Location 15: West of House\n"
+            "**Visits:** 1 | **Episodes:** 1\n\n"
+            "### Memories\n\n"
+            "**[SUCCESS - PERMANENT] Open window** *(Ep1, T23, +0)*\n"
+            "Window can be opened.\n\n"
+            "---\n"
+        )
+
+        manager = make_manager()
+
+        assert [m.title for m in manager.memory_cache[15]] == ["Open window"]
+        assert (tmp_path / log_config.simple_memory_log_file).exists()
+
+    def test_export_round_trips_through_markdown_parser(self, make_manager, tmp_path):
+        manager = make_manager()
+        manager.add_memory(15, "West of House", _memory("Open window", episode=1))
+        manager.add_memory(15, "West of House", _memory("Take leaflet", episode=2))
+        manager.add_memory(23, "Living Room", _memory("Grab lantern", persistence="core"))
+        manager.invalidate_memory(23, "Grab lantern", reason="Lantern gone", turn=30)
+
+        path = manager.export_markdown()
+        content = path.read_text()
+
+        assert "## Location 15: West of House" in content
+        assert "**Visits:** 2 | **Episodes:** 1, 2" in content
+        assert '[Invalidated at T30: "Lantern gone"]' in content
+
+        # The rendered view parses back to the same memories
+        markdown_config = manager.config.model_copy(update={"simple_memory_store": "markdown"})
+        parsed = SimpleMemoryManager(
+            logger=Mock(spec=logging.Logger),
+            config=markdown_config,
+            game_state=GameState(),
+            llm_client=Mock(),
+        )
+        assert [m.title for m in parsed.memory_cache[15]] == ["Open window", "Take leaflet"]
+        lantern = parsed.memory_cache[23][0]
+        assert lantern.persistence == "core"
+        assert lantern.status == MemoryStatus.SUPERSEDED
+        assert lantern.invalidation_reason == "Lantern gone"
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 
 from managers.objective_manager import ObjectiveManager
 from managers.simple_memory_manager import Memory
+from map_graph import MapGraph
 from session.game_state import GameState
 from session.game_configuration import GameConfiguration
 
@@ -54,20 +55,14 @@ class TestObjectiveManagerEnhanced:
 
     @pytest.fixture
     def mock_map_manager(self):
-        """Create mock map manager with game_map."""
+        """Create mock map manager with a real game_map."""
         manager = Mock()
-        manager.game_map = Mock()
-        manager.game_map.rooms = {180: Mock(), 79: Mock(), 62: Mock()}
-        manager.game_map.room_names = {
-            180: "West of House",
-            79: "Behind House",
-            62: "Kitchen"
-        }
-        manager.game_map.connections = {
-            180: {"north": 79},
-            79: {"south": 180, "enter window": 62},
-            62: {}
-        }
+        manager.game_map = MapGraph()
+        manager.game_map.add_room(180, "West of House")
+        manager.game_map.add_room(79, "Behind House")
+        manager.game_map.add_room(62, "Kitchen")
+        manager.game_map.add_connection(180, "north", 79)
+        manager.game_map.add_connection(79, "enter window", 62)
         manager.game_map.render_mermaid = Mock(return_value="```mermaid\ngraph TD\nL180-->L79\n```")
         return manager
 
@@ -136,8 +131,7 @@ class TestObjectiveManagerEnhanced:
     def test_calculate_distance_bfs_unreachable(self, objective_manager, mock_map_manager):
         """Should return float('inf') for unreachable locations."""
         # Add isolated location 999 with no connections
-        mock_map_manager.game_map.rooms[999] = Mock()
-        mock_map_manager.game_map.connections[999] = {}
+        mock_map_manager.game_map.add_room(999, "Isolated Room")
 
         distance = objective_manager._calculate_distance_bfs(180, 999)
         assert distance == float('inf')
@@ -194,20 +188,13 @@ class TestObjectiveManagerEnhanced:
         # Create 10 locations with memories
         for i in range(1, 11):
             loc_id = 100 + i
-            mock_map_manager.game_map.rooms[loc_id] = Mock()
-            mock_map_manager.game_map.room_names[loc_id] = f"Room {i}"
+            mock_map_manager.game_map.add_room(loc_id, f"Room {i}")
             mock_simple_memory.memory_cache[loc_id] = [
                 Memory("NOTE", f"Memory {i}", 1, str(i), 0, f"Text {i}", status="ACTIVE", persistence="permanent")
             ]
             # Chain connections: 180 → 101 → 102 → ... → 110
-            if i == 1:
-                mock_map_manager.game_map.connections[180]["east"] = loc_id
-            else:
-                prev_loc_id = 100 + i - 1
-                if prev_loc_id not in mock_map_manager.game_map.connections:
-                    mock_map_manager.game_map.connections[prev_loc_id] = {}
-                mock_map_manager.game_map.connections[prev_loc_id]["east"] = loc_id
-            mock_map_manager.game_map.connections[loc_id] = {}
+            prev_loc_id = 180 if i == 1 else loc_id - 1
+            mock_map_manager.game_map.add_connection(prev_loc_id, "east", loc_id)
 
         result = objective_manager._get_all_memories_by_distance(180)
 
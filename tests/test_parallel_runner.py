@@ -0,0 +1,323 @@
+# ABOUTME: Tests for parallel episodes: process-pool runner, shared-store locking and merge-on-write
+# ABOUTME: Covers the cross-process LLM request limiter, knowledge/map/memory merges and worker isolation
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from knowledge import AdaptiveKnowledgeManager
+from knowledge.section_utils import merge_concurrent_update, split_sections
+from llm_client import LLMClient, LLMResponse, RateLimitError
+from managers.memory import Memory
+from managers.memory.cache_manager import MemoryCacheManager
+from managers.memory.file_operations import MemoryFileWriter
+from managers.memory.memory_store import MemoryLogStore
+from map_graph import MapGraph
+from orchestration.parallel_runner import ParallelEpisodeRunner, episode_worker_config
+from session.game_configuration import GameConfiguration
+from shared_store import SharedRequestLimiter, get_request_limiter, store_lock
+
+
+def fake_episode_worker(episode_id, config, max_turns=None):
+    """Stand-in for run_episode_worker (module level so spawned workers can import it)."""
+    if episode_id.endswith("boom"):
+        raise RuntimeError("worker crashed")
+    return {
+        "episode_id": episode_id,
+        "score": len(episode_id),
+        "turns": max_turns,
+        "error": None,
+        "pid": os.getpid(),
+        "json_log_file": episode_worker_config(config, episode_id).json_log_file,
+    }
+
+
+@pytest.fixture
+def config(tmp_path):
+    return GameConfiguration(max_turns_per_episode=100, zork_game_workdir=str(tmp_path))
+
+
+class TestStoreLock:
+    """store_lock returns one re-entrant lock per path that excludes other threads."""
+
+    def test_same_lock_per_path_and_reentrant(self, tmp_path):
+        lock = store_lock(tmp_path / "knowledgebase.md")
+
+        assert store_lock(str(tmp_path / "knowledgebase.md")) is lock
+        with lock:
+            with store_lock(tmp_path / "knowledgebase.md"):
+                assert lock.is_locked
+
+    def test_other_threads_are_excluded(self, tmp_path):
+        lock = store_lock(tmp_path / "map_state.json")
+        outcome = []
+
+        def try_acquire():
+            try:
+                lock.acquire(timeout=0)
+                outcome.append("acquired")
+                lock.release()
+            except Exception as e:
+                outcome.append(type(e).__name__)
+
+        with lock:
+            thread = threading.Thread(target=try_acquire)
+            thread.start()
+            thread.join()
+
+        assert outcome == ["Timeout"]
+
+
+class TestSharedRequestLimiter:
+    """Slots cap concurrency; a rate limit in one client pauses all of them."""
+
+    def test_slots_cap_concurrent_requests(self, tmp_path):
+        limiter = SharedRequestLimiter(tmp_path / "limiter", slots=2, poll_interval=0.01)
+        active = []
+        peak = []
+
+        def request():
+            with limiter.slot():
+                active.append(1)
+                peak.append(len(active))
+                time.sleep(0.05)
+                active.pop()
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) <= 2
+        assert limiter.get_stats()["requests"] == 5
+
+    def test_cooldown_is_shared_and_keeps_later_deadline(self, tmp_path):
+        first = SharedRequestLimiter(tmp_path / "limiter", slots=1)
+        second = SharedRequestLimiter(tmp_path / "limiter", slots=1)
+
+        first.note_rate_limit(30.0)
+        second.note_rate_limit(1.0)
+
+        assert second.cooldown_remaining() > 20.0
+
+    def test_disabled_by_default(self, config):
+        assert get_request_limiter(config) is None
+
+    def test_rate_limit_sets_shared_cooldown(self, tmp_path):
+        config = GameConfiguration(
+            max_turns_per_episode=100,
+            zork_game_workdir=str(tmp_path),
+            llm_shared_request_slots=2,
+        )
+        client = LLMClient(config=config, base_url="http://test.com", api_key="test-key")
+        client.retry_config.update({"initial_delay": 0.05, "jitter_factor": 0.0, "max_retries": 2})
+        client._make_request = Mock(
+            side_effect=[RateLimitError("Rate limit error: 429"), LLMResponse(content="ok", model="m")]
+        )
+
+        response = client.chat_completions_create(model="m", messages=[{"role": "user", "content": "hi"}])
+
+        assert response.content == "ok"
+        stats = client.request_limiter.get_stats()
+        assert stats["cooldowns_set"] == 1
+        assert stats["requests"] == 2
+
+
+class TestKnowledgeMerge:
+    """A knowledge write never discards what another process wrote meanwhile."""
+
+    BASE = "# KB\n\n## A\nalpha\n\n## B\nbeta\n\n## CROSS-EPISODE INSIGHTS\nold insight\n"
+
+    def test_three_way_section_merge(self):
+        ours = self.BASE.replace("alpha", "alpha revised") + "\n## C\ngamma\n"
+        theirs = self.BASE.replace("beta", "beta revised").replace("old insight", "new insight")
+
+        merged, taken = merge_concurrent_update(self.BASE, ours, theirs)
+        sections = split_sections(merged)
+
+        assert taken == ["A", "C"]
+        assert sections["A"] == "alpha revised"
+        assert sections["B"] == "beta revised"
+        assert sections["C"] == "gamma"
+        assert sections["CROSS-EPISODE INSIGHTS"] == "new insight"
+
+    def test_write_merges_when_file_changed_since_load(self, config, tmp_path):
+        kb = tmp_path / "knowledgebase.md"
+        kb.write_text(self.BASE)
+        manager = AdaptiveKnowledgeManager(
+            config=config,
+            log_file=str(tmp_path / "missing.jsonl"),
+            output_file=str(kb),
+            logger=Mock(),
+            workdir=str(tmp_path),
+        )
+        existing, preserved = manager._load_existing_knowledge("ep")
+
+        # Another episode revises B and the insights before this write lands
+        kb.write_text(self.BASE.replace("beta", "beta from other").replace("old insight", "fresh"))
+        ours = manager._restore_cross_episode_section(existing.replace("alpha", "alpha ours"), preserved)
+
+        assert manager._write_knowledge("ep", ours)
+
+        sections = split_sections(kb.read_text())
+        assert sections["A"] == "alpha ours"
+        assert sections["B"] == "beta from other"
+        assert sections["CROSS-EPISODE INSIGHTS"] == "fresh"
+
+    def test_unchanged_file_is_overwritten(self, config, tmp_path):
+        kb = tmp_path / "knowledgebase.md"
+        kb.write_text(self.BASE)
+        manager = AdaptiveKnowledgeManager(
+            config=config,
+            log_file=str(tmp_path / "missing.jsonl"),
+            output_file=str(kb),
+            logger=Mock(),
+            workdir=str(tmp_path),
+        )
+        manager._load_existing_knowledge("ep")
+
+        assert manager._write_knowledge("ep", "# KB\n\n## A\nonly\n")
+
+        assert kb.read_text() == "# KB\n\n## A\nonly\n"
+
+
+class TestMapMerge:
+    """MapGraph.merge_from unions maps without undoing this map's decisions."""
+
+    def test_union_keeps_our_connections_and_prunes(self):
+        ours = MapGraph()
+        ours.add_room(1, "West of House")
+        ours.add_room(2, "North of House")
+        ours.connections[1] = {"north": 2}
+        ours.pruned_exits[1] = {"east"}
+
+        theirs = MapGraph()
+        theirs.add_room(1, "West of House")
+        theirs.add_room(3, "Forest")
+        theirs.rooms[1].exits.update({"north", "east", "west"})
+        theirs.connections[1] = {"north": 3, "east": 2, "west": 3}
+        theirs.connection_verifications[(1, "west")] = 4
+
+        merged = ours.merge_from(theirs)
+
+        assert merged == {"rooms_added": 1, "connections_added": 1}
+        assert ours.connections[1] == {"north": 2, "west": 3}
+        assert "east" not in ours.rooms[1].exits
+        assert ours.connection_verifications[(1, "west")] == 4
+
+    def test_save_map_state_merges_saved_map(self, config, tmp_path):
+        from managers.map_manager import MapManager
+        from session.game_state import GameState
+
+        saved = MapGraph()
+        saved.add_room(7, "Kitchen")
+        saved.save_to_json(str(tmp_path / config.map_state_file))
+
+        manager = MapManager(logger=Mock(spec=logging.Logger), config=config, game_state=GameState())
+        # Another episode saves a room after this manager loaded the map
+        saved.add_room(9, "Attic")
+        saved.save_to_json(str(tmp_path / config.map_state_file))
+        manager.game_map.add_room(8, "Living Room")
+
+        assert manager.save_map_state()
+
+        reloaded = MapGraph.load_from_json(str(tmp_path / config.map_state_file))
+        assert set(reloaded.rooms) == {7, 8, 9}
+
+
+def _memory(title, episode=1):
+    return Memory(
+        category="SUCCESS",
+        title=title,
+        episode=episode,
+        turns="5",
+        score_change=0,
+        text=f"{title} works.",
+        persistence="permanent",
+    )
+
+
+class TestSharedMemoryLog:
+    """Two stores on one memory log (two episode processes) stay consistent."""
+
+    @pytest.fixture
+    def make_store(self, tmp_path):
+        config = GameConfiguration(
+            max_turns_per_episode=100,
+            zork_game_workdir=str(tmp_path),
+            simple_memory_store="log",
+        )
+
+        def _make():
+            logger = Mock(spec=logging.Logger)
+            store = MemoryLogStore(logger, config, MemoryFileWriter(logger, config))
+            store.load_into(MemoryCacheManager())
+            return store
+
+        return _make
+
+    def test_writes_apply_other_processes_records_first(self, make_store):
+        first, second = make_store(), make_store()
+
+        first.write_memory(_memory("Open window"), 15, "Behind House")
+        second.write_memory(_memory("Enter window", episode=2), 15, "Behind House")
+        assert second.update_memory_status(
+            15, "Open window", "SUPERSEDED", superseded_by="Window stays open", superseded_at_turn=9
+        )
+
+        assert second.records_from_other_processes == 1
+        replayed = make_store()
+        statuses = {m.title: m.status for m in replayed._index[15]}
+        assert statuses == {"Open window": "SUPERSEDED", "Enter window": "ACTIVE"}
+
+    def test_compaction_keeps_other_processes_records(self, make_store):
+        first, second = make_store(), make_store()
+        first.write_memory(_memory("Open window"), 15, "Behind House")
+        second.write_memory(_memory("Take lamp", episode=2), 20, "Living Room")
+
+        first.compact()
+        second.write_memory(_memory("Light lamp", episode=2), 20, "Living Room")
+
+        titles = sorted(m.title for memories in make_store()._index.values() for m in memories)
+        assert titles == ["Light lamp", "Open window", "Take lamp"]
+
+
+class TestParallelEpisodeRunner:
+    """Episodes run in separate worker processes with episode-local log paths."""
+
+    def test_worker_config_isolates_log_and_export_paths(self, config, tmp_path):
+        worker_config = episode_worker_config(config, "ep-p1")
+        episode_dir = tmp_path / "episodes" / "ep-p1"
+
+        assert Path(worker_config.episode_log_file).parent == episode_dir
+        assert Path(worker_config.json_log_file) == episode_dir / "episode_log.jsonl"
+        assert Path(worker_config.state_export_file).parent == episode_dir
+        assert config.json_log_file == "zork_episode_log.jsonl"
+
+    def test_make_episode_ids_are_distinct(self):
+        ids = ParallelEpisodeRunner.make_episode_ids(3)
+
+        assert len(set(ids)) == 3
+        assert ids[0].endswith("-p1")
+
+    def test_runs_each_episode_in_its_own_process(self, config):
+        runner = ParallelEpisodeRunner(
+            config, max_workers=2, max_turns=5, logger=Mock(spec=logging.Logger), worker=fake_episode_worker
+        )
+        seen = []
+
+        results = runner.run(3, episode_ids=["a", "bb", "ccc-boom"], on_result=seen.append)
+
+        assert [r["episode_id"] for r in results] == ["a", "bb", "ccc-boom"]
+        assert [r["score"] for r in results[:2]] == [1, 2]
+        assert results[0]["turns"] == 5
+        assert results[0]["pid"] != results[1]["pid"] != os.getpid()
+        assert results[2]["error"] == "RuntimeError: worker crashed"
+        assert len(seen) == 3
+        runner.logger.error.assert_called_once()
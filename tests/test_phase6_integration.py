@@ -19,7 +19,7 @@ class TestPhase6Integration:
         mock.get_inventory_structured.return_value = []
         mock.get_score.return_value = (0, 350)
         mock.is_game_over.return_value = (False, None)
-        mock.save_state.return_value = (1, 2, 3)  # State tuple
+        mock.get_state_digest.return_value = (1, 2, 3)  # State digest
         mock.close.return_value = None
         return mock
 
@@ -54,8 +54,6 @@ class TestPhase6Integration:
                 objective_refinement_interval=200,
                 max_objectives_before_forced_refinement=15,
                 refined_objectives_target_count=10,
-                max_context_tokens=100000,
-                context_overflow_threshold=0.8,
                 enable_state_export=False,
                 s3_bucket="test-bucket",
                 s3_key_prefix="test/",
@@ -172,7 +170,7 @@ class TestPhase6Integration:
             (4, 5, 6),  # State 2 again - Loop back to North of House
         ]
 
-        mock_jericho.save_state.side_effect = state_sequence
+        mock_jericho.get_state_digest.side_effect = state_sequence
         mock_jericho.start.return_value = "Welcome"
         mock_jericho.get_location_structured.return_value = Mock(num=1, name="Start")
         mock_jericho.get_inventory_structured.return_value = []
@@ -215,7 +213,7 @@ class TestPhase6Integration:
 
         mock_jericho.get_score.return_value = (0, 350)
         mock_jericho.is_game_over.return_value = (False, None)
-        mock_jericho.save_state.return_value = (1, 2, 3)
+        mock_jericho.get_state_digest.return_value = (1, 2, 3)
         mock_jericho.close.return_value = None
 
         # Simulate inventory changes - properly configure Mock object
@@ -263,7 +261,7 @@ class TestPhase6Integration:
         mock_jericho.close.return_value = None
 
         # Different states for each turn
-        mock_jericho.save_state.side_effect = [
+        mock_jericho.get_state_digest.side_effect = [
             (1, 2, 3),
             (4, 5, 6),
             (7, 8, 9),
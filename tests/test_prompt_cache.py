@@ -0,0 +1,139 @@
+# ABOUTME: Tests for cache-aware prompt layout and provider-reported prompt cache accounting
+# ABOUTME: Covers PromptBuilder tiers, usage normalization per provider and the agent's stable prompt prefix
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from llm_client import LLMClient
+from prompt_cache import PromptBuilder, PromptCacheStats
+from zork_agent import ZorkAgent
+
+
+def _agent_response():
+    return SimpleNamespace(content=json.dumps({"thinking": "Go", "action": "north"}))
+
+
+class TestPromptBuilder:
+    """Messages are ordered stable to volatile with a breakpoint on every cacheable tier."""
+
+    def test_tiers_are_ordered_and_cached_except_turn(self):
+        messages = (
+            PromptBuilder("anthropic/claude")
+            .add("turn", "state")
+            .add("reference", "map")
+            .add("static", "rules")
+            .add("knowledge", "")
+            .build()
+        )
+
+        assert [(m["role"], m["content"]) for m in messages] == [
+            ("system", "rules"),
+            ("user", "map"),
+            ("user", "state"),
+        ]
+        assert [m.get("cache_control") for m in messages] == [
+            {"type": "ephemeral"},
+            {"type": "ephemeral"},
+            None,
+        ]
+
+    def test_o1_models_get_user_roles_and_segments_join(self):
+        messages = PromptBuilder("o1-mini").add("static", "a").add("static", "b").build()
+
+        assert messages == [{"role": "user", "content": "a\n\nb", "cache_control": {"type": "ephemeral"}}]
+
+    def test_unknown_tier_is_rejected(self):
+        with pytest.raises(ValueError):
+            PromptBuilder().add("volatile", "x")
+
+
+class TestPromptCacheStats:
+    """Cached tokens are normalized per provider and totalled per component."""
+
+    @pytest.mark.parametrize(
+        "usage",
+        [
+            {"prompt_tokens": 1000, "completion_tokens": 5, "cache_read_input_tokens": 800},
+            {"prompt_tokens": 1000, "completion_tokens": 5, "prompt_tokens_details": {"cached_tokens": 800}},
+            {"prompt_tokens": 1000, "completion_tokens": 5, "prompt_cache_hit_tokens": 800},
+        ],
+        ids=["anthropic", "openai", "deepseek"],
+    )
+    def test_usage_formats_report_cache_reads(self, test_config, usage):
+        client = LLMClient(config=test_config, base_url="http://test.com", api_key="test-key")
+
+        assert client._extract_usage_details(usage)["cache_read_input_tokens"] == 800
+
+    def test_totals_and_hit_rate(self):
+        stats = PromptCacheStats()
+        stats.record("Agent", {"input": 1000, "cache_read_input_tokens": 900})
+        stats.record("Agent", {"input": 1000, "cache_creation_input_tokens": 1000})
+        stats.record("Critic", {"input": 500})
+        stats.record("Critic", None)
+
+        summary = stats.get_stats()
+
+        assert (summary["calls"], summary["prompt_tokens"], summary["cached_tokens"]) == (3, 2500, 900)
+        assert summary["hit_rate"] == 0.36
+        assert summary["components"]["Agent"]["hit_rate"] == 0.45
+        assert summary["components"]["Agent"]["cache_write_tokens"] == 1000
+        stats.reset()
+        assert stats.get_stats()["calls"] == 0
+
+    def test_client_records_each_completed_call(self, test_config):
+        client = LLMClient(config=test_config, base_url="http://test.com", api_key="test-key")
+        client.prompt_cache_stats = PromptCacheStats()
+        response = Mock(ok=True)
+        response.json.return_value = {
+            "model": "test-model",
+            "choices": [{"message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 200, "completion_tokens": 1, "prompt_tokens_details": {"cached_tokens": 150}},
+        }
+
+        with patch("requests.Session.post", return_value=response):
+            client.chat_completions_create(
+                model="test-model", messages=[{"role": "user", "content": "hi"}], name="Critic"
+            )
+
+        assert client.prompt_cache_stats.get_stats()["components"]["Critic"]["cached_tokens"] == 150
+
+
+class TestAgentPromptLayout:
+    """The agent keeps agent.md, the knowledge base and the map in separate cached messages."""
+
+    @pytest.fixture
+    def agent(self, test_config, tmp_path):
+        config = test_config.model_copy(update={"zork_game_workdir": str(tmp_path)})
+        (tmp_path / config.knowledge_file).write_text("Bring a lamp.", encoding="utf-8")
+        agent = ZorkAgent(config=config, client=Mock())
+        agent.client.chat.completions.create.return_value = _agent_response()
+        return agent
+
+    def _sent_messages(self, agent):
+        return agent.client.chat.completions.create.call_args.kwargs["messages"]
+
+    def test_knowledge_is_its_own_message(self, agent):
+        agent.get_action_with_reasoning("", "GAME RESPONSE: ok", reference_context="CURRENT WORLD MAP:")
+
+        messages = self._sent_messages(agent)
+        assert [m["content"] for m in messages[:1]] == [agent.system_prompt]
+        assert "Bring a lamp." in messages[1]["content"]
+        assert messages[2]["content"] == "CURRENT WORLD MAP:"
+        assert messages[3] == {"role": "user", "content": "GAME RESPONSE: ok"}
+        assert all(m.get("cache_control") for m in messages[:3])
+
+    def test_knowledge_reload_leaves_system_prompt_unchanged(self, agent, tmp_path):
+        system_prompt = agent.system_prompt
+
+        (tmp_path / agent.config.knowledge_file).write_text("Avoid the troll.", encoding="utf-8")
+        assert agent.reload_knowledge_base()
+
+        agent.get_action_candidates("", "context", num_candidates=2)
+        messages = self._sent_messages(agent)
+        assert messages[0]["content"] == system_prompt
+        assert "Avoid the troll." in messages[1]["content"]
+        assert "Bring a lamp." not in messages[1]["content"]
+        assert messages[-1]["content"].startswith("context")
@@ -23,6 +23,8 @@ def mock_config():
     }
     config.get_llm_base_url_for_model = Mock(return_value="https://api.openai.com/v1")
     config.get_effective_api_key = Mock(return_value="test-key")
+    config.extractor_fast_path = False
+    config.extractor_memo_size = 0
     return config
 
 
@@ -43,6 +45,7 @@ def mock_jericho():
 
     # Setup empty visible objects
     jericho.get_all_objects = Mock(return_value=[])
+    jericho.get_visible_objects_in_location = Mock(return_value=[])
 
     # Setup score
     jericho.get_score = Mock(return_value=(0, 350))
@@ -263,6 +263,19 @@ Grue attacks in dark locations.
         assert "New strategic patterns." in result
         assert "## DANGERS & THREATS" in result  # Existing sections preserved
 
+    def test_section_name_prefix_does_not_match_longer_header(self):
+        """A section named DANGERS is not the DANGERS & THREATS section."""
+        knowledge = """# Zork Game World Knowledge Base
+
+## DANGERS & THREATS
+Grue attacks in dark locations.
+"""
+
+        result = section_utils.update_section_content(knowledge, "DANGERS", "Trolls.")
+
+        assert "Grue attacks in dark locations." in result
+        assert section_utils.extract_section_content(result, "DANGERS") == "Trolls."
+
     def test_update_empty_knowledge(self):
         """Test updating section in empty knowledge creates initial structure."""
         new_content = "Some danger content."
@@ -0,0 +1,209 @@
+# ABOUTME: Tests for the background state exporter and the filesystem S3 stand-in
+# ABOUTME: Covers coalescing, ordering, backpressure, flush/close and StateManager integration
+
+import json
+import logging
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from managers.state_manager import StateManager
+from session.game_configuration import GameConfiguration
+from session.game_state import GameState
+from state_exporter import FilesystemBucket, StateExporter
+
+
+class _GatedWriter:
+    """Records writes; the first write blocks until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.writes = []
+
+    def __call__(self, key, value):
+        self.started.set()
+        self.release.wait(timeout=5)
+        self.writes.append((key, value))
+
+
+class TestFilesystemBucket:
+    """put_object/get_object round trip under <root>/<bucket>/<key>."""
+
+    def test_round_trip(self, tmp_path):
+        bucket = FilesystemBucket(str(tmp_path))
+        bucket.put_object(Bucket="b", Key="zorkgpt/current_state.json", Body='{"a": 1}')
+
+        assert (tmp_path / "b" / "zorkgpt" / "current_state.json").exists()
+        body = bucket.get_object(Bucket="b", Key="zorkgpt/current_state.json")["Body"]
+        assert json.loads(body.read()) == {"a": 1}
+
+    def test_missing_object(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            FilesystemBucket(str(tmp_path)).get_object(Bucket="b", Key="nope.json")
+
+    def test_list_objects_under_prefix(self, tmp_path):
+        bucket = FilesystemBucket(str(tmp_path))
+        for key in ("z/snapshots/ep2/turn_1.json", "z/snapshots/ep1/turn_1.json", "z/current_state.json"):
+            bucket.put_object(Bucket="b", Key=key, Body="{}")
+
+        pages = list(bucket.get_paginator("list_objects_v2").paginate(Bucket="b", Prefix="z/snapshots/"))
+
+        keys = [obj["Key"] for page in pages for obj in page["Contents"]]
+        assert keys == ["z/snapshots/ep1/turn_1.json", "z/snapshots/ep2/turn_1.json"]
+        assert bucket.list_objects_v2(Bucket="b", Prefix="z/missing/") == {"KeyCount": 0}
+
+
+class TestStateExporter:
+    """Background queue semantics."""
+
+    def test_inline_mode_writes_immediately(self):
+        writes = []
+        exporter = StateExporter(enabled=False)
+
+        exporter.submit("k", writes.append, 1)
+
+        assert writes == [1]
+        assert exporter.get_stats()["writes_completed"] == 1
+
+    def test_pending_writes_to_same_key_coalesce(self):
+        writer = _GatedWriter()
+        exporter = StateExporter(enabled=True)
+
+        # First write occupies the worker; the rest queue up behind it
+        exporter.submit("blocker", writer, "blocker", 0)
+        assert writer.started.wait(timeout=5)
+        for turn in range(1, 6):
+            exporter.submit("current", writer, "current", turn)
+            exporter.submit(f"snapshot_{turn}", writer, "snapshot", turn)
+
+        writer.release.set()
+        assert exporter.flush(timeout=5)
+
+        assert writer.writes[1] == ("current", 5)
+        assert [v for k, v in writer.writes if k == "current"] == [5]
+        assert [v for k, v in writer.writes if k == "snapshot"] == [1, 2, 3, 4, 5]
+        stats = exporter.get_stats()
+        assert stats["writes_coalesced"] == 4
+        assert stats["writes_completed"] == 7
+        exporter.close()
+
+    def test_submit_does_not_wait_for_slow_writes(self):
+        exporter = StateExporter(enabled=True)
+
+        start = time.perf_counter()
+        for i in range(5):
+            exporter.submit("current", time.sleep, 0.2)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.2
+        exporter.close()
+        assert exporter.get_stats()["writes_completed"] <= 2
+
+    def test_full_queue_applies_backpressure(self):
+        writer = _GatedWriter()
+        exporter = StateExporter(enabled=True, max_pending=2)
+        exporter.submit("blocker", writer, "blocker", 0)
+        assert writer.started.wait(timeout=5)
+        exporter.submit("a", writer, "a", 1)
+        exporter.submit("b", writer, "b", 2)
+
+        threading.Timer(0.1, writer.release.set).start()
+        exporter.submit("c", writer, "c", 3)
+
+        stats = exporter.get_stats()
+        assert stats["backpressure_waits"] == 1
+        assert stats["backpressure_wait_seconds"] > 0
+        exporter.close()
+        assert [k for k, _ in writer.writes] == ["blocker", "a", "b", "c"]
+
+    def test_failures_are_logged_not_raised(self):
+        logger = Mock(spec=logging.Logger)
+        exporter = StateExporter(enabled=True, logger=logger)
+
+        def fail():
+            raise IOError("disk full")
+
+        exporter.submit("bad", fail)
+        exporter.submit("good", lambda: None)
+        exporter.close()
+
+        stats = exporter.get_stats()
+        assert stats["writes_failed"] == 1
+        assert stats["writes_completed"] == 1
+        assert logger.error.call_args.kwargs["extra"]["event_type"] == "state_export_write_failed"
+
+    def test_close_restarts_worker_on_next_submit(self):
+        writes = []
+        exporter = StateExporter(enabled=True)
+        exporter.submit("a", writes.append, 1)
+        exporter.close()
+        exporter.submit("a", writes.append, 2)
+        exporter.close()
+
+        assert writes == [1, 2]
+
+
+@pytest.fixture
+def bucket_config(tmp_path):
+    return GameConfiguration(
+        max_turns_per_episode=100,
+        zork_game_workdir=str(tmp_path),
+        state_export_file=str(tmp_path / "current_state.json"),
+        enable_background_state_export=True,
+        s3_bucket="test-bucket",
+        s3_local_dir=str(tmp_path / "bucket"),
+    )
+
+
+@pytest.fixture
+def state_manager(bucket_config):
+    game_state = GameState()
+    game_state.episode_id = "ep-bg"
+    manager = StateManager(
+        logger=Mock(spec=logging.Logger), config=bucket_config, game_state=game_state
+    )
+    yield manager
+    manager.close()
+
+
+class TestStateManagerBackgroundExport:
+    """export_current_state through the exporter and filesystem bucket."""
+
+    def test_uses_filesystem_bucket(self, state_manager):
+        assert isinstance(state_manager.s3_client, FilesystemBucket)
+
+    def test_snapshots_keep_their_turn_after_game_moves_on(self, state_manager, tmp_path):
+        for turn in (1, 2, 3):
+            state_manager.game_state.turn_count = turn
+            assert state_manager.export_current_state()
+        assert state_manager.flush_exports(timeout=5)
+
+        prefix = tmp_path / "bucket" / "test-bucket" / "zorkgpt"
+        for turn in (1, 2, 3):
+            with open(prefix / "snapshots" / "ep-bg" / f"turn_{turn}.json") as f:
+                assert json.load(f)["metadata"]["turn_count"] == turn
+        with open(prefix / "current_state.json") as f:
+            assert json.load(f)["metadata"]["turn_count"] == 3
+        with open(tmp_path / "current_state.json") as f:
+            assert json.load(f)["metadata"]["turn_count"] == 3
+
+    def test_delta_mode_uploads_deltas(self, state_manager, bucket_config, tmp_path):
+        bucket_config.state_export_mode = "delta"
+        for turn in (1, 2):
+            state_manager.game_state.turn_count = turn
+            state_manager.export_current_state()
+        state_manager.close()
+
+        episode_dir = tmp_path / "bucket" / "test-bucket" / "zorkgpt" / "snapshots" / "ep-bg"
+        assert sorted(p.name for p in episode_dir.iterdir()) == ["delta_2.json", "turn_1.json"]
+
+    def test_status_reports_exporter(self, state_manager):
+        state_manager.export_current_state()
+        state_manager.flush_exports(timeout=5)
+
+        exporter_status = state_manager.get_status()["exporter"]
+        assert exporter_status["enabled"] is True
+        assert exporter_status["writes_completed"] == 3
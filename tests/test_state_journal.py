@@ -0,0 +1,282 @@
+# ABOUTME: Tests for the delta state export journal and its readers
+# ABOUTME: Covers diff/replay round trips, keyframe cadence, StateManager delta mode and episode indexing
+
+import copy
+import json
+import logging
+
+import pytest
+from unittest.mock import Mock
+
+from generate_episode_index import EpisodeIndexGenerator
+from managers.state_manager import StateManager
+from session.game_configuration import GameConfiguration
+from session.game_state import GameState
+from state_journal import (
+    EpisodeExportLog,
+    StateJournal,
+    apply_delta,
+    diff_state,
+    read_journal,
+    reconstruct_state,
+)
+
+
+def _state(turn, rooms=None, score=0):
+    return {
+        "metadata": {"turn_count": turn, "score": score, "timestamp": f"t{turn}"},
+        "current_state": {"location": "Kitchen", "inventory": ["lamp"]},
+        "recent_log": [{"turn": turn, "action": "look"}],
+        "map": {"rooms": rooms or {"1": "West of House"}, "total_rooms": len(rooms or [1])},
+    }
+
+
+class TestDiffAndApply:
+    """diff_state/apply_delta round-trip through JSON."""
+
+    def test_unchanged_sections_are_not_emitted(self):
+        previous = _state(1)
+        current = _state(2)
+
+        ops = diff_state(previous, current)
+        paths = [op["path"] for op in ops]
+
+        assert ["metadata", "turn_count"] in paths
+        assert not any(path[0] in ("map", "current_state") for path in paths)
+
+    def test_round_trip_matches_current(self):
+        previous = _state(1)
+        current = _state(2, rooms={"1": "West of House", "2": "North of House"}, score=5)
+        current["knowledge_base"] = {"content": "new"}
+        del current["recent_log"]
+
+        ops = json.loads(json.dumps(diff_state(previous, current)))
+        rebuilt = apply_delta(json.loads(json.dumps(previous)), ops)
+
+        assert rebuilt == json.loads(json.dumps(current))
+
+    def test_integer_keys_use_json_paths(self):
+        previous = {"map": {1: "a"}}
+        current = {"map": {1: "b"}}
+
+        ops = diff_state(previous, current)
+
+        assert ops == [{"op": "set", "path": ["map", "1"], "value": "b"}]
+        assert apply_delta({"map": {"1": "a"}}, ops) == {"map": {"1": "b"}}
+
+
+class TestStateJournal:
+    """Keyframe cadence and turn reconstruction."""
+
+    def test_keyframe_interval(self, tmp_path):
+        journal = StateJournal(tmp_path / "journal.jsonl", keyframe_interval=3)
+        types = [journal.record(turn, _state(turn))["type"] for turn in range(1, 8)]
+
+        assert types == ["keyframe", "delta", "delta", "keyframe", "delta", "delta", "keyframe"]
+
+    def test_force_keyframe(self, tmp_path):
+        journal = StateJournal(tmp_path / "journal.jsonl", keyframe_interval=100)
+        journal.record(1, _state(1))
+
+        assert journal.record(2, _state(2), force_keyframe=True)["type"] == "keyframe"
+
+    def test_reconstruct_any_turn(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        journal = StateJournal(path, keyframe_interval=4)
+        states = {}
+        rooms = {"1": "West of House"}
+        for turn in range(1, 11):
+            rooms = dict(rooms, **{str(turn + 1): f"Room {turn}"}) if turn % 3 == 0 else rooms
+            states[turn] = _state(turn, rooms=rooms, score=turn)
+            journal.record(turn, states[turn])
+
+        records = read_journal(path)
+        for turn, expected in states.items():
+            assert reconstruct_state(records, turn) == expected
+        assert reconstruct_state(records) == states[10]
+
+    def test_later_mutation_does_not_leak_into_diff(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        journal = StateJournal(path, keyframe_interval=10)
+        state = _state(1)
+        journal.record(1, state)
+
+        # Managers hand over live dicts; mutating one must still produce a delta
+        state["map"]["rooms"]["2"] = "North of House"
+        state["metadata"]["turn_count"] = 2
+        journal.record(2, state)
+
+        assert reconstruct_state(read_journal(path))["map"]["rooms"]["2"] == "North of House"
+
+    def test_mutation_after_a_delta_is_still_diffed(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        journal = StateJournal(path, keyframe_interval=10)
+        state = _state(1)
+        journal.record(1, state)
+        state["map"]["rooms"] = {"1": "West of House", "2": "North of House"}
+        journal.record(2, state)
+
+        # The delta's value is the live rooms dict; the journal must not share it
+        state["map"]["rooms"]["3"] = "Forest"
+        record = journal.record(3, state)
+
+        assert record["ops"] == [{"op": "set", "path": ["map", "rooms"], "value": state["map"]["rooms"]}]
+        assert reconstruct_state(read_journal(path)) == state
+
+    def test_delta_is_smaller_than_keyframe(self, tmp_path):
+        journal = StateJournal(tmp_path / "journal.jsonl", keyframe_interval=10)
+        big_rooms = {str(i): f"Room {i} " * 20 for i in range(200)}
+        keyframe = journal.record(1, _state(1, rooms=big_rooms))
+        delta = journal.record(2, _state(2, rooms=big_rooms))
+
+        assert len(json.dumps(delta)) * 20 < len(json.dumps(keyframe))
+
+    def test_torn_final_line_is_ignored(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        journal = StateJournal(path)
+        journal.record(1, _state(1))
+        with open(path, "a") as f:
+            f.write('{"type": "delta", "tu')
+
+        assert len(read_journal(path)) == 1
+
+
+class TestEpisodeExportLog:
+    """Manifest bookkeeping keeps summary fields, not whole documents."""
+
+    def test_manifest_summarizes_first_and_last_snapshots(self):
+        log = EpisodeExportLog()
+        assert log.manifest("ep") is None
+
+        for turn in (1, 2, 3):
+            state = _state(turn, score=turn * 5)
+            state["current_state"]["death_count"] = turn - 1
+            log.track_snapshot(turn, state)
+
+        manifest = log.manifest("ep")
+        assert (manifest["start_time"], manifest["end_time"]) == ("t1", "t3")
+        assert (manifest["final_score"], manifest["death_count"]) == (15, 2)
+        assert (manifest["first_turn"], manifest["last_turn"], manifest["snapshot_count"]) == (1, 3, 3)
+        assert "map" not in log._last_state and "recent_log" not in log._first_state
+
+        log.reset()
+        assert log.manifest("ep") is None
+
+
+@pytest.fixture
+def delta_config(tmp_path):
+    return GameConfiguration(
+        max_turns_per_episode=100,
+        zork_game_workdir=str(tmp_path),
+        state_export_file=str(tmp_path / "current_state.json"),
+        state_export_mode="delta",
+        state_keyframe_interval=3,
+    )
+
+
+@pytest.fixture
+def delta_state_manager(delta_config):
+    game_state = GameState()
+    game_state.episode_id = "ep-delta"
+    return StateManager(
+        logger=Mock(spec=logging.Logger), config=delta_config, game_state=game_state
+    )
+
+
+class TestStateManagerDeltaExport:
+    """export_current_state in delta mode."""
+
+    def test_current_state_written_on_keyframes_only(self, delta_state_manager, delta_config, tmp_path):
+        current_state = tmp_path / "current_state.json"
+
+        delta_state_manager.game_state.turn_count = 1
+        assert delta_state_manager.export_current_state(map_data={"rooms": {}})
+        first_write = current_state.stat().st_mtime_ns
+
+        delta_state_manager.game_state.turn_count = 2
+        assert delta_state_manager.export_current_state(map_data={"rooms": {}})
+
+        assert current_state.stat().st_mtime_ns == first_write
+        records = read_journal(tmp_path / "episodes" / "ep-delta" / "state_journal.jsonl")
+        assert [r["type"] for r in records] == ["keyframe", "delta"]
+
+    def test_pipelined_exports_share_one_journal(self, delta_state_manager, tmp_path):
+        # Pipelined turns export through a shallow copy of the manager
+        for turn in (1, 2):
+            delta_state_manager.game_state.turn_count = turn
+            assert copy.copy(delta_state_manager).export_current_state()
+
+        records = read_journal(tmp_path / "episodes" / "ep-delta" / "state_journal.jsonl")
+        assert [r["type"] for r in records] == ["keyframe", "delta"]
+        assert delta_state_manager.get_status()["state_journal"] is not None
+
+    def test_final_export_forces_keyframe(self, delta_state_manager, tmp_path):
+        for turn in (1, 2):
+            delta_state_manager.game_state.turn_count = turn
+            delta_state_manager.export_current_state()
+        delta_state_manager.export_current_state(force_keyframe=True)
+
+        with open(tmp_path / "current_state.json") as f:
+            assert json.load(f)["metadata"]["turn_count"] == 2
+
+    def test_reset_episode_starts_new_journal(self, delta_state_manager, tmp_path):
+        delta_state_manager.game_state.turn_count = 1
+        delta_state_manager.export_current_state()
+
+        delta_state_manager.reset_episode()
+        delta_state_manager.game_state.episode_id = "ep-next"
+        delta_state_manager.export_current_state()
+
+        records = read_journal(tmp_path / "episodes" / "ep-next" / "state_journal.jsonl")
+        assert records[0]["type"] == "keyframe"
+
+    def test_s3_uploads_deltas_and_keyframes(self, delta_state_manager, delta_config):
+        delta_config.s3_bucket = "bucket"
+        delta_state_manager.s3_client = Mock()
+
+        for turn in (1, 2):
+            delta_state_manager.game_state.turn_count = turn
+            delta_state_manager.export_current_state()
+
+        prefix = delta_config.s3_key_prefix
+        keys = [c.kwargs["Key"] for c in delta_state_manager.s3_client.put_object.call_args_list]
+        assert keys == [
+            f"{prefix}current_state.json",
+            f"{prefix}snapshots/ep-delta/turn_1.json",
+            f"{prefix}snapshots/ep-delta/delta_2.json",
+        ]
+
+
+class TestEpisodeIndexWithDeltas:
+    """generate_episode_index rebuilds final stats from deltas."""
+
+    def _write_snapshots(self, episode_dir):
+        episode_dir.mkdir(parents=True)
+        journal = StateJournal(episode_dir / "state_journal.jsonl", keyframe_interval=3)
+        for turn in range(1, 6):
+            record = journal.record(turn, _state(turn, score=turn * 5))
+            name = f"turn_{turn}.json" if record["type"] == "keyframe" else f"delta_{turn}.json"
+            (episode_dir / name).write_text(
+                json.dumps(record["state"] if record["type"] == "keyframe" else record)
+            )
+
+    def test_snapshot_directory_with_deltas(self, tmp_path):
+        self._write_snapshots(tmp_path / "snapshots" / "ep1")
+
+        generator = EpisodeIndexGenerator(local_snapshots_dir=str(tmp_path / "snapshots"))
+        episode = generator.generate_index()["episodes"][0]
+
+        assert episode["last_turn"] == 5
+        assert episode["final_score"] == 25
+        assert episode["snapshot_count"] == 5
+
+    def test_journal_only_directory(self, tmp_path):
+        self._write_snapshots(tmp_path / "snapshots" / "ep1")
+        for snapshot in (tmp_path / "snapshots" / "ep1").glob("*.json"):
+            snapshot.unlink()
+
+        generator = EpisodeIndexGenerator(local_snapshots_dir=str(tmp_path / "snapshots"))
+        episode = generator.generate_index()["episodes"][0]
+
+        assert episode["total_turns"] == 5
+        assert episode["final_score"] == 25
@@ -0,0 +1,229 @@
+# ABOUTME: Tests for token counting and prompt section budgeting
+# ABOUTME: Covers tokenizers and their cache, truncation, ContextBudgeter priorities and the agent/objective budgets
+
+import builtins
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+
+from managers.context_manager import ContextManager
+from managers.objective_manager import ObjectiveManager
+from session.game_configuration import GameConfiguration
+from session.game_state import GameState
+from shared_utils import estimate_context_tokens
+from token_budget import (
+    TRUNCATION_MARKER,
+    CachedTokenizer,
+    ContextBudgeter,
+    ContextSection,
+    HeuristicTokenizer,
+    get_tokenizer,
+    truncate_to_tokens,
+)
+
+
+def _lines(n):
+    return "\n".join(f"line {i} with a few more words" for i in range(n))
+
+
+class TestTokenizers:
+    """Counting is pluggable and cached per string."""
+
+    def test_heuristic_charges_code_like_text_more_than_prose(self):
+        tokenizer = HeuristicTokenizer()
+
+        assert tokenizer.count("Hello world, this is a test.") == 8
+        # Mermaid punctuation and IDs cost more per character than prose (len // 4 == 9)
+        assert tokenizer.count('L180["West of House"] -->|north| L181') == 13
+
+    def test_cache_counts_each_string_once(self):
+        base = Mock(name="base")
+        base.name = "mock"
+        base.count.side_effect = lambda text: len(text)
+        tokenizer = CachedTokenizer(base, max_entries=2)
+
+        for text in ("a", "bb", "a", "ccc", "bb"):
+            tokenizer.count(text)
+
+        assert [call.args[0] for call in base.count.call_args_list] == ["a", "bb", "ccc", "bb"]
+        assert tokenizer.get_stats() == {"tokenizer": "mock", "entries": 2, "hits": 1, "misses": 4}
+
+    def test_unknown_tokenizer_is_rejected(self):
+        with pytest.raises(ValueError):
+            get_tokenizer("sentencepiece")
+
+    def test_tiktoken_counts_when_installed(self):
+        pytest.importorskip("tiktoken")
+        try:
+            tokenizer = get_tokenizer("tiktoken")
+        except Exception as e:
+            pytest.skip(f"tiktoken encoding unavailable: {e}")
+
+        assert tokenizer.count("hello world") == 2
+
+
+class TestTruncation:
+    """Truncated text stays within the limit and keeps the requested end."""
+
+    @pytest.mark.parametrize("keep", ["head", "tail"])
+    def test_truncates_at_line_boundaries(self, keep):
+        tokenizer = get_tokenizer("heuristic")
+
+        result = truncate_to_tokens(_lines(100), 60, tokenizer, keep=keep)
+
+        assert tokenizer.count(result) <= 60
+        assert TRUNCATION_MARKER in result
+        kept_line = "line 0 with" if keep == "head" else "line 99 with"
+        assert kept_line in result
+
+    def test_single_long_line_is_cut_by_characters(self):
+        tokenizer = get_tokenizer("heuristic")
+
+        result = truncate_to_tokens("word " * 500, 30, tokenizer)
+
+        assert result.startswith("word word")
+        assert tokenizer.count(result) <= 30
+
+    def test_fitting_text_is_unchanged(self):
+        assert truncate_to_tokens("short", 10, get_tokenizer("heuristic")) == "short"
+
+
+class TestContextBudgeter:
+    """Lowest-priority sections are shortened or dropped first; required ones never."""
+
+    def _sections(self):
+        return [
+            ContextSection("map", "x " * 400, priority=10),
+            ContextSection("reasoning", _lines(60), priority=30, truncate="tail", header="## Reasoning\n"),
+            ContextSection("exits", "AVAILABLE EXITS: north", priority=5, required=True),
+            ContextSection("game_response", "GAME RESPONSE: " + "y " * 300, required=True),
+        ]
+
+    def test_drops_then_truncates_by_priority(self):
+        budgeter = ContextBudgeter(500, tokenizer="heuristic")
+
+        kept, report = budgeter.fit(self._sections())
+
+        assert [s.name for s in kept] == ["reasoning", "exits", "game_response"]
+        assert report.dropped == ["map"]
+        assert report.truncated == ["reasoning"]
+        assert kept[0].render().startswith("## Reasoning\n\n" + TRUNCATION_MARKER)
+        assert "line 59" in kept[0].text
+        assert report.used_tokens <= 500
+        joined = "\n\n".join(s.render() for s in kept)
+        assert get_tokenizer("heuristic").count(joined) == report.used_tokens
+
+    def test_required_sections_survive_an_impossible_budget(self):
+        kept, report = ContextBudgeter(10, tokenizer="heuristic").fit(self._sections())
+
+        assert [s.name for s in kept] == ["exits", "game_response"]
+        assert report.used_tokens > report.budget
+
+    def test_caps_apply_without_a_budget(self):
+        kept, report = ContextBudgeter(0, {"reasoning": 50}, tokenizer="heuristic").fit(self._sections())
+
+        assert [s.name for s in kept] == ["map", "reasoning", "exits", "game_response"]
+        assert report.sections["reasoning"]["tokens"] <= 50
+        assert report.to_dict()["truncated"] == ["reasoning"]
+
+
+class TestAgentContextBudget:
+    """ContextManager fits the agent prompt (including the separate map) to the budget."""
+
+    def _manager(self, **config):
+        game_state = GameState()
+        game_state.action_reasoning_history = [
+            {"turn": turn, "reasoning": "thinking " * 40, "action": "north"} for turn in range(1, 4)
+        ]
+        config = GameConfiguration.from_toml().model_copy(update={"context_tokenizer": "heuristic", **config})
+        return ContextManager(Mock(spec=logging.Logger), config, game_state)
+
+    def _context(self):
+        return {
+            "current_map": "\n".join(f"    L{i} -->|north| L{i + 1}" for i in range(200)),
+            "available_exits": ["north"],
+            "current_location": "West of House",
+        }
+
+    def test_unbudgeted_prompt_keeps_everything(self):
+        manager = self._manager()
+
+        prompt = manager.get_formatted_agent_prompt_context(self._context(), "You see a door.")
+
+        assert "CURRENT WORLD MAP:" in prompt
+        assert "Turn 1:" in prompt
+        assert manager.get_status()["context_budget"] == {}
+
+    def test_budget_drops_map_before_recent_reasoning(self):
+        manager = self._manager(agent_context_token_budget=300)
+        context = self._context()
+
+        reference = manager.get_agent_reference_context(context, "You see a door.")
+        prompt = manager.get_formatted_agent_prompt_context(context, "You see a door.", include_map=False)
+
+        assert reference == ""
+        assert "Turn 3:" in prompt
+        assert prompt.endswith("GAME RESPONSE: You see a door.")
+        budget = manager.get_status()["context_budget"]
+        assert budget["dropped"] == ["map"]
+        assert budget["used_tokens"] <= 300
+
+    def test_map_cap_keeps_a_whole_map_or_none(self):
+        manager = self._manager(context_section_token_caps={"map": 20})
+
+        prompt = manager.get_formatted_agent_prompt_context(self._context())
+
+        assert "mermaid" not in prompt
+        assert "Turn 1:" in prompt
+
+
+class TestObjectiveContextBudget:
+    """Objective discovery sections are fitted with placeholders for dropped ones."""
+
+    def _manager(self, budget):
+        config = GameConfiguration.from_toml().model_copy(
+            update={"context_tokenizer": "heuristic", "objective_context_token_budget": budget}
+        )
+        return ObjectiveManager(Mock(spec=logging.Logger), config, GameState(), Mock())
+
+    def test_map_is_shortened_first_and_gameplay_kept(self):
+        manager = self._manager(200)
+
+        knowledge, memories, map_context, gameplay = manager._fit_objective_context(
+            "Know things.", "Memory near.", "L1 --> L2\n" * 200, "Turn 9: took lamp"
+        )
+
+        assert map_context.startswith("L1 --> L2") and map_context.endswith(TRUNCATION_MARKER)
+        assert (knowledge, memories, gameplay) == ("Know things.", "Memory near.", "Turn 9: took lamp")
+        assert manager.get_status()["context_budget"]["truncated"] == ["map"]
+
+    def test_dropped_sections_get_a_placeholder(self):
+        manager = self._manager(20)
+
+        knowledge, memories, map_context, gameplay = manager._fit_objective_context(
+            "Know " * 100, "Memory " * 100, "L1 --> L2\n" * 200, "Turn 9: took lamp"
+        )
+
+        assert map_context == knowledge == "(Omitted to fit the context budget)"
+        assert gameplay == "Turn 9: took lamp"
+
+
+class TestEstimateContextTokens:
+    """The knowledge base is re-read only when it changes on disk."""
+
+    def test_knowledge_base_count_is_cached_until_modified(self, tmp_path):
+        kb = tmp_path / "knowledgebase.md"
+        kb.write_text("Bring a lamp.", encoding="utf-8")
+        real_open = builtins.open
+
+        with patch("builtins.open", side_effect=real_open) as opened:
+            first = estimate_context_tokens(knowledge_base_path=str(kb))
+            assert estimate_context_tokens(knowledge_base_path=str(kb)) == first
+            assert opened.call_count == 1
+
+            kb.write_text("Bring a lamp. Avoid the troll in the cellar.", encoding="utf-8")
+            assert estimate_context_tokens(knowledge_base_path=str(kb)) > first
+            assert opened.call_count == 2
+
+        assert estimate_context_tokens(knowledge_base_path=str(tmp_path / "missing.md")) == 0
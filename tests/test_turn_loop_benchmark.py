@@ -0,0 +1,26 @@
+# ABOUTME: Budget test for the offline turn-loop benchmark (LLM calls replayed from a cassette)
+# ABOUTME: Fails when the non-LLM hot path of a turn gets drastically slower
+
+from benchmark_turn_loop import run_benchmark
+
+TURNS = 25
+
+# Generous ceilings: a turn currently costs a few tens of milliseconds of CPU
+# on a laptop. These catch order-of-magnitude regressions, not noise.
+MAX_LOOP_CPU_MS_PER_TURN = 250.0
+MIN_TURNS_PER_SEC = 2.0
+
+
+class TestTurnLoopBenchmark:
+    """A replayed walkthrough episode stays within the per-turn CPU budget."""
+
+    def test_replayed_episode_within_budget(self, tmp_path):
+        report = run_benchmark(turns=TURNS, workdir=str(tmp_path))
+
+        assert report["turns"] == TURNS
+        # Every agent turn came from the cassette, in walkthrough order
+        assert report["cassette"]["sequence_hits"] >= TURNS
+        assert report["score"] > 0
+        assert report["phases"]["game_engine"]["calls"] >= TURNS
+        assert report["loop_cpu_ms_per_turn"] < MAX_LOOP_CPU_MS_PER_TURN, report["phases"]
+        assert report["turns_per_sec"] > MIN_TURNS_PER_SEC
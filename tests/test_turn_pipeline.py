@@ -0,0 +1,201 @@
+"""
+Tests for pipelined turn execution.
+
+Covers the TurnPipeline executor (inline fallback, ordering, barriers, failure
+isolation) and the orchestrator's snapshot binding for background jobs.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock, patch
+
+from orchestration.turn_pipeline import TurnPipeline
+from orchestration.zork_orchestrator_v2 import ZorkOrchestratorV2
+
+
+class TestTurnPipelineInline:
+    """Disabled pipeline must behave exactly like direct calls."""
+
+    def test_inline_job_runs_immediately(self):
+        pipeline = TurnPipeline(enabled=False)
+        calls = []
+
+        future = pipeline.submit("job", calls.append, "ran")
+
+        assert calls == ["ran"]
+        assert future.done()
+        assert not pipeline.has_pending()
+
+    def test_inline_job_exception_propagates(self):
+        pipeline = TurnPipeline(enabled=False)
+
+        def boom():
+            raise ValueError("inline failure")
+
+        with pytest.raises(ValueError, match="inline failure"):
+            pipeline.submit("job", boom)
+
+    def test_inline_barrier_is_noop(self):
+        pipeline = TurnPipeline(enabled=False)
+        pipeline.submit("job", lambda: None)
+        pipeline.barrier("test")
+
+        assert pipeline.get_status()["barrier_count"] == 0
+
+
+class TestTurnPipelineBackground:
+    """Enabled pipeline runs jobs on a single ordered worker."""
+
+    def test_jobs_run_in_submission_order(self):
+        pipeline = TurnPipeline(enabled=True)
+        order = []
+
+        for i in range(10):
+            pipeline.submit(f"job-{i}", order.append, i)
+        pipeline.barrier("test")
+
+        assert order == list(range(10))
+        pipeline.shutdown()
+
+    def test_barrier_waits_for_pending_jobs(self):
+        pipeline = TurnPipeline(enabled=True)
+        release = threading.Event()
+        finished = []
+
+        def slow_job():
+            release.wait(timeout=5)
+            finished.append(True)
+
+        pipeline.submit("slow", slow_job)
+        assert pipeline.has_pending()
+
+        release.set()
+        pipeline.barrier("test")
+
+        assert finished == [True]
+        assert not pipeline.has_pending()
+        assert pipeline.get_status()["barrier_count"] == 1
+        pipeline.shutdown()
+
+    def test_job_failure_is_logged_not_raised(self):
+        logger = Mock()
+        pipeline = TurnPipeline(enabled=True, logger=logger)
+
+        def boom():
+            raise RuntimeError("background failure")
+
+        pipeline.submit("failing", boom)
+        pipeline.submit("after", lambda: None)
+        pipeline.barrier("test")
+
+        status = pipeline.get_status()
+        assert status["jobs_failed"] == 1
+        assert status["jobs_submitted"] == 2
+        logger.error.assert_called_once()
+        assert logger.error.call_args.kwargs["extra"]["job"] == "failing"
+        pipeline.shutdown()
+
+    def test_on_complete_runs_at_barrier_on_caller_thread(self):
+        pipeline = TurnPipeline(enabled=True, logger=Mock())
+        applied = []
+
+        pipeline.submit(
+            "job",
+            lambda: threading.current_thread().name,
+            on_complete=lambda worker: applied.append((worker, threading.current_thread().name)),
+        )
+        pipeline.submit("failing", Mock(side_effect=RuntimeError("boom")), on_complete=applied.append)
+        pipeline.barrier("test")
+
+        [(worker, caller)] = applied
+        assert worker.startswith("zorkgpt-turn-pipeline")
+        assert caller == threading.current_thread().name
+        pipeline.shutdown()
+
+
+class _TurnRecorder:
+    """Minimal manager stand-in that records the turn it sees."""
+
+    def __init__(self, game_state, gate: threading.Event):
+        self.game_state = game_state
+        self.gate = gate
+        self.seen = []
+
+    def record(self, label: str) -> None:
+        self.gate.wait(timeout=5)
+        self.seen.append((label, self.game_state.turn_count))
+
+    def update_objectives(self) -> None:
+        self.gate.wait(timeout=5)
+        self.game_state.discovered_objectives = ["open window"]
+        self.game_state.objective_update_turn = self.game_state.turn_count
+        self.last_update_turn = self.game_state.turn_count
+
+
+class TestOrchestratorPipelining:
+    """Orchestrator binds background jobs to a GameState snapshot."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        with patch("orchestration.zork_orchestrator_v2.JerichoInterface"):
+            return ZorkOrchestratorV2(episode_id="test_turn_pipeline")
+
+    def test_pipelining_disabled_by_default(self, orchestrator):
+        assert orchestrator.turn_pipeline.enabled is False
+        assert "turn_pipeline" in orchestrator.get_orchestrator_status()
+
+    def test_disabled_mode_calls_live_manager(self, orchestrator):
+        gate = threading.Event()
+        gate.set()
+        recorder = _TurnRecorder(orchestrator.game_state, gate)
+        orchestrator.game_state.turn_count = 4
+
+        orchestrator._submit_post_action_work("record", recorder, "record", label="a")
+
+        assert recorder.seen == [("a", 4)]
+
+    def test_background_job_sees_submission_turn(self, orchestrator):
+        orchestrator.turn_pipeline = TurnPipeline(enabled=True, logger=Mock())
+        gate = threading.Event()
+        recorder = _TurnRecorder(orchestrator.game_state, gate)
+        orchestrator.game_state.turn_count = 7
+        orchestrator.game_state.action_reasoning_history.append({"turn": 7})
+
+        orchestrator._submit_post_action_work("record", recorder, "record", label="a")
+
+        # Main thread moves on to the next turn while the job is still blocked
+        orchestrator.game_state.turn_count = 8
+        orchestrator.game_state.action_reasoning_history.append({"turn": 8})
+        gate.set()
+        orchestrator.turn_pipeline.barrier("test")
+
+        assert recorder.seen == [("a", 7)]
+        orchestrator.turn_pipeline.shutdown()
+
+    def test_snapshot_shares_objective_lists(self, orchestrator):
+        orchestrator.game_state.discovered_objectives.append("find lamp")
+        snapshot = orchestrator._snapshot_game_state()
+
+        snapshot.discovered_objectives.remove("find lamp")
+        snapshot.action_history.append(Mock())
+
+        assert orchestrator.game_state.discovered_objectives == []
+        assert orchestrator.game_state.action_history == []
+
+    def test_background_job_rebinds_are_applied_at_barrier(self, orchestrator):
+        orchestrator.turn_pipeline = TurnPipeline(enabled=True, logger=Mock())
+        gate = threading.Event()
+        recorder = _TurnRecorder(orchestrator.game_state, gate)
+        orchestrator.game_state.turn_count = 7
+
+        orchestrator._submit_post_action_work("objectives", recorder, "update_objectives")
+        orchestrator.game_state.turn_count = 8
+        gate.set()
+        orchestrator.turn_pipeline.barrier("test")
+
+        assert orchestrator.game_state.discovered_objectives == ["open window"]
+        assert orchestrator.game_state.objective_update_turn == 7
+        assert orchestrator.game_state.turn_count == 8
+        assert recorder.last_update_turn == 7
+        assert recorder.game_state is orchestrator.game_state
+        orchestrator.turn_pipeline.shutdown()
@@ -0,0 +1,144 @@
+# ABOUTME: Tests for per-phase turn timing: rolling latency histograms, no-op mode and exports
+# ABOUTME: Covers percentiles, the method decorator, Prometheus text and the status/state-export/file surfaces
+
+import json
+import logging
+import threading
+from unittest.mock import Mock
+
+from benchmark_turn_loop import run_benchmark
+from managers.state_manager import StateManager
+from orchestration.turn_timing import LatencyHistogram, TurnTimer, timed_phase
+from session.game_configuration import GameConfiguration
+from session.game_state import GameState
+
+
+class TestLatencyHistogram:
+    """Percentiles cover a rolling window; count and total cover the whole run."""
+
+    def test_nearest_rank_quantiles(self):
+        histogram = LatencyHistogram(window=100)
+        for ms in range(1, 101):
+            histogram.add(ms / 1000)
+
+        assert histogram.quantiles() == {0.5: 0.05, 0.95: 0.095, 0.99: 0.099}
+
+    def test_window_rolls_but_totals_accumulate(self):
+        histogram = LatencyHistogram(window=2)
+        for seconds in (10.0, 1.0, 2.0):
+            histogram.add(seconds)
+
+        assert list(histogram.samples) == [1.0, 2.0]
+        assert (histogram.count, histogram.total, histogram.max) == (3, 13.0, 10.0)
+        assert histogram.quantiles()[0.99] == 2.0
+
+
+class TestTurnTimer:
+    """Phases feed per-name histograms; a disabled timer records nothing."""
+
+    def test_phase_and_timed_record_samples(self):
+        timer = TurnTimer(enabled=True)
+
+        with timer.phase("agent"):
+            pass
+        assert timer.timed("memory_synthesis", lambda x: x * 2)(21) == 42
+
+        phases = timer.get_summary()["phases"]
+        assert phases["agent"]["count"] == 1
+        assert phases["memory_synthesis"]["count"] == 1
+        assert set(phases["agent"]) == {
+            "count", "total_s", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"
+        }
+
+    def test_failed_phase_is_still_recorded(self):
+        timer = TurnTimer(enabled=True)
+
+        try:
+            with timer.phase("critic"):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+
+        assert timer.get_summary()["phases"]["critic"]["count"] == 1
+
+    def test_disabled_timer_is_a_no_op(self):
+        timer = TurnTimer(enabled=False)
+
+        def job():
+            return "done"
+
+        assert timer.timed("state_export", job) is job
+        assert timer.phase("agent") is timer.phase("critic")
+        with timer.phase("agent"):
+            pass
+        assert timer.get_summary() == {"enabled": False, "window": 512, "phases": {}}
+
+    def test_decorator_uses_instance_timer(self):
+        class Orchestrator:
+            def __init__(self):
+                self.turn_timer = TurnTimer(enabled=True)
+
+            @timed_phase("periodic_updates")
+            def _check_periodic_updates(self, value):
+                return value
+
+        orchestrator = Orchestrator()
+
+        assert orchestrator._check_periodic_updates(7) == 7
+        assert orchestrator.turn_timer.get_summary()["phases"]["periodic_updates"]["count"] == 1
+
+    def test_threads_record_concurrently(self):
+        timer = TurnTimer(enabled=True)
+
+        def work():
+            for _ in range(200):
+                timer.record("memory_synthesis", 0.001)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert timer.get_summary()["phases"]["memory_synthesis"]["count"] == 800
+
+    def test_prometheus_text(self):
+        timer = TurnTimer(enabled=True, window=10)
+        timer.record("agent", 0.5)
+        timer.record("agent", 1.5)
+
+        text = timer.render_prometheus({"episode_id": 'ep"1'})
+
+        assert "# TYPE zorkgpt_turn_phase_seconds summary" in text
+        assert 'zorkgpt_turn_phase_seconds{episode_id="ep\\"1",phase="agent",quantile="0.5"} 0.500000' in text
+        assert 'zorkgpt_turn_phase_seconds_sum{episode_id="ep\\"1",phase="agent"} 2.000000' in text
+        assert 'zorkgpt_turn_phase_seconds_count{episode_id="ep\\"1",phase="agent"} 2' in text
+        assert text.endswith("\n")
+
+
+class TestTimingExports:
+    """Timing reaches the state export and the Prometheus file during a real episode."""
+
+    def test_state_export_includes_timing_section(self, tmp_path):
+        config = GameConfiguration(max_turns_per_episode=100, zork_game_workdir=str(tmp_path))
+        manager = StateManager(logger=Mock(spec=logging.Logger), config=config, game_state=GameState())
+        timing = TurnTimer(enabled=True)
+        timing.record("agent", 0.25)
+
+        state = manager.get_current_state(timing_data=timing.get_summary())
+
+        assert state["turn_timing"]["phases"]["agent"]["p50_ms"] == 250.0
+        assert "turn_timing" not in manager.get_current_state()
+
+    def test_replayed_episode_exports_turn_timing(self, tmp_path):
+        config = GameConfiguration.from_toml().model_copy(
+            update={"enable_turn_timing": True, "turn_timing_prometheus_file": "turn_timing.prom"}
+        )
+
+        run_benchmark(turns=5, workdir=str(tmp_path), config=config)
+
+        prom = (tmp_path / "turn_timing.prom").read_text()
+        for phase in ("turn", "agent", "critic", "valid_exits", "extraction", "memory_synthesis"):
+            assert f'phase="{phase}"' in prom
+        state = json.loads((tmp_path / "episodes" / "benchmark" / "current_state.json").read_text())
+        assert state["turn_timing"]["phases"]["agent"]["count"] >= 4
@@ -0,0 +1,173 @@
+"""
+Tests for WorldSnapshot, the per-step object-tree index.
+
+Unit tests use lightweight stand-ins for Jericho ZObjects; integration tests
+run against the real Zork I ROM to check the snapshot agrees with Jericho and
+is invalidated by send_command/restore_state.
+"""
+
+import pytest
+from dataclasses import dataclass, field
+from typing import List
+from unittest.mock import Mock
+
+from game_interface.core.jericho_interface import JerichoInterface
+from game_interface.core.world_snapshot import WorldSnapshot
+from zork_critic import ZorkCritic
+
+
+@dataclass
+class FakeObj:
+    num: int
+    name: str
+    parent: int
+    sibling: int = 0
+    child: int = 0
+    attrs: List[str] = field(default_factory=list)
+
+
+def _attrs(obj):
+    return {"transparent": "transparent" in obj.attrs}
+
+
+@pytest.fixture
+def snapshot():
+    # Room 10 holds the player (1), a bottle (2, transparent) and a table (3).
+    # The bottle holds water (4); the closed box (5) in inventory holds a coin (6).
+    objects = [
+        FakeObj(0, "", 0),
+        FakeObj(1, "cretin", 10, sibling=2, child=5),
+        FakeObj(2, "glass bottle", 10, sibling=3, child=4, attrs=["transparent"]),
+        FakeObj(3, "table", 10),
+        FakeObj(4, "quantity of water", 2),
+        FakeObj(5, "wooden box", 1, child=6),
+        FakeObj(6, "gold coin", 5),
+        FakeObj(10, "Kitchen", 0, child=1),
+    ]
+    return WorldSnapshot(
+        objects=objects, location=objects[7], player=objects[1], attribute_fn=_attrs
+    )
+
+
+class TestWorldSnapshotIndex:
+    """Lookups served from the prebuilt indexes."""
+
+    def test_visible_objects_exclude_player(self, snapshot):
+        assert [o.name for o in snapshot.visible_objects()] == ["glass bottle", "table"]
+
+    def test_inventory_follows_sibling_chain(self, snapshot):
+        assert [o.name for o in snapshot.inventory()] == ["wooden box"]
+
+    def test_children_of(self, snapshot):
+        assert [o.name for o in snapshot.children_of(2)] == ["quantity of water"]
+        assert snapshot.children_of(999) == []
+
+    def test_find_by_name_is_case_insensitive(self, snapshot):
+        assert [o.num for o in snapshot.find_by_name("Gold Coin")] == [6]
+
+    def test_accessible_includes_transparent_contents_only(self, snapshot):
+        names = {o.name for o in snapshot.accessible_objects()}
+
+        assert "quantity of water" in names  # inside transparent bottle
+        assert "gold coin" not in names  # inside closed box
+        assert snapshot.is_accessible(4)
+        assert not snapshot.is_accessible(6)
+
+    def test_attributes_are_memoized(self, snapshot):
+        calls = []
+
+        def counting_attrs(obj):
+            calls.append(obj.num)
+            return {}
+
+        snapshot._attribute_fn = counting_attrs
+        snapshot.attributes_of(snapshot.get_object(3))
+        snapshot.attributes_of(snapshot.get_object(3))
+
+        assert calls == [3]
+
+
+class TestJerichoWorldSnapshot:
+    """Snapshot lifecycle inside JerichoInterface on the real Zork I ROM."""
+
+    @pytest.fixture
+    def jericho_interface(self):
+        interface = JerichoInterface(game_file_path="jericho-game-suite/zork1.z5")
+        interface.start()
+        yield interface
+        interface.close()
+
+    def test_snapshot_reused_until_state_changes(self, jericho_interface):
+        first = jericho_interface.get_world_snapshot()
+        assert jericho_interface.get_world_snapshot() is first
+
+        jericho_interface.send_command("open mailbox")
+        assert jericho_interface.get_world_snapshot() is not first
+
+    def test_restore_state_invalidates_snapshot(self, jericho_interface):
+        state = jericho_interface.save_state()
+        jericho_interface.send_command("north")
+        moved = jericho_interface.get_world_snapshot()
+
+        jericho_interface.restore_state(state)
+
+        assert jericho_interface.get_world_snapshot() is not moved
+        assert jericho_interface.get_world_snapshot().location_id != moved.location_id
+
+    def test_matches_jericho_inventory_and_location(self, jericho_interface):
+        jericho_interface.send_command("open mailbox")
+        jericho_interface.send_command("take leaflet")
+
+        snapshot = jericho_interface.get_world_snapshot()
+
+        assert [o.num for o in snapshot.inventory()] == [
+            o.num for o in jericho_interface.env.get_inventory()
+        ]
+        location = jericho_interface.env.get_player_location()
+        expected_visible = [
+            o.num for o in jericho_interface.env.get_world_objects()
+            if o.parent == location.num and o.num != snapshot.player_id
+        ]
+        assert [o.num for o in snapshot.visible_objects()] == expected_visible
+
+    def test_open_mailbox_contents_become_accessible(self, jericho_interface):
+        snapshot = jericho_interface.get_world_snapshot()
+        leaflet = snapshot.find_by_name("leaflet")[0]
+
+        jericho_interface.send_command("open mailbox")
+
+        assert jericho_interface.get_world_snapshot().is_accessible(leaflet.num)
+
+    def test_critic_take_validation_uses_accessible_objects(self, jericho_interface, test_config):
+        critic = ZorkCritic(config=test_config, client=Mock())
+
+        assert critic.validate_against_object_tree("take leaflet", jericho_interface).valid
+        rejected = critic.validate_against_object_tree("take leaflet, lamp", jericho_interface)
+        assert not rejected.valid
+        assert "'lamp'" in rejected.reason
+
+    def test_critic_take_validation_reaches_into_containers(self, jericho_interface, test_config):
+        critic = ZorkCritic(config=test_config, client=Mock())
+        for command in ("north", "east", "open window", "west"):
+            jericho_interface.send_command(command)
+
+        # Kitchen: garlic is in the sack on the table, water in the bottle
+        for action in ("take garlic", "take water", "take lunch from sack"):
+            assert critic.validate_against_object_tree(action, jericho_interface).valid, action
+        rejected = critic.validate_against_object_tree("take garlic, sword", jericho_interface)
+        assert not rejected.valid
+        assert "'sword'" in rejected.reason
+
+        # Contents of a held container stay reachable in the next room
+        jericho_interface.send_command("take sack")
+        jericho_interface.send_command("west")
+        assert critic.validate_against_object_tree("take lunch", jericho_interface).valid
+        assert not critic.validate_against_object_tree("take water", jericho_interface).valid
+
+    def test_exit_probe_keeps_snapshot_valid(self, jericho_interface):
+        snapshot = jericho_interface.get_world_snapshot()
+        jericho_interface.get_valid_exits()
+
+        # Probing restores the original state, so the index still describes it
+        assert jericho_interface.get_world_snapshot() is snapshot
+        assert jericho_interface.env.get_player_location().num == snapshot.location_id
@@ -0,0 +1,167 @@
+"""
+Tests for the zork_cli daemon mode.
+
+The daemon runs in a background thread with the session directory redirected
+to tmp_path; requests go through the same Unix-socket client the CLI uses, so
+these run the real Zork I ROM end to end.
+"""
+
+import json
+import pickle
+import socket
+import threading
+import time
+
+import pytest
+
+import zork_cli
+
+
+@pytest.fixture
+def session_dir(tmp_path, monkeypatch):
+    session = tmp_path / ".session"
+    monkeypatch.setattr(zork_cli, "SESSION_DIR", session)
+    monkeypatch.setattr(zork_cli, "STATE_FILE", session / "game_state.pkl")
+    monkeypatch.setattr(zork_cli, "SESSION_FILE", session / "session.json")
+    monkeypatch.setattr(zork_cli, "MAP_FILE", session / "map_state.json")
+    monkeypatch.setattr(zork_cli, "EXIT_ORACLE_FILE", session / "exit_oracle.json")
+    monkeypatch.setattr(zork_cli, "CHECKPOINT_DIR", session / "checkpoints")
+    monkeypatch.setattr(zork_cli, "NARRATIVE_LOG", session / "narrative.log")
+    return session
+
+
+@pytest.fixture
+def daemon(session_dir, tmp_path):
+    """Start a daemon that only writes to disk on demand; yields a request function."""
+    socket_path = tmp_path / "daemon.sock"
+    thread = threading.Thread(target=zork_cli._serve, args=(socket_path, 0), daemon=True)
+    thread.start()
+    while zork_cli._send_to_daemon(["flush"], socket_path) is None:
+        time.sleep(0.01)
+
+    def request(*argv):
+        reply = zork_cli._send_to_daemon(list(argv), socket_path)
+        assert reply["exit_code"] == 0, reply
+        return json.loads(reply["stdout"])
+
+    request.thread = thread
+    yield request
+
+    if thread.is_alive():
+        zork_cli._send_to_daemon(["daemon-stop"], socket_path)
+    thread.join(timeout=10)
+    assert not socket_path.exists()
+
+
+def _saved_turn(session_dir):
+    with open(session_dir / "session.json") as f:
+        return json.load(f)["turn"]
+
+
+class TestDaemonSession:
+    """Commands share one live engine and reach disk lazily."""
+
+    def test_commands_run_against_the_live_session(self, daemon):
+        daemon("start-game")
+
+        moved = daemon("send-command", "north")
+        state = daemon("get-state")
+
+        assert moved["moved"] and moved["turn"] == 1
+        assert state["location_name"] == moved["location_name"]
+        assert state["turn"] == 1
+
+    def test_state_is_written_only_on_flush(self, daemon, session_dir):
+        daemon("start-game")
+        daemon("send-command", "north")
+        daemon("send-command", "east")
+        assert _saved_turn(session_dir) == 0
+
+        assert daemon("flush")["flushed"]
+        assert _saved_turn(session_dir) == 2
+
+    def test_checkpoints_include_unflushed_turns(self, daemon, session_dir):
+        daemon("start-game")
+        daemon("save-checkpoint", "start")
+        daemon("send-command", "north")
+        daemon("save-checkpoint", "north")
+        daemon("send-command", "south")
+
+        restored = daemon("restore-checkpoint", "north")
+        state = daemon("get-state")
+
+        assert restored["turn"] == 1
+        assert state["location_name"] == restored["location_name"]
+        with open(session_dir / "checkpoints" / "north" / "game_state.pkl", "rb") as f:
+            assert pickle.load(f)
+
+    def test_stop_flushes_the_session(self, daemon, session_dir):
+        daemon("start-game")
+        daemon("send-command", "north")
+
+        assert daemon("daemon-stop")["stopped"]
+        daemon.thread.join(timeout=10)
+
+        assert _saved_turn(session_dir) == 1
+        assert zork_cli._live is None
+
+    def test_errors_are_returned_to_the_client(self, daemon, tmp_path):
+        reply = zork_cli._send_to_daemon(["send-command", "look"], tmp_path / "daemon.sock")
+
+        assert reply["exit_code"] == 1
+        assert "No active game session" in json.loads(reply["stdout"])["error"]
+
+
+class TestDaemonConnections:
+    """A bad or silent client is dropped without taking the session down."""
+
+    def test_malformed_request_gets_an_error_reply(self, daemon, tmp_path):
+        daemon("start-game")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(tmp_path / "daemon.sock"))
+            sock.sendall(b"not json\n")
+            reply = json.loads(sock.makefile("rb").readline())
+
+        assert reply["exit_code"] == 1
+        assert json.loads(reply["stdout"])["error"] == "Malformed daemon request"
+        assert daemon("get-state")["turn"] == 0
+
+    def test_client_hanging_up_before_the_reply(self, daemon, tmp_path):
+        daemon("start-game")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(tmp_path / "daemon.sock"))
+            sock.sendall(json.dumps({"argv": ["send-command", "north"]}).encode() + b"\n")
+
+        assert daemon("get-state")["turn"] == 1
+
+    def test_silent_client_times_out(self, daemon, tmp_path, monkeypatch):
+        monkeypatch.setattr(zork_cli, "DAEMON_CONNECTION_TIMEOUT", 0.1)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as silent:
+            silent.connect(str(tmp_path / "daemon.sock"))
+
+            assert daemon("flush")["flushed"]
+
+
+def test_client_returns_none_without_a_daemon(tmp_path):
+    assert zork_cli._send_to_daemon(["get-state"], tmp_path / "missing.sock") is None
+
+
+def test_missing_reply_is_an_error_not_a_fallback(tmp_path):
+    socket_path = tmp_path / "dying.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen()
+
+    def accept_and_die():
+        conn, _ = server.accept()
+        conn.makefile("rb").readline()
+        conn.close()
+
+    thread = threading.Thread(target=accept_and_die, daemon=True)
+    thread.start()
+    reply = zork_cli._send_to_daemon(["send-command", "north"], socket_path)
+    thread.join(timeout=5)
+    server.close()
+
+    assert reply["exit_code"] == 1
+    assert "without replying" in json.loads(reply["stdout"])["error"]
@@ -0,0 +1,391 @@
+"""
+Token counting and prompt section budgeting.
+
+Tokenizers:
+- "tiktoken": exact BPE counts from the tiktoken package (optional
+  dependency; its encoding tables are cached locally after the first load)
+- "heuristic": offline approximation of BPE splitting (letters, digit groups,
+  punctuation runs, whitespace runs), much closer than len(text) // 4 for
+  code-like prompt content such as Mermaid maps and JSON
+- "auto": tiktoken when it is installed and its tables load, else heuristic
+
+Every tokenizer returned by get_tokenizer() is wrapped in a CachedTokenizer,
+which memoizes counts per string hash: most prompt sections (knowledge base,
+memories, map) are identical from one call to the next.
+
+ContextBudgeter fits a list of named prompt sections into a token budget.
+Each section has a priority, an optional per-section cap and a truncation
+side. Sections over their cap are truncated first; then, while the total is
+over budget, the lowest-priority section is truncated to the remaining room
+or dropped. Required sections are never touched. The BudgetReport records
+what was kept, truncated and dropped so callers can log and expose it.
+"""
+
+import math
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+TOKENIZERS = ("auto", "tiktoken", "heuristic")
+
+TIKTOKEN_ENCODING = "o200k_base"
+
+TRUNCATION_MARKER = "[... truncated to fit context budget]"
+
+_PIECE_PATTERN = re.compile(r"[^\W\d_]+|\d+|\s+|[^\w\s]+|_+")
+
+
+class HeuristicTokenizer:
+    """
+    Dependency-free approximation of a BPE tokenizer.
+
+    Splits text into letter runs, digit runs, punctuation runs and whitespace
+    runs, and charges each piece the way common BPE vocabularies tend to:
+    about one token per 5 letters, per 3 digits and per 2 punctuation marks,
+    and one token per whitespace run other than a single space (which BPE
+    merges into the following word).
+    """
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        tokens = 0
+        for piece in _PIECE_PATTERN.findall(text):
+            first = piece[0]
+            if first.isspace():
+                if piece != " ":
+                    tokens += 1
+            elif first.isdigit():
+                tokens += math.ceil(len(piece) / 3)
+            elif first.isalpha():
+                tokens += math.ceil(len(piece) / 5)
+            else:
+                tokens += math.ceil(len(piece) / 2)
+        return tokens
+
+
+class TiktokenTokenizer:
+    """Exact token counts from a tiktoken encoding."""
+
+    name = "tiktoken"
+
+    def __init__(self, encoding: str = TIKTOKEN_ENCODING):
+        if not TIKTOKEN_AVAILABLE:
+            raise ImportError("tiktoken is not installed")
+        self._encoding = tiktoken.get_encoding(encoding)
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+class CachedTokenizer:
+    """
+    LRU cache of token counts in front of a tokenizer, keyed by string hash.
+
+    Thread-safe: counts are requested from the turn pipeline worker as well
+    as the main loop.
+    """
+
+    def __init__(self, tokenizer, max_entries: int = 4096):
+        """
+        Initialize the cache.
+
+        Args:
+            tokenizer: Object with name and count(text) -> int
+            max_entries: Counts kept before the least recently used is evicted
+        """
+        self.tokenizer = tokenizer
+        self.name = tokenizer.name
+        self.max_entries = max_entries
+        self._counts: "OrderedDict[Tuple[int, int], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        key = (hash(text), len(text))
+        with self._lock:
+            tokens = self._counts.get(key)
+            if tokens is not None:
+                self._counts.move_to_end(key)
+                self.hits += 1
+                return tokens
+
+        tokens = self.tokenizer.count(text)
+        with self._lock:
+            self.misses += 1
+            self._counts[key] = tokens
+            if len(self._counts) > self.max_entries:
+                self._counts.popitem(last=False)
+        return tokens
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters for status reporting."""
+        with self._lock:
+            return {
+                "tokenizer": self.name,
+                "entries": len(self._counts),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_tokenizers: Dict[str, CachedTokenizer] = {}
+_tokenizers_lock = threading.Lock()
+
+
+def get_tokenizer(name: str = "auto") -> CachedTokenizer:
+    """
+    Get the shared cached tokenizer for a name.
+
+    Args:
+        name: One of TOKENIZERS
+
+    Returns:
+        CachedTokenizer (the heuristic one when "auto" cannot load tiktoken)
+
+    Raises:
+        ValueError: If name is unknown
+        ImportError: If name is "tiktoken" and tiktoken is not installed
+    """
+    if name not in TOKENIZERS:
+        raise ValueError(f"context_tokenizer must be one of {TOKENIZERS}, got {name!r}")
+
+    with _tokenizers_lock:
+        tokenizer = _tokenizers.get(name)
+        if tokenizer is None:
+            if name == "heuristic":
+                base = HeuristicTokenizer()
+            elif name == "tiktoken":
+                base = TiktokenTokenizer()
+            else:
+                try:
+                    base = TiktokenTokenizer()
+                except Exception:
+                    # Not installed, or its tables cannot be fetched offline
+                    base = HeuristicTokenizer()
+            tokenizer = _tokenizers[name] = CachedTokenizer(base)
+        return tokenizer
+
+
+def truncate_to_tokens(text: str, max_tokens: int, tokenizer, keep: str = "head") -> str:
+    """
+    Cut text down to at most max_tokens, at a line boundary where possible.
+
+    Args:
+        text: Text to shorten
+        max_tokens: Token limit for the result, marker included
+        tokenizer: Object with count(text) -> int
+        keep: "head" keeps the beginning, "tail" keeps the end
+
+    Returns:
+        The text unchanged if it fits, the kept part plus TRUNCATION_MARKER,
+        or "" if not even the marker fits
+    """
+    if tokenizer.count(text) <= max_tokens:
+        return text
+    lines = text.split("\n")
+    room = max_tokens - tokenizer.count(TRUNCATION_MARKER) - 1
+    while room > 0:
+        kept = _longest_fit(lines, room, tokenizer, keep, "\n")
+        if not kept:
+            # Not even one line fits: cut within the nearest line by characters
+            line = lines[0] if keep == "head" else lines[-1]
+            kept = _longest_fit(list(line), room, tokenizer, keep, "")
+        if not kept:
+            return ""
+
+        if keep == "head":
+            result = f"{kept}\n{TRUNCATION_MARKER}"
+        else:
+            result = f"{TRUNCATION_MARKER}\n{kept}"
+        # Tokens can merge across the join, so check the whole result
+        overshoot = tokenizer.count(result) - max_tokens
+        if overshoot <= 0:
+            return result
+        room -= overshoot
+    return ""
+
+
+def _longest_fit(parts: List[str], room: int, tokenizer, keep: str, joiner: str) -> str:
+    """Longest head or tail run of parts whose join fits in room tokens (binary search)."""
+
+    def take(n: int) -> str:
+        return joiner.join(parts[:n] if keep == "head" else parts[len(parts) - n:])
+
+    low, high = 0, len(parts)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if tokenizer.count(take(middle)) <= room:
+            low = middle
+        else:
+            high = middle - 1
+    return take(low) if low else ""
+
+
+@dataclass
+class ContextSection:
+    """
+    One named block of a prompt.
+
+    Attributes:
+        name: Section name used for caps and reporting (e.g., "map")
+        text: Section content
+        priority: Higher is kept longer when over budget
+        truncate: "head"/"tail" to keep that end when shortened, None to only
+            keep or drop the section whole
+        required: Never truncated or dropped
+        header: Title line kept above the content when it is truncated
+    """
+
+    name: str
+    text: str
+    priority: int = 50
+    truncate: Optional[str] = None
+    required: bool = False
+    header: str = ""
+
+    def render(self) -> str:
+        return f"{self.header}\n{self.text}" if self.header else self.text
+
+
+@dataclass
+class BudgetReport:
+    """What a ContextBudgeter did to fit one prompt."""
+
+    budget: int
+    used_tokens: int = 0
+    original_tokens: int = 0
+    sections: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def dropped(self) -> List[str]:
+        return [name for name, s in self.sections.items() if s["status"] == "dropped"]
+
+    @property
+    def truncated(self) -> List[str]:
+        return [name for name, s in self.sections.items() if s["status"] == "truncated"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "budget": self.budget,
+            "used_tokens": self.used_tokens,
+            "original_tokens": self.original_tokens,
+            "dropped": self.dropped,
+            "truncated": self.truncated,
+            "sections": {name: dict(s) for name, s in self.sections.items()},
+        }
+
+
+class ContextBudgeter:
+    """
+    Fits prompt sections into a token budget by priority.
+
+    Usage:
+        budgeter = ContextBudgeter(budget=6000, section_caps={"map": 1500})
+        sections, report = budgeter.fit(sections)
+    """
+
+    def __init__(
+        self,
+        budget: int,
+        section_caps: Optional[Dict[str, int]] = None,
+        tokenizer: str = "auto",
+        separator: str = "\n\n",
+    ):
+        """
+        Initialize the budgeter.
+
+        Args:
+            budget: Token budget for all sections together (0 = unlimited)
+            section_caps: Section name to token cap, applied before the budget
+            tokenizer: Tokenizer name for get_tokenizer()
+            separator: String the caller joins sections with (counted)
+        """
+        self.budget = budget
+        self.section_caps = dict(section_caps or {})
+        self.tokenizer = get_tokenizer(tokenizer)
+        self.separator = separator
+
+    def fit(self, sections: Sequence[ContextSection]) -> Tuple[List[ContextSection], BudgetReport]:
+        """
+        Apply caps and the budget.
+
+        Args:
+            sections: Sections in prompt order
+
+        Returns:
+            (kept sections in their original order, possibly truncated;
+            BudgetReport). Join section.render() with the separator.
+        """
+        report = BudgetReport(budget=self.budget)
+        fitted: List[Optional[ContextSection]] = []
+        tokens: List[int] = []
+
+        for section in sections:
+            original = self.tokenizer.count(section.render())
+            report.original_tokens += original
+            report.sections[section.name] = {
+                "priority": section.priority,
+                "original_tokens": original,
+                "tokens": original,
+                "status": "kept",
+            }
+            cap = self.section_caps.get(section.name)
+            if cap is not None and original > cap and not section.required:
+                section = self._shorten(section, cap, report)
+            fitted.append(section)
+            tokens.append(report.sections[section.name]["tokens"] if section else 0)
+
+        separator_tokens = self.tokenizer.count(self.separator)
+
+        def total() -> int:
+            present = [t for s, t in zip(fitted, tokens) if s is not None]
+            return sum(present) + separator_tokens * max(0, len(present) - 1)
+
+        if self.budget > 0:
+            # Lowest priority first; later sections first among equals
+            order = sorted(
+                (i for i, s in enumerate(fitted) if s is not None and not s.required),
+                key=lambda i: (fitted[i].priority, -i),
+            )
+            for index in order:
+                excess = total() - self.budget
+                if excess <= 0:
+                    break
+                shortened = self._shorten(fitted[index], tokens[index] - excess, report)
+                fitted[index] = shortened
+                tokens[index] = report.sections[shortened.name]["tokens"] if shortened else 0
+
+        kept = [s for s in fitted if s is not None]
+        report.used_tokens = total() if kept else 0
+        return kept, report
+
+    def _shorten(
+        self, section: ContextSection, max_tokens: int, report: BudgetReport
+    ) -> Optional[ContextSection]:
+        """Truncate a section to max_tokens if allowed, else drop it (None)."""
+        entry = report.sections[section.name]
+        text = ""
+        if section.header:
+            max_tokens -= self.tokenizer.count(f"{section.header}\n")
+        if section.truncate and max_tokens > 0:
+            text = truncate_to_tokens(section.text, max_tokens, self.tokenizer, keep=section.truncate)
+        if not text:
+            entry.update(tokens=0, status="dropped")
+            return None
+        shortened = replace(section, text=text)
+        entry.update(tokens=self.tokenizer.count(shortened.render()), status="truncated")
+        return shortened
@@ -8,9 +8,11 @@ from collections import Counter
 import os
 from pathlib import Path
 from pydantic import BaseModel, Field
+from episode_finalization import get_episode_finalizer
 from map_graph import MapGraph
 from hybrid_zork_extractor import ExtractorResponse
 from llm_client import LLMClientWrapper
+from prompt_cache import PromptBuilder
 from session.game_configuration import GameConfiguration
 from shared_utils import create_json_schema
 
@@ -44,6 +46,24 @@ class AgentResponse(BaseModel):
     )
 
 
+class AgentCandidatesResponse(BaseModel):
+    """Structured response when the agent proposes several ranked actions.
+
+    Used in candidate mode, where the critic scores all candidates in one
+    request instead of asking the agent again after each rejection.
+    """
+    thinking: str = Field(
+        description="Your reasoning - what you observe, plan, and why"
+    )
+    candidates: List[str] = Field(
+        description="Distinct single game commands, best first"
+    )
+    new_objective: Optional[str] = Field(
+        default=None,
+        description="Optional multi-step objective to track. Only set when starting a new multi-turn plan. Should reference specific locations (e.g., 'get lamp from L124')"
+    )
+
+
 class ZorkAgent:
     """
     Handles agent action generation and memory management for Zork gameplay.
@@ -109,14 +129,19 @@ class ZorkAgent:
         self._load_system_prompt()
 
     def _load_system_prompt(self) -> None:
-        """Load agent system prompt from markdown files and enhance with knowledge."""
+        """Load agent system prompt from markdown files and the knowledge base."""
         try:
             # Load base agent prompt
             with open("agent.md") as fh:
-                base_agent_prompt = fh.read()
+                self.system_prompt = fh.read()
 
-            # Try to enhance with knowledge base
-            self.system_prompt = self._enhance_prompt_with_knowledge(base_agent_prompt)
+            # Knowledge is sent as its own cached segment after the system prompt.
+            # While the previous episode is still being finalized it is loaded on
+            # first use, so episode startup is not held up by the knowledge update.
+            if get_episode_finalizer().has_pending():
+                self._knowledge_prompt = None
+            else:
+                self.knowledge_prompt = self._load_knowledge_section()
 
         except FileNotFoundError as e:
             if self.logger:
@@ -126,66 +151,68 @@ class ZorkAgent:
                 )
             raise
 
-    def _enhance_prompt_with_knowledge(self, base_prompt: str) -> str:
-        """Enhance the agent prompt with accumulated knowledge."""
+    @property
+    def knowledge_prompt(self) -> str:
+        """Knowledge base section of the prompt (loaded on first use if deferred)."""
+        if self._knowledge_prompt is None:
+            self._knowledge_prompt = self._load_knowledge_section()
+        return self._knowledge_prompt
+
+    @knowledge_prompt.setter
+    def knowledge_prompt(self, value: str) -> None:
+        self._knowledge_prompt = value
+
+    def _load_knowledge_section(self) -> str:
+        """Load accumulated knowledge as a strategic guide ("" if there is none).
+
+        Kept out of the system prompt so that reloading the knowledge base
+        does not invalidate the provider's cached copy of agent.md.
+        """
+        get_episode_finalizer().knowledge_barrier("agent_knowledge")
+
         knowledge_file = Path(self.config.zork_game_workdir) / self.config.knowledge_file
 
         if not os.path.exists(knowledge_file):
-            return base_prompt
+            return ""
 
         try:
             with open(knowledge_file, "r", encoding="utf-8") as f:
                 knowledge_content = f.read()
 
             # Strip map section from knowledge base (map is now passed dynamically in context)
-            import re
             pattern = r"## CURRENT WORLD MAP\s*\n\s*```mermaid\s*\n.*?\n```"
             knowledge_content = re.sub(pattern, "", knowledge_content, flags=re.DOTALL)
             knowledge_content = knowledge_content.strip()
 
-            # Insert strategic guide before the "Output Format" section
-            knowledge_section = f"""
-
-**STRATEGIC GUIDE FROM PREVIOUS EPISODES:**
+            knowledge_section = f"""**STRATEGIC GUIDE FROM PREVIOUS EPISODES:**
 
 The following strategic guide has been compiled from analyzing previous episodes. Use this guide to improve your performance, prioritize important items, navigate efficiently, and avoid known dangers:
 
 {knowledge_content}
 
-**END OF STRATEGIC GUIDE**
-
-"""
-
-            if "**Output Format" in base_prompt:
-                insertion_point = base_prompt.find("**Output Format")
-                enhanced_prompt = (
-                    base_prompt[:insertion_point]
-                    + knowledge_section
-                    + base_prompt[insertion_point:]
-                )
-            else:
-                enhanced_prompt = base_prompt + knowledge_section
+**END OF STRATEGIC GUIDE**"""
 
             # Log knowledge integration
             if self.logger:
                 self.logger.info(
-                    f"Enhanced prompt with knowledge base ({len(knowledge_content):,} characters)"
+                    f"Loaded knowledge base for agent prompt ({len(knowledge_content):,} characters)"
                 )
 
-            return enhanced_prompt
+            return knowledge_section
 
         except Exception as e:
             if self.logger:
                 self.logger.warning(
                     f"Could not load knowledge from {knowledge_file}: {e}"
                 )
-            return base_prompt
+            return ""
 
     @observe(name="agent-generate-action")
     def get_action_with_reasoning(
         self,
         game_state_text: str,
         relevant_memories: Optional[str] = None,
+        reference_context: Optional[str] = None,
     ) -> Dict[str, str]:
         """
         Gets an action from the Agent LM with reasoning preserved.
@@ -193,37 +220,12 @@ The following strategic guide has been compiled from analyzing previous episodes
         Args:
             game_state_text: Current game state text
             relevant_memories: Formatted string of relevant memories (includes reasoning history)
+            reference_context: Slow-changing context (e.g., the map) sent as its own cached message
 
         Returns:
             Dict with 'action' (cleaned) and 'reasoning' (raw thinking/reasoning)
         """
-        if "o1" in self.model:
-            # Use user prompt for o1 models with caching
-            messages = [
-                {
-                    "role": "user",
-                    "content": self.system_prompt,
-                    "cache_control": {"type": "ephemeral"},
-                }
-            ]
-        else:
-            messages = [
-                {
-                    "role": "system",
-                    "content": self.system_prompt,
-                    "cache_control": {"type": "ephemeral"},
-                }
-            ]
-
-        # Combine game state with relevant memories if available
-        user_content = game_state_text
-        if relevant_memories:
-            if user_content:
-                user_content = f"{user_content}\n\n{relevant_memories}"
-            else:
-                user_content = relevant_memories
-
-        messages.append({"role": "user", "content": user_content})
+        messages = self._build_messages(game_state_text, relevant_memories, reference_context)
 
         try:
             client_args = dict(
@@ -278,6 +280,120 @@ The following strategic guide has been compiled from analyzing previous episodes
                 "raw_response": None,
             }  # Default safe action on error
 
+    @observe(name="agent-generate-candidates")
+    def get_action_candidates(
+        self,
+        game_state_text: str,
+        relevant_memories: Optional[str] = None,
+        num_candidates: int = 3,
+        reference_context: Optional[str] = None,
+    ) -> Dict:
+        """
+        Gets several ranked candidate actions from the Agent LM in one call.
+
+        Args:
+            game_state_text: Current game state text
+            relevant_memories: Formatted string of relevant memories (includes reasoning history)
+            num_candidates: Maximum number of candidates to request
+            reference_context: Slow-changing context (e.g., the map) sent as its own cached message
+
+        Returns:
+            Dict with 'candidates' (cleaned, distinct, best first), 'action'
+            (the top candidate), 'reasoning', 'new_objective' and 'raw_response'
+        """
+        candidate_instruction = (
+            f"Propose up to {num_candidates} DISTINCT candidate actions in \"candidates\", "
+            f"best first. Each candidate must be a single game command; they are scored "
+            f"together and the best acceptable one is executed."
+        )
+        messages = self._build_messages(game_state_text, relevant_memories, reference_context)
+        messages[-1]["content"] = f"{messages[-1]['content']}\n\n{candidate_instruction}"
+
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                stop=None,
+                temperature=self.temperature,
+                top_p=self.top_p,
+                top_k=self.top_k,
+                min_p=self.min_p,
+                max_tokens=self.max_tokens,
+                name="Agent",
+                response_format=create_json_schema(AgentCandidatesResponse),
+            )
+            raw_response = response.content.strip()
+
+            try:
+                agent_response = AgentCandidatesResponse.model_validate_json(raw_response)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Failed to parse agent candidates response: {e}")
+                    self.logger.error(f"Raw response: {raw_response}")
+                agent_response = AgentCandidatesResponse(
+                    thinking="[Error parsing response]",
+                    candidates=["look"],
+                    new_objective=None
+                )
+
+            candidates = []
+            for candidate in agent_response.candidates:
+                cleaned = self._clean_action(candidate)
+                if cleaned not in candidates:
+                    candidates.append(cleaned)
+            candidates = candidates[:num_candidates] or ["look"]
+
+            return {
+                "action": candidates[0],
+                "candidates": candidates,
+                "reasoning": agent_response.thinking,
+                "new_objective": agent_response.new_objective,
+                "raw_response": raw_response,
+            }
+        except Exception as e:
+            if self.logger:
+                self.logger.error(
+                    f"Error getting agent candidates: {e}",
+                    extra={"episode_id": self.episode_id},
+                )
+            return {
+                "action": "look",
+                "candidates": ["look"],
+                "reasoning": None,
+                "new_objective": None,
+                "raw_response": None,
+            }  # Default safe action on error
+
+    def _build_messages(
+        self,
+        game_state_text: str,
+        relevant_memories: Optional[str],
+        reference_context: Optional[str] = None,
+    ) -> List[Dict]:
+        """Build the agent chat messages, ordered from most to least cacheable.
+
+        System prompt, knowledge base and reference context (map) each get a
+        cached message of their own; the turn context always comes last.
+        """
+        # Combine game state with relevant memories if available
+        user_content = game_state_text
+        if relevant_memories:
+            if user_content:
+                user_content = f"{user_content}\n\n{relevant_memories}"
+            else:
+                user_content = relevant_memories
+
+        messages = (
+            PromptBuilder(self.model)
+            .add("static", self.system_prompt)
+            .add("knowledge", self.knowledge_prompt)
+            .add("reference", reference_context)
+            .build()
+        )
+        # The turn message is always sent, even when empty
+        messages.append({"role": "user", "content": user_content})
+        return messages
+
     def _clean_action(self, action: str) -> str:
         """Clean and validate an action command from the agent.
 
@@ -312,7 +428,7 @@ The following strategic guide has been compiled from analyzing previous episodes
         self.episode_id = episode_id
 
     def reload_knowledge_base(self) -> bool:
-        """Reload the knowledge base from file and update the system prompt.
+        """Reload the system prompt and knowledge base from file.
 
         Returns:
             True if knowledge base was successfully reloaded, False otherwise
@@ -320,21 +436,16 @@ The following strategic guide has been compiled from analyzing previous episodes
         try:
             # Load base agent prompt
             with open("agent.md") as fh:
-                base_agent_prompt = fh.read()
-
-            # Re-enhance with current knowledge base
-            new_system_prompt = self._enhance_prompt_with_knowledge(base_agent_prompt)
+                self.system_prompt = fh.read()
 
-            # Update the system prompt
-            old_length = (
-                len(self.system_prompt) if hasattr(self, "system_prompt") else 0
-            )
-            self.system_prompt = new_system_prompt
-            new_length = len(self.system_prompt)
+            # Reload the knowledge section; the cached system prompt is unaffected
+            old_length = len(getattr(self, "_knowledge_prompt", None) or "")
+            self.knowledge_prompt = self._load_knowledge_section()
+            new_length = len(self.knowledge_prompt)
 
             if self.logger:
                 self.logger.info(
-                    f"Knowledge base reloaded successfully (prompt: {old_length} -> {new_length} chars)",
+                    f"Knowledge base reloaded successfully (knowledge: {old_length} -> {new_length} chars)",
                     extra={
                         "event_type": "knowledge_base_reloaded",
                         "episode_id": self.episode_id,
@@ -4,6 +4,12 @@
 Each invocation creates a JerichoInterface, loads persisted state from disk,
 executes the requested command, saves state back, and prints JSON to stdout.
 
+Optionally, `daemon` starts a long-lived server on a Unix socket that holds the
+live JerichoInterface, session and MapGraph in memory. While it runs, every
+other subcommand is forwarded to it, so a command costs a socket round-trip
+instead of an engine boot, and state is written to disk every --flush-every
+commands, on `flush`, before `save-checkpoint`, and on `daemon-stop`.
+
 Usage:
     uv run python zork_cli.py start-game
     uv run python zork_cli.py send-command "open mailbox"
@@ -12,18 +18,30 @@ Usage:
     uv run python zork_cli.py save-checkpoint "before-troll"
     uv run python zork_cli.py restore-checkpoint "before-troll"
     uv run python zork_cli.py get-map
+    uv run python zork_cli.py route 62
+    uv run python zork_cli.py route --unexplored
     uv run python zork_cli.py look
+    uv run python zork_cli.py daemon --flush-every 20
+    uv run python zork_cli.py flush
+    uv run python zork_cli.py daemon-stop
 """
 
 import argparse
+import io
 import json
+import os
 import pickle
 import shutil
+import signal
+import socket
 import sys
 import uuid
+from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import List, Optional
 
+from game_interface.core.exit_oracle import ExitOracle
 from game_interface.core.jericho_interface import JerichoInterface
 from map_graph import MapGraph, DIRECTION_MAPPING, normalize_direction
 from movement_analyzer import MovementAnalyzer
@@ -48,9 +66,32 @@ SESSION_DIR = _PROJECT_ROOT / "game_files" / ".session"
 STATE_FILE = SESSION_DIR / "game_state.pkl"
 SESSION_FILE = SESSION_DIR / "session.json"
 MAP_FILE = SESSION_DIR / "map_state.json"
+EXIT_ORACLE_FILE = SESSION_DIR / "exit_oracle.json"
 CHECKPOINT_DIR = SESSION_DIR / "checkpoints"
 GAME_FILE = str(_PROJECT_ROOT / "jericho-game-suite" / "zork1.z5")
 NARRATIVE_LOG = SESSION_DIR / "narrative.log"
+DAEMON_SOCKET = Path(os.environ.get("ZORK_CLI_SOCKET", SESSION_DIR / "daemon.sock"))
+DAEMON_CONNECTION_TIMEOUT = 10.0  # Seconds the daemon waits on a silent client
+
+
+class _LiveSession:
+    """Session held in memory by the daemon between requests."""
+
+    def __init__(self, flush_every: int):
+        self.flush_every = flush_every
+        self.jericho: Optional[JerichoInterface] = None
+        self.session: Optional[dict] = None
+        self.game_map: Optional[MapGraph] = None
+        self.unsaved = 0  # Saves not yet written to disk
+        self.stopping = False
+
+
+class _DaemonShutdown(BaseException):
+    """Raised by the SIGTERM handler to leave the daemon's accept loop."""
+
+
+# Set while this process is serving as the daemon; None for one-shot invocations
+_live: Optional[_LiveSession] = None
 
 
 def _log_narrative(text: str):
@@ -84,9 +125,14 @@ def _ensure_session_dir():
 def _load_session():
     """Load Jericho state + session metadata + map from disk.
 
+    In daemon mode the session is loaded once and then served from memory.
+
     Returns:
         Tuple of (JerichoInterface, session_dict, MapGraph)
     """
+    if _live is not None and _live.jericho is not None:
+        return _live.jericho, _live.session, _live.game_map
+
     if not STATE_FILE.exists():
         _error("No active game session. Run 'start-game' first.")
 
@@ -102,6 +148,11 @@ def _load_session():
             state = pickle.load(f)
         jericho.restore_state(state)
 
+        # Reuse exit probes from earlier invocations
+        if EXIT_ORACLE_FILE.exists():
+            with open(EXIT_ORACLE_FILE, "r") as f:
+                jericho.exit_oracle = ExitOracle.from_dict(json.load(f))
+
         # Load session metadata
         with open(SESSION_FILE, "r") as f:
             session = json.load(f)
@@ -113,6 +164,8 @@ def _load_session():
                 map_data = json.load(f)
             game_map = MapGraph.from_dict(map_data)
 
+        if _live is not None:
+            _live.jericho, _live.session, _live.game_map = jericho, session, game_map
         return jericho, session, game_map
     except SystemExit:
         raise
@@ -121,8 +174,52 @@ def _load_session():
         raise
 
 
+def _release_session(jericho: JerichoInterface):
+    """Close the engine after a command, unless the daemon keeps it live."""
+    if _live is None or _live.jericho is not jericho:
+        jericho.close()
+
+
 def _save_session(jericho: JerichoInterface, session: dict, game_map: MapGraph):
-    """Save Jericho state + session metadata + map to disk."""
+    """Save Jericho state + session metadata + map.
+
+    One-shot invocations write to disk immediately. The daemon keeps the
+    session in memory and writes it every `flush_every` saves (0 = only on
+    demand).
+    """
+    if _live is None:
+        _write_session(jericho, session, game_map)
+        return
+
+    if _live.jericho is not jericho:
+        # start-game replaced the engine
+        _drop_live_session()
+    _live.jericho, _live.session, _live.game_map = jericho, session, game_map
+    _live.unsaved += 1
+    if _live.flush_every and _live.unsaved >= _live.flush_every:
+        _flush_session()
+
+
+def _flush_session():
+    """Write the daemon's unsaved session to disk (no-op outside the daemon)."""
+    if _live is None or _live.jericho is None or not _live.unsaved:
+        return
+    _write_session(_live.jericho, _live.session, _live.game_map)
+    _live.unsaved = 0
+
+
+def _drop_live_session():
+    """Close the daemon's engine so the next command reloads from disk."""
+    if _live is None:
+        return
+    if _live.jericho is not None:
+        _live.jericho.close()
+    _live.jericho = _live.session = _live.game_map = None
+    _live.unsaved = 0
+
+
+def _write_session(jericho: JerichoInterface, session: dict, game_map: MapGraph):
+    """Write Jericho state + session metadata + map to disk."""
     _ensure_session_dir()
 
     # Save Z-machine state
@@ -138,6 +235,24 @@ def _save_session(jericho: JerichoInterface, session: dict, game_map: MapGraph):
     with open(MAP_FILE, "w") as f:
         json.dump(game_map.to_dict(), f, indent=2)
 
+    _write_exit_oracle(jericho)
+
+
+def _save_exit_oracle(jericho: JerichoInterface):
+    """Persist cached exit probes so the next invocation can skip them."""
+    if _live is not None:
+        # The daemon reuses its in-memory oracle; written with the next flush
+        _live.unsaved += 1
+        return
+    _write_exit_oracle(jericho)
+
+
+def _write_exit_oracle(jericho: JerichoInterface):
+    """Write cached exit probes to disk."""
+    _ensure_session_dir()
+    with open(EXIT_ORACLE_FILE, "w") as f:
+        json.dump(jericho.exit_oracle.to_dict(), f)
+
 
 def _get_location_info(jericho: JerichoInterface) -> dict:
     """Extract current location info from Z-machine."""
@@ -227,10 +342,11 @@ def cmd_start_game(args):
             "score_history": [{"turn": 0, "score": score_info["score"]}],
         }
 
-        # Save everything
+        # Save everything, straight to disk even in daemon mode
         _save_session(jericho, session, game_map)
+        _flush_session()
     finally:
-        jericho.close()
+        _release_session(jericho)
 
     # Write narrative log header
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
@@ -317,7 +433,7 @@ def cmd_send_command(args):
         # Save
         _save_session(jericho, session, game_map)
     finally:
-        jericho.close()
+        _release_session(jericho)
 
     result = {
         "response": response,
@@ -367,8 +483,9 @@ def cmd_get_state(args):
         inventory = _get_inventory_list(jericho)
         visible = _get_visible_objects_info(jericho)
         valid_exits = _normalize_exits(jericho.get_valid_exits())
+        _save_exit_oracle(jericho)
     finally:
-        jericho.close()
+        _release_session(jericho)
 
     _output({
         **loc,
@@ -392,7 +509,7 @@ def cmd_validate_action(args):
     try:
         result = _validate_against_object_tree(action, jericho)
     finally:
-        jericho.close()
+        _release_session(jericho)
 
     _output(result)
 
@@ -421,27 +538,8 @@ def _validate_against_object_tree(action: str, jericho: JerichoInterface) -> dic
         # Validate "take" actions
         if verb in ['take', 'get', 'grab', 'pick']:
             targets = [t.strip() for t in target.split(',')]
-            visible_objects = jericho.get_visible_objects_in_location()
-            inventory_objects = jericho.get_inventory_structured()
-
-            # Build accessible objects list (including contents of transparent containers)
-            all_accessible = list(visible_objects) + list(inventory_objects)
-            world_objects = jericho.env.get_world_objects()
-
-            def add_accessible_children(obj_list):
-                new_objects = []
-                for obj in obj_list:
-                    attrs = jericho.get_object_attributes(obj)
-                    if attrs.get('transparent'):
-                        for child_obj in world_objects:
-                            if child_obj.parent == obj.num and child_obj not in all_accessible:
-                                new_objects.append(child_obj)
-                                all_accessible.append(child_obj)
-                return new_objects
-
-            current_level = list(visible_objects) + list(inventory_objects)
-            while current_level:
-                current_level = add_accessible_children(current_level)
+            # Room, inventory and contents of transparent containers, recursively
+            all_accessible = jericho.get_world_snapshot().accessible_objects()
 
             for single_target in targets:
                 found = any(single_target in obj.name.lower() for obj in all_accessible)
@@ -500,6 +598,8 @@ def cmd_save_checkpoint(args):
     checkpoint_path = CHECKPOINT_DIR / safe_name
 
     try:
+        # Checkpoints copy the session files, so write the daemon's state first
+        _flush_session()
         checkpoint_path.mkdir(parents=True, exist_ok=True)
         shutil.copy2(STATE_FILE, checkpoint_path / "game_state.pkl")
         shutil.copy2(SESSION_FILE, checkpoint_path / "session.json")
@@ -533,6 +633,9 @@ def cmd_restore_checkpoint(args):
         _error(f"Checkpoint '{safe_name}' not found. Available: {available}")
 
     try:
+        # The daemon reloads the restored files on the next _load_session
+        _flush_session()
+        _drop_live_session()
         shutil.copy2(checkpoint_path / "game_state.pkl", STATE_FILE)
         shutil.copy2(checkpoint_path / "session.json", SESSION_FILE)
         map_checkpoint = checkpoint_path / "map_state.json"
@@ -546,7 +649,7 @@ def cmd_restore_checkpoint(args):
             score_info = _get_score_info(jericho)
             inventory = _get_inventory_list(jericho)
         finally:
-            jericho.close()
+            _release_session(jericho)
 
         _log_narrative(
             f"  [Checkpoint restored: \"{safe_name}\" — "
@@ -569,6 +672,7 @@ def cmd_restore_checkpoint(args):
 
 def cmd_get_map(args):
     """Get the current game map."""
+    _flush_session()
     if not MAP_FILE.exists():
         _error("No map data. Start a game first.")
 
@@ -585,7 +689,7 @@ def cmd_get_map(args):
                 loc = _get_location_info(jericho)
                 current_location_id = loc["location_id"]
             finally:
-                jericho.close()
+                _release_session(jericho)
 
         rooms = {str(rid): room.name for rid, room in game_map.rooms.items()}
         total_connections = sum(len(c) for c in game_map.connections.values())
@@ -602,13 +706,204 @@ def cmd_get_map(args):
         _error(f"Failed to get map: {e}")
 
 
+def cmd_route(args):
+    """Get the shortest mapped route from the current location to a room."""
+    jericho, session, game_map = _load_session()
+    try:
+        current_location_id = _get_location_info(jericho)["location_id"]
+    finally:
+        _release_session(jericho)
+
+    if args.unexplored:
+        nearest = game_map.find_nearest(current_location_id, game_map.get_unexplored_exits)
+        if nearest is None:
+            _error("No reachable room has unexplored exits.")
+        target_id, route = nearest
+    else:
+        if args.location_id is None:
+            _error("Give a target location ID or --unexplored.")
+        target_id = args.location_id
+        if target_id not in game_map.rooms:
+            _error(f"Location {target_id} is not on the map.")
+        route = game_map.find_route(current_location_id, target_id)
+        if route is None:
+            _error(f"No mapped route from {current_location_id} to {target_id}.")
+
+    _output({
+        "from_location_id": current_location_id,
+        "to_location_id": target_id,
+        "to_location_name": game_map.room_names.get(target_id, ""),
+        "distance": len(route),
+        "commands": [exit_name for exit_name, _ in route],
+        "steps": [
+            {
+                "command": exit_name,
+                "location_id": room_id,
+                "location_name": game_map.room_names.get(room_id, ""),
+            }
+            for exit_name, room_id in route
+        ],
+        "unexplored_exits": game_map.get_unexplored_exits(target_id),
+    })
+
+
 def cmd_look(args):
     """Convenience: equivalent to send-command 'look'."""
     from types import SimpleNamespace
     cmd_send_command(SimpleNamespace(cmd="look"))
 
 
-def main():
+def cmd_flush(args):
+    """Write the daemon's in-memory session to disk now."""
+    if _live is None:
+        _output({"flushed": False, "message": "No daemon running; state is saved after every command"})
+        return
+    _flush_session()
+    _output({"flushed": True, "turn": _live.session["turn"] if _live.session else None})
+
+
+def cmd_daemon(args):
+    """Serve CLI commands from a long-lived process (blocks until daemon-stop)."""
+    def _on_sigterm(signum, frame):
+        raise _DaemonShutdown()
+
+    signal.signal(signal.SIGTERM, _on_sigterm)
+    try:
+        _serve(Path(args.socket), args.flush_every)
+    except _DaemonShutdown:
+        pass
+
+
+def cmd_daemon_stop(args):
+    """Flush the daemon's session and stop it."""
+    if _live is None:
+        _error("No daemon running.")
+    _flush_session()
+    _live.stopping = True
+    _output({"stopped": True})
+
+
+# --- Daemon ---
+
+
+def _serve(socket_path: Path, flush_every: int):
+    """Accept one JSON request per connection until daemon-stop.
+
+    Requests are handled one at a time: the Z-machine is not thread-safe, and
+    commands from one agent are sequential anyway.
+    """
+    global _live
+
+    if socket_path.exists():
+        if _send_to_daemon(["flush"], socket_path) is not None:
+            _error(f"A daemon is already listening on {socket_path}")
+        socket_path.unlink()  # Stale socket from a daemon that died
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    _live = _LiveSession(flush_every)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(socket_path))
+        server.listen()
+        while not _live.stopping:
+            conn, _ = server.accept()
+            conn.settimeout(DAEMON_CONNECTION_TIMEOUT)
+            try:
+                with conn, conn.makefile("rwb") as stream:
+                    argv = _parse_daemon_request(stream.readline())
+                    if argv is None:
+                        reply = _error_reply("Malformed daemon request")
+                    else:
+                        reply = _handle_daemon_request(argv)
+                    stream.write(json.dumps(reply).encode("utf-8") + b"\n")
+                    stream.flush()
+            except OSError:
+                # Client timed out or hung up; drop it and keep the session alive
+                continue
+    finally:
+        try:
+            _flush_session()
+        finally:
+            _drop_live_session()
+            _live = None
+            server.close()
+            socket_path.unlink(missing_ok=True)
+
+
+def _parse_daemon_request(line: bytes) -> Optional[List[str]]:
+    """Get the argv of a request line, or None if the line is malformed."""
+    try:
+        argv = json.loads(line or b"{}").get("argv", [])
+    except (ValueError, AttributeError):
+        return None
+    if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+        return None
+    return argv
+
+
+def _error_reply(message: str) -> dict:
+    """A daemon reply carrying the output of _error(message)."""
+    return {
+        "stdout": json.dumps({"error": message}, indent=2) + "\n",
+        "stderr": "",
+        "exit_code": 1,
+    }
+
+
+def _handle_daemon_request(argv: List[str]) -> dict:
+    """Run one CLI invocation in-process, capturing what it would print."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            args = _build_parser().parse_args(argv)
+            if args.command == "daemon":
+                _error("A daemon is already running.")
+            _dispatch(args)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception as e:
+            try:
+                _error(f"Unexpected error: {e}")
+            except SystemExit as exit_:
+                exit_code = exit_.code
+    return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "exit_code": exit_code}
+
+
+def _send_to_daemon(argv: List[str], socket_path: Path = None) -> Optional[dict]:
+    """Forward a CLI invocation to the daemon.
+
+    Returns:
+        The daemon's reply, or None if no daemon is listening. If the daemon
+        accepted the request but hung up without replying, an error reply:
+        the command may already have run, so it must not be retried.
+    """
+    socket_path = socket_path or DAEMON_SOCKET
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+
+    line = b""
+    try:
+        with sock, sock.makefile("rwb") as stream:
+            stream.write(json.dumps({"argv": argv}).encode("utf-8") + b"\n")
+            stream.flush()
+            line = stream.readline()
+    except OSError:
+        pass  # Reported below as a missing reply
+    try:
+        return json.loads(line)
+    except ValueError:
+        return _error_reply(
+            "The daemon closed the connection without replying; "
+            "the command may or may not have run"
+        )
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="ZorkGPT CLI — play Zork via Jericho, outputs JSON to stdout"
     )
@@ -640,12 +935,39 @@ def main():
     # get-map
     subparsers.add_parser("get-map", help="Get the current game map as Mermaid diagram")
 
+    # route
+    p_route = subparsers.add_parser("route", help="Get the shortest mapped route to a location")
+    p_route.add_argument("location_id", type=int, nargs="?", help="Target location ID")
+    p_route.add_argument(
+        "--unexplored", action="store_true", help="Route to the nearest room with unexplored exits"
+    )
+
     # look
     subparsers.add_parser("look", help="Equivalent to send-command 'look'")
 
-    args = parser.parse_args()
+    # daemon
+    p_daemon = subparsers.add_parser(
+        "daemon", help="Serve commands from a long-lived process holding the game in memory"
+    )
+    p_daemon.add_argument(
+        "--socket", default=str(DAEMON_SOCKET), help="Unix socket path (default: $ZORK_CLI_SOCKET)"
+    )
+    p_daemon.add_argument(
+        "--flush-every", type=int, default=20,
+        help="Write state to disk every N saves (0 = only on flush, checkpoints and stop)",
+    )
+
+    # flush
+    subparsers.add_parser("flush", help="Write the daemon's in-memory state to disk")
 
-    # Dispatch
+    # daemon-stop
+    subparsers.add_parser("daemon-stop", help="Flush and stop the daemon")
+
+    return parser
+
+
+def _dispatch(args):
+    """Run the handler for parsed arguments."""
     handlers = {
         "start-game": cmd_start_game,
         "send-command": cmd_send_command,
@@ -654,7 +976,11 @@ def main():
         "save-checkpoint": cmd_save_checkpoint,
         "restore-checkpoint": cmd_restore_checkpoint,
         "get-map": cmd_get_map,
+        "route": cmd_route,
         "look": cmd_look,
+        "daemon": cmd_daemon,
+        "flush": cmd_flush,
+        "daemon-stop": cmd_daemon_stop,
     }
 
     handler = handlers.get(args.command)
@@ -664,6 +990,22 @@ def main():
         _error(f"Unknown command: {args.command}")
 
 
+def main():
+    argv = sys.argv[1:]
+
+    # Thin client: forward to a running daemon instead of booting the engine.
+    # Only run one-shot when nothing is listening; a request the daemon took
+    # but never answered is reported, not re-run from stale on-disk state.
+    if argv[:1] != ["daemon"] and DAEMON_SOCKET.exists():
+        reply = _send_to_daemon(argv)
+        if reply is not None:
+            sys.stdout.write(reply["stdout"])
+            sys.stderr.write(reply["stderr"])
+            sys.exit(reply["exit_code"])
+
+    _dispatch(_build_parser().parse_args(argv))
+
+
 if __name__ == "__main__":
     try:
         main()
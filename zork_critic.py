@@ -6,8 +6,17 @@ import json
 import re
 from typing import Optional, List, Tuple, Dict
 from pydantic import BaseModel
+from pydantic.json_schema import SkipJsonSchema
 from collections import Counter
+from game_interface.core.lookahead import (
+    DEATH,
+    PARSER_REJECTION,
+    SCORE_CHANGE,
+    LookaheadOutcome,
+    LookaheadSimulator,
+)
 from llm_client import LLMClientWrapper
+from prompt_cache import PromptBuilder
 from session.game_configuration import GameConfiguration
 from session.game_state import ActionHistoryEntry
 
@@ -30,6 +39,20 @@ class CriticResponse(BaseModel):
     score: float
     justification: str
     confidence: float = 0.8  # Default confidence level
+    # Set only for verdicts taken from a simulated outcome (never by the LLM;
+    # left out of the response schema), which are never overridden
+    from_lookahead: SkipJsonSchema[bool] = False
+
+
+class CandidateEvaluation(BaseModel):
+    action: str
+    score: float
+    justification: str
+    confidence: float = 0.8
+
+
+class CriticBatchResponse(BaseModel):
+    evaluations: List[CandidateEvaluation]
 
 
 class FailureDetectionResponse(BaseModel):
@@ -521,6 +544,10 @@ class ZorkCritic:
     Handles critic evaluation of actions with confidence scoring and trust tracking.
     """
 
+    # Justification prefix of verdicts taken from a simulated outcome (display only;
+    # branch on CriticResponse.from_lookahead)
+    LOOKAHEAD_PREFIX = "[Lookahead]"
+
     def __init__(
         self,
         config: GameConfiguration,
@@ -583,6 +610,9 @@ class ZorkCritic:
         self.trust_tracker = CriticTrustTracker(config=self.config)
         self.rejection_system = ActionRejectionSystem()
 
+        # Critic LLM evaluations replaced by a lookahead verdict
+        self.lookahead_verdicts = 0
+
     def _load_system_prompt(self) -> None:
         """Load critic system prompt from markdown file."""
         try:
@@ -641,44 +671,15 @@ class ZorkCritic:
                 # Handle comma-separated multi-object commands (e.g., "take X, Y, Z")
                 targets = [t.strip() for t in target.split(',')]
 
-                # Get visible objects in location
-                visible_objects = jericho_interface.get_visible_objects_in_location()
-
-                # Also get objects in inventory (for "take X from sack" when sack is held)
-                inventory_objects = jericho_interface.get_inventory_structured()
-
-                # Expand to include objects inside open/transparent containers
-                # This is needed because Zork allows "take X" for objects in open containers
-                # We need to recursively check because containers can be inside containers
-                # Start with both room objects AND inventory objects
-                all_accessible_objects = list(visible_objects) + list(inventory_objects)
-                world_objects = jericho_interface.env.get_world_objects()
-
-                # Helper to recursively add children of transparent objects
-                def add_accessible_children(obj_list):
-                    """Recursively add children of transparent objects."""
-                    new_objects = []
-                    for obj in obj_list:
-                        attrs = jericho_interface.get_object_attributes(obj)
-                        # If object is transparent, we can see (and take) its contents
-                        # In Zork, transparent=true means the container is open or see-through
-                        if attrs.get('transparent'):
-                            for child_obj in world_objects:
-                                if child_obj.parent == obj.num and child_obj not in all_accessible_objects:
-                                    new_objects.append(child_obj)
-                                    all_accessible_objects.append(child_obj)
-                    return new_objects
-
-                # Recursively add children until no new objects found
-                # Start with both room objects and inventory objects
-                current_level = list(visible_objects) + list(inventory_objects)
-                while current_level:
-                    current_level = add_accessible_children(current_level)
+                # Room contents, inventory and (recursively) the contents of
+                # open/transparent containers among them: Zork allows "take X"
+                # for objects in open containers, including held ones
+                accessible_objects = jericho_interface.get_world_snapshot().accessible_objects()
 
                 # Validate each target object individually
                 for single_target in targets:
                     found = False
-                    for obj in all_accessible_objects:
+                    for obj in accessible_objects:
                         if single_target in obj.name.lower():
                             # Object exists and is visible/accessible
                             # Note: We don't check 'takeable' attribute because Jericho's
@@ -730,6 +731,84 @@ class ZorkCritic:
                 self.logger.warning(f"Object tree validation error: {e}")
             return ValidationResult(valid=True, reason="Validation error - defaulting to allow")
 
+    def evaluate_with_lookahead(
+        self, actions: List[str], jericho_interface
+    ) -> List[Optional[CriticResponse]]:
+        """
+        Settle actions whose outcome the Z-machine already decides, without the LLM.
+
+        Outcomes come from the action outcome store when this state and action
+        were seen before (JerichoInterface.outcome_store), otherwise from a dry
+        run of the action (JerichoInterface.lookahead). Parser rejections,
+        blocked movements and deaths are rejected and score increases
+        accepted; anything else gets None and goes to the LLM. Stored deaths
+        are not trusted (the digest leaves out the RNG) and are re-simulated.
+
+        Args:
+            actions: Actions to check
+            jericho_interface: JerichoInterface for the current game
+
+        Returns:
+            One CriticResponse or None per action, in order
+        """
+        lookahead = getattr(jericho_interface, "lookahead", None)
+        if not isinstance(lookahead, LookaheadSimulator):
+            return [None] * len(actions)
+        store = getattr(jericho_interface, "outcome_store", None)
+        if not self.config.enable_lookahead and store is None:
+            return [None] * len(actions)
+
+        outcomes: List[Optional[LookaheadOutcome]] = [None] * len(actions)
+        try:
+            if store is not None:
+                digest = jericho_interface.get_state_digest()
+                for i, action in enumerate(actions):
+                    stored = store.lookup(digest, action)
+                    if stored is not None and stored.kind != DEATH:
+                        outcomes[i] = stored
+
+            missing = [i for i, outcome in enumerate(outcomes) if outcome is None]
+            if self.config.enable_lookahead and missing:
+                simulated = lookahead.simulate_candidates([actions[i] for i in missing])
+                for i, outcome in zip(missing, simulated):
+                    outcomes[i] = outcome
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Lookahead simulation error: {e}")
+            return [None] * len(actions)
+
+        verdicts = [self._lookahead_verdict(outcome) for outcome in outcomes]
+        self.lookahead_verdicts += sum(verdict is not None for verdict in verdicts)
+        if store is not None:
+            for i, verdict in enumerate(verdicts):
+                if i not in missing:
+                    store.count_skip("critic", skipped=verdict is not None)
+        return verdicts
+
+    def _lookahead_verdict(self, outcome: Optional[LookaheadOutcome]) -> Optional[CriticResponse]:
+        """Map a simulated outcome to a critic verdict (None if it needs judgment)."""
+        if outcome is None:
+            return None
+
+        game_says = " ".join(outcome.response.split())[:150]
+        if outcome.kind == DEATH:
+            score, reason = -1.0, f"This action kills the player: \"{game_says}\""
+        elif outcome.kind == PARSER_REJECTION:
+            score, reason = -1.0, f"The game does not understand this command: \"{game_says}\""
+        elif outcome.blocked_move:
+            score, reason = -1.0, f"This direction leads nowhere from here: \"{game_says}\""
+        elif outcome.kind == SCORE_CHANGE and outcome.score_delta > 0:
+            score, reason = 1.0, f"This action increases the score by {outcome.score_delta}"
+        else:
+            return None
+
+        return CriticResponse(
+            score=score,
+            justification=f"{self.LOOKAHEAD_PREFIX} {reason}",
+            confidence=0.95,
+            from_lookahead=True,
+        )
+
     @observe(name="critic-evaluate-action")
     def evaluate_action(
         self,
@@ -774,9 +853,237 @@ class ZorkCritic:
                     confidence=validation_result.confidence
                 )
 
+            # Outcomes the game already decides need no LLM judgment
+            lookahead_result = self.evaluate_with_lookahead(
+                [proposed_action], jericho_interface
+            )[0]
+            if lookahead_result is not None:
+                return lookahead_result
+
         # If validation passes, continue with LLM-based evaluation
         # Prepare context about repetitive actions for the critic
-        repetition_context = ""
+        repetition_context = self._build_repetition_context(
+            proposed_action, action_counts, current_location_name, failed_actions_by_location
+        )
+
+        recent_context = self._build_recent_context(previous_actions_and_responses)
+        situation = self._build_situation(game_state_text, available_exits, inventory)
+
+        user_prompt = f"""{situation}
+
+Proposed Agent Action:
+{proposed_action}{repetition_context}{recent_context}
+
+Evaluate this action based on your criteria. Respond with ONLY a JSON object in this exact format:
+{{"score": 0.0, "justification": "Your justification here", "confidence": 0.8}}
+"""
+        messages = (
+            PromptBuilder(self.model)
+            .add("static", self.system_prompt)
+            .add("turn", user_prompt)
+            .build()
+        )
+
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                top_p=self.top_p,
+                top_k=self.top_k,
+                min_p=self.min_p,
+                name="Critic",
+                response_format=create_json_schema(CriticResponse),
+            )
+
+            response_content = response.content
+            try:
+                parsed_data = self._parse_json_response(response_content)
+                return CriticResponse(**{**parsed_data, "from_lookahead": False})
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(
+                        f"Error parsing critic response: {e}",
+                        extra={"episode_id": self.episode_id},
+                    )
+                    self.logger.error(
+                        f"Response content: {response_content}",
+                        extra={"episode_id": self.episode_id},
+                    )
+                return CriticResponse(
+                    score=0.0, justification="Critic evaluation error (parsing)."
+                )
+        except Exception as e:
+            if self.logger:
+                self.logger.error(
+                    f"Error getting critic evaluation: {e}",
+                    extra={"episode_id": self.episode_id},
+                )
+            return CriticResponse(
+                score=0.0, justification="Critic evaluation error (API)."
+            )
+
+    @observe(name="critic-evaluate-candidates")
+    def evaluate_candidates(
+        self,
+        game_state_text: str,
+        candidates: List[str],
+        available_exits: Optional[List[str]] = None,
+        action_counts: Optional[Counter] = None,
+        previous_actions_and_responses: Optional[List[ActionHistoryEntry]] = None,
+        current_location_name: Optional[str] = None,
+        failed_actions_by_location: Optional[Dict[str, set]] = None,
+        jericho_interface=None,
+        inventory: Optional[List[str]] = None,
+    ) -> List[CriticResponse]:
+        """
+        Score several candidate actions with a single Critic LM request.
+
+        Candidates are first checked against the object tree and the lookahead
+        simulator; those they settle get the same verdicts as in evaluate_action
+        and are not sent to the LLM. The rest are scored together in one
+        structured response.
+
+        Args:
+            game_state_text: Current game state text
+            candidates: Candidate actions, in the agent's order of preference
+            available_exits: List of valid exits from current location for spatial awareness
+            action_counts: Counter of action frequencies
+            previous_actions_and_responses: Recent action history
+            current_location_name: Name of the current location
+            failed_actions_by_location: Dict mapping location names to sets of failed actions
+            jericho_interface: Optional JerichoInterface for object tree validation
+            inventory: Current inventory items for evaluating item-based actions
+
+        Returns:
+            One CriticResponse per candidate, in the order of `candidates`
+        """
+        results: List[Optional[CriticResponse]] = [None] * len(candidates)
+        to_score = []
+
+        for i, candidate in enumerate(candidates):
+            if jericho_interface:
+                validation_result = self.validate_against_object_tree(
+                    candidate, jericho_interface
+                )
+                if not validation_result.valid:
+                    results[i] = CriticResponse(
+                        score=0.0,
+                        justification=f"[Object Tree Validation] {validation_result.reason}",
+                        confidence=validation_result.confidence
+                    )
+                    continue
+            to_score.append(i)
+
+        if jericho_interface and to_score:
+            verdicts = self.evaluate_with_lookahead(
+                [candidates[i] for i in to_score], jericho_interface
+            )
+            for i, verdict in zip(to_score, verdicts):
+                results[i] = verdict
+            to_score = [i for i, verdict in zip(to_score, verdicts) if verdict is None]
+
+        if not to_score:
+            return results
+
+        candidate_lines = []
+        for number, i in enumerate(to_score, start=1):
+            repetition_context = self._build_repetition_context(
+                candidates[i], action_counts, current_location_name, failed_actions_by_location
+            )
+            notes = repetition_context.replace("\n", "\n   ") if repetition_context else ""
+            candidate_lines.append(f"{number}. {candidates[i]}{notes}")
+
+        situation = self._build_situation(game_state_text, available_exits, inventory)
+        recent_context = self._build_recent_context(previous_actions_and_responses)
+        candidate_list = "\n".join(candidate_lines)
+
+        user_prompt = f"""{situation}
+
+Candidate Agent Actions:
+{candidate_list}{recent_context}
+
+Evaluate EACH candidate independently based on your criteria. Respond with ONLY a JSON object in this exact format, with one evaluation per candidate in the same order:
+{{"evaluations": [{{"action": "candidate 1", "score": 0.0, "justification": "Your justification here", "confidence": 0.8}}]}}
+"""
+        messages = (
+            PromptBuilder(self.model)
+            .add("static", self.system_prompt)
+            .add("turn", user_prompt)
+            .build()
+        )
+
+        # critic max_tokens is sized for one evaluation: give each candidate that
+        # budget, plus one for the JSON envelope, so the batch is not truncated
+        batch_max_tokens = self.max_tokens * (len(to_score) + 1) if self.max_tokens else None
+
+        error_justification = "Critic evaluation error (API)."
+        evaluations: List[CandidateEvaluation] = []
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=batch_max_tokens,
+                top_p=self.top_p,
+                top_k=self.top_k,
+                min_p=self.min_p,
+                name="Critic",
+                response_format=create_json_schema(CriticBatchResponse),
+            )
+            error_justification = "Critic evaluation error (parsing)."
+            parsed_data = self._parse_json_response(response.content)
+            evaluations = CriticBatchResponse(**parsed_data).evaluations
+        except Exception as e:
+            if self.logger:
+                self.logger.error(
+                    f"Error getting batch critic evaluation: {e}",
+                    extra={"episode_id": self.episode_id},
+                )
+
+        # Match evaluations to candidates by action text, falling back to position
+        by_action = {e.action.strip().lower(): e for e in evaluations}
+        for position, i in enumerate(to_score):
+            evaluation = by_action.get(candidates[i].strip().lower())
+            if evaluation is None and len(evaluations) == len(to_score):
+                evaluation = evaluations[position]
+                self._log_batch_mismatch(
+                    candidates[i], f"matched by position to '{evaluation.action}'"
+                )
+            if evaluation is None:
+                if evaluations:
+                    self._log_batch_mismatch(candidates[i], "no evaluation returned; scored 0.0")
+                results[i] = CriticResponse(score=0.0, justification=error_justification)
+            else:
+                results[i] = CriticResponse(
+                    score=evaluation.score,
+                    justification=evaluation.justification,
+                    confidence=evaluation.confidence,
+                )
+
+        return results
+
+    def _log_batch_mismatch(self, candidate: str, problem: str) -> None:
+        """Warn about a candidate whose batch evaluation was missing or mismatched."""
+        if self.logger:
+            self.logger.warning(
+                f"Batch critic evaluation for '{candidate}': {problem}",
+                extra={
+                    "event_type": "critic_batch_mismatch",
+                    "episode_id": self.episode_id,
+                    "candidate": candidate,
+                },
+            )
+
+    def _build_repetition_context(
+        self,
+        proposed_action: str,
+        action_counts: Optional[Counter],
+        current_location_name: Optional[str],
+        failed_actions_by_location: Optional[Dict[str, set]],
+    ) -> str:
+        """Describe how often an action was tried and where it already failed."""
         repetition_details = []
 
         # Global count context (useful for overall action frequency)
@@ -815,9 +1122,14 @@ class ZorkCritic:
                         f"Note: '{proposed_action}' also failed in {len(other_failed_locations)} other locations."
                     )
 
-        if repetition_details:
-            repetition_context = "\n" + "\n".join(repetition_details)
+        if not repetition_details:
+            return ""
+        return "\n" + "\n".join(repetition_details)
 
+    def _build_recent_context(
+        self, previous_actions_and_responses: Optional[List[ActionHistoryEntry]]
+    ) -> str:
+        """Describe the last few actions and responses."""
         # Add context about the last few actions and responses
         recent_context = ""
         if previous_actions_and_responses and len(previous_actions_and_responses) > 0:
@@ -826,7 +1138,15 @@ class ZorkCritic:
                 recent_context += f"Location: {entry.location_name} (ID: {entry.location_id})\n"
                 recent_context += f"Command: {entry.action}\n"
                 recent_context += f"Result: {entry.response.strip()}\n\n"
+        return recent_context
 
+    def _build_situation(
+        self,
+        game_state_text: str,
+        available_exits: Optional[List[str]],
+        inventory: Optional[List[str]],
+    ) -> str:
+        """Render the game state with exits and inventory for the critic prompt."""
         # Add spatial context if available
         spatial_context = ""
         if available_exits:
@@ -841,80 +1161,30 @@ class ZorkCritic:
                 f"\nCurrent inventory: {', '.join(inventory)}"
             )
 
-        user_prompt = f"""Current Game State:
-{game_state_text}{spatial_context}{inventory_context}
-
-Proposed Agent Action:
-{proposed_action}{repetition_context}{recent_context}
-
-Evaluate this action based on your criteria. Respond with ONLY a JSON object in this exact format:
-{{"score": 0.0, "justification": "Your justification here", "confidence": 0.8}}
-"""
-        messages = [
-            {
-                "role": "system",
-                "content": self.system_prompt,
-                "cache_control": {"type": "ephemeral"},
-            },
-            {"role": "user", "content": user_prompt},
-        ]
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                top_p=self.top_p,
-                top_k=self.top_k,
-                min_p=self.min_p,
-                name="Critic",
-                response_format=create_json_schema(CriticResponse),
-            )
+        return f"""Current Game State:
+{game_state_text}{spatial_context}{inventory_context}"""
 
-            response_content = response.content
-            try:
-                # Strip markdown fences if present (some LLMs wrap JSON in ```json ... ```)
-                json_content = strip_markdown_json_fences(response_content)
+    @staticmethod
+    def _parse_json_response(response_content: str) -> Dict:
+        """Parse a critic JSON response, repairing common formatting issues."""
+        # Strip markdown fences if present (some LLMs wrap JSON in ```json ... ```)
+        json_content = strip_markdown_json_fences(response_content)
 
-                # Clean up JSON content to handle common formatting issues
-                # Fix positive numbers with + prefix (e.g., +0.2 -> 0.2)
-                json_content = re.sub(r":\s*\+(\d+\.?\d*)", r": \1", json_content)
+        # Clean up JSON content to handle common formatting issues
+        # Fix positive numbers with + prefix (e.g., +0.2 -> 0.2)
+        json_content = re.sub(r":\s*\+(\d+\.?\d*)", r": \1", json_content)
 
-                # Fix unterminated strings by ensuring quotes are properly closed
-                # This is a basic fix - if there's an odd number of quotes, add a closing quote
-                quote_count = json_content.count('"')
-                if quote_count % 2 == 1:
-                    json_content += '"'
+        # Fix unterminated strings by ensuring quotes are properly closed
+        # This is a basic fix - if there's an odd number of quotes, add a closing quote
+        quote_count = json_content.count('"')
+        if quote_count % 2 == 1:
+            json_content += '"'
 
-                # Ensure the JSON object is properly closed
-                if json_content.strip() and not json_content.strip().endswith("}"):
-                    json_content = json_content.strip() + "}"
+        # Ensure the JSON object is properly closed
+        if json_content.strip() and not json_content.strip().endswith("}"):
+            json_content = json_content.strip() + "}"
 
-                parsed_data = json.loads(json_content)
-                return CriticResponse(**parsed_data)
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(
-                        f"Error parsing critic response: {e}",
-                        extra={"episode_id": self.episode_id},
-                    )
-                    self.logger.error(
-                        f"Response content: {response_content}",
-                        extra={"episode_id": self.episode_id},
-                    )
-                return CriticResponse(
-                    score=0.0, justification="Critic evaluation error (parsing)."
-                )
-        except Exception as e:
-            if self.logger:
-                self.logger.error(
-                    f"Error getting critic evaluation: {e}",
-                    extra={"episode_id": self.episode_id},
-                )
-            return CriticResponse(
-                score=0.0, justification="Critic evaluation error (API)."
-            )
+        return json.loads(json_content)
 
     def get_robust_evaluation(
         self,